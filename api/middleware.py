@@ -0,0 +1,110 @@
+import logging
+import time
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+
+from core import profiling
+from core.querybudget import QueryBudget
+from core.telemetry import REQUEST_SECONDS
+
+logger = logging.getLogger(__name__)
+
+
+class RequestMetricsMiddleware:
+    """
+    요청 처리 시간을 뷰(URL 이름)별 Prometheus 히스토그램에 누적
+
+    미들웨어 목록 맨 앞에 두어 스냅샷 응답을 포함한 전체 처리 시간을 잰다.
+    URL 에 매칭되지 않은 요청은 스냅샷 응답이면 'snapshot', 아니면
+    'unresolved' 로 묶어 라벨 수가 경로 수만큼 늘어나지 않게 한다.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        started = time.perf_counter()
+        response = self.get_response(request)
+        REQUEST_SECONDS.observe(
+            time.perf_counter() - started,
+            view=self._view_name(request, response),
+            method=request.method,
+            status=str(response.status_code),
+        )
+        return response
+
+    def _view_name(self, request, response) -> str:
+        match = getattr(request, 'resolver_match', None)
+        if match is not None:
+            return match.view_name
+        return 'snapshot' if response.get('X-Snapshot') else 'unresolved'
+
+
+class QueryBudgetMiddleware:
+    """
+    요청별 쿼리 수/DB 시간을 세어 예산 초과를 로그로 남기고 Server-Timing 헤더 추가
+
+    예산: RSS_QUERY_BUDGET_REQUEST (쿼리 수), RSS_QUERY_TIME_BUDGET_REQUEST_MS (DB 시간)
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        started = time.perf_counter()
+        budget = QueryBudget(
+            f"{request.method} {request.path}",
+            max_queries=getattr(settings, 'RSS_QUERY_BUDGET_REQUEST', 30),
+            max_db_ms=getattr(settings, 'RSS_QUERY_TIME_BUDGET_REQUEST_MS', 500),
+        )
+        with budget:
+            response = self.get_response(request)
+
+        match = getattr(request, 'resolver_match', None)
+        if match is not None:
+            budget.label = f"{request.method} {match.view_name}"
+        budget.check()
+
+        if getattr(settings, 'RSS_SERVER_TIMING', True):
+            timing = f'{budget.server_timing()}, app;dur={(time.perf_counter() - started) * 1000:.1f}'
+            existing = response.get('Server-Timing')
+            response['Server-Timing'] = f'{existing}, {timing}' if existing else timing
+        return response
+
+
+class ProfilingMiddleware:
+    """
+    서명된 X-Profile 헤더가 있는 요청 하나만 cProfile 로 기록
+
+    RSS_PROFILING_ENABLED 가 꺼져 있으면 미들웨어 체인에서 빠진다. 헤더가
+    없거나 서명이 맞지 않으면 그대로 처리한다. 기록한 요청의 응답에는
+    X-Profile-Capture 헤더로 파일 이름을 돌려준다.
+    """
+
+    header = 'HTTP_' + profiling.PROFILE_HEADER.upper().replace('-', '_')
+
+    def __init__(self, get_response):
+        if not profiling.profiling_enabled():
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+
+    def __call__(self, request):
+        token = request.META.get(self.header)
+        if token is None:
+            return self.get_response(request)
+        if not profiling.verify_token(token):
+            logger.warning("Ignoring invalid %s header for %s", profiling.PROFILE_HEADER, request.path)
+            return self.get_response(request)
+
+        current = profiling.Capture('request', f"{request.method} {request.path}").start()
+        try:
+            response = self.get_response(request)
+        finally:
+            match = getattr(request, 'resolver_match', None)
+            if match is not None:
+                current.label = f"{request.method} {match.view_name}"
+            path = current.stop(path=request.get_full_path())
+        if path:
+            response['X-Profile-Capture'] = path.rsplit('/', 1)[-1]
+        return response
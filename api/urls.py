@@ -6,6 +6,12 @@ app_name = 'api'
 urlpatterns = [
     path('crawl/', views.CrawlRSSView.as_view(), name='crawl-rss'),
     path('summary/', views.RSSSummaryView.as_view(), name='rss-summary'),
+    path('summary/daily/', views.DailySummaryAPIView.as_view(), name='daily-summary-api'),
     path('entries/', views.RSSEntriesAPIView.as_view(), name='entries-api'),
+    path('entries/facets/', views.EntryFacetsAPIView.as_view(), name='entry-facets-api'),
+    path('entries/<int:pk>/related/', views.RelatedEntriesAPIView.as_view(), name='related-entries-api'),
+    path('trending/', views.TrendingKeywordsAPIView.as_view(), name='trending-api'),
+    path('logs/stages/', views.CrawlStageMetricsAPIView.as_view(), name='log-stages-api'),
+    path('cache-stats/', views.CacheStatsAPIView.as_view(), name='cache-stats-api'),
     path('feeds/', views.RSSFeedsAPIView.as_view(), name='feeds-api'),
 ] 
\ No newline at end of file
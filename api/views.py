@@ -1,12 +1,20 @@
-from django.http import JsonResponse
+from django.http import HttpResponse, JsonResponse
+from django.conf import settings
 from django.views import View
 from django.utils import timezone
-from django.db.models import Count
-from datetime import timedelta
+from django.db.models import Count, Q
+from datetime import date, timedelta
 import json
+import redis
 
-from core.models import RSSFeed, RSSEntry, RSSProcessingLog
+from core.filters import entry_facets, filter_entries
+from core.fragments import fragment_stats, ingest_version
+from core.models import DailySummary, RSSFeed, RSSEntry, RSSProcessingLog
+from core.periods import annotate_time_period, local_today, period_counts, period_q
+from core.telemetry import render_metrics
+from crawler.related import related_entries
 from crawler.tasks import crawl_rss_feed_task
+from crawler.trending import HALF_LIVES, TrendingKeywords
 
 
 class CrawlRSSView(View):
@@ -52,47 +60,30 @@ class RSSSummaryView(View):
         """RSS 요약 정보 반환"""
         try:
             # 기간별 통계
-            today = timezone.now().date()
-            week_ago = today - timedelta(days=7)
-            month_ago = today - timedelta(days=30)
-            
-            # 엔트리 통계
-            today_entries = RSSEntry.objects.filter(published_at__date=today).count()
-            week_entries = RSSEntry.objects.filter(published_at__date__gte=week_ago).count()
-            month_entries = RSSEntry.objects.filter(published_at__date__gte=month_ago).count()
-            
-            # 키워드 통계
-            keyword_stats = {}
-            recent_entries = RSSEntry.objects.filter(
-                published_at__date__gte=week_ago
-            )
-            
-            for entry in recent_entries:
-                for keyword in entry.keywords_list:
-                    keyword_stats[keyword] = keyword_stats.get(keyword, 0) + 1
-            
-            top_keywords = sorted(
-                keyword_stats.items(), 
-                key=lambda x: x[1], 
-                reverse=True
-            )[:10]
-            
-            # 피드별 통계
-            feed_stats = recent_entries.values('feed__title').annotate(
+            now = timezone.now()
+            week_q = period_q('this_week', now)
+            
+            # 엔트리 통계 (피드 간 유사 중복은 대표 엔트리만 집계)
+            stories = RSSEntry.objects.canonical()
+            period_stats = period_counts(stories, now)
+            
+            # 키워드 통계 (DB 에서 GROUP BY)
+            top_keywords = stories.filter(week_q).keyword_counts(10)
+            
+            # 피드별 통계 (피드마다 자기 엔트리 전체를 집계)
+            feed_stats = RSSEntry.objects.filter(
+                week_q
+            ).values('feed__title').annotate(
                 count=Count('id')
             ).order_by('-count')[:5]
             
             # 최근 처리 로그
             recent_logs = RSSProcessingLog.objects.filter(
-                created_at__gte=timezone.now() - timedelta(hours=24)
-            ).order_by('-created_at')[:5]
+                created_at__gte=now - timedelta(hours=24)
+            ).select_related('feed').order_by('-created_at')[:5]
             
             summary = {
-                'period_stats': {
-                    'today': today_entries,
-                    'this_week': week_entries,
-                    'this_month': month_entries
-                },
+                'period_stats': period_stats,
                 'top_keywords': top_keywords,
                 'top_feeds': list(feed_stats),
                 'recent_logs': [
@@ -119,6 +110,52 @@ class RSSSummaryView(View):
             }, status=500)
 
 
+class DailySummaryAPIView(View):
+    """저장된 일일 요약 API 뷰"""
+    
+    def get(self, request):
+        """
+        지난 날짜의 저장된 일일 요약 반환
+
+        GET 은 저장하지 않으므로 요약이 없는 날짜는 404 이다. 요약은 정기
+        태스크(최근 며칠 재계산)와 backfill_daily_summaries 가 채운다.
+        """
+        try:
+            day = date.fromisoformat(request.GET['date']) if 'date' in request.GET else local_today() - timedelta(days=1)
+        except ValueError:
+            return JsonResponse({
+                'status': 'error',
+                'message': 'date must be YYYY-MM-DD'
+            }, status=400)
+        
+        if day >= local_today():
+            return JsonResponse({
+                'status': 'error',
+                'message': 'Only past days have daily summaries'
+            }, status=400)
+        
+        try:
+            summary = DailySummary.objects.filter(date=day).first()
+            if summary is None:
+                return JsonResponse({
+                    'status': 'error',
+                    'message': f'No daily summary for {day.isoformat()}'
+                }, status=404)
+            data = summary.as_dict()
+            data['generated_at'] = summary.generated_at.isoformat()
+            
+            return JsonResponse({
+                'status': 'success',
+                'data': data
+            })
+            
+        except Exception as e:
+            return JsonResponse({
+                'status': 'error',
+                'message': str(e)
+            }, status=500)
+
+
 class RSSEntriesAPIView(View):
     """RSS 엔트리 API 뷰"""
     
@@ -126,30 +163,10 @@ class RSSEntriesAPIView(View):
         """RSS 엔트리 목록을 JSON으로 반환"""
         try:
             # 쿼리 파라미터 처리
-            feed_id = request.GET.get('feed')
-            period = request.GET.get('period')
-            keyword = request.GET.get('keyword')
             limit = int(request.GET.get('limit', 20))
             
-            queryset = RSSEntry.objects.select_related('feed').order_by('-published_at')
-            
-            # 필터링
-            if feed_id:
-                queryset = queryset.filter(feed_id=feed_id)
-            
-            if period:
-                today = timezone.now().date()
-                if period == 'today':
-                    queryset = queryset.filter(published_at__date=today)
-                elif period == 'this_week':
-                    week_ago = today - timedelta(days=7)
-                    queryset = queryset.filter(published_at__date__gte=week_ago)
-                elif period == 'this_month':
-                    month_ago = today - timedelta(days=30)
-                    queryset = queryset.filter(published_at__date__gte=month_ago)
-            
-            if keyword:
-                queryset = queryset.filter(keywords__icontains=keyword)
+            queryset = RSSEntry.objects.select_related('feed', 'article').order_by('-published_at')
+            queryset = annotate_time_period(filter_entries(queryset, request.GET))
             
             entries = queryset[:limit]
             
@@ -160,6 +177,7 @@ class RSSEntriesAPIView(View):
                     'title': entry.title,
                     'link': entry.link,
                     'description': entry.clean_description[:200] + '...' if len(entry.clean_description) > 200 else entry.clean_description,
+                    'summary': entry.full_summary,
                     'author': entry.author,
                     'published_at': entry.published_at.isoformat(),
                     'keywords': entry.keywords_list,
@@ -168,7 +186,7 @@ class RSSEntriesAPIView(View):
                         'title': entry.feed.title,
                         'url': entry.feed.url
                     },
-                    'time_period': entry.get_time_period()
+                    'time_period': entry.time_period
                 }
                 for entry in entries
             ]
@@ -186,13 +204,174 @@ class RSSEntriesAPIView(View):
             }, status=500)
 
 
+class EntryFacetsAPIView(View):
+    """엔트리 필터 패싯 API 뷰"""
+    
+    def get(self, request):
+        """현재 필터 조합에서 피드/기간/키워드 선택지별 엔트리 수 반환"""
+        try:
+            keyword_limit = min(int(request.GET.get('keyword_limit', 10)), 50)
+            
+            return JsonResponse({
+                'status': 'success',
+                'data': entry_facets(request.GET, keyword_limit=keyword_limit)
+            })
+            
+        except Exception as e:
+            return JsonResponse({
+                'status': 'error',
+                'message': str(e)
+            }, status=500)
+
+
+class CacheStatsAPIView(View):
+    """화면 조각 캐시 통계 API 뷰"""
+    
+    def get(self, request):
+        """조각별 누적 hit/miss 와 현재 인제스트 버전 반환"""
+        try:
+            return JsonResponse({
+                'status': 'success',
+                'ingest_version': ingest_version(),
+                'data': fragment_stats()
+            })
+            
+        except Exception as e:
+            return JsonResponse({
+                'status': 'error',
+                'message': str(e)
+            }, status=500)
+
+
+class RelatedEntriesAPIView(View):
+    """관련 기사 API 뷰"""
+    
+    def get(self, request, pk):
+        """미리 계산된 벡터 인덱스에서 관련 엔트리를 찾아 반환"""
+        try:
+            entry = RSSEntry.objects.select_related('article').filter(pk=pk).first()
+            if entry is None:
+                return JsonResponse({
+                    'status': 'error',
+                    'message': 'Entry not found'
+                }, status=404)
+            
+            limit = int(request.GET.get('limit', 0)) or None
+            related_data = [
+                {
+                    'id': related.id,
+                    'title': related.title,
+                    'link': related.link,
+                    'published_at': related.published_at.isoformat(),
+                    'score': round(score, 4),
+                    'feed': {
+                        'id': related.feed.id,
+                        'title': related.feed.title
+                    }
+                }
+                for related, score in related_entries(entry, limit)
+            ]
+            
+            return JsonResponse({
+                'status': 'success',
+                'data': related_data,
+                'count': len(related_data)
+            })
+            
+        except Exception as e:
+            return JsonResponse({
+                'status': 'error',
+                'message': str(e)
+            }, status=500)
+
+
+class TrendingKeywordsAPIView(View):
+    """트렌딩 키워드 API 뷰"""
+    
+    def get(self, request):
+        """시간 감쇠 점수 상위 키워드와 속도 반환 (Redis 만 조회)"""
+        window = request.GET.get('window', '24h')
+        if window not in HALF_LIVES:
+            return JsonResponse({
+                'status': 'error',
+                'message': f"window must be one of: {', '.join(HALF_LIVES)}"
+            }, status=400)
+        
+        try:
+            limit = min(int(request.GET.get('limit', 10)), 100)
+            keywords = TrendingKeywords().top(window, limit=limit)
+            
+            return JsonResponse({
+                'status': 'success',
+                'window': window,
+                'half_life_seconds': HALF_LIVES[window],
+                'data': keywords,
+                'count': len(keywords)
+            })
+            
+        except redis.RedisError as e:
+            return JsonResponse({
+                'status': 'error',
+                'message': f'Trending store unavailable: {e}'
+            }, status=503)
+        except Exception as e:
+            return JsonResponse({
+                'status': 'error',
+                'message': str(e)
+            }, status=500)
+
+
+class CrawlStageMetricsAPIView(View):
+    """크롤링 단계별 소요 시간 API 뷰"""
+    
+    def get(self, request):
+        """최근 처리 로그의 피드별 단계(fetch/parse/enrich/db) p50/p95 반환"""
+        try:
+            days = int(request.GET.get('days', getattr(settings, 'RSS_STAGE_METRICS_DAYS', 7)))
+            logs = RSSProcessingLog.objects.filter(created_at__gte=timezone.now() - timedelta(days=days))
+            if request.GET.get('feed'):
+                logs = logs.filter(feed_id=request.GET['feed'])
+            
+            feeds = logs.stage_percentiles()
+            return JsonResponse({
+                'status': 'success',
+                'days': days,
+                'data': feeds,
+                'count': len(feeds)
+            })
+            
+        except Exception as e:
+            return JsonResponse({
+                'status': 'error',
+                'message': str(e)
+            }, status=500)
+
+
+class MetricsView(View):
+    """Prometheus 스크레이프 뷰"""
+    
+    def get(self, request):
+        """프로세스 간 누적 지표를 텍스트 형식으로 반환 (Redis 만 조회, DB 미사용)"""
+        try:
+            body = render_metrics()
+        except redis.RedisError as e:
+            return HttpResponse(f'# metrics store unavailable: {e}\n', status=503, content_type='text/plain')
+        return HttpResponse(body, content_type='text/plain; version=0.0.4; charset=utf-8')
+
+
 class RSSFeedsAPIView(View):
     """RSS 피드 API 뷰"""
     
     def get(self, request):
         """RSS 피드 목록을 JSON으로 반환"""
         try:
-            feeds = RSSFeed.objects.filter(is_active=True).order_by('-created_at')
+            # 피드별 전체/최근 7일 엔트리 수를 한 번의 GROUP BY 로
+            feeds = RSSFeed.objects.filter(is_active=True).annotate(
+                entry_count=Count('entries'),
+                recent_entry_count=Count(
+                    'entries', filter=Q(entries__published_at__gte=timezone.now() - timedelta(days=7))
+                )
+            ).order_by('-created_at')
             
             feeds_data = [
                 {
@@ -202,8 +381,8 @@ class RSSFeedsAPIView(View):
                     'description': feed.description,
                     'is_active': feed.is_active,
                     'last_crawled_at': feed.last_crawled_at.isoformat() if feed.last_crawled_at else None,
-                    'entry_count': feed.entries.count(),
-                    'recent_entry_count': feed.get_recent_entries(7).count()
+                    'entry_count': feed.entry_count,
+                    'recent_entry_count': feed.recent_entry_count
                 }
                 for feed in feeds
             ]
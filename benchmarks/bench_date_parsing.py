@@ -0,0 +1,78 @@
+"""
+엔트리 날짜 파싱 마이크로 벤치마크
+
+결정적으로 생성한 날짜 문자열(RFC 822 / ISO 8601)을 dateutil 로만
+파싱할 때와 FeedDateParser(피드별 형식 기억 + 전용 파서)로 파싱할 때의
+처리량을 비교한다.
+
+    python benchmarks/bench_date_parsing.py --dates 100000
+"""
+import argparse
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from crawler.dates import FeedDateParser, parse_with_dateutil  # noqa: E402
+
+FEED_FORMATS = {
+    'rfc822-offset': lambda dt: dt.strftime('%a, %d %b %Y %H:%M:%S +0000'),
+    'rfc822-gmt': lambda dt: dt.strftime('%a, %d %b %Y %H:%M:%S GMT'),
+    'iso8601': lambda dt: dt.isoformat(),
+    'iso8601-z': lambda dt: dt.strftime('%Y-%m-%dT%H:%M:%SZ'),
+}
+
+
+def build_corpus(count, feeds, seed):
+    """(피드 키, 엔트리) 목록 생성. 피드마다 하나의 날짜 형식을 사용"""
+    rng = random.Random(seed)
+    base = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    formats = list(FEED_FORMATS.values())
+    corpus = []
+    for i in range(count):
+        feed = i % feeds
+        dt = base + timedelta(seconds=rng.randrange(0, 2 * 365 * 24 * 3600))
+        corpus.append((f"feed-{feed}", {'published': formats[feed % len(formats)](dt)}))
+    return corpus
+
+
+def run_dateutil(corpus):
+    for _, entry in corpus:
+        parse_with_dateutil(entry['published'])
+
+
+def run_feed_parser(corpus):
+    parser = FeedDateParser()
+    for feed_key, entry in corpus:
+        parser.parse(entry, feed_key)
+    return parser
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--dates', type=int, default=100000, help='날짜 문자열 수')
+    parser.add_argument('--feeds', type=int, default=50, help='피드 수')
+    parser.add_argument('--seed', type=int, default=42, help='난수 시드')
+    args = parser.parse_args()
+
+    corpus = build_corpus(args.dates, args.feeds, args.seed)
+    print(f"corpus: {len(corpus)} dates, {args.feeds} feeds")
+    print(f"{'parser':>16} {'seconds':>9} {'dates/s':>11} {'speedup':>8}")
+
+    started = time.perf_counter()
+    run_dateutil(corpus)
+    baseline = time.perf_counter() - started
+    print(f"{'dateutil':>16} {baseline:>9.3f} {len(corpus) / baseline:>11.0f} {1:>7.2f}x")
+
+    started = time.perf_counter()
+    feed_parser = run_feed_parser(corpus)
+    elapsed = time.perf_counter() - started
+    print(f"{'FeedDateParser':>16} {elapsed:>9.3f} {len(corpus) / elapsed:>11.0f} {baseline / elapsed:>7.2f}x")
+    print(f"counters: {dict(feed_parser.counters)}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,284 @@
+"""
+크롤러/API 핫패스 벤치마크 (PostgreSQL)
+
+결정적 합성 코퍼스(crawler.synthetic)를 코퍼스 크기별로 별도 테스트 DB
+(test_<DB_NAME>)에 채우고 다음 경로의 처리량, 지연 p50/p99, 작업당
+쿼리 수를 잰다.
+
+- clean_text / extract_keywords / process_entry: 코퍼스 엔트리 전체
+- save_entries_to_db: 새 엔트리 배치 저장 (코퍼스가 커질 때의 비용)
+- RSSEntriesAPIView / RSSSummaryView: 필터 조합별 요청 (캐시 미사용)
+
+결과는 JSON 으로 저장하고, 기준 결과(--baseline)가 있으면 비교해
+p99/처리량이 --threshold 이상 나빠졌거나 쿼리 수가 늘어난 항목이 있을 때
+종료 코드 1 을 돌려준다.
+
+    python benchmarks/bench_hot_paths.py --sizes 10000,100000,1000000 --output var/bench/results.json
+    python benchmarks/bench_hot_paths.py --sizes 10000 --save-baseline
+"""
+import argparse
+import json
+import math
+import os
+import platform
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'issue_tracker.settings')
+
+import django  # noqa: E402
+
+django.setup()
+
+from django.db import connection  # noqa: E402
+from django.test import Client  # noqa: E402
+from django.test.utils import override_settings  # noqa: E402
+
+from core.models import RSSEntry, RSSFeed  # noqa: E402
+from core.querybudget import QueryBudget  # noqa: E402
+from crawler.parsing import clean_text, extract_keywords, process_entry  # noqa: E402
+from crawler.services import RSSCrawlerService  # noqa: E402
+from crawler.synthetic import SyntheticCorpus, load_corpus  # noqa: E402
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_BASELINE = os.path.join(BENCH_DIR, 'baseline.json')
+
+# 뷰는 캐시 없이 DB 경로를 잼 (지표/프로파일링 훅은 끔)
+BENCH_SETTINGS = {
+    'ALLOWED_HOSTS': ['testserver'],
+    'CACHES': {'default': {'BACKEND': 'django.core.cache.backends.dummy.DummyCache'}},
+    'RSS_METRICS_ENABLED': False,
+    'RSS_SERVER_TIMING': False,
+}
+# 저장 벤치마크 엔트리 번호 시작점 (코퍼스 엔트리 링크 story-<번호> 와 구분)
+SAVE_NUMBER_START = 10 ** 9
+
+
+def percentile(sorted_values, q):
+    """정렬된 값의 q 분위수 (최근접 순위)"""
+    if not sorted_values:
+        return None
+    return sorted_values[max(0, math.ceil(q * len(sorted_values)) - 1)]
+
+
+def summarize(name, size, timings_ns, ops, queries=None):
+    """
+    호출별 소요 시간(ns) 목록을 결과 항목으로
+
+    처리량은 ops(엔트리/요청) 기준, p50/p99 와 쿼리 수는 호출(저장이면
+    배치 하나) 기준이다.
+    """
+    timings = sorted(timings_ns)
+    seconds = sum(timings) / 1e9
+    return {
+        'bench': name,
+        'size': size,
+        'ops': ops,
+        'calls': len(timings),
+        'seconds': round(seconds, 4),
+        'throughput': round(ops / seconds, 1) if seconds else None,
+        'p50_ms': round(percentile(timings, 0.50) / 1e6, 4),
+        'p99_ms': round(percentile(timings, 0.99) / 1e6, 4),
+        'queries_per_call': round(queries / len(timings), 2) if queries is not None else None,
+    }
+
+
+def timed(func, items):
+    """items 마다 func 을 실행한 소요 시간(ns) 목록"""
+    clock = time.perf_counter_ns
+    timings = []
+    for item in items:
+        started = clock()
+        func(item)
+        timings.append(clock() - started)
+    return timings
+
+
+def seed_corpus(corpus, current, size):
+    """코퍼스를 size 엔트리가 될 때까지 COPY 로 채움 (current 번부터 이어서 생성)"""
+    load_corpus(corpus, size - current, start=current, logs=(size - current) // 20)
+    return {
+        index: RSSFeed.objects.get(url=feed_row['url'])
+        for index, feed_row in enumerate(corpus.feed_rows())
+    }
+
+
+def bench_parsing(corpus, size, sample):
+    """정제/키워드/엔트리 처리 (DB 미사용)"""
+    raw = [corpus.raw_entry(row) for row in corpus.entry_rows(min(size, sample))]
+    texts = [f"{row['title']} {row['description']}" for row in raw]
+    return [
+        summarize('clean_text', size, timed(clean_text, [row['description'] for row in raw]), len(raw)),
+        summarize('extract_keywords', size, timed(extract_keywords, texts), len(raw)),
+        summarize('process_entry', size, timed(process_entry, raw), len(raw)),
+    ]
+
+
+def bench_save(corpus, size, feeds, batches, batch_size):
+    """새 엔트리 batch_size 개씩 batches 번 저장"""
+    service = RSSCrawlerService()
+    rows = corpus.entry_rows(batches * batch_size, start=SAVE_NUMBER_START + size)
+    feed_list = list(feeds.values())
+    timings = []
+    queries = 0
+    for number in range(batches):
+        entries = [process_entry(corpus.raw_entry(row)) for _, row in zip(range(batch_size), rows)]
+        feed = feed_list[number % len(feed_list)]
+        with QueryBudget('save_entries_to_db') as budget:
+            started = time.perf_counter_ns()
+            service.save_entries_to_db(feed, entries)
+            timings.append(time.perf_counter_ns() - started)
+        queries += budget.count
+    return [summarize('save_entries_to_db', size, timings, batches * batch_size, queries)]
+
+
+def bench_views(size, feeds, requests):
+    """필터 조합을 돌아가며 API 요청"""
+    client = Client()
+    feed_id = next(iter(feeds.values())).pk
+    cases = {
+        'RSSEntriesAPIView': (
+            '/api/entries/',
+            [{}, {'keyword': 'AI'}, {'feed': feed_id}, {'period': 'this_week'}, {'keyword': 'cloud', 'period': 'this_month'}],
+        ),
+        'RSSSummaryView': ('/api/summary/', [{}]),
+    }
+    results = []
+    for name, (url, variants) in cases.items():
+        client.get(url, variants[0])  # 연결/URL 해석 준비
+        timings = []
+        queries = 0
+        for number in range(requests):
+            with QueryBudget(name) as budget:
+                started = time.perf_counter_ns()
+                response = client.get(url, variants[number % len(variants)])
+                timings.append(time.perf_counter_ns() - started)
+            if response.status_code != 200:
+                raise SystemExit(f"{url} returned {response.status_code}: {response.content[:200]!r}")
+            queries += budget.count
+        results.append(summarize(name, size, timings, requests, queries))
+    return results
+
+
+def compare(results, baseline, threshold):
+    """
+    기준 결과와 비교
+
+    Returns:
+        (항목 이름, 지표, 기준 값, 현재 값) 회귀 목록
+    """
+    base = {(row['bench'], row['size']): row for row in baseline.get('results', [])}
+    regressions = []
+    for row in results:
+        before = base.get((row['bench'], row['size']))
+        if before is None:
+            continue
+        name = f"{row['bench']}@{row['size']}"
+        if before['p99_ms'] and row['p99_ms'] > before['p99_ms'] * (1 + threshold):
+            regressions.append((name, 'p99_ms', before['p99_ms'], row['p99_ms']))
+        if before['throughput'] and row['throughput'] < before['throughput'] / (1 + threshold):
+            regressions.append((name, 'throughput', before['throughput'], row['throughput']))
+        if before['queries_per_call'] is not None and row['queries_per_call'] > before['queries_per_call']:
+            regressions.append((name, 'queries_per_call', before['queries_per_call'], row['queries_per_call']))
+    return regressions
+
+
+def git_revision():
+    try:
+        return subprocess.check_output(
+            ['git', 'rev-parse', '--short', 'HEAD'], cwd=BENCH_DIR, stderr=subprocess.DEVNULL
+        ).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', default='10000,100000,1000000', help='코퍼스 엔트리 수 목록 (쉼표 구분)')
+    parser.add_argument('--seed', type=int, default=42, help='합성 코퍼스 시드')
+    parser.add_argument('--feeds', type=int, default=50, help='피드 수')
+    parser.add_argument('--parse-sample', type=int, default=1000000, help='정제/키워드 벤치마크 최대 엔트리 수')
+    parser.add_argument('--save-batches', type=int, default=20, help='저장 벤치마크 배치 수')
+    parser.add_argument('--batch-size', type=int, default=50, help='저장 배치당 엔트리 수')
+    parser.add_argument('--requests', type=int, default=50, help='뷰별 요청 수')
+    parser.add_argument('--output', default=os.path.join('var', 'bench', 'results.json'), help='결과 JSON 경로')
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE, help='비교할 기준 결과 JSON')
+    parser.add_argument('--threshold', type=float, default=0.25, help='회귀로 볼 p99/처리량 악화 비율')
+    parser.add_argument('--save-baseline', action='store_true', help='이번 결과를 기준 결과로 저장')
+    parser.add_argument('--keepdb', action='store_true', help='벤치마크 DB 를 지우지 않고 재사용')
+    args = parser.parse_args()
+
+    sizes = sorted(int(size) for size in args.sizes.split(','))
+    corpus = SyntheticCorpus(seed=args.seed, feeds=args.feeds)
+    old_name = connection.creation.create_test_db(verbosity=0, autoclobber=True, keepdb=args.keepdb, serialize=False)
+    with connection.cursor() as cursor:
+        cursor.execute('SHOW server_version')
+        server_version = cursor.fetchone()[0]
+    results = []
+    try:
+        with override_settings(**BENCH_SETTINGS):
+            for size in sizes:
+                started = time.perf_counter()
+                # --keepdb 로 재사용한 DB 면 이미 있는 코퍼스 엔트리 다음부터 채움
+                current = RSSEntry.objects.filter(link__regex=r'/story-\d{1,9}$').count()
+                feeds = seed_corpus(corpus, current, size) if current < size else {
+                    index: RSSFeed.objects.get(url=row['url']) for index, row in enumerate(corpus.feed_rows())
+                }
+                print(f"corpus: {size} entries ({time.perf_counter() - started:.1f}s to load)")
+                rows = (
+                    bench_parsing(corpus, size, args.parse_sample)
+                    + bench_save(corpus, size, feeds, args.save_batches, args.batch_size)
+                    + bench_views(size, feeds, args.requests)
+                )
+                for row in rows:
+                    print(
+                        f"  {row['bench']:<20} {row['ops']:>9} ops {row['throughput'] or 0:>12.1f}/s "
+                        f"p50 {row['p50_ms']:>9.3f}ms p99 {row['p99_ms']:>9.3f}ms "
+                        f"queries/call {row['queries_per_call'] if row['queries_per_call'] is not None else '-'}"
+                    )
+                results += rows
+    finally:
+        if not args.keepdb:
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+
+    report = {
+        'meta': {
+            'created_at': datetime.now(timezone.utc).isoformat(),
+            'revision': git_revision(),
+            'python': platform.python_version(),
+            'postgresql': server_version,
+            'seed': args.seed,
+            'feeds': args.feeds,
+        },
+        'results': results,
+    }
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f"results: {args.output}")
+
+    if args.save_baseline:
+        with open(args.baseline, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"baseline saved: {args.baseline}")
+        return
+
+    if not os.path.exists(args.baseline):
+        print(f"no baseline at {args.baseline} (run with --save-baseline to create one)")
+        return
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    regressions = compare(results, baseline, args.threshold)
+    print(f"compared with baseline {baseline['meta'].get('revision')} ({baseline['meta'].get('created_at')})")
+    for name, metric, before, after in regressions:
+        print(f"  REGRESSION {name} {metric}: {before} -> {after}")
+    if regressions:
+        sys.exit(1)
+    print("  no regressions")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,76 @@
+"""
+파싱/정제 단계 프로세스 풀 벤치마크
+
+로컬 RSS 픽스처 파일로 만든 코퍼스를 워커 수를 바꿔 가며 파싱하고
+처리량과 직렬 대비 속도 향상을 출력한다. 네트워크/DB 를 사용하지 않는다.
+
+    python benchmarks/bench_parse_pool.py --feeds 400
+"""
+import argparse
+import glob
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from crawler.parsing import parse_feeds_parallel  # noqa: E402
+
+DEFAULT_FIXTURES = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'tests', 'fixtures')
+
+
+def load_corpus(fixtures_dir, feeds):
+    """픽스처 파일들을 반복해 feeds 개의 피드 원문 코퍼스를 만듦"""
+    paths = sorted(glob.glob(os.path.join(fixtures_dir, '*.xml')))
+    if not paths:
+        raise SystemExit(f"No RSS fixtures found in {fixtures_dir}")
+    bodies = []
+    for path in paths:
+        with open(path, 'rb') as f:
+            bodies.append(f.read())
+    return [bodies[i % len(bodies)] for i in range(feeds)]
+
+
+def worker_counts(max_workers):
+    counts = []
+    n = 1
+    while n < max_workers:
+        counts.append(n)
+        n *= 2
+    counts.append(max_workers)
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--fixtures', default=DEFAULT_FIXTURES, help='RSS 픽스처 디렉터리')
+    parser.add_argument('--feeds', type=int, default=400, help='코퍼스 피드 수')
+    parser.add_argument('--max-workers', type=int, default=os.cpu_count() or 1, help='최대 워커 수')
+    parser.add_argument('--repeat', type=int, default=3, help='워커 수별 반복 횟수 (최솟값 사용)')
+    args = parser.parse_args()
+
+    corpus = load_corpus(args.fixtures, args.feeds)
+    corpus_mb = sum(len(body) for body in corpus) / 1024 / 1024
+    print(f"corpus: {len(corpus)} feeds, {corpus_mb:.1f} MB, cpus: {os.cpu_count()}")
+    print(f"{'workers':>8} {'seconds':>9} {'feeds/s':>9} {'entries/s':>10} {'speedup':>8} {'efficiency':>10}")
+
+    baseline = None
+    for workers in worker_counts(args.max_workers):
+        best = None
+        for _ in range(args.repeat):
+            started = time.perf_counter()
+            results = parse_feeds_parallel(corpus, max_workers=workers)
+            elapsed = time.perf_counter() - started
+            best = elapsed if best is None else min(best, elapsed)
+
+        entries = sum(len(result) for result in results if isinstance(result, list))
+        baseline = baseline or best
+        speedup = baseline / best
+        print(
+            f"{workers:>8} {best:>9.3f} {len(corpus) / best:>9.1f} {entries / best:>10.0f} "
+            f"{speedup:>7.2f}x {speedup / workers:>9.0%}"
+        )
+
+
+if __name__ == '__main__':
+    main()
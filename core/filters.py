@@ -0,0 +1,142 @@
+"""
+엔트리 목록 필터와 패싯 집계
+
+목록 화면/API 가 같은 필터 조건을 쓰도록 조건을 한곳에서 만들고, 필터
+UI 에 보여줄 선택지별 건수(패싯)를 한 번의 SQL 로 집계한다.
+"""
+import hashlib
+import json
+from datetime import datetime
+from typing import Dict, Mapping
+
+from django.conf import settings
+from django.db import connection
+from django.db.models import BooleanField, ExpressionWrapper, Q, Value
+from django.utils import timezone
+
+from .fragments import cached_fragment
+from .models import RSSEntry, RSSFeed
+from .periods import PERIODS, period_q
+
+
+def entry_filter_conditions(params: Mapping[str, str], now: datetime = None) -> Dict[str, Q]:
+    """
+    요청 파라미터의 차원별 필터 조건
+
+    Args:
+        params: feed, period, keyword 를 담은 쿼리 파라미터
+        now: 기간 계산 기준 시각 (기본값: 현재)
+
+    Returns:
+        {'feed': Q, 'period': Q, 'keyword': Q} (지정되지 않은 차원은 빈 Q)
+    """
+    feed_id = params.get('feed')
+    keyword = params.get('keyword')
+    return {
+        'feed': Q(feed_id=feed_id) if feed_id else Q(),
+        'period': period_q(params.get('period'), now),
+        'keyword': Q(keywords__icontains=keyword) if keyword else Q(),
+    }
+
+
+def filter_entries(queryset, params: Mapping[str, str]):
+    """엔트리 쿼리셋에 요청 파라미터의 필터를 모두 적용"""
+    for condition in entry_filter_conditions(params).values():
+        queryset = queryset.filter(condition)
+    return queryset
+
+
+def _flag(condition: Q):
+    """조건을 SELECT 절의 boolean 컬럼으로 (빈 조건은 항상 참)"""
+    if not condition:
+        return Value(True, output_field=BooleanField())
+    return ExpressionWrapper(condition, output_field=BooleanField())
+
+
+def facets_cache_key(params: Mapping[str, str], keyword_limit: int) -> str:
+    """필터 조합별 캐시 키 (파라미터 순서, 관계없는 파라미터는 무시)"""
+    signature = json.dumps(
+        [params.get('feed') or '', params.get('period') or '', params.get('keyword') or '', keyword_limit]
+    )
+    return hashlib.sha1(signature.encode('utf-8')).hexdigest()
+
+
+def entry_facets(params: Mapping[str, str], keyword_limit: int = 10) -> dict:
+    """
+    현재 필터 조합에서 선택지별 엔트리 수
+
+    각 차원의 건수는 그 차원을 제외한 나머지 필터를 적용해 센다 (피드를
+    바꾸면 몇 건이 나오는지). 필터 플래그를 붙인 엔트리를 CTE 로 한 번
+    읽고 피드(제목 포함)/기간/키워드/전체 집계를 UNION ALL 로 묶어 한 번에
+    실행하며, 결과는 인제스트 버전과 필터 조합별로 RSS_FACETS_CACHE_SECONDS
+    동안 캐시한다.
+
+    Args:
+        params: feed, period, keyword 를 담은 쿼리 파라미터
+        keyword_limit: 키워드 패싯 수
+
+    Returns:
+        total, feeds, periods, keywords 건수
+    """
+    return cached_fragment(
+        'entry_facets', lambda: _build_facets(params, keyword_limit),
+        facets_cache_key(params, keyword_limit),
+        timeout=getattr(settings, 'RSS_FACETS_CACHE_SECONDS', 60)
+    )
+
+
+def _build_facets(params: Mapping[str, str], keyword_limit: int) -> dict:
+    now = timezone.now()
+    conditions = entry_filter_conditions(params, now)
+    base = RSSEntry.objects.annotate(
+        f_ok=_flag(conditions['feed']),
+        p_ok=_flag(conditions['period']),
+        k_ok=_flag(conditions['keyword']),
+        **{f'in_{period}': _flag(period_q(period, now)) for period, _ in PERIODS}
+    ).order_by().values('feed_id', 'keywords', 'f_ok', 'p_ok', 'k_ok', *[f'in_{period}' for period, _ in PERIODS])
+    base_sql, base_params = base.query.sql_with_params()
+
+    buckets = ', '.join(f"('{period}', base.in_{period})" for period, _ in PERIODS)
+    sql = f"""
+        WITH base AS ({base_sql})
+        SELECT 'total' AS facet, '' AS value, '' AS label, COUNT(*) AS count
+        FROM base WHERE f_ok AND p_ok AND k_ok
+        UNION ALL
+        SELECT 'feed', base.feed_id::text, MAX(feed.title), COUNT(*)
+        FROM base JOIN {RSSFeed._meta.db_table} AS feed ON feed.id = base.feed_id
+        WHERE p_ok AND k_ok GROUP BY base.feed_id
+        UNION ALL
+        SELECT 'period', bucket.name, '', COUNT(*)
+        FROM base CROSS JOIN LATERAL (VALUES {buckets}) AS bucket (name, hit)
+        WHERE bucket.hit AND f_ok AND k_ok GROUP BY bucket.name
+        UNION ALL
+        (
+            SELECT 'keyword', keyword, '', COUNT(*)
+            FROM base CROSS JOIN LATERAL json_array_elements_text(rss_keywords_json(base.keywords)) AS keyword
+            WHERE f_ok AND p_ok GROUP BY keyword ORDER BY COUNT(*) DESC, keyword LIMIT %s
+        )
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(sql, (*base_params, keyword_limit))
+        rows = cursor.fetchall()
+
+    total, feeds, periods, keywords = 0, [], {}, []
+    for facet, value, label, count in rows:
+        if facet == 'total':
+            total = count
+        elif facet == 'feed':
+            feeds.append({'id': int(value), 'title': label, 'count': count})
+        elif facet == 'period':
+            periods[value] = count
+        else:
+            keywords.append({'value': value, 'count': count})
+
+    return {
+        'total': total,
+        'feeds': sorted(feeds, key=lambda item: (-item['count'], item['id'])),
+        'periods': [
+            {'value': period, 'label': label, 'count': periods.get(period, 0)}
+            for period, label in PERIODS
+        ],
+        'keywords': keywords,
+    }
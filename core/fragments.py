@@ -0,0 +1,146 @@
+"""
+버전 기반 프래그먼트 캐시
+
+화면 내용은 크롤링(인제스트)이 커밋될 때만 바뀌므로, 통계/최근 목록/
+키워드 같은 조각의 캐시 키에 전역 인제스트 버전을 넣는다. 크롤러가 커밋
+후 버전을 올리면 이전 조각은 더 이상 조회되지 않고 TTL 로 사라진다.
+
+캐시 장애 시에는 캐시 없이 바로 계산한다 (화면은 계속 동작).
+조각별 hit/miss 는 캐시 카운터에 누적해 fragment_stats() 로 노출한다.
+"""
+import logging
+from typing import Any, Callable, Dict
+
+import redis
+from django.conf import settings
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+INGEST_VERSION_KEY = 'ingest:version'
+STATS_KEY_PREFIX = 'fragment-stats:'
+
+# 캐시하는 조각 이름 (통계 노출 대상)
+FRAGMENTS = (
+    'home_stats',
+    'home_recent_entries',
+    'dashboard_recent_entries',
+    'dashboard_stats',
+    'dashboard_keywords',
+    'feed_recent_entries',
+    'feed_processing_logs',
+    'entry_facets',
+    'entry_page',
+    'log_stats',
+    'log_stage_percentiles',
+)
+
+CACHE_ERRORS = (redis.RedisError, OSError)
+
+
+def ingest_version() -> int:
+    """현재 인제스트 버전 (캐시를 쓸 수 없으면 0)"""
+    try:
+        version = cache.get(INGEST_VERSION_KEY)
+        if version is None:
+            cache.add(INGEST_VERSION_KEY, 1, timeout=None)
+            version = cache.get(INGEST_VERSION_KEY, 1)
+        return version
+    except CACHE_ERRORS as e:
+        logger.warning("Fragment cache unavailable: %s", e)
+        return 0
+
+
+def bump_ingest_version() -> int:
+    """
+    인제스트 버전을 올려 모든 버전 기반 조각을 무효화
+
+    크롤러가 저장을 커밋한 뒤(transaction.on_commit) 호출한다.
+
+    Returns:
+        새 버전 (캐시를 쓸 수 없으면 0)
+    """
+    try:
+        try:
+            return cache.incr(INGEST_VERSION_KEY)
+        except ValueError:
+            cache.add(INGEST_VERSION_KEY, 1, timeout=None)
+            return cache.get(INGEST_VERSION_KEY, 1)
+    except CACHE_ERRORS as e:
+        logger.warning("Failed to bump ingest version: %s", e)
+        return 0
+
+
+def _count(name: str, outcome: str):
+    key = f"{STATS_KEY_PREFIX}{name}:{outcome}"
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.add(key, 1, timeout=None)
+
+
+def cached_fragment(
+    name: str,
+    build: Callable[[], Any],
+    *key_parts,
+    version: int = None,
+    versioned: bool = True,
+    timeout: int = None,
+) -> Any:
+    """
+    조각을 캐시에서 가져오거나 계산해 저장
+
+    Args:
+        name: 조각 이름 (FRAGMENTS 중 하나)
+        build: 캐시에 없을 때 값을 계산하는 함수
+        key_parts: 조각 키에 덧붙일 값 (피드 ID, 날짜, updated_at 등)
+        version: 인제스트 버전 (기본값: 현재 버전, 같은 요청의 여러 조각은 한 번 읽어 전달)
+        versioned: False 면 인제스트 버전 없이 key_parts 만으로 키 구성 (updated_at 기반 페이지)
+        timeout: 캐시 시간(초) (기본값: RSS_FRAGMENT_CACHE_SECONDS)
+
+    Returns:
+        조각 값
+    """
+    if versioned and version is None:
+        version = ingest_version()
+    prefix = ['fragment', name, f'v{version}'] if versioned else ['fragment', name]
+    key = ':'.join([*prefix, *map(str, key_parts)])
+    timeout = timeout or getattr(settings, 'RSS_FRAGMENT_CACHE_SECONDS', 600)
+
+    try:
+        value = cache.get(key)
+        if value is not None:
+            _count(name, 'hit')
+            return value
+        _count(name, 'miss')
+    except CACHE_ERRORS as e:
+        logger.warning("Fragment cache unavailable: %s", e)
+        return build()
+
+    value = build()
+    try:
+        cache.set(key, value, timeout)
+    except CACHE_ERRORS as e:
+        logger.warning("Failed to store fragment %s: %s", name, e)
+    return value
+
+
+def fragment_stats() -> Dict[str, Dict[str, Any]]:
+    """
+    조각별 누적 hit/miss 와 적중률
+
+    Returns:
+        {조각 이름: {'hits', 'misses', 'hit_rate'}}
+    """
+    keys = [f"{STATS_KEY_PREFIX}{name}:{outcome}" for name in FRAGMENTS for outcome in ('hit', 'miss')]
+    counters = cache.get_many(keys)
+    stats = {}
+    for name in FRAGMENTS:
+        hits = counters.get(f"{STATS_KEY_PREFIX}{name}:hit", 0)
+        misses = counters.get(f"{STATS_KEY_PREFIX}{name}:miss", 0)
+        stats[name] = {
+            'hits': hits,
+            'misses': misses,
+            'hit_rate': round(hits / (hits + misses), 4) if hits + misses else None,
+        }
+    return stats
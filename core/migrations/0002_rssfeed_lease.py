@@ -0,0 +1,40 @@
+# Generated by Django 4.2.7 on 2026-10-19 02:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="rssfeed",
+            name="heartbeat_at",
+            field=models.DateTimeField(
+                blank=True, null=True, verbose_name="마지막 하트비트"
+            ),
+        ),
+        migrations.AddField(
+            model_name="rssfeed",
+            name="lease_expires_at",
+            field=models.DateTimeField(
+                blank=True, null=True, verbose_name="리스 만료 시간"
+            ),
+        ),
+        migrations.AddField(
+            model_name="rssfeed",
+            name="lease_owner",
+            field=models.CharField(
+                blank=True, max_length=200, verbose_name="리스 소유 워커"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="rssfeed",
+            index=models.Index(
+                fields=["is_active", "last_crawled_at"], name="rssfeed_due_idx"
+            ),
+        ),
+    ]
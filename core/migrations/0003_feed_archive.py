@@ -0,0 +1,93 @@
+# Generated by Django 4.2.7 on 2026-10-19 02:45
+
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0002_rssfeed_lease"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="FeedBody",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "content_hash",
+                    models.CharField(
+                        max_length=64, unique=True, verbose_name="내용 해시"
+                    ),
+                ),
+                ("data", models.BinaryField(verbose_name="압축된 원문")),
+                ("size", models.PositiveIntegerField(verbose_name="원문 크기(바이트)")),
+                (
+                    "created_at",
+                    models.DateTimeField(auto_now_add=True, verbose_name="생성일"),
+                ),
+            ],
+            options={
+                "verbose_name": "피드 원문",
+                "verbose_name_plural": "피드 원문들",
+            },
+        ),
+        migrations.CreateModel(
+            name="FeedSnapshot",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "fetched_at",
+                    models.DateTimeField(
+                        default=django.utils.timezone.now, verbose_name="수집 시각"
+                    ),
+                ),
+                (
+                    "body",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.PROTECT,
+                        related_name="snapshots",
+                        to="core.feedbody",
+                        verbose_name="원문",
+                    ),
+                ),
+                (
+                    "feed",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="snapshots",
+                        to="core.rssfeed",
+                        verbose_name="RSS 피드",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "피드 스냅샷",
+                "verbose_name_plural": "피드 스냅샷들",
+                "ordering": ["-fetched_at"],
+                "indexes": [
+                    models.Index(
+                        fields=["feed", "fetched_at"], name="feedsnapshot_feed_idx"
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 4.2.7 on 2026-10-19 02:47
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0003_feed_archive"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="TermDocumentFrequency",
+            fields=[
+                (
+                    "term",
+                    models.CharField(
+                        max_length=50,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="용어",
+                    ),
+                ),
+                (
+                    "document_count",
+                    models.BigIntegerField(default=0, verbose_name="문서 빈도"),
+                ),
+            ],
+            options={
+                "verbose_name": "용어 문서 빈도",
+                "verbose_name_plural": "용어 문서 빈도들",
+            },
+        ),
+    ]
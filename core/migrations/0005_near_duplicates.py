@@ -0,0 +1,65 @@
+# Generated by Django 4.2.7 on 2026-10-19 02:49
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0004_term_document_frequency"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="rssentry",
+            name="canonical_entry",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="duplicates",
+                to="core.rssentry",
+                verbose_name="대표 엔트리",
+            ),
+        ),
+        migrations.AddField(
+            model_name="rssentry",
+            name="minhash",
+            field=models.BinaryField(
+                blank=True, null=True, verbose_name="MinHash 시그니처"
+            ),
+        ),
+        migrations.CreateModel(
+            name="RSSEntryLSHBand",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("band", models.SmallIntegerField(verbose_name="밴드 번호")),
+                ("bucket", models.BigIntegerField(verbose_name="버킷 해시")),
+                (
+                    "entry",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="lsh_bands",
+                        to="core.rssentry",
+                        verbose_name="RSS 엔트리",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "LSH 밴드",
+                "verbose_name_plural": "LSH 밴드들",
+                "indexes": [
+                    models.Index(fields=["band", "bucket"], name="lshband_bucket_idx")
+                ],
+            },
+        ),
+    ]
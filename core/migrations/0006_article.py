@@ -0,0 +1,73 @@
+# Generated by Django 4.2.7 on 2026-10-19 02:51
+
+import core.models
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0005_near_duplicates"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Article",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "canonical_url",
+                    models.URLField(
+                        max_length=500, unique=True, verbose_name="정규화된 URL"
+                    ),
+                ),
+                ("title", models.CharField(max_length=500, verbose_name="제목")),
+                ("description", models.TextField(blank=True, verbose_name="설명")),
+                (
+                    "author",
+                    models.CharField(blank=True, max_length=200, verbose_name="작성자"),
+                ),
+                ("published_at", models.DateTimeField(verbose_name="발행일")),
+                (
+                    "keywords",
+                    models.TextField(blank=True, default="[]", verbose_name="키워드"),
+                ),
+                ("summary", models.TextField(blank=True, verbose_name="요약")),
+                (
+                    "created_at",
+                    models.DateTimeField(auto_now_add=True, verbose_name="생성일"),
+                ),
+                (
+                    "updated_at",
+                    models.DateTimeField(auto_now=True, verbose_name="수정일"),
+                ),
+            ],
+            options={
+                "verbose_name": "기사",
+                "verbose_name_plural": "기사들",
+                "ordering": ["-published_at"],
+            },
+            bases=(core.models.KeywordsMixin, models.Model),
+        ),
+        migrations.AddField(
+            model_name="rssentry",
+            name="article",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="appearances",
+                to="core.article",
+                verbose_name="기사",
+            ),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.7 on 2026-10-19 03:01
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0006_article"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="rssentry",
+            index=models.Index(fields=["published_at"], name="rssentry_published_idx"),
+        ),
+    ]
@@ -0,0 +1,46 @@
+# Generated by Django 4.2.7 on 2026-10-19 03:06
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0007_entry_published_index"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DailySummary",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("date", models.DateField(unique=True, verbose_name="날짜")),
+                (
+                    "total_entries",
+                    models.IntegerField(default=0, verbose_name="엔트리 수"),
+                ),
+                (
+                    "top_keywords",
+                    models.JSONField(default=list, verbose_name="상위 키워드"),
+                ),
+                ("top_feeds", models.JSONField(default=list, verbose_name="상위 피드")),
+                (
+                    "generated_at",
+                    models.DateTimeField(auto_now=True, verbose_name="생성 시각"),
+                ),
+            ],
+            options={
+                "verbose_name": "일일 요약",
+                "verbose_name_plural": "일일 요약들",
+                "ordering": ["-date"],
+            },
+        ),
+    ]
@@ -0,0 +1,69 @@
+# Generated by Django 4.2.7 on 2026-10-19 03:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0008_daily_summary"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="rssprocessinglog",
+            name="db_ms",
+            field=models.FloatField(
+                blank=True, null=True, verbose_name="DB 저장 시간(ms)"
+            ),
+        ),
+        migrations.AddField(
+            model_name="rssprocessinglog",
+            name="db_queries",
+            field=models.PositiveIntegerField(
+                blank=True, null=True, verbose_name="DB 쿼리 수"
+            ),
+        ),
+        migrations.AddField(
+            model_name="rssprocessinglog",
+            name="enrich_ms",
+            field=models.FloatField(
+                blank=True, null=True, verbose_name="키워드/중복 처리 시간(ms)"
+            ),
+        ),
+        migrations.AddField(
+            model_name="rssprocessinglog",
+            name="fetch_ms",
+            field=models.FloatField(
+                blank=True, null=True, verbose_name="가져오기 시간(ms)"
+            ),
+        ),
+        migrations.AddField(
+            model_name="rssprocessinglog",
+            name="http_status",
+            field=models.PositiveSmallIntegerField(
+                blank=True, null=True, verbose_name="HTTP 상태"
+            ),
+        ),
+        migrations.AddField(
+            model_name="rssprocessinglog",
+            name="parse_ms",
+            field=models.FloatField(
+                blank=True, null=True, verbose_name="파싱 시간(ms)"
+            ),
+        ),
+        migrations.AddField(
+            model_name="rssprocessinglog",
+            name="peak_rss_delta_kb",
+            field=models.PositiveIntegerField(
+                blank=True, null=True, verbose_name="최대 RSS 증가량(KB)"
+            ),
+        ),
+        migrations.AddField(
+            model_name="rssprocessinglog",
+            name="response_bytes",
+            field=models.PositiveIntegerField(
+                blank=True, null=True, verbose_name="응답 크기(바이트)"
+            ),
+        ),
+    ]
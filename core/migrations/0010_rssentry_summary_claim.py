@@ -0,0 +1,20 @@
+# Generated by Django 4.2.7 on 2026-10-19 03:54
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0009_processing_log_stage_metrics"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="rssentry",
+            name="summary_claimed_at",
+            field=models.DateTimeField(
+                blank=True, null=True, verbose_name="요약 선점 시간"
+            ),
+        ),
+    ]
@@ -0,0 +1,49 @@
+import ast
+import json
+
+from django.db import migrations
+
+
+def _normalize(value):
+    """JSON 배열 문자열이면 None, 아니면 변환한 JSON 문자열 (파이썬 repr 리스트 포함)"""
+    try:
+        if isinstance(json.loads(value), list):
+            return None
+    except (json.JSONDecodeError, TypeError):
+        pass
+    try:
+        keywords = ast.literal_eval(value)
+    except (ValueError, SyntaxError, TypeError):
+        return '[]'
+    if not isinstance(keywords, (list, tuple)):
+        return '[]'
+    return json.dumps([str(keyword) for keyword in keywords])
+
+
+def normalize_keywords(apps, schema_editor):
+    """이전 버전이 str(list) 로 저장한 키워드를 JSON 배열로 변환"""
+    for model_name in ('Article', 'RSSEntry'):
+        model = apps.get_model('core', model_name)
+        # 정상 JSON 배열은 '["' 또는 '[]' 로 시작
+        legacy = model.objects.exclude(keywords__startswith='["').exclude(keywords='[]')
+        batch = []
+        for obj in legacy.only('pk', 'keywords').iterator(chunk_size=2000):
+            keywords = _normalize(obj.keywords)
+            if keywords is not None:
+                obj.keywords = keywords
+                batch.append(obj)
+            if len(batch) >= 2000:
+                model.objects.bulk_update(batch, ['keywords'])
+                batch = []
+        model.objects.bulk_update(batch, ['keywords'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0010_rssentry_summary_claim"),
+    ]
+
+    operations = [
+        migrations.RunPython(normalize_keywords, migrations.RunPython.noop),
+    ]
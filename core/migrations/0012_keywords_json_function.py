@@ -0,0 +1,35 @@
+from django.db import migrations
+
+# 키워드 집계 SQL 에서 쓰는 캐스트: JSON 배열 문자열이 아니면 빈 배열
+#
+# 큰 테이블에서는 병렬 계획이 선택되므로 함수는 PARALLEL SAFE 여야 하고,
+# 그래서 서브트랜잭션을 여는 plpgsql EXCEPTION 블록을 쓰지 않는다.
+# PostgreSQL 16 이상은 pg_input_is_valid 로 깨진 JSON 도 걸러내고, 그 이전
+# 버전은 0011 에서 정규화한 데이터(json.dumps 로만 저장)를 전제로 한다.
+KEYWORDS_JSON_FUNCTION = """
+CREATE OR REPLACE FUNCTION rss_keywords_json(value text) RETURNS json AS $$
+    SELECT CASE WHEN {condition} THEN value::json ELSE '[]'::json END
+$$ LANGUAGE sql STABLE PARALLEL SAFE;
+"""
+
+
+def create_function(apps, schema_editor):
+    condition = "value LIKE '[%'"
+    if schema_editor.connection.pg_version >= 160000:
+        condition += " AND pg_input_is_valid(value, 'json')"
+    schema_editor.execute(KEYWORDS_JSON_FUNCTION.format(condition=condition), params=None)
+
+
+def drop_function(apps, schema_editor):
+    schema_editor.execute("DROP FUNCTION IF EXISTS rss_keywords_json(text);", params=None)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0011_normalize_legacy_keywords"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_function, drop_function),
+    ]
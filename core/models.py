@@ -1,7 +1,88 @@
-from django.db import models
+from django.conf import settings
+from django.db import connections, models, transaction
+from django.db.models import F, Q
 from django.utils import timezone
+from datetime import timedelta
+import gzip
+import hashlib
 import json
 
+from .periods import day_range, range_q, time_period_of
+
+
+class RSSFeedQuerySet(models.QuerySet):
+    """RSS 피드 쿼리셋"""
+
+    def due(self, now=None):
+        """크롤링 주기가 지났고 유효한 리스(lease)가 없는 활성 피드"""
+        now = now or timezone.now()
+        interval = getattr(settings, 'RSS_CRAWL_INTERVAL', 3600)
+        crawl_cutoff = now - timedelta(seconds=interval)
+        return self.filter(
+            Q(last_crawled_at__isnull=True) | Q(last_crawled_at__lt=crawl_cutoff),
+            Q(lease_expires_at__isnull=True) | Q(lease_expires_at__lt=now),
+            is_active=True,
+        )
+
+    def claim_due(self, worker_id, limit=10, lease_seconds=None):
+        """
+        크롤링할 피드를 리스로 선점
+
+        SELECT ... FOR UPDATE SKIP LOCKED 로 다른 워커가 잡고 있는 행을
+        건너뛰므로 여러 워커가 동시에 호출해도 같은 피드를 중복으로
+        가져가지 않는다. 리스가 만료된 피드(워커 크래시)는 다시 선점 가능.
+
+        Args:
+            worker_id: 리스 소유자 식별자
+            limit: 한 번에 선점할 최대 피드 수
+            lease_seconds: 리스 유지 시간(초)
+
+        Returns:
+            선점한 피드 목록
+        """
+        lease_seconds = lease_seconds or getattr(settings, 'RSS_FEED_LEASE_SECONDS', 300)
+
+        with transaction.atomic():
+            now = timezone.now()
+            feeds = list(
+                self.due(now)
+                .order_by(F('last_crawled_at').asc(nulls_first=True), 'id')
+                .select_for_update(skip_locked=True)[:limit]
+            )
+            if not feeds:
+                return []
+
+            lease_expires_at = now + timedelta(seconds=lease_seconds)
+            self.filter(pk__in=[feed.pk for feed in feeds]).update(
+                lease_owner=worker_id,
+                lease_expires_at=lease_expires_at,
+                heartbeat_at=now,
+            )
+            for feed in feeds:
+                feed.lease_owner = worker_id
+                feed.lease_expires_at = lease_expires_at
+                feed.heartbeat_at = now
+
+        return feeds
+
+    def renew_leases(self, worker_id, lease_seconds=None):
+        """
+        워커가 소유한 모든 리스 연장 (하트비트)
+
+        한 번에 여러 피드를 선점한 워커는 크롤링 중인 피드뿐 아니라 아직
+        차례가 오지 않은 피드의 리스도 함께 연장해야 다른 워커에게
+        넘어가지 않는다.
+
+        Returns:
+            연장한 리스 수
+        """
+        lease_seconds = lease_seconds or getattr(settings, 'RSS_FEED_LEASE_SECONDS', 300)
+        now = timezone.now()
+        return self.filter(lease_owner=worker_id).update(
+            lease_expires_at=now + timedelta(seconds=lease_seconds),
+            heartbeat_at=now,
+        )
+
 
 class RSSFeed(models.Model):
     """RSS 피드 모델"""
@@ -12,24 +93,132 @@ class RSSFeed(models.Model):
     created_at = models.DateTimeField(auto_now_add=True, verbose_name="생성일")
     updated_at = models.DateTimeField(auto_now=True, verbose_name="수정일")
     last_crawled_at = models.DateTimeField(null=True, blank=True, verbose_name="마지막 크롤링 시간")
+    lease_owner = models.CharField(max_length=200, blank=True, verbose_name="리스 소유 워커")
+    lease_expires_at = models.DateTimeField(null=True, blank=True, verbose_name="리스 만료 시간")
+    heartbeat_at = models.DateTimeField(null=True, blank=True, verbose_name="마지막 하트비트")
+
+    objects = RSSFeedQuerySet.as_manager()
 
     class Meta:
         verbose_name = "RSS 피드"
         verbose_name_plural = "RSS 피드들"
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['is_active', 'last_crawled_at'], name='rssfeed_due_idx'),
+        ]
 
     def __str__(self):
         return self.title
 
+    def release_lease(self, worker_id, retry_after=None):
+        """
+        리스 반납
+
+        Args:
+            worker_id: 리스 소유자 식별자
+            retry_after: 지정 시 해당 시간(초) 동안 다시 선점되지 않도록 유지 (실패 백오프)
+        """
+        lease_expires_at = None
+        if retry_after:
+            lease_expires_at = timezone.now() + timedelta(seconds=retry_after)
+        RSSFeed.objects.filter(pk=self.pk, lease_owner=worker_id).update(
+            lease_owner='',
+            lease_expires_at=lease_expires_at,
+        )
+
     def get_recent_entries(self, days=7):
         """최근 N일간의 엔트리들을 반환"""
-        from datetime import timedelta
         cutoff_date = timezone.now() - timedelta(days=days)
         return self.entries.filter(published_at__gte=cutoff_date)
 
 
-class RSSEntry(models.Model):
-    """RSS 엔트리 모델"""
+class KeywordsMixin:
+    """JSON 문자열로 저장하는 keywords 필드 접근자"""
+
+    def get_keywords(self):
+        """키워드 리스트 반환"""
+        try:
+            return json.loads(self.keywords)
+        except (json.JSONDecodeError, TypeError):
+            return []
+
+    def set_keywords(self, keywords_list):
+        """키워드 리스트 설정"""
+        self.keywords = json.dumps(keywords_list)
+
+    @property
+    def keywords_list(self):
+        """키워드 리스트 프로퍼티"""
+        return self.get_keywords()
+
+
+class Article(KeywordsMixin, models.Model):
+    """
+    정규화된 URL 기준으로 피드 간에 공유하는 기사 모델
+
+    같은 기사가 여러 피드에 실려도 본문(설명), 요약, 키워드는 여기에
+    한 번만 저장하고 피드별 등장(RSSEntry)이 이를 참조한다.
+    """
+    canonical_url = models.URLField(max_length=500, unique=True, verbose_name="정규화된 URL")
+    title = models.CharField(max_length=500, verbose_name="제목")
+    description = models.TextField(blank=True, verbose_name="설명")
+    author = models.CharField(max_length=200, blank=True, verbose_name="작성자")
+    published_at = models.DateTimeField(verbose_name="발행일")
+    keywords = models.TextField(
+        blank=True,
+        default='[]',
+        verbose_name="키워드"
+    )
+    summary = models.TextField(blank=True, verbose_name="요약")
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name="생성일")
+    updated_at = models.DateTimeField(auto_now=True, verbose_name="수정일")
+
+    class Meta:
+        verbose_name = "기사"
+        verbose_name_plural = "기사들"
+        ordering = ['-published_at']
+
+    def __str__(self):
+        return self.title
+
+
+class RSSEntryQuerySet(models.QuerySet):
+    """RSS 엔트리 쿼리셋"""
+
+    def canonical(self):
+        """유사 중복을 제외한 대표 엔트리만 (같은 기사는 한 번만 집계)"""
+        return self.filter(canonical_entry__isnull=True)
+
+    def keyword_counts(self, limit=10):
+        """
+        키워드별 엔트리 수를 DB 에서 집계 (JSON 배열 키워드를 행으로 펼쳐 GROUP BY)
+
+        JSON 배열이 아닌 키워드는 rss_keywords_json (마이그레이션 0012) 이 빈 배열로 바꿔
+        한 행 때문에 집계 전체가 실패하지 않는다.
+
+        Returns:
+            (키워드, 엔트리 수) 목록, 많은 순
+        """
+        sql, params = self.order_by().values('keywords').query.sql_with_params()
+        with connections[self.db].cursor() as cursor:
+            cursor.execute(
+                f"""
+                SELECT keyword, COUNT(*) FROM ({sql}) AS entry
+                CROSS JOIN LATERAL json_array_elements_text(rss_keywords_json(entry.keywords)) AS keyword
+                GROUP BY keyword ORDER BY COUNT(*) DESC, keyword LIMIT %s
+                """,
+                (*params, limit)
+            )
+            return [(keyword, count) for keyword, count in cursor.fetchall()]
+
+
+class RSSEntry(KeywordsMixin, models.Model):
+    """
+    RSS 엔트리 모델 (기사의 피드별 등장)
+
+    article 이 연결된 엔트리는 설명/요약을 Article 에만 저장하고
+    목록 조회에 필요한 제목, 작성자, 발행일, 키워드만 함께 가진다.
+    """
     feed = models.ForeignKey(
         RSSFeed, 
         on_delete=models.CASCADE, 
@@ -48,55 +237,144 @@ class RSSEntry(models.Model):
     )
     summary = models.TextField(blank=True, verbose_name="요약")
     is_processed = models.BooleanField(default=False, verbose_name="처리 완료")
+    summary_claimed_at = models.DateTimeField(null=True, blank=True, verbose_name="요약 선점 시간")
+    article = models.ForeignKey(
+        Article,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='appearances',
+        verbose_name="기사"
+    )
+    minhash = models.BinaryField(null=True, blank=True, verbose_name="MinHash 시그니처")
+    canonical_entry = models.ForeignKey(
+        'self',
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='duplicates',
+        verbose_name="대표 엔트리"
+    )
     created_at = models.DateTimeField(auto_now_add=True, verbose_name="생성일")
     updated_at = models.DateTimeField(auto_now=True, verbose_name="수정일")
 
+    objects = RSSEntryQuerySet.as_manager()
+
     class Meta:
         verbose_name = "RSS 엔트리"
         verbose_name_plural = "RSS 엔트리들"
         ordering = ['-published_at']
         unique_together = ['feed', 'link']
+        indexes = [
+            # 기간 필터는 반열림 published_at 범위로 조회 (core.periods)
+            models.Index(fields=['published_at'], name='rssentry_published_idx'),
+        ]
 
     def __str__(self):
         return self.title
 
     def get_time_period(self):
-        """엔트리의 시간대 분류 (오늘/이번주/이번달)"""
-        now = timezone.now()
-        published_date = self.published_at.date()
-        today = now.date()
-        
-        if published_date == today:
-            return 'today'
-        elif published_date >= today - timezone.timedelta(days=7):
-            return 'this_week'
-        elif published_date >= today - timezone.timedelta(days=30):
-            return 'this_month'
-        else:
-            return 'older'
+        """엔트리의 시간대 분류 (오늘/이번주/이번달, annotate_time_period 결과 우선)"""
+        if hasattr(self, 'time_period'):
+            return self.time_period
+        return time_period_of(self.published_at)
+
+    @property
+    def full_description(self):
+        """기사에 저장된 설명 (기사 미연결 엔트리는 자체 설명)"""
+        if self.article_id:
+            return self.article.description
+        return self.description
+
+    @property
+    def full_summary(self):
+        """기사에 저장된 요약 (기사 미연결 엔트리는 자체 요약)"""
+        if self.article_id:
+            return self.article.summary
+        return self.summary
 
     @property
     def clean_description(self):
         """HTML 태그가 제거된 깨끗한 설명"""
         import re
-        clean_text = re.sub(r'<[^>]+>', '', self.description)
+        clean_text = re.sub(r'<[^>]+>', '', self.full_description)
         return clean_text.strip()
 
-    def get_keywords(self):
-        """키워드 리스트 반환"""
-        try:
-            return json.loads(self.keywords)
-        except (json.JSONDecodeError, TypeError):
-            return []
 
-    def set_keywords(self, keywords_list):
-        """키워드 리스트 설정"""
-        self.keywords = json.dumps(keywords_list)
+class RSSEntryLSHBand(models.Model):
+    """유사 중복 탐지용 LSH 밴드 버킷 (엔트리당 밴드 수만큼)"""
+    entry = models.ForeignKey(
+        RSSEntry,
+        on_delete=models.CASCADE,
+        related_name='lsh_bands',
+        verbose_name="RSS 엔트리"
+    )
+    band = models.SmallIntegerField(verbose_name="밴드 번호")
+    bucket = models.BigIntegerField(verbose_name="버킷 해시")
 
-    @property
-    def keywords_list(self):
-        """키워드 리스트 프로퍼티"""
-        return self.get_keywords()
+    class Meta:
+        verbose_name = "LSH 밴드"
+        verbose_name_plural = "LSH 밴드들"
+        indexes = [
+            models.Index(fields=['band', 'bucket'], name='lshband_bucket_idx'),
+        ]
+
+
+class TermDocumentFrequency(models.Model):
+    """
+    키워드 추출용 용어별 문서 빈도(DF)
+
+    빈 문자열 용어 행은 전체 문서 수를 저장한다.
+    """
+    term = models.CharField(max_length=50, primary_key=True, verbose_name="용어")
+    document_count = models.BigIntegerField(default=0, verbose_name="문서 빈도")
+
+    class Meta:
+        verbose_name = "용어 문서 빈도"
+        verbose_name_plural = "용어 문서 빈도들"
+
+    def __str__(self):
+        return f"{self.term}: {self.document_count}"
+
+
+class Percentile(models.Aggregate):
+    """PostgreSQL percentile_cont 집계 (연속 백분위수, NULL 은 제외)"""
+    function = 'percentile_cont'
+    name = 'Percentile'
+    template = '%(function)s(%(fraction)s) WITHIN GROUP (ORDER BY %(expressions)s)'
+    output_field = models.FloatField()
+
+    def __init__(self, expression, fraction, **extra):
+        super().__init__(expression, fraction=float(fraction), **extra)
+
+
+class RSSProcessingLogQuerySet(models.QuerySet):
+    STAGE_FIELDS = ('fetch_ms', 'parse_ms', 'enrich_ms', 'db_ms')
+
+    def stage_percentiles(self, fractions=(0.5, 0.95)):
+        """
+        피드별 단계 소요 시간 백분위수를 한 번의 GROUP BY 로 집계
+
+        실행하지 않은 단계(None)는 해당 단계 백분위에서만 빠지고, 단계 시간이
+        하나도 없는 로그(단계 지표 도입 전 로그)는 제외한다.
+
+        Args:
+            fractions: 구할 백분위 (0~1)
+
+        Returns:
+            피드별 feed_id, feed__title, crawls, <단계>_p50 / <단계>_p95 ... 목록
+        """
+        percentiles = {
+            f'{field.removesuffix("_ms")}_p{round(fraction * 100)}': Percentile(field, fraction)
+            for field in self.STAGE_FIELDS
+            for fraction in fractions
+        }
+        return list(
+            self.exclude(**{f'{field}__isnull': True for field in self.STAGE_FIELDS})
+            .values('feed_id', 'feed__title')
+            .annotate(crawls=models.Count('pk'), **percentiles)
+            .order_by('feed__title', 'feed_id')
+        )
 
 
 class RSSProcessingLog(models.Model):
@@ -122,8 +400,19 @@ class RSSProcessingLog(models.Model):
     entries_new = models.IntegerField(default=0, verbose_name="새로운 엔트리 수")
     error_message = models.TextField(blank=True, verbose_name="오류 메시지")
     processing_time = models.FloatField(null=True, blank=True, verbose_name="처리 시간(초)")
+    # 크롤링 단계별 지표 (crawler.metrics, 지표 도입 전 로그는 NULL)
+    fetch_ms = models.FloatField(null=True, blank=True, verbose_name="가져오기 시간(ms)")
+    parse_ms = models.FloatField(null=True, blank=True, verbose_name="파싱 시간(ms)")
+    enrich_ms = models.FloatField(null=True, blank=True, verbose_name="키워드/중복 처리 시간(ms)")
+    db_ms = models.FloatField(null=True, blank=True, verbose_name="DB 저장 시간(ms)")
+    response_bytes = models.PositiveIntegerField(null=True, blank=True, verbose_name="응답 크기(바이트)")
+    http_status = models.PositiveSmallIntegerField(null=True, blank=True, verbose_name="HTTP 상태")
+    db_queries = models.PositiveIntegerField(null=True, blank=True, verbose_name="DB 쿼리 수")
+    peak_rss_delta_kb = models.PositiveIntegerField(null=True, blank=True, verbose_name="최대 RSS 증가량(KB)")
     created_at = models.DateTimeField(auto_now_add=True, verbose_name="생성일")
 
+    objects = RSSProcessingLogQuerySet.as_manager()
+
     class Meta:
         verbose_name = "RSS 처리 로그"
         verbose_name_plural = "RSS 처리 로그들"
@@ -131,3 +420,129 @@ class RSSProcessingLog(models.Model):
 
     def __str__(self):
         return f"{self.feed.title} - {self.get_status_display()} ({self.created_at})"
+
+
+class FeedBody(models.Model):
+    """
+    피드 원문 보관 모델
+
+    gzip 으로 압축한 원문을 내용 해시(sha256)로 한 번만 저장한다.
+    내용이 바뀌지 않은 피드를 다시 가져오면 기존 행을 재사용한다.
+    """
+    content_hash = models.CharField(max_length=64, unique=True, verbose_name="내용 해시")
+    data = models.BinaryField(verbose_name="압축된 원문")
+    size = models.PositiveIntegerField(verbose_name="원문 크기(바이트)")
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name="생성일")
+
+    class Meta:
+        verbose_name = "피드 원문"
+        verbose_name_plural = "피드 원문들"
+
+    def __str__(self):
+        return self.content_hash
+
+    @classmethod
+    def store(cls, raw):
+        """원문을 압축해 저장 (같은 내용이 있으면 기존 행 반환)"""
+        content_hash = hashlib.sha256(raw).hexdigest()
+        body = cls.objects.filter(content_hash=content_hash).only('pk', 'content_hash').first()
+        if body is None:
+            body, created = cls.objects.get_or_create(
+                content_hash=content_hash,
+                defaults={'data': gzip.compress(raw), 'size': len(raw)}
+            )
+        return body
+
+    def get_raw(self):
+        """압축 해제한 원문 반환"""
+        return gzip.decompress(bytes(self.data))
+
+
+class FeedSnapshot(models.Model):
+    """피드 수집 기록 (피드, 수집 시각, 원문)"""
+    feed = models.ForeignKey(
+        RSSFeed,
+        on_delete=models.CASCADE,
+        related_name='snapshots',
+        verbose_name="RSS 피드"
+    )
+    body = models.ForeignKey(
+        FeedBody,
+        on_delete=models.PROTECT,
+        related_name='snapshots',
+        verbose_name="원문"
+    )
+    fetched_at = models.DateTimeField(default=timezone.now, verbose_name="수집 시각")
+
+    class Meta:
+        verbose_name = "피드 스냅샷"
+        verbose_name_plural = "피드 스냅샷들"
+        ordering = ['-fetched_at']
+        indexes = [
+            models.Index(fields=['feed', 'fetched_at'], name='feedsnapshot_feed_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.feed.title} ({self.fetched_at})"
+
+
+class DailySummary(models.Model):
+    """
+    일일 요약 모델
+
+    하루(서비스 시간대 기준) 동안 발행된 대표 엔트리의 건수, 상위 키워드,
+    상위 피드를 저장해 두고 대시보드/API 가 지난 날짜도 다시 계산하지 않고
+    조회한다.
+    """
+    date = models.DateField(unique=True, verbose_name="날짜")
+    total_entries = models.IntegerField(default=0, verbose_name="엔트리 수")
+    top_keywords = models.JSONField(default=list, verbose_name="상위 키워드")
+    top_feeds = models.JSONField(default=list, verbose_name="상위 피드")
+    generated_at = models.DateTimeField(auto_now=True, verbose_name="생성 시각")
+
+    class Meta:
+        verbose_name = "일일 요약"
+        verbose_name_plural = "일일 요약들"
+        ordering = ['-date']
+
+    def __str__(self):
+        return f"{self.date} ({self.total_entries})"
+
+    @classmethod
+    def generate(cls, day):
+        """
+        하루치 요약을 DB 집계로 계산해 저장 (이미 있으면 갱신)
+
+        건수, 피드별 건수(피드 JOIN 후 GROUP BY), 키워드별 건수를 각각 한 번의
+        집계 쿼리로 구한다.
+
+        Args:
+            day: 요약할 날짜 (서비스 시간대 기준)
+
+        Returns:
+            저장된 DailySummary
+        """
+        entries = RSSEntry.objects.canonical().filter(range_q(*day_range(day)))
+        top_feeds = (
+            entries.values('feed__title')
+            .annotate(count=models.Count('pk'))
+            .order_by('-count', 'feed__title')[:5]
+        )
+        summary, _ = cls.objects.update_or_create(
+            date=day,
+            defaults={
+                'total_entries': entries.count(),
+                'top_keywords': [list(item) for item in entries.keyword_counts(10)],
+                'top_feeds': [[item['feed__title'], item['count']] for item in top_feeds],
+            }
+        )
+        return summary
+
+    def as_dict(self):
+        """API/태스크 결과용 딕셔너리"""
+        return {
+            'date': self.date,
+            'total_entries': self.total_entries,
+            'top_keywords': self.top_keywords,
+            'top_feeds': self.top_feeds,
+        }
@@ -0,0 +1,66 @@
+"""
+근사 건수 페이지네이터
+
+Django 기본 Paginator 는 페이지마다 필터된 테이블 전체에 COUNT(*) 를
+실행한다. 행이 많으면 이 집계가 목록 페이지 지연 시간을 좌우하므로,
+PostgreSQL 플래너 추정치(pg_class.reltuples / EXPLAIN 행 추정)가 임계값
+이상이면 추정치를 쓰고, 그보다 작으면 정확한 건수를 센다.
+"""
+from django.conf import settings
+from django.core.paginator import Paginator
+from django.db import connections
+from django.utils.functional import cached_property
+
+
+def estimate_count(queryset) -> int:
+    """
+    쿼리셋 행 수의 플래너 추정치
+
+    조건이 없으면 테이블 통계(reltuples)를, 조건이 있으면 EXPLAIN 의 최상위
+    계획 행 수를 사용한다.
+
+    Args:
+        queryset: 건수를 추정할 쿼리셋
+
+    Returns:
+        추정 행 수 (통계가 없으면 EXPLAIN 추정치)
+    """
+    connection = connections[queryset.db]
+    with connection.cursor() as cursor:
+        if not queryset.query.where:
+            cursor.execute(
+                "SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass",
+                [queryset.model._meta.db_table]
+            )
+            row = cursor.fetchone()
+            # 한 번도 ANALYZE 되지 않은 테이블은 -1 (PostgreSQL 14+)
+            if row and row[0] >= 0:
+                return row[0]
+
+        sql, params = queryset.order_by().query.sql_with_params()
+        cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+        plan = cursor.fetchone()[0]
+    return int(plan[0]['Plan']['Plan Rows'])
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    추정치가 임계값(RSS_EXACT_COUNT_THRESHOLD) 이상이면 근사 건수를 쓰는 페이지네이터
+
+    is_estimated 가 True 이면 count / num_pages 는 근사값이다 (화면에 "약" 표시).
+    """
+
+    def __init__(self, *args, exact_threshold: int = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.exact_threshold = exact_threshold or getattr(settings, 'RSS_EXACT_COUNT_THRESHOLD', 10000)
+        self.is_estimated = False
+
+    @cached_property
+    def count(self):
+        if not hasattr(self.object_list, 'query'):
+            return super().count
+        estimate = estimate_count(self.object_list)
+        if estimate < self.exact_threshold:
+            return super().count
+        self.is_estimated = True
+        return estimate
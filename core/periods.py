@@ -0,0 +1,104 @@
+"""
+기간 필터 쿼리 계층
+
+오늘/이번 주/이번 달 기간을 서비스 시간대(settings.TIME_ZONE, Asia/Seoul)
+기준의 반열림 구간 [시작, 끝) 으로 미리 계산해 published_at 범위 조건으로
+만든다. published_at__date 조회처럼 행마다 AT TIME ZONE 변환을 하지 않으므로
+published_at 인덱스의 범위 스캔을 그대로 쓸 수 있다.
+"""
+from datetime import date, datetime, time, timedelta
+from typing import Dict, Optional, Tuple
+
+from django.db.models import CharField, Count, Case, Q, Value, When
+from django.utils import timezone
+
+PERIODS = [
+    ('today', '오늘'),
+    ('this_week', '이번 주'),
+    ('this_month', '이번 달'),
+]
+PERIOD_DAYS = {
+    'today': 0,
+    'this_week': 7,
+    'this_month': 30,
+}
+OLDER = 'older'
+
+
+def local_today(now: datetime = None) -> date:
+    """서비스 시간대 기준 오늘 날짜"""
+    return timezone.localdate(now or timezone.now())
+
+
+def day_start(day: date) -> datetime:
+    """서비스 시간대에서 그 날짜가 시작하는 시각 (aware)"""
+    return timezone.make_aware(datetime.combine(day, time.min))
+
+
+def day_range(day: date) -> Tuple[datetime, datetime]:
+    """그 날짜 하루의 반열림 구간"""
+    return day_start(day), day_start(day + timedelta(days=1))
+
+
+def period_range(period: str, now: datetime = None) -> Optional[Tuple[datetime, datetime]]:
+    """
+    기간 이름의 반열림 구간
+
+    Args:
+        period: 'today', 'this_week', 'this_month'
+        now: 기준 시각 (기본값: 현재)
+
+    Returns:
+        (시작, 끝) aware datetime. 알 수 없는 기간이면 None
+    """
+    if period not in PERIOD_DAYS:
+        return None
+    today = local_today(now)
+    return day_start(today - timedelta(days=PERIOD_DAYS[period])), day_start(today + timedelta(days=1))
+
+
+def range_q(start: datetime, end: datetime, field: str = 'published_at') -> Q:
+    """반열림 구간 [start, end) 조건"""
+    return Q(**{f'{field}__gte': start, f'{field}__lt': end})
+
+
+def period_q(period: str, now: datetime = None) -> Q:
+    """기간 필터 조건 (알 수 없는 기간이면 빈 조건)"""
+    bounds = period_range(period, now)
+    return range_q(*bounds) if bounds else Q()
+
+
+def period_counts(queryset, now: datetime = None) -> Dict[str, int]:
+    """
+    기간별 건수를 한 번의 조건부 집계로 계산
+
+    가장 긴 기간으로 먼저 범위를 좁혀 인덱스 범위 스캔 후 집계한다.
+    """
+    now = now or timezone.now()
+    widest = max(PERIOD_DAYS, key=PERIOD_DAYS.get)
+    return queryset.filter(period_q(widest, now)).aggregate(**{
+        period: Count('pk', filter=period_q(period, now)) for period, _ in PERIODS
+    })
+
+
+def time_period_case(now: datetime = None, field: str = 'published_at') -> Case:
+    """행의 기간 분류 SQL 식 (가장 짧은 기간부터, 나머지는 'older')"""
+    whens = []
+    for period, _ in PERIODS:
+        start, end = period_range(period, now)
+        whens.append(When(range_q(start, end, field), then=Value(period)))
+    return Case(*whens, default=Value(OLDER), output_field=CharField())
+
+
+def annotate_time_period(queryset, now: datetime = None):
+    """쿼리셋에 time_period 기간 분류를 SQL 로 붙임"""
+    return queryset.annotate(time_period=time_period_case(now))
+
+
+def time_period_of(published_at: datetime, now: datetime = None) -> str:
+    """단일 시각의 기간 분류 (time_period_case 와 같은 규칙)"""
+    for period, _ in PERIODS:
+        start, end = period_range(period, now)
+        if start <= published_at < end:
+            return period
+    return OLDER
@@ -0,0 +1,205 @@
+"""
+요청/태스크 단위 on-demand 프로파일링
+
+운영 중 특정 요청이나 크롤링 하나만 cProfile 로 기록한다.
+
+- 요청: 서명된 X-Profile 헤더(python manage.py profile_token 으로 발급)가
+  있을 때만 ProfilingMiddleware 가 그 요청을 프로파일링한다.
+- Celery 태스크: `apply_async(..., headers={'profile': True})` 처럼 profile
+  메시지 헤더를 붙이면 task_prerun 에서 그 실행만 프로파일링한다. 태스크
+  시그니처 검사에 걸리지 않도록 kwarg 가 아니라 헤더로 전달한다.
+
+결과는 RSS_PROFILE_DIR 에 pstats 파일과 메타데이터(json)로 저장하며
+python manage.py list_profiles 로 목록과 핫스팟을 본다. 헤더가 없으면
+딕셔너리 조회 한 번 외에는 아무 일도 하지 않는다.
+"""
+import cProfile
+import json
+import logging
+import os
+import pstats
+import re
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional
+
+from django.conf import settings
+from django.core import signing
+
+logger = logging.getLogger(__name__)
+
+PROFILE_HEADER = 'X-Profile'
+TASK_PROFILE_HEADER = 'profile'
+SIGNING_SALT = 'core.profiling'
+
+_SLUG_RE = re.compile(r'[^A-Za-z0-9_.-]+')
+
+
+def profile_dir() -> str:
+    return getattr(settings, 'RSS_PROFILE_DIR', os.path.join(settings.BASE_DIR, 'var', 'profiles'))
+
+
+def profiling_enabled() -> bool:
+    return getattr(settings, 'RSS_PROFILING_ENABLED', True)
+
+
+def make_token(issued_to: str = '') -> str:
+    """X-Profile 헤더 값 (RSS_PROFILE_TOKEN_MAX_AGE 동안 유효)"""
+    return signing.TimestampSigner(salt=SIGNING_SALT).sign(issued_to or 'profile')
+
+
+def verify_token(token: str) -> bool:
+    """서명과 유효 기간 확인"""
+    try:
+        signing.TimestampSigner(salt=SIGNING_SALT).unsign(
+            token, max_age=getattr(settings, 'RSS_PROFILE_TOKEN_MAX_AGE', 3600)
+        )
+    except signing.BadSignature:
+        return False
+    return True
+
+
+def _write_atomic(path: str, data: bytes):
+    tmp_path = f"{path}.tmp.{os.getpid()}"
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def _prune(directory: str, keep: int):
+    """오래된 캡처를 지워 최근 keep 개만 남김"""
+    for capture in list_captures(directory)[keep:]:
+        for path in (capture['path'], capture['meta_path']):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+
+class Capture:
+    """진행 중인 프로파일 하나 (start ~ stop)"""
+
+    def __init__(self, kind: str, label: str):
+        self.kind = kind
+        self.label = label
+        self.profiler = cProfile.Profile()
+        self.path = None
+
+    def start(self) -> 'Capture':
+        self.started = time.perf_counter()
+        self.profiler.enable()
+        return self
+
+    def stop(self, **extra) -> Optional[str]:
+        """
+        프로파일을 멈추고 pstats/메타데이터 파일로 저장
+
+        Returns:
+            저장한 pstats 파일 경로 (저장 실패 시 None)
+        """
+        self.profiler.disable()
+        duration_ms = (time.perf_counter() - self.started) * 1000
+        directory = profile_dir()
+        name = f"{datetime.now().strftime('%Y%m%dT%H%M%S%f')}-{self.kind}-{_SLUG_RE.sub('_', self.label)[:80]}"
+        path = os.path.join(directory, f'{name}.pstats')
+        try:
+            os.makedirs(directory, exist_ok=True)
+            self.profiler.dump_stats(f'{path}.tmp')
+            os.replace(f'{path}.tmp', path)
+            meta = {
+                'kind': self.kind,
+                'label': self.label,
+                'duration_ms': round(duration_ms, 3),
+                'created_at': time.time(),
+                'pid': os.getpid(),
+                **extra,
+            }
+            _write_atomic(os.path.join(directory, f'{name}.json'), json.dumps(meta).encode('utf-8'))
+            _prune(directory, getattr(settings, 'RSS_PROFILE_KEEP', 200))
+        except OSError as e:
+            logger.warning("Failed to write profile %s: %s", path, e)
+            return None
+        self.path = path
+        logger.info("Profiled %s %s in %.1fms -> %s", self.kind, self.label, duration_ms, path)
+        return path
+
+
+@contextmanager
+def capture(kind: str, label: str) -> Iterator[Capture]:
+    """블록 실행을 프로파일링해 파일로 저장"""
+    current = Capture(kind, label).start()
+    try:
+        yield current
+    finally:
+        current.stop()
+
+
+# Celery 태스크 ID -> 진행 중인 캡처 (워커 프로세스별)
+_task_captures: Dict[str, Capture] = {}
+
+
+def start_task_profile(task_id: str, task_name: str, headers: Optional[dict]):
+    """태스크 메시지에 profile 헤더가 있으면 그 실행만 프로파일링 시작 (task_prerun)"""
+    if headers and headers.get(TASK_PROFILE_HEADER) and profiling_enabled():
+        _task_captures[task_id] = Capture('task', task_name).start()
+
+
+def finish_task_profile(task_id: str, state: str = None) -> Optional[str]:
+    """진행 중인 태스크 프로파일을 저장 (task_postrun)"""
+    current = _task_captures.pop(task_id, None)
+    if current is None:
+        return None
+    return current.stop(task_id=task_id, state=state)
+
+
+def list_captures(directory: str = None) -> List[dict]:
+    """저장된 캡처 목록 (최근 순)"""
+    directory = directory or profile_dir()
+    try:
+        names = os.listdir(directory)
+    except FileNotFoundError:
+        return []
+
+    captures = []
+    for name in names:
+        if not name.endswith('.json'):
+            continue
+        meta_path = os.path.join(directory, name)
+        try:
+            with open(meta_path) as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            continue
+        meta['meta_path'] = meta_path
+        meta['path'] = meta_path[:-len('.json')] + '.pstats'
+        if os.path.exists(meta['path']):
+            captures.append(meta)
+    return sorted(captures, key=lambda meta: meta.get('created_at', 0), reverse=True)
+
+
+def hot_functions(paths: List[str], limit: int = 15, sort: str = 'tottime') -> List[dict]:
+    """
+    여러 캡처를 합친 함수별 시간 상위 목록
+
+    Args:
+        paths: pstats 파일 경로 목록
+        limit: 반환할 함수 수
+        sort: 'tottime' (함수 자체 시간) 또는 'cumtime' (호출한 함수 포함)
+
+    Returns:
+        function, calls, tottime, cumtime (초) 목록
+    """
+    if not paths:
+        return []
+    stats = pstats.Stats(*paths)
+    rows = [
+        {
+            'function': f"{filename}:{line}({func})",
+            'calls': calls,
+            'tottime': tottime,
+            'cumtime': cumtime,
+        }
+        for (filename, line, func), (_, calls, tottime, cumtime, _) in stats.stats.items()
+    ]
+    return sorted(rows, key=lambda row: row[sort], reverse=True)[:limit]
@@ -0,0 +1,147 @@
+"""
+요청/태스크별 DB 쿼리 예산
+
+요청 하나(QueryBudgetMiddleware) 또는 Celery 태스크 하나(task_prerun /
+task_postrun 신호)에서 실행된 쿼리 수와 DB 시간을 connection.execute_wrapper
+로 세고, 파라미터를 뺀 SQL 모양별로 묶는다. 예산(RSS_QUERY_BUDGET_*)을
+넘으면 반복된 SQL 모양(N+1 의심)과 함께 경고 로그를 남긴다.
+"""
+import logging
+import re
+import time
+from collections import Counter
+from typing import Dict, List, Tuple
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+
+logger = logging.getLogger(__name__)
+
+_PLACEHOLDER_LIST_RE = re.compile(r'%s(?:\s*,\s*%s)+')
+_STRING_RE = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_RE = re.compile(r'\b\d+(?:\.\d+)?\b')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+def sql_shape(sql: str) -> str:
+    """SQL 에서 값(파라미터, 문자열/숫자 리터럴, IN 목록 길이)을 지운 모양"""
+    shape = _STRING_RE.sub('?', sql)
+    shape = _NUMBER_RE.sub('?', shape)
+    shape = _PLACEHOLDER_LIST_RE.sub('%s, ...', shape)
+    return _WHITESPACE_RE.sub(' ', shape).strip()
+
+
+class QueryBudget:
+    """
+    블록(또는 start~stop 구간)에서 실행된 쿼리 수/DB 시간/SQL 모양 집계
+
+    Args:
+        label: 로그에 남길 이름 (뷰 이름, 태스크 이름)
+        max_queries: 쿼리 수 예산 (None 이면 검사하지 않음)
+        max_db_ms: DB 시간 예산(ms) (None 이면 검사하지 않음)
+        using: 대상 DB 별칭
+    """
+
+    def __init__(self, label: str, max_queries: int = None, max_db_ms: float = None, using: str = DEFAULT_DB_ALIAS):
+        self.label = label
+        self.max_queries = max_queries
+        self.max_db_ms = max_db_ms
+        self.using = using
+        self.count = 0
+        self.db_ms = 0.0
+        self.shapes = Counter()
+        self.shape_ms: Dict[str, float] = {}
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            elapsed = (time.perf_counter() - started) * 1000
+            shape = sql_shape(sql)
+            self.count += 1
+            self.db_ms += elapsed
+            self.shapes[shape] += 1
+            self.shape_ms[shape] = self.shape_ms.get(shape, 0.0) + elapsed
+
+    def start(self) -> 'QueryBudget':
+        connections[self.using].execute_wrappers.append(self)
+        return self
+
+    def stop(self):
+        wrappers = connections[self.using].execute_wrappers
+        if self in wrappers:
+            wrappers.remove(self)
+
+    def __enter__(self) -> 'QueryBudget':
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    @property
+    def exceeded(self) -> bool:
+        return (
+            (self.max_queries is not None and self.count > self.max_queries)
+            or (self.max_db_ms is not None and self.db_ms > self.max_db_ms)
+        )
+
+    def repeated(self, threshold: int = None) -> List[Tuple[str, int, float]]:
+        """threshold 번 이상 반복된 SQL 모양 (모양, 횟수, 누적 ms), 많은 순"""
+        threshold = threshold or getattr(settings, 'RSS_QUERY_REPEAT_THRESHOLD', 5)
+        return [
+            (shape, count, self.shape_ms[shape])
+            for shape, count in self.shapes.most_common()
+            if count >= threshold
+        ]
+
+    def report(self, limit: int = 5) -> str:
+        """쿼리 수/DB 시간과 가장 많이 실행된 SQL 모양 요약"""
+        lines = [f"{self.label}: {self.count} queries, {self.db_ms:.1f}ms in DB"]
+        for shape, count in self.shapes.most_common(limit):
+            lines.append(f"  {count}x {self.shape_ms[shape]:.1f}ms  {shape[:300]}")
+        return '\n'.join(lines)
+
+    def check(self) -> bool:
+        """
+        예산 초과 또는 반복 SQL(N+1 의심)을 경고 로그로 남김
+
+        Returns:
+            예산을 넘었는지 여부
+        """
+        repeated = self.repeated()
+        if self.exceeded or repeated:
+            logger.warning(
+                "Query budget %s for %s (budget: %s queries, %s ms)%s\n%s",
+                'exceeded' if self.exceeded else 'ok, repeated SQL',
+                self.label, self.max_queries, self.max_db_ms,
+                ''.join(f"\n  repeated {count}x: {shape[:300]}" for shape, count, _ in repeated),
+                self.report(),
+            )
+        return self.exceeded
+
+    def server_timing(self) -> str:
+        """Server-Timing 헤더 항목"""
+        return f'db;dur={self.db_ms:.1f};desc="{self.count} queries"'
+
+
+# Celery 태스크 ID -> 진행 중인 예산 (워커 프로세스별)
+_task_budgets: Dict[str, QueryBudget] = {}
+
+
+def start_task_budget(task_id: str, task_name: str):
+    """태스크 시작 시 쿼리 집계 시작 (task_prerun)"""
+    _task_budgets[task_id] = QueryBudget(
+        task_name,
+        max_queries=getattr(settings, 'RSS_QUERY_BUDGET_TASK', 1000),
+        max_db_ms=getattr(settings, 'RSS_QUERY_TIME_BUDGET_TASK_MS', 30000),
+    ).start()
+
+
+def finish_task_budget(task_id: str):
+    """태스크 종료 시 집계를 멈추고 예산 검사 (task_postrun)"""
+    budget = _task_budgets.pop(task_id, None)
+    if budget is not None:
+        budget.stop()
+        budget.check()
+    return budget
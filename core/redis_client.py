@@ -0,0 +1,19 @@
+from functools import lru_cache
+
+import redis
+from django.conf import settings
+
+
+@lru_cache(maxsize=None)
+def get_redis_client() -> redis.Redis:
+    """
+    공용 Redis 클라이언트를 반환 (프로세스당 하나의 커넥션 풀 공유)
+
+    Returns:
+        settings.REDIS_URL 에 연결된 Redis 클라이언트
+    """
+    return redis.Redis.from_url(
+        settings.REDIS_URL,
+        socket_connect_timeout=1,
+        socket_timeout=2,
+    )
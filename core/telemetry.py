@@ -0,0 +1,230 @@
+"""
+Prometheus 형식 지표
+
+gunicorn 워커와 Celery 워커 여러 프로세스의 값을 합치기 위해 카운터와
+히스토그램을 Redis 해시에 누적한다 (지표 하나당 해시 하나, 라벨 조합별
+필드). 관측 한 번은 파이프라인 한 번의 HINCRBYFLOAT 이고, /metrics 스크레이프는
+Redis(지표 해시, 화면 조각 캐시 카운터)만 읽으며 PostgreSQL 은 건드리지 않는다.
+
+Redis 장애 시 관측은 버리고(RETRY_AFTER 초 동안 재시도하지 않음) 요청과
+크롤링은 그대로 진행한다.
+"""
+import json
+import logging
+import math
+import time
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+import redis
+from django.conf import settings
+
+from .fragments import CACHE_ERRORS, fragment_stats
+from .redis_client import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = 'metrics:'
+RETRY_AFTER = 30  # Redis 쓰기 실패 후 관측을 건너뛰는 시간(초)
+
+# 마지막 쓰기 실패 후 다시 시도할 시각 (프로세스별)
+_state = {'retry_at': 0.0}
+
+
+def _enabled() -> bool:
+    return getattr(settings, 'RSS_METRICS_ENABLED', True) and time.monotonic() >= _state['retry_at']
+
+
+def _write(commands: Iterable[Tuple[str, str, float]]):
+    """(키, 필드, 증가량) 들을 파이프라인 한 번으로 누적"""
+    try:
+        pipe = get_redis_client().pipeline(transaction=False)
+        for key, field, amount in commands:
+            pipe.hincrbyfloat(key, field, amount)
+        pipe.execute()
+    except redis.RedisError as e:
+        _state['retry_at'] = time.monotonic() + RETRY_AFTER
+        logger.warning("Metrics store unavailable, dropping observations for %ss: %s", RETRY_AFTER, e)
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return '+Inf' if value > 0 else '-Inf'
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+def _escape(value: str) -> str:
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _format_labels(pairs: Sequence[Tuple[str, str]]) -> str:
+    if not pairs:
+        return ''
+    return '{' + ','.join(f'{name}="{_escape(value)}"' for name, value in pairs) + '}'
+
+
+class Metric:
+    """Redis 해시에 누적되는 지표 (라벨 값 목록을 JSON 으로 필드 이름에 사용)"""
+
+    kind = ''
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        REGISTRY.append(self)
+
+    @property
+    def key(self) -> str:
+        return f"{KEY_PREFIX}{self.name}"
+
+    def _label_key(self, labels: Dict[str, str]) -> str:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        return json.dumps([str(labels[name]) for name in self.labelnames])
+
+    def _label_pairs(self, label_key: str) -> List[Tuple[str, str]]:
+        return list(zip(self.labelnames, json.loads(label_key)))
+
+    def render(self, fields: Dict[bytes, bytes]) -> List[str]:
+        lines = [f'# HELP {self.name} {self.documentation}', f'# TYPE {self.name} {self.kind}']
+        return lines + self._samples({field.decode(): float(value) for field, value in fields.items()})
+
+    def _samples(self, fields: Dict[str, float]) -> List[str]:
+        raise NotImplementedError
+
+
+class Counter(Metric):
+    """단조 증가 카운터"""
+
+    kind = 'counter'
+
+    def inc(self, amount: float = 1, **labels):
+        if amount and _enabled():
+            _write([(self.key, self._label_key(labels), amount)])
+
+    def _samples(self, fields: Dict[str, float]) -> List[str]:
+        return [
+            f'{self.name}{_format_labels(self._label_pairs(label_key))} {_format_value(value)}'
+            for label_key, value in sorted(fields.items())
+        ]
+
+
+class Histogram(Metric):
+    """
+    누적 버킷 히스토그램
+
+    관측값이 속하는 버킷 하나만 올려 두고(필드 'b:<le>:<라벨>') 렌더링할 때
+    누적 합으로 바꾼다. 합계와 개수는 'sum:<라벨>', 'count:<라벨>' 필드.
+    """
+
+    kind = 'histogram'
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = ()):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+
+    def observe(self, value: float, **labels):
+        if not _enabled():
+            return
+        label_key = self._label_key(labels)
+        bucket = next(bound for bound in self.buckets if value <= bound)
+        _write([
+            (self.key, f'b:{_format_value(bucket)}:{label_key}', 1),
+            (self.key, f'sum:{label_key}', value),
+            (self.key, f'count:{label_key}', 1),
+        ])
+
+    def _samples(self, fields: Dict[str, float]) -> List[str]:
+        series = {}
+        for field, value in fields.items():
+            kind, _, rest = field.partition(':')
+            if kind == 'b':
+                bound, _, label_key = rest.partition(':')
+                series.setdefault(label_key, {}).setdefault('buckets', {})[bound] = value
+            else:
+                series.setdefault(rest, {})[kind] = value
+
+        lines = []
+        for label_key in sorted(series):
+            values = series[label_key]
+            pairs = self._label_pairs(label_key)
+            cumulative = 0.0
+            for bound in self.buckets:
+                cumulative += values.get('buckets', {}).get(_format_value(bound), 0.0)
+                labels = _format_labels(pairs + [('le', _format_value(bound))])
+                lines.append(f'{self.name}_bucket{labels} {_format_value(cumulative)}')
+            lines.append(f'{self.name}_sum{_format_labels(pairs)} {_format_value(values.get("sum", 0.0))}')
+            lines.append(f'{self.name}_count{_format_labels(pairs)} {_format_value(values.get("count", 0.0))}')
+        return lines
+
+
+REGISTRY: List[Metric] = []
+
+CRAWL_STAGE_SECONDS = Histogram(
+    'rss_crawl_stage_seconds', 'Crawl time per pipeline stage (fetch, parse, enrich, db).',
+    ('feed', 'stage'), buckets=(0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60),
+)
+CRAWLS = Counter('rss_crawls_total', 'Crawls by processing log status.', ('feed', 'status'))
+ENTRIES_INGESTED = Counter('rss_entries_ingested_total', 'New entries stored.', ('feed',))
+ENTRIES_UPDATED = Counter('rss_entries_updated_total', 'Existing entries updated by a crawl.', ('feed',))
+FETCH_ERRORS = Counter('rss_fetch_errors_total', 'Feed fetch failures by HTTP status or exception.', ('feed', 'reason'))
+DATE_PARSES = Counter(
+    'rss_entry_date_parses_total',
+    'Entry dates by parsing step (struct, fast, detected, dateutil_fallback, unparsed).', ('feed', 'strategy'),
+)
+INGEST_DEAD_LETTERS = Counter(
+    'rss_ingest_dead_letters_total', 'Ingest stream messages moved to the dead-letter stream.', ('feed',),
+)
+REQUEST_SECONDS = Histogram(
+    'rss_http_request_seconds', 'Web/API request latency per view.',
+    ('view', 'method', 'status'), buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+)
+TASK_SECONDS = Histogram(
+    'rss_celery_task_seconds', 'Celery task runtime.',
+    ('task', 'state'), buckets=(0.1, 0.5, 1, 5, 10, 30, 60, 120, 300, 600),
+)
+
+
+def _render_fragment_cache() -> List[str]:
+    """화면 조각 캐시 hit/miss 카운터와 적중률 (캐시 Redis 에서 읽음)"""
+    try:
+        stats = fragment_stats()
+    except CACHE_ERRORS as e:
+        logger.warning("Fragment cache unavailable: %s", e)
+        return []
+
+    lines = [
+        '# HELP rss_fragment_cache_requests_total Fragment cache lookups by result.',
+        '# TYPE rss_fragment_cache_requests_total counter',
+    ]
+    for name, values in stats.items():
+        for result, count in (('hit', values['hits']), ('miss', values['misses'])):
+            lines.append(f'rss_fragment_cache_requests_total{_format_labels([("fragment", name), ("result", result)])} {count}')
+    lines += [
+        '# HELP rss_fragment_cache_hit_ratio Fragment cache hit ratio since counters were created.',
+        '# TYPE rss_fragment_cache_hit_ratio gauge',
+    ]
+    for name, values in stats.items():
+        if values['hit_rate'] is not None:
+            lines.append(f'rss_fragment_cache_hit_ratio{_format_labels([("fragment", name)])} {_format_value(values["hit_rate"])}')
+    return lines
+
+
+def render_metrics() -> str:
+    """
+    모든 지표를 Prometheus 텍스트 형식으로 (Redis 만 읽음)
+
+    Returns:
+        text/plain; version=0.0.4 본문
+
+    Raises:
+        redis.RedisError: 지표 저장소를 읽을 수 없을 때
+    """
+    pipe = get_redis_client().pipeline(transaction=False)
+    for metric in REGISTRY:
+        pipe.hgetall(metric.key)
+    lines = []
+    for metric, fields in zip(REGISTRY, pipe.execute()):
+        lines += metric.render(fields)
+    lines += _render_fragment_cache()
+    return '\n'.join(lines) + '\n'
@@ -0,0 +1,58 @@
+"""
+테스트용 쿼리 예산 단언
+
+뷰/태스크의 쿼리 수를 테스트에 고정해 N+1 이 다시 생기면 바로 실패하게
+한다. 실패 메시지에 반복된 SQL 모양을 함께 보여준다.
+
+작은 테스트 테이블에서는 PostgreSQL 이 병렬 계획을 고르지 않으므로,
+병렬 실행에서만 드러나는 문제(PARALLEL SAFE 함수 등)는
+force_parallel_plan() 안에서 검사한다.
+"""
+from contextlib import contextmanager
+
+from django.db import DEFAULT_DB_ALIAS, connections
+
+from .querybudget import QueryBudget
+
+
+class QueryBudgetAssertionsMixin:
+    """TestCase 에 섞어 쓰는 쿼리 예산 단언"""
+
+    @contextmanager
+    def assertQueryBudget(self, max_queries: int, using: str = DEFAULT_DB_ALIAS):
+        """
+        블록 안의 쿼리 수가 max_queries 이하인지 검사
+
+        Args:
+            max_queries: 허용 쿼리 수 (뷰별로 현재 값을 고정)
+            using: 대상 DB 별칭
+        """
+        with QueryBudget(self.id(), max_queries=max_queries, using=using) as budget:
+            yield budget
+        if budget.count > max_queries:
+            self.fail(f"{budget.count} queries executed, budget is {max_queries}\n{budget.report()}")
+
+
+PARALLEL_PLAN_SETTINGS = {
+    'max_parallel_workers_per_gather': 2,
+    'parallel_setup_cost': 0,
+    'parallel_tuple_cost': 0,
+    'min_parallel_table_scan_size': 0,
+    # 작은 테이블은 인덱스 스캔을 골라 병렬 순차 스캔이 나오지 않으므로 끔
+    'enable_indexscan': 'off',
+    'enable_bitmapscan': 'off',
+}
+
+
+@contextmanager
+def force_parallel_plan(using: str = DEFAULT_DB_ALIAS):
+    """블록 안의 쿼리가 테이블 크기와 관계없이 병렬 계획을 쓰도록 설정 (트랜잭션 안에서 사용)"""
+    with connections[using].cursor() as cursor:
+        for name, value in PARALLEL_PLAN_SETTINGS.items():
+            cursor.execute(f'SET LOCAL {name} = {value}')
+    try:
+        yield
+    finally:
+        with connections[using].cursor() as cursor:
+            for name in PARALLEL_PLAN_SETTINGS:
+                cursor.execute(f'RESET {name}')
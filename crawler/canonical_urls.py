@@ -0,0 +1,57 @@
+"""
+기사 URL 정규화
+
+같은 기사가 추적용 쿼리 문자열(utm_*, guccounter 등)이나 대소문자,
+기본 포트, 프래그먼트만 다른 URL 로 들어와도 하나의 URL 로 모은다.
+"""
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+TRACKING_PARAMS = frozenset({
+    'guccounter', 'guce_referrer', 'guce_referrer_sig', 'guce_referrer_cs',
+    'fbclid', 'gclid', 'dclid', 'msclkid', 'yclid', 'igshid',
+    'mc_cid', 'mc_eid', 'ncid', 'sr_share', 'cmpid', 'ref_src',
+})
+TRACKING_PREFIXES = ('utm_', 'tc_', '__twitter', '_hs')
+DEFAULT_PORTS = {'http': 80, 'https': 443}
+
+
+def is_tracking_param(name: str) -> bool:
+    """추적용 쿼리 파라미터인지 여부"""
+    name = name.lower()
+    return name in TRACKING_PARAMS or name.startswith(TRACKING_PREFIXES)
+
+
+def canonicalize_url(url: str) -> str:
+    """
+    기사 URL 정규화
+
+    스킴/호스트 소문자화, 기본 포트와 프래그먼트 제거, 추적 파라미터
+    제거, 남은 쿼리 파라미터 정렬. 경로는 대소문자를 구분하므로 그대로 둔다.
+
+    Args:
+        url: 원본 URL
+
+    Returns:
+        정규화된 URL (URL 이 아니면 앞뒤 공백만 제거해 반환)
+    """
+    url = (url or '').strip()
+    try:
+        parts = urlsplit(url)
+        port = parts.port
+    except ValueError:
+        return url
+    if parts.scheme.lower() not in DEFAULT_PORTS or not parts.hostname or parts.username:
+        # 웹 URL 이 아니거나 인증 정보가 있는 URL 은 그대로 둠
+        return url
+
+    scheme = parts.scheme.lower()
+    netloc = parts.hostname.lower()
+    if port and port != DEFAULT_PORTS[scheme]:
+        netloc = f"{netloc}:{port}"
+
+    query = sorted(
+        (name, value)
+        for name, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not is_tracking_param(name)
+    )
+    return urlunsplit((scheme, netloc, parts.path or '/', urlencode(query), ''))
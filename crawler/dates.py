@@ -0,0 +1,161 @@
+"""
+RSS 엔트리 날짜 파싱
+
+feedparser 가 이미 파싱한 struct_time 을 먼저 사용하고, 없으면 피드별로
+한 번 감지해 둔 형식(RFC 822 / ISO 8601)의 전용 파서를 사용한다.
+dateutil 은 두 형식 모두 실패했을 때만 쓰는 마지막 수단이다.
+"""
+import re
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, Optional
+
+# RFC 822 / 1123: "Thu, 31 Jul 2025 09:00:00 +0000", "31 Jul 25 09:00 GMT"
+RFC822_RE = re.compile(
+    r'^\s*(?:[A-Za-z]{3},\s*)?(\d{1,2})\s+([A-Za-z]{3})\s+(\d{2,4})\s+'
+    r'(\d{1,2}):(\d{2})(?::(\d{2}))?\s*([+-]\d{4}|[A-Za-z]{1,5})?\s*$'
+)
+MONTHS = {
+    'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4, 'may': 5, 'jun': 6,
+    'jul': 7, 'aug': 8, 'sep': 9, 'oct': 10, 'nov': 11, 'dec': 12,
+}
+TZ_OFFSETS = {
+    'GMT': 0, 'UT': 0, 'UTC': 0, 'Z': 0,
+    'EST': -5, 'EDT': -4, 'CST': -6, 'CDT': -5,
+    'MST': -7, 'MDT': -6, 'PST': -8, 'PDT': -7,
+    'KST': 9,
+}
+TIMEZONES = {name: timezone(timedelta(hours=hours)) for name, hours in TZ_OFFSETS.items()}
+
+STRUCT_FIELDS = ('published_parsed', 'updated_parsed')
+STRING_FIELDS = ('published', 'pubDate', 'updated')
+
+
+def parse_rfc822(value: str) -> Optional[datetime]:
+    """RFC 822 날짜 문자열 파싱 (형식이 다르면 None)"""
+    match = RFC822_RE.match(value)
+    if not match:
+        return None
+
+    day, month_name, year, hour, minute, second, zone = match.groups()
+    month = MONTHS.get(month_name.lower())
+    if month is None:
+        return None
+
+    year = int(year)
+    if year < 100:
+        year += 2000 if year < 50 else 1900
+
+    if not zone:
+        tzinfo = timezone.utc
+    elif zone[0] in '+-':
+        offset = int(zone[1:3]) * 60 + int(zone[3:5])
+        tzinfo = timezone(timedelta(minutes=offset if zone[0] == '+' else -offset))
+    else:
+        tzinfo = TIMEZONES.get(zone.upper())
+        if tzinfo is None:
+            return None
+
+    try:
+        return datetime(year, month, int(day), int(hour), int(minute), int(second or 0), tzinfo=tzinfo)
+    except ValueError:
+        return None
+
+
+def parse_iso8601(value: str) -> Optional[datetime]:
+    """ISO 8601 날짜 문자열 파싱 (형식이 다르면 None)"""
+    try:
+        parsed = datetime.fromisoformat(value.strip())
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+def parse_with_dateutil(value: str) -> Optional[datetime]:
+    """범용(느린) 파서"""
+    from dateutil import parser
+
+    try:
+        parsed = parser.parse(value)
+    except (ValueError, OverflowError):
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+FAST_PARSERS: Dict[str, Callable[[str], Optional[datetime]]] = {
+    'rfc822': parse_rfc822,
+    'iso8601': parse_iso8601,
+}
+
+
+class FeedDateParser:
+    """
+    피드별 형식 기억(memoization)을 하는 엔트리 날짜 파서
+
+    한 피드의 엔트리들은 같은 형식을 쓰므로 처음 성공한 빠른 파서를
+    피드별로 기억해 두고 다음부터는 그 파서만 시도한다. 어떤 단계로
+    파싱했는지 counters 에 누적한다.
+    """
+
+    def __init__(self):
+        self.strategies: Dict[str, str] = {}
+        self.counters: Counter = Counter()
+
+    def _parse_string(self, value: str, feed_key: Optional[str]) -> Optional[datetime]:
+        strategy = self.strategies.get(feed_key)
+        if strategy:
+            parsed = FAST_PARSERS[strategy](value)
+            if parsed is not None:
+                self.counters['fast'] += 1
+                return parsed
+
+        # 형식 감지 (또는 피드 형식이 바뀐 경우 재감지)
+        for name, fast_parser in FAST_PARSERS.items():
+            if name == strategy:
+                continue
+            parsed = fast_parser(value)
+            if parsed is not None:
+                if feed_key is not None:
+                    self.strategies[feed_key] = name
+                self.counters['detected'] += 1
+                return parsed
+
+        parsed = parse_with_dateutil(value)
+        if parsed is not None:
+            self.counters['dateutil_fallback'] += 1
+        return parsed
+
+    def parse(self, entry: Dict[str, Any], feed_key: str = None) -> Optional[datetime]:
+        """
+        엔트리의 발행일 파싱
+
+        Args:
+            entry: RSS 엔트리
+            feed_key: 형식을 기억할 피드 식별자 (피드 URL)
+
+        Returns:
+            UTC 기준 aware datetime (파싱할 수 없으면 None)
+        """
+        for field in STRUCT_FIELDS:
+            parsed_struct = entry.get(field)
+            if parsed_struct:
+                self.counters['struct'] += 1
+                return datetime(*parsed_struct[:6], tzinfo=timezone.utc)
+
+        for field in STRING_FIELDS:
+            value = entry.get(field)
+            if value:
+                parsed = self._parse_string(value, feed_key)
+                if parsed is not None:
+                    return parsed
+
+        self.counters['unparsed'] += 1
+        return None
+
+
+# 프로세스별 기본 파서 (프로세스 풀 워커마다 하나씩)
+default_date_parser = FeedDateParser()
@@ -10,4 +10,9 @@ class RSSProcessingError(Exception):
 
 class RSSStorageError(Exception):
     """RSS 저장 중 발생하는 오류"""
-    pass 
\ No newline at end of file
+    pass
+
+
+class IngestBacklogFullError(RSSStorageError):
+    """인제스트 스트림 밀림이 용량에 가까워 적재를 거부함"""
+    pass
@@ -0,0 +1,188 @@
+import json
+import logging
+import os
+import socket
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Tuple
+
+import redis
+from django.conf import settings
+
+from core.redis_client import get_redis_client
+from .exceptions import IngestBacklogFullError
+
+logger = logging.getLogger(__name__)
+
+# (스트림 메시지 ID, 피드 ID, 엔트리 데이터)
+IngestMessage = Tuple[str, int, Dict[str, Any]]
+
+
+class IngestBuffer:
+    """
+    크롤링 결과를 DB 대신 먼저 쌓아 두는 Redis Stream 버퍼 (write-behind)
+
+    크롤링 태스크는 처리된 엔트리를 스트림에 XADD 하고 바로 반환하며,
+    전용 writer 태스크가 컨슈머 그룹으로 큰 배치를 읽어 DB 에 upsert 한
+    뒤 XACK 한다. writer 가 ACK 전에 죽으면 메시지가 pending 으로 남아
+    XAUTOCLAIM 으로 다른 writer 가 다시 처리한다. 여러 번 전달돼도 저장에
+    실패한 메시지는 dead-letter 스트림으로 옮긴다.
+
+    ACK 된 메시지는 바로 삭제하므로 스트림에는 아직 저장되지 않은 메시지만
+    남는다. 그래서 MAXLEN 으로 자르지 않고, 밀린 양이 용량에 가까우면 적재를
+    거부한다 (피드는 다음 주기에 다시 크롤링된다).
+    """
+
+    STREAM_KEY = 'crawl:ingest'
+    DEAD_LETTER_KEY = 'crawl:ingest:dead'
+    GROUP = 'ingest-writers'
+
+    def __init__(self, client: redis.Redis = None):
+        self.client = client or get_redis_client()
+        self.maxlen = getattr(settings, 'RSS_INGEST_STREAM_MAXLEN', 1000000)
+        self.warn_ratio = getattr(settings, 'RSS_INGEST_BACKLOG_WARN_RATIO', 0.8)
+
+    @staticmethod
+    def consumer_name() -> str:
+        """현재 프로세스의 컨슈머 이름 (재시작 전까지 고정)"""
+        return f"{socket.gethostname()}:{os.getpid()}"
+
+    def ensure_group(self):
+        """컨슈머 그룹 생성 (이미 있으면 무시)"""
+        try:
+            self.client.xgroup_create(self.STREAM_KEY, self.GROUP, id='0', mkstream=True)
+        except redis.ResponseError as e:
+            if 'BUSYGROUP' not in str(e):
+                raise
+
+    def append(self, feed_id: int, entries: List[Dict[str, Any]]) -> int:
+        """
+        엔트리들을 스트림에 추가
+
+        Args:
+            feed_id: 엔트리가 속한 피드 ID
+            entries: 처리된 엔트리 목록
+
+        Returns:
+            추가한 엔트리 수
+
+        Raises:
+            IngestBacklogFullError: 밀린 메시지 수가 RSS_INGEST_STREAM_MAXLEN 을 넘게 될 때
+        """
+        backlog = self.client.xlen(self.STREAM_KEY)
+        if backlog + len(entries) > self.maxlen:
+            logger.error(
+                "Ingest backlog full (%d/%d), refusing %d entries for feed %s",
+                backlog, self.maxlen, len(entries), feed_id
+            )
+            raise IngestBacklogFullError(f"Ingest backlog full ({backlog}/{self.maxlen})")
+        if backlog + len(entries) > self.maxlen * self.warn_ratio:
+            logger.warning("Ingest backlog at %d/%d, writers are falling behind", backlog, self.maxlen)
+
+        pipe = self.client.pipeline(transaction=False)
+        for entry in entries:
+            pipe.xadd(self.STREAM_KEY, self._encode(feed_id, entry))
+        pipe.execute()
+        return len(entries)
+
+    @staticmethod
+    def _encode(feed_id: int, entry: Dict[str, Any]) -> Dict[str, Any]:
+        payload = dict(entry)
+        if isinstance(payload.get('published_at'), datetime):
+            payload['published_at'] = payload['published_at'].isoformat()
+        return {'feed_id': feed_id, 'entry': json.dumps(payload)}
+
+    def _decode(self, messages) -> List[IngestMessage]:
+        decoded = []
+        for message_id, fields in messages:
+            if not fields:
+                # XAUTOCLAIM 이 돌려준, 이미 삭제된 메시지
+                continue
+            entry = json.loads(fields[b'entry'])
+            if entry.get('published_at'):
+                entry['published_at'] = datetime.fromisoformat(entry['published_at'])
+            decoded.append((message_id.decode(), int(fields[b'feed_id']), entry))
+        return decoded
+
+    def reclaim(self, consumer: str, count: int, min_idle_ms: int) -> List[IngestMessage]:
+        """죽은 writer 가 ACK 하지 못한 메시지를 가져옴"""
+        result = self.client.xautoclaim(
+            self.STREAM_KEY, self.GROUP, consumer, min_idle_ms, start_id='0-0', count=count
+        )
+        return self._decode(result[1])
+
+    def read(self, consumer: str, count: int, block_ms: int = None) -> List[IngestMessage]:
+        """아직 어떤 writer 에게도 전달되지 않은 메시지를 읽음"""
+        response = self.client.xreadgroup(
+            self.GROUP, consumer, {self.STREAM_KEY: '>'}, count=count, block=block_ms
+        )
+        if not response:
+            return []
+        return self._decode(response[0][1])
+
+    def ack(self, message_ids: List[str]):
+        """처리 완료한 메시지를 ACK 하고 스트림에서 삭제"""
+        if not message_ids:
+            return
+        pipe = self.client.pipeline()
+        pipe.xack(self.STREAM_KEY, self.GROUP, *message_ids)
+        pipe.xdel(self.STREAM_KEY, *message_ids)
+        pipe.execute()
+
+    def delivery_counts(self, message_ids: List[str]) -> Dict[str, int]:
+        """pending 메시지별 전달 횟수 (XREADGROUP 이 1, XAUTOCLAIM 마다 1 증가)"""
+        pipe = self.client.pipeline(transaction=False)
+        for message_id in message_ids:
+            pipe.xpending_range(self.STREAM_KEY, self.GROUP, min=message_id, max=message_id, count=1)
+        return {
+            message_id: result[0]['times_delivered'] if result else 0
+            for message_id, result in zip(message_ids, pipe.execute())
+        }
+
+    def dead_letter(self, messages: List[IngestMessage], error: str):
+        """재시도를 다 쓴 메시지를 dead-letter 스트림에 옮기고 원래 스트림에서 ACK/삭제"""
+        if not messages:
+            return
+        pipe = self.client.pipeline()
+        for message_id, feed_id, entry in messages:
+            pipe.xadd(self.DEAD_LETTER_KEY, {
+                **self._encode(feed_id, entry),
+                'message_id': message_id,
+                'error': error[:1000],
+            })
+        message_ids = [message_id for message_id, _, _ in messages]
+        pipe.xack(self.STREAM_KEY, self.GROUP, *message_ids)
+        pipe.xdel(self.STREAM_KEY, *message_ids)
+        pipe.execute()
+
+    def lag(self) -> Dict[str, Any]:
+        """
+        큐 지연 지표
+
+        ACK 된 메시지는 바로 삭제하므로 스트림 길이가 곧 밀린 양이다.
+
+        Returns:
+            backlog(미처리 전체), pending(전달됐지만 미ACK), oldest_age_seconds,
+            capacity(적재 거부 기준), dead_letters(dead-letter 스트림 길이)
+        """
+        backlog = self.client.xlen(self.STREAM_KEY)
+        pending = 0
+        if backlog:
+            try:
+                pending = self.client.xpending(self.STREAM_KEY, self.GROUP)['pending']
+            except redis.ResponseError:
+                pending = 0
+
+        oldest_age = 0.0
+        oldest = self.client.xrange(self.STREAM_KEY, count=1)
+        if oldest:
+            oldest_ms = int(oldest[0][0].decode().split('-')[0])
+            oldest_age = max(time.time() - oldest_ms / 1000, 0.0)
+
+        return {
+            'backlog': backlog,
+            'pending': pending,
+            'oldest_age_seconds': oldest_age,
+            'capacity': self.maxlen,
+            'dead_letters': self.client.xlen(self.DEAD_LETTER_KEY),
+        }
@@ -0,0 +1,158 @@
+"""
+코퍼스 기반 TF-IDF 키워드 추출
+
+엔트리가 저장될 때마다 용어별 문서 빈도(DF)를 DB 테이블에 누적하고,
+엔트리 배치 전체를 (문서, 용어, 빈도) 희소 행렬(COO 배열)로 만들어
+NumPy 로 한 번에 TF-IDF 점수와 문서별 상위 k 개 용어를 계산한다.
+"""
+import re
+from collections import Counter
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+from django.db import connection
+
+from core.models import TermDocumentFrequency
+
+TOKEN_RE = re.compile(r"[a-z][a-z0-9+#]*(?:[.'-][a-z0-9]+)*")
+MAX_TERM_LENGTH = 50
+TITLE_WEIGHT = 2  # 제목에 나온 용어는 본문보다 가중치를 높게
+
+STOP_WORDS = frozenset("""
+a about above after again against all also am an and any are as at be because been before being
+below between both but by can could did do does doing down during each even few for from further
+had has have having he her here hers herself him himself his how however i if in into is it its
+itself just like made make many may me might more most much must my myself new no nor not now of
+off on once one only or other our ours ourselves out over own per said same says she should since
+so some still such than that the their theirs them themselves then there these they this those
+through to too two under until up upon us very via was we were what when where which while who
+whom why will with within without would year years yet you your yours yourself yourselves
+according already another around back called company companies get gets going know last later
+least less let lot next often part people percent put really see several show take thing things
+think three time told use used uses using way week weeks well went whether work would
+""".split())
+
+
+def tokenize(text: str) -> List[str]:
+    """소문자 용어 목록 (불용어, 한 글자 용어 제외)"""
+    return [
+        token for token in TOKEN_RE.findall(text.lower())
+        if len(token) > 1 and len(token) <= MAX_TERM_LENGTH and token not in STOP_WORDS
+    ]
+
+
+def document_terms(title: str, description: str) -> Counter:
+    """엔트리 하나의 용어 빈도 (제목 가중치 적용)"""
+    counts = Counter(tokenize(description))
+    for token in tokenize(title):
+        counts[token] += TITLE_WEIGHT
+    return counts
+
+
+class TfidfKeywordExtractor:
+    """
+    증분 문서 빈도 테이블을 사용하는 TF-IDF 키워드 추출기
+
+    코퍼스 문서 수(N)는 CORPUS_TERM(빈 문자열) 행에 함께 저장하므로
+    DF 증가와 N 증가가 한 문장(INSERT ... ON CONFLICT)으로 반영된다.
+    """
+
+    CORPUS_TERM = ''
+
+    def __init__(self, top_k: int = 10):
+        self.top_k = top_k
+
+    def _build_matrix(self, documents: Sequence[Tuple[str, str]]):
+        """(제목, 설명) 목록 -> 용어 목록과 COO 배열 (행, 열, 빈도)"""
+        vocabulary: Dict[str, int] = {}
+        rows, cols, counts = [], [], []
+        for row, (title, description) in enumerate(documents):
+            for term, count in document_terms(title, description).items():
+                rows.append(row)
+                cols.append(vocabulary.setdefault(term, len(vocabulary)))
+                counts.append(count)
+        return (
+            list(vocabulary),
+            np.asarray(rows, dtype=np.int64),
+            np.asarray(cols, dtype=np.int64),
+            np.asarray(counts, dtype=np.float64),
+        )
+
+    def _increment_document_frequencies(self, terms: List[str], cols: np.ndarray, num_docs: int) -> Dict[str, int]:
+        """배치의 DF 를 테이블에 더하고 갱신된 DF 를 반환 (UPSERT ... RETURNING)"""
+        batch_df = np.bincount(cols, minlength=len(terms))
+        pairs = sorted(zip(terms, batch_df.tolist()))  # 동시 writer 간 교착 방지를 위해 키 순서 고정
+        pairs.insert(0, (self.CORPUS_TERM, num_docs))
+        table = TermDocumentFrequency._meta.db_table
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"""
+                INSERT INTO {table} (term, document_count)
+                SELECT * FROM unnest(%s::varchar[], %s::bigint[])
+                ON CONFLICT (term) DO UPDATE
+                    SET document_count = {table}.document_count + EXCLUDED.document_count
+                RETURNING term, document_count
+                """,
+                [[term for term, _ in pairs], [df for _, df in pairs]]
+            )
+            return dict(cursor.fetchall())
+
+    def _lookup_document_frequencies(self, terms: List[str]) -> Dict[str, int]:
+        """DF 테이블 조회 (갱신 없음)"""
+        return dict(
+            TermDocumentFrequency.objects.filter(
+                term__in=[self.CORPUS_TERM] + terms
+            ).values_list('term', 'document_count')
+        )
+
+    def add_documents(self, documents: Sequence[Tuple[str, str]]) -> int:
+        """
+        문서 배치를 DF 테이블에만 반영 (점수 계산 없음, 백필 1단계용)
+
+        Returns:
+            반영한 문서 수
+        """
+        terms, rows, cols, counts = self._build_matrix(documents)
+        if documents:
+            self._increment_document_frequencies(terms, cols, len(documents))
+        return len(documents)
+
+    def extract(self, documents: Sequence[Tuple[str, str]], count_documents: bool = True) -> List[List[str]]:
+        """
+        문서 배치의 키워드 추출
+
+        Args:
+            documents: (제목, 설명) 목록
+            count_documents: 새로 저장되는 문서면 True (DF 에 반영), 재처리면 False
+
+        Returns:
+            문서별 TF-IDF 상위 top_k 용어 목록
+        """
+        if not documents:
+            return []
+
+        terms, rows, cols, counts = self._build_matrix(documents)
+        if not terms:
+            return [[] for _ in documents]
+
+        if count_documents:
+            frequencies = self._increment_document_frequencies(terms, cols, len(documents))
+        else:
+            frequencies = self._lookup_document_frequencies(terms)
+        total_docs = max(frequencies.get(self.CORPUS_TERM, 0), len(documents))
+
+        df = np.asarray([frequencies.get(term, 0) for term in terms], dtype=np.float64)
+        idf = np.log((1 + total_docs) / (1 + df)) + 1
+        doc_lengths = np.bincount(rows, weights=counts, minlength=len(documents))
+        scores = counts / doc_lengths[rows] * idf[cols]
+
+        # 문서별 점수 내림차순 정렬 후 문서 안 순위가 top_k 미만인 용어만
+        order = np.lexsort((cols, -scores, rows))
+        sorted_rows = rows[order]
+        ranks = np.arange(len(order)) - np.searchsorted(sorted_rows, sorted_rows, side='left')
+        selected = order[ranks < self.top_k]
+
+        keywords = [[] for _ in documents]
+        for row, col in zip(rows[selected].tolist(), cols[selected].tolist()):
+            keywords[row].append(terms[col])
+        return keywords
@@ -0,0 +1,65 @@
+import logging
+import os
+import socket
+import threading
+
+from celery.utils import uuid
+from django.conf import settings
+from django.db import DatabaseError, connection
+
+from core.models import RSSFeed
+
+logger = logging.getLogger(__name__)
+
+
+def make_worker_id() -> str:
+    """리스 소유자로 사용할 워커 식별자 (호스트:PID:랜덤)"""
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid()[:8]}"
+
+
+class LeaseHeartbeat(threading.Thread):
+    """
+    크롤링하는 동안 워커의 피드 리스를 주기적으로 연장하는 하트비트 스레드
+
+    리스 유지 시간의 1/3 간격으로 워커가 소유한 모든 피드의
+    heartbeat_at / lease_expires_at 을 갱신한다. 배치로 선점한 피드 중
+    아직 크롤링하지 않은 피드의 리스도 함께 연장되며, 반납한 피드는
+    소유자가 비워지므로 더 이상 연장되지 않는다. 워커가 죽으면 하트비트가
+    멈추고 리스가 만료되어 다른 워커가 해당 피드를 다시 선점할 수 있다.
+    """
+
+    def __init__(self, worker_id: str, lease_seconds: int = None):
+        super().__init__(daemon=True)
+        self.worker_id = worker_id
+        self.lease_seconds = lease_seconds or getattr(settings, 'RSS_FEED_LEASE_SECONDS', 300)
+        self.interval = max(self.lease_seconds / 3, 1)
+        self._stop_event = threading.Event()
+
+    def beat(self) -> int:
+        """소유한 리스를 한 번 연장하고 연장한 수를 반환"""
+        return RSSFeed.objects.renew_leases(self.worker_id, self.lease_seconds)
+
+    def run(self):
+        try:
+            while not self._stop_event.wait(self.interval):
+                try:
+                    self.beat()
+                except DatabaseError as e:
+                    # 일시적인 DB 오류로 하트비트를 멈추지 않음 (리스 만료 전 다음 주기에 재시도)
+                    logger.warning("Lease heartbeat failed (%s): %s", self.worker_id, e)
+        finally:
+            # 스레드 전용 DB 커넥션 정리
+            connection.close()
+
+    def stop(self):
+        self._stop_event.set()
+        if self.is_alive():
+            self.join()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+        return False
@@ -0,0 +1,91 @@
+import hashlib
+import logging
+
+import redis
+from django.conf import settings
+
+from core.redis_client import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+# 락이 비어 있으면 token 으로 획득, 이미 token 이 들고 있으면 TTL 연장.
+# 어느 경우든 현재 락 소유자를 반환한다.
+ACQUIRE_SCRIPT = """
+local holder = redis.call('GET', KEYS[1])
+if not holder then
+    redis.call('SET', KEYS[1], ARGV[1], 'EX', ARGV[2])
+    return ARGV[1]
+end
+if holder == ARGV[1] then
+    redis.call('EXPIRE', KEYS[1], ARGV[2])
+end
+return holder
+"""
+
+# 소유자가 token 일 때만 삭제 (다른 태스크가 잡은 락을 지우지 않도록)
+RELEASE_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+class FeedCrawlLock:
+    """
+    피드 URL 단위 크롤링 락 (singleflight)
+
+    같은 피드에 대한 크롤링이 동시에 하나만 실행되도록 Redis 키에
+    진행 중인 태스크 id 를 TTL 과 함께 저장한다. Redis 장애 시에는
+    크롤링을 막지 않도록 락 없이 진행한다 (fail-open).
+    """
+
+    KEY_PREFIX = 'crawl:lock:'
+
+    def __init__(self, feed_url: str, ttl: int = None):
+        self.feed_url = feed_url
+        self.ttl = ttl or getattr(settings, 'CRAWL_LOCK_TTL', 600)
+        digest = hashlib.sha1(feed_url.strip().encode('utf-8')).hexdigest()
+        self.key = f"{self.KEY_PREFIX}{digest}"
+
+    def acquire(self, token: str) -> str:
+        """
+        락 획득 시도
+
+        Args:
+            token: 락 소유자로 기록할 값 (Celery task id)
+
+        Returns:
+            현재 락 소유자. token 과 같으면 획득(또는 이미 소유) 성공
+        """
+        try:
+            client = get_redis_client()
+            holder = client.register_script(ACQUIRE_SCRIPT)(
+                keys=[self.key], args=[token, self.ttl]
+            )
+        except redis.RedisError as e:
+            logger.warning("Crawl lock unavailable for %s: %s", self.feed_url, e)
+            return token
+
+        if isinstance(holder, bytes):
+            holder = holder.decode('utf-8')
+        return holder
+
+    def release(self, token: str) -> bool:
+        """
+        token 이 소유한 락을 해제
+
+        Args:
+            token: 락을 획득할 때 사용한 값
+
+        Returns:
+            실제로 해제되었는지 여부
+        """
+        try:
+            client = get_redis_client()
+            return bool(client.register_script(RELEASE_SCRIPT)(
+                keys=[self.key], args=[token]
+            ))
+        except redis.RedisError as e:
+            logger.warning("Failed to release crawl lock for %s: %s", self.feed_url, e)
+            return False
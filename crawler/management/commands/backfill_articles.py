@@ -0,0 +1,33 @@
+from django.core.management.base import BaseCommand
+from django.db.models import F, Q
+
+from core.models import RSSEntry
+from crawler.services import RSSCrawlerService
+
+
+class Command(BaseCommand):
+    help = '기존 엔트리의 링크를 정규화하고(같은 피드의 중복은 합침) 정규화된 URL 기준 기사에 연결합니다'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=2000, help='한 번에 처리할 엔트리 수')
+
+    def handle(self, *args, **options):
+        service = RSSCrawlerService()
+        attached = merged = 0
+        last_pk = 0
+        while True:
+            # 기사 미연결 엔트리와, 예전 백필에서 링크를 정규화하지 않은 채 연결된 엔트리
+            batch = list(
+                RSSEntry.objects.filter(
+                    Q(article__isnull=True) | ~Q(link=F('article__canonical_url')),
+                    pk__gt=last_pk,
+                )
+                .order_by('pk')[:options['batch_size']]
+            )
+            if not batch:
+                break
+            last_pk = batch[-1].pk
+            entries = service.canonicalize_entry_links(batch)
+            merged += len(batch) - len(entries)
+            attached += service.attach_articles([entry for entry in entries if entry.article_id is None])
+            self.stdout.write(f"attached={attached} merged={merged}")
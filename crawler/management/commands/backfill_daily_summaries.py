@@ -0,0 +1,51 @@
+import time
+from datetime import date, timedelta
+
+from celery import group
+from django.core.management.base import BaseCommand, CommandError
+
+from core.models import DailySummary
+from core.periods import local_today
+from crawler.tasks import generate_daily_summary_task
+
+
+def parse_day(value):
+    """YYYY-MM-DD 를 date 로 변환"""
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        raise CommandError(f"Invalid date: {value} (expected YYYY-MM-DD)")
+
+
+class Command(BaseCommand):
+    help = '기간 내 날짜마다 일일 요약 태스크를 하나씩 실행해 DailySummary 를 채웁니다'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--start', required=True, help='시작 날짜 (YYYY-MM-DD)')
+        parser.add_argument('--end', help='끝 날짜, 포함 (YYYY-MM-DD, 기본값: 어제)')
+        parser.add_argument('--missing-only', action='store_true', help='이미 저장된 날짜는 건너뜀')
+        parser.add_argument('--sync', action='store_true', help='워커에 보내지 않고 현재 프로세스에서 순서대로 실행')
+
+    def handle(self, *args, **options):
+        start = parse_day(options['start'])
+        end = parse_day(options['end']) if options['end'] else local_today() - timedelta(days=1)
+        if end < start:
+            raise CommandError(f"--end ({end}) is before --start ({start})")
+        if end >= local_today():
+            raise CommandError("Only past days can be summarized (--end must be before today)")
+
+        days = [start + timedelta(days=offset) for offset in range((end - start).days + 1)]
+        if options['missing_only']:
+            existing = set(DailySummary.objects.filter(date__range=(start, end)).values_list('date', flat=True))
+            days = [day for day in days if day not in existing]
+
+        started = time.perf_counter()
+        if options['sync']:
+            for day in days:
+                generate_daily_summary_task(day.isoformat())
+            self.stdout.write(f"summaries: {len(days)} days in {time.perf_counter() - started:.1f}s")
+            return
+
+        # 날짜별 집계는 서로 독립적이므로 하루에 태스크 하나씩 워커들에 나눠 실행
+        result = group(generate_daily_summary_task.s(day.isoformat()) for day in days).apply_async()
+        self.stdout.write(f"queued: {len(days)} days ({start} ~ {end}) group={result.id}")
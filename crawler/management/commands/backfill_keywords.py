@@ -0,0 +1,65 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db.models import OuterRef, Subquery
+
+from core.models import Article, RSSEntry, TermDocumentFrequency
+from crawler.keywords import TfidfKeywordExtractor
+
+
+class Command(BaseCommand):
+    help = '저장된 기사 전체의 키워드를 코퍼스 TF-IDF 로 다시 계산합니다 (기사 미연결 엔트리는 backfill_articles 먼저 실행)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rebuild-df', action='store_true', help='문서 빈도 테이블을 비우고 전체 기사로 다시 집계')
+        parser.add_argument('--batch-size', type=int, default=5000, help='한 번에 처리할 기사 수')
+
+    def batches(self, batch_size):
+        """pk 순서로 (pk, 제목, 설명) 배치를 반환 (키셋 페이지네이션)"""
+        last_pk = 0
+        while True:
+            batch = list(
+                Article.objects.filter(pk__gt=last_pk)
+                .order_by('pk')
+                .values_list('pk', 'title', 'description')[:batch_size]
+            )
+            if not batch:
+                return
+            yield batch
+            last_pk = batch[-1][0]
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        extractor = TfidfKeywordExtractor(top_k=getattr(settings, 'RSS_KEYWORD_TOP_K', 10))
+
+        # 1단계: 문서 빈도 집계 (테이블이 비어 있으면 자동으로 수행)
+        if options['rebuild_df'] or not TermDocumentFrequency.objects.filter(term=extractor.CORPUS_TERM).exists():
+            started = time.perf_counter()
+            TermDocumentFrequency.objects.all().delete()
+            counted = 0
+            for batch in self.batches(batch_size):
+                counted += extractor.add_documents([(title, description) for _, title, description in batch])
+            self.stdout.write(f"document frequencies: {counted} articles in {time.perf_counter() - started:.1f}s")
+
+        # 2단계: 최종 문서 빈도로 점수를 매겨 기사 키워드를 갱신하고 피드별 엔트리에 복사
+        started = time.perf_counter()
+        updated = 0
+        for batch in self.batches(batch_size):
+            keywords = extractor.extract(
+                [(title, description) for _, title, description in batch],
+                count_documents=False
+            )
+            articles = []
+            for (pk, _, _), article_keywords in zip(batch, keywords):
+                article = Article(pk=pk)
+                article.set_keywords(article_keywords)
+                articles.append(article)
+            Article.objects.bulk_update(articles, ['keywords'], batch_size=1000)
+            RSSEntry.objects.filter(article_id__in=[pk for pk, _, _ in batch]).update(
+                keywords=Subquery(Article.objects.filter(pk=OuterRef('article_id')).values('keywords')[:1])
+            )
+            updated += len(batch)
+
+        elapsed = time.perf_counter() - started
+        self.stdout.write(f"keywords: {updated} articles in {elapsed:.1f}s ({updated / max(elapsed, 1e-9) * 60:.0f}/min)")
@@ -0,0 +1,30 @@
+from django.core.management.base import BaseCommand
+
+from core.models import RSSEntry
+from crawler.minhash import NearDuplicateIndex
+
+
+class Command(BaseCommand):
+    help = 'MinHash 시그니처가 없는 기존 엔트리를 유사 중복 인덱스에 추가합니다'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=2000, help='한 번에 처리할 엔트리 수')
+
+    def handle(self, *args, **options):
+        index = NearDuplicateIndex()
+        indexed = linked = 0
+        last_pk = 0
+        while True:
+            # 먼저 저장된 엔트리가 대표가 되도록 pk 순서로 처리
+            batch = list(
+                RSSEntry.objects.filter(pk__gt=last_pk, minhash__isnull=True)
+                .order_by('pk')
+                .select_related('article')
+                .only('pk', 'title', 'description', 'canonical_entry', 'article', 'article__description')[:options['batch_size']]
+            )
+            if not batch:
+                break
+            linked += index.index_entries(batch)
+            indexed += len(batch)
+            last_pk = batch[-1].pk
+            self.stdout.write(f"indexed={indexed} linked={linked}")
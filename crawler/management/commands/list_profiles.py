@@ -0,0 +1,45 @@
+from datetime import datetime
+
+from django.core.management.base import BaseCommand
+
+from core.profiling import hot_functions, list_captures
+
+
+class Command(BaseCommand):
+    help = '저장된 프로파일 캡처 목록과 가장 오래 걸린 함수들을 보여줍니다'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--limit', type=int, default=20, help='보여줄 최근 캡처 수')
+        parser.add_argument('--label', help='라벨(뷰/태스크 이름)에 이 문자열이 들어간 캡처만')
+        parser.add_argument('--kind', choices=['request', 'task'], help='요청 또는 태스크 캡처만')
+        parser.add_argument('--top', type=int, default=15, help='핫스팟 함수 수 (0 이면 목록만)')
+        parser.add_argument('--sort', choices=['tottime', 'cumtime'], default='tottime', help='핫스팟 정렬 기준')
+
+    def handle(self, *args, **options):
+        captures = list_captures()
+        if options['label']:
+            captures = [c for c in captures if options['label'] in c.get('label', '')]
+        if options['kind']:
+            captures = [c for c in captures if c.get('kind') == options['kind']]
+        captures = captures[:options['limit']]
+
+        if not captures:
+            self.stdout.write("no captures")
+            return
+
+        for capture in captures:
+            created = datetime.fromtimestamp(capture.get('created_at', 0)).strftime('%Y-%m-%d %H:%M:%S')
+            self.stdout.write(
+                f"{created}  {capture.get('kind', '?'):<7} {capture.get('duration_ms', 0):>9.1f}ms  "
+                f"{capture.get('label', '')}  {capture['path']}"
+            )
+
+        if options['top'] <= 0:
+            return
+
+        # 선택된 캡처를 합쳐 함수별 시간 순위
+        rows = hot_functions([c['path'] for c in captures], limit=options['top'], sort=options['sort'])
+        self.stdout.write(f"\ntop {len(rows)} functions by {options['sort']} across {len(captures)} captures:")
+        self.stdout.write(f"{'calls':>10} {'tottime':>10} {'cumtime':>10}  function")
+        for row in rows:
+            self.stdout.write(f"{row['calls']:>10} {row['tottime']:>10.4f} {row['cumtime']:>10.4f}  {row['function']}")
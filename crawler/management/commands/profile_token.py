@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from core.profiling import PROFILE_HEADER, make_token
+
+
+class Command(BaseCommand):
+    help = '요청 하나를 프로파일링할 때 보낼 서명된 X-Profile 헤더 값을 발급합니다'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--issued-to', default='', help='토큰에 남길 발급 대상 (기록용)')
+
+    def handle(self, *args, **options):
+        token = make_token(options['issued_to'])
+        self.stdout.write(f"{PROFILE_HEADER}: {token}")
@@ -0,0 +1,33 @@
+from django.core.management.base import BaseCommand
+
+from core.models import RSSFeed, RSSEntry
+from crawler.seen_filter import SeenLinkFilter
+
+
+class Command(BaseCommand):
+    help = '저장된 RSSEntry 링크로 피드별 블룸 필터를 다시 채웁니다'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--feed', type=int, action='append', help='재구축할 피드 ID (여러 번 지정 가능)')
+        parser.add_argument('--stats', action='store_true', help='재구축 없이 필터 지표만 출력')
+
+    def handle(self, *args, **options):
+        feeds = RSSFeed.objects.order_by('id')
+        if options['feed']:
+            feeds = feeds.filter(pk__in=options['feed'])
+
+        for feed in feeds:
+            seen_filter = SeenLinkFilter(feed.pk)
+
+            if not options['stats']:
+                links = RSSEntry.objects.filter(feed=feed).values_list('link', flat=True)
+                total = seen_filter.rebuild(links.iterator(chunk_size=5000))
+                self.stdout.write(f"[{feed.pk}] {feed.title}: {total} links loaded")
+
+            stats = seen_filter.stats()
+            self.stdout.write(
+                f"[{feed.pk}] items={stats['items']} "
+                f"estimated_fp_rate={stats['estimated_fp_rate']:.6f} "
+                f"observed_fp_rate={stats['observed_fp_rate']:.6f} "
+                f"hit_rate={stats['hit_rate']:.3f}"
+            )
@@ -0,0 +1,40 @@
+import time
+from datetime import datetime
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from crawler.services import RSSCrawlerService
+
+
+def parse_date(value):
+    """YYYY-MM-DD 를 현재 시간대 기준 aware datetime 으로 변환"""
+    try:
+        return timezone.make_aware(datetime.strptime(value, '%Y-%m-%d'))
+    except ValueError:
+        raise CommandError(f"Invalid date: {value} (expected YYYY-MM-DD)")
+
+
+class Command(BaseCommand):
+    help = '보관된 피드 원문을 현재 파싱/정제 로직으로 다시 처리해 엔트리를 갱신합니다 (네트워크 미사용)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--feed', type=int, action='append', help='재처리할 피드 ID (여러 번 지정 가능)')
+        parser.add_argument('--since', help='이 날짜 이후 수집된 원문만 (YYYY-MM-DD)')
+        parser.add_argument('--until', help='이 날짜 이전 수집된 원문만 (YYYY-MM-DD)')
+        parser.add_argument('--workers', type=int, help='파싱 워커 프로세스 수 (기본값: CPU 코어 수)')
+        parser.add_argument('--chunk-size', type=int, default=200, help='한 번에 파싱할 원문 수')
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        stats = RSSCrawlerService().reprocess_archive(
+            feed_ids=options['feed'],
+            since=parse_date(options['since']) if options['since'] else None,
+            until=parse_date(options['until']) if options['until'] else None,
+            max_workers=options['workers'],
+            chunk_size=options['chunk_size'],
+        )
+        self.stdout.write(
+            f"bodies={stats['bodies']} failed={stats['failed']} "
+            f"updated_entries={stats['updated']} elapsed={time.perf_counter() - started:.1f}s"
+        )
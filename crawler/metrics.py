@@ -0,0 +1,211 @@
+"""
+크롤링 단계별 지표
+
+한 번의 크롤링에서 가져오기(fetch) / 파싱(parse) / 키워드·중복 처리(enrich) /
+DB 저장(db) 단계별 소요 시간과 응답 크기, HTTP 상태, DB 쿼리 수, 최대 RSS
+증가량을 모아 RSSProcessingLog 에 함께 저장한다. 실행하지 않은 단계(스트림
+writer 의 fetch/parse 등)는 0 이 아니라 None 으로 남긴다.
+
+지표 객체는 activate() 동안 컨텍스트 변수로 현재 크롤링에 연결되므로
+서비스 메서드 시그니처를 바꾸지 않고 각 단계에서 stage() 로 기록한다.
+활성화된 지표가 없으면 stage() 는 아무것도 하지 않는다.
+
+처리 로그를 남길 때 export() 로 같은 값을 Prometheus 지표(core.telemetry)에도
+누적한다.
+"""
+import os
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Optional
+
+from django.db import connection
+
+from core.telemetry import CRAWL_STAGE_SECONDS, CRAWLS, DATE_PARSES, ENTRIES_INGESTED, ENTRIES_UPDATED
+
+STAGES = ('fetch', 'parse', 'enrich', 'db')
+
+_current: ContextVar[Optional['CrawlMetrics']] = ContextVar('crawl_metrics', default=None)
+
+
+_PAGE_KB = os.sysconf('SC_PAGE_SIZE') // 1024 if hasattr(os, 'sysconf') else 4
+
+
+def _current_rss_kb() -> Optional[int]:
+    """
+    프로세스 현재 RSS (KB, /proc/self/statm 을 읽을 수 없으면 None)
+
+    ru_maxrss 는 프로세스 수명 전체의 최댓값이라 오래 떠 있는 워커에서는
+    크롤링 한 번의 증가량을 보여주지 못하므로 현재 RSS 를 단계마다 샘플링한다.
+    """
+    try:
+        with open('/proc/self/statm', 'rb') as f:
+            return int(f.read().split()[1]) * _PAGE_KB
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+class CrawlMetrics:
+    """
+    크롤링 한 번의 단계별 지표
+
+    단계가 중첩되면(db 안의 enrich 등) 안쪽 단계 시간은 바깥 단계에서
+    빼고 기록하므로 단계별 시간의 합이 전체 시간을 넘지 않는다.
+    최대 RSS 는 단계가 끝날 때마다 현재 RSS 를 샘플링한 값 중 최댓값이며,
+    같은 프로세스의 다른 스레드가 쓴 메모리도 포함된다.
+    """
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.stage_ms = {name: 0.0 for name in STAGES}
+        self.response_bytes = None
+        self.http_status = None
+        self.db_queries = 0
+        self.date_parses = Counter()
+        self._measured = set()
+        self._rss_start = self._rss_peak = _current_rss_kb()
+        self._stack = []
+        self._tracking_queries = False
+
+    @contextmanager
+    def activate(self):
+        """현재 컨텍스트(스레드)의 크롤링 지표로 설정"""
+        token = _current.set(self)
+        try:
+            yield self
+        finally:
+            _current.reset(token)
+
+    @contextmanager
+    def stage(self, name: str):
+        """블록 실행 시간을 단계에 누적 (중첩된 단계 시간은 제외)"""
+        frame = [name, time.perf_counter(), 0.0]
+        self._measured.add(name)
+        self._stack.append(frame)
+        try:
+            yield
+        finally:
+            self._stack.pop()
+            elapsed = (time.perf_counter() - frame[1]) * 1000
+            self.stage_ms[name] += elapsed - frame[2]
+            if self._stack:
+                self._stack[-1][2] += elapsed
+            self._sample_rss()
+
+    def add_stage_ms(self, name: str, ms: float):
+        """다른 곳(파싱 워커 프로세스 등)에서 잰 단계 시간을 더함"""
+        self._measured.add(name)
+        self.stage_ms[name] += ms
+
+    def _sample_rss(self):
+        rss = _current_rss_kb()
+        if rss is not None and self._rss_peak is not None:
+            self._rss_peak = max(self._rss_peak, rss)
+
+    @property
+    def peak_rss_delta_kb(self) -> Optional[int]:
+        """크롤링 시작 대비 샘플링한 최대 RSS 증가량 (KB, 측정 불가면 None)"""
+        self._sample_rss()
+        if self._rss_start is None:
+            return None
+        return max(self._rss_peak - self._rss_start, 0)
+
+    def add_date_parses(self, counts: Dict[str, int]):
+        """엔트리 날짜 파싱 단계별 횟수를 더함 (crawler.parsing.parse_feed_with_stats)"""
+        self.date_parses.update(counts)
+
+    @contextmanager
+    def track_queries(self):
+        """블록 안에서 현재 스레드 DB 연결로 실행된 쿼리 수를 셈 (중첩 시 한 번만)"""
+        if self._tracking_queries:
+            yield
+            return
+
+        def count(execute, sql, params, many, context):
+            self.db_queries += 1
+            return execute(sql, params, many, context)
+
+        self._tracking_queries = True
+        try:
+            with connection.execute_wrapper(count):
+                yield
+        finally:
+            self._tracking_queries = False
+
+    def record_response(self, status: int, size: int):
+        self.http_status = status
+        self.response_bytes = size
+
+    @property
+    def elapsed_seconds(self) -> float:
+        return time.perf_counter() - self.started
+
+    def _stage_totals(self) -> Dict[str, float]:
+        """실행한 단계별로 끝난 시간 + 아직 진행 중인 단계의 현재까지 시간"""
+        totals = {name: ms for name, ms in self.stage_ms.items() if name in self._measured}
+        now = time.perf_counter()
+        inner_elapsed = 0.0
+        for name, started, child_ms in reversed(self._stack):
+            elapsed = (now - started) * 1000
+            totals[name] += elapsed - child_ms - inner_elapsed
+            inner_elapsed = elapsed
+        return totals
+
+    def log_fields(self) -> Dict[str, Any]:
+        """RSSProcessingLog 에 저장할 필드 (진행 중인 단계는 현재까지 시간, 실행하지 않은 단계는 None)"""
+        totals = self._stage_totals()
+        return {
+            **{f'{name}_ms': round(totals[name], 3) if name in totals else None for name in STAGES},
+            'response_bytes': self.response_bytes,
+            'http_status': self.http_status,
+            'db_queries': self.db_queries,
+            'peak_rss_delta_kb': self.peak_rss_delta_kb,
+            'processing_time': self.elapsed_seconds,
+        }
+
+    def export(self, feed_url: str, status: str, new: int = 0, updated: int = 0):
+        """
+        크롤링 결과를 Prometheus 지표에 누적
+
+        Args:
+            feed_url: 피드 URL (지표 라벨)
+            status: 처리 로그 상태
+            new: 새로 저장한 엔트리 수
+            updated: 갱신한 기존 엔트리 수
+        """
+        # 실행되지 않은 단계(스트림 writer 의 fetch/parse 등)는 분포에 넣지 않음
+        for name, ms in self._stage_totals().items():
+            CRAWL_STAGE_SECONDS.observe(ms / 1000, feed=feed_url, stage=name)
+        CRAWLS.inc(feed=feed_url, status=status)
+        ENTRIES_INGESTED.inc(new, feed=feed_url)
+        ENTRIES_UPDATED.inc(updated, feed=feed_url)
+        for strategy, count in self.date_parses.items():
+            DATE_PARSES.inc(count, feed=feed_url, strategy=strategy)
+
+
+def current_metrics() -> Optional[CrawlMetrics]:
+    """현재 컨텍스트의 크롤링 지표 (없으면 None)"""
+    return _current.get()
+
+
+@contextmanager
+def ensure_metrics():
+    """현재 크롤링 지표를 쓰거나, 없으면 새로 만들어 블록 동안 활성화"""
+    metrics = current_metrics()
+    if metrics is not None:
+        yield metrics
+        return
+    with CrawlMetrics().activate() as metrics:
+        yield metrics
+
+
+@contextmanager
+def stage(name: str):
+    """현재 크롤링 지표에 단계 시간을 기록 (활성화된 지표가 없으면 그대로 실행)"""
+    metrics = current_metrics()
+    if metrics is None:
+        yield
+        return
+    with metrics.stage(name):
+        yield
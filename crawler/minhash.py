@@ -0,0 +1,196 @@
+"""
+MinHash/LSH 기반 유사 중복 기사 탐지
+
+정제된 제목+설명의 단어 3-gram(shingle) 집합으로 MinHash 시그니처를
+만들고(엔트리당 uint32 x NUM_PERM, 512바이트), 시그니처를 밴드로 나눈
+버킷 해시를 RSSEntryLSHBand 테이블에 저장한다. 새 엔트리는 버킷이
+하나라도 같은 엔트리만 후보로 비교하므로 전체 엔트리 수와 무관하게
+조회된다.
+"""
+import hashlib
+import re
+import zlib
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+from django.conf import settings
+from django.db import connection
+
+from core.models import RSSEntry, RSSEntryLSHBand
+
+WORD_RE = re.compile(r'\w+')
+SHINGLE_SIZE = 3
+NUM_PERM = 128
+NUM_BANDS = 16  # 밴드당 8행: 유사도 약 0.7 이상부터 후보가 될 확률이 급격히 높아짐
+HASH_PRIME = np.uint64(4294967311)  # 2^32 보다 큰 소수
+MAX_HASH = np.uint32(0xFFFFFFFF)
+MAX_SHINGLES_PER_CHUNK = 20000  # (NUM_PERM x shingle 수) uint64 행렬을 약 20MB 로 제한
+
+
+def shingle_hashes(title: str, description: str) -> np.ndarray:
+    """엔트리의 단어 3-gram 해시 집합 (crc32 값)"""
+    words = WORD_RE.findall(f"{title} {description}".lower())
+    if len(words) < SHINGLE_SIZE:
+        shingles = {' '.join(words)} if words else set()
+    else:
+        shingles = {' '.join(words[i:i + SHINGLE_SIZE]) for i in range(len(words) - SHINGLE_SIZE + 1)}
+    return np.fromiter(
+        (zlib.crc32(shingle.encode('utf-8')) for shingle in shingles),
+        dtype=np.uint64,
+        count=len(shingles)
+    )
+
+
+class MinHasher:
+    """배치 단위로 MinHash 시그니처를 계산 (NumPy 벡터 연산)"""
+
+    def __init__(self, num_perm: int = NUM_PERM, seed: int = 1):
+        rng = np.random.RandomState(seed)
+        # 고정 시드로 만든 해시 함수 (a * x + b) mod p, 저장된 시그니처와 호환되도록 바꾸지 말 것
+        self.a = rng.randint(1, 2 ** 32, size=num_perm, dtype=np.uint64)
+        self.b = rng.randint(0, 2 ** 32, size=num_perm, dtype=np.uint64)
+        self.num_perm = num_perm
+
+    def signatures(self, documents: Sequence[Tuple[str, str]]) -> np.ndarray:
+        """
+        문서 배치의 시그니처 계산
+
+        Args:
+            documents: (제목, 설명) 목록
+
+        Returns:
+            (문서 수, num_perm) uint32 배열. shingle 이 없는 문서는 모두 MAX_HASH
+        """
+        result = np.full((len(documents), self.num_perm), MAX_HASH, dtype=np.uint32)
+        hashes = [shingle_hashes(title, description) for title, description in documents]
+
+        start = 0
+        while start < len(documents):
+            end, total = start, 0
+            while end < len(documents) and (end == start or total + len(hashes[end]) <= MAX_SHINGLES_PER_CHUNK):
+                total += len(hashes[end])
+                end += 1
+
+            lengths = np.asarray([len(h) for h in hashes[start:end]])
+            nonempty = np.flatnonzero(lengths)
+            if len(nonempty):
+                values = np.concatenate([hashes[start + i] for i in nonempty])
+                permuted = (np.outer(self.a, values) + self.b[:, None]) % HASH_PRIME
+                offsets = np.concatenate(([0], np.cumsum(lengths[nonempty])[:-1]))
+                mins = np.minimum.reduceat(permuted, offsets, axis=1).T
+                result[start + nonempty] = np.minimum(mins, MAX_HASH).astype(np.uint32)
+            start = end
+        return result
+
+
+def band_buckets(signatures: np.ndarray, num_bands: int = NUM_BANDS) -> np.ndarray:
+    """시그니처별 밴드 버킷 해시 ((문서 수, num_bands) int64)"""
+    rows = signatures.shape[1] // num_bands
+    buckets = np.empty((signatures.shape[0], num_bands), dtype=np.int64)
+    for i, signature in enumerate(signatures):
+        for band in range(num_bands):
+            digest = hashlib.blake2b(signature[band * rows:(band + 1) * rows].tobytes(), digest_size=8).digest()
+            buckets[i, band] = int.from_bytes(digest, 'big', signed=True)
+    return buckets
+
+
+def similarity(a: np.ndarray, b: np.ndarray) -> float:
+    """두 시그니처의 추정 자카드 유사도"""
+    return float(np.mean(a == b))
+
+
+class NearDuplicateIndex:
+    """
+    새로 저장된 엔트리를 LSH 인덱스에 넣고 유사 중복이면 대표 엔트리에 연결
+
+    먼저 저장된 엔트리가 대표(canonical)가 되며, 중복 엔트리는
+    canonical_entry 로 대표 엔트리를 가리킨다.
+    """
+
+    def __init__(self, threshold: float = None):
+        self.threshold = threshold or getattr(settings, 'RSS_NEAR_DUPLICATE_THRESHOLD', 0.8)
+        self.hasher = MinHasher()
+
+    def _find_candidates(self, buckets: np.ndarray) -> Dict[int, set]:
+        """배치 문서 인덱스 -> 버킷을 공유하는 기존 엔트리 ID 집합"""
+        num_docs, num_bands = buckets.shape
+        table = RSSEntryLSHBand._meta.db_table
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"""
+                SELECT DISTINCT v.idx, lb.entry_id
+                FROM unnest(%s::int[], %s::smallint[], %s::bigint[]) AS v(idx, band, bucket)
+                JOIN {table} lb ON lb.band = v.band AND lb.bucket = v.bucket
+                """,
+                [
+                    np.repeat(np.arange(num_docs), num_bands).tolist(),
+                    np.tile(np.arange(num_bands), num_docs).tolist(),
+                    buckets.ravel().tolist(),
+                ]
+            )
+            candidates: Dict[int, set] = {}
+            for idx, entry_id in cursor.fetchall():
+                candidates.setdefault(idx, set()).add(entry_id)
+            return candidates
+
+    def index_entries(self, entries: List[RSSEntry]) -> int:
+        """
+        저장된 엔트리들의 시그니처를 계산해 인덱스에 추가하고 중복을 연결
+
+        Args:
+            entries: 저장된(pk 가 있는) 엔트리 목록, 먼저 저장된 순서
+
+        Returns:
+            유사 중복으로 연결한 엔트리 수
+        """
+        if not entries:
+            return 0
+
+        signatures = self.hasher.signatures([(entry.title, entry.full_description) for entry in entries])
+        indexable = np.flatnonzero((signatures != MAX_HASH).any(axis=1))
+        buckets = band_buckets(signatures[indexable])
+        candidates = self._find_candidates(buckets)
+
+        candidate_ids = set().union(*candidates.values()) if candidates else set()
+        known = {
+            pk: (np.frombuffer(bytes(minhash), dtype=np.uint32), canonical_id or pk)
+            for pk, minhash, canonical_id in RSSEntry.objects.filter(
+                pk__in=candidate_ids, minhash__isnull=False
+            ).values_list('pk', 'minhash', 'canonical_entry_id')
+        }
+
+        linked = 0
+        batch_buckets: Dict[Tuple[int, int], List[int]] = {}
+        bands = []
+        for position, i in enumerate(indexable):
+            entry = entries[i]
+            signature = signatures[i]
+
+            # 기존 엔트리 후보 + 같은 배치에서 먼저 처리된 엔트리 후보
+            best_similarity, canonical_id = 0.0, None
+            for pk in candidates.get(position, ()):
+                if pk == entry.pk or pk not in known:
+                    continue
+                candidate_signature, candidate_canonical = known[pk]
+                score = similarity(signature, candidate_signature)
+                if score > best_similarity:
+                    best_similarity, canonical_id = score, candidate_canonical
+            for band, bucket in enumerate(buckets[position].tolist()):
+                for j in batch_buckets.get((band, bucket), ()):
+                    score = similarity(signature, signatures[j])
+                    if score > best_similarity:
+                        best_similarity = score
+                        canonical_id = entries[j].canonical_entry_id or entries[j].pk
+                batch_buckets.setdefault((band, bucket), []).append(i)
+                bands.append(RSSEntryLSHBand(entry_id=entry.pk, band=band, bucket=bucket))
+
+            if best_similarity >= self.threshold and canonical_id != entry.pk:
+                entry.canonical_entry_id = canonical_id
+                linked += 1
+            entry.minhash = signature.tobytes()
+
+        RSSEntry.objects.bulk_update(
+            [entries[i] for i in indexable], ['minhash', 'canonical_entry'], batch_size=1000
+        )
+        RSSEntryLSHBand.objects.bulk_create(bands, batch_size=5000)
+        return linked
@@ -0,0 +1,237 @@
+"""
+RSS 파싱/정제 단계
+
+피드 원문(bytes)을 받아 정제된 엔트리 레코드(dict) 목록을 돌려주는 순수
+함수들이다. DB 나 Django 설정에 의존하지 않으므로 ProcessPoolExecutor 의
+워커 프로세스에서 그대로 실행할 수 있다.
+"""
+import logging
+import multiprocessing
+import os
+import re
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import feedparser
+
+from .canonical_urls import canonicalize_url
+from .dates import default_date_parser
+from .exceptions import RSSFeedError
+
+logger = logging.getLogger(__name__)
+
+TAG_RE = re.compile(r'<[^>]+>')
+WHITESPACE_RE = re.compile(r'\s+')
+
+# 일반적인 기술 키워드들
+TECH_KEYWORDS = [
+    'AI', 'artificial intelligence', 'machine learning', 'ML',
+    'blockchain', 'cryptocurrency', 'bitcoin', 'ethereum',
+    'startup', 'venture capital', 'funding', 'investment',
+    'technology', 'innovation', 'disruption', 'digital',
+    'cloud', 'AWS', 'Azure', 'Google Cloud',
+    'mobile', 'app', 'application', 'software',
+    'cybersecurity', 'privacy', 'data', 'analytics',
+    'fintech', 'healthtech', 'edtech', 'proptech'
+]
+TECH_KEYWORDS_LOWER = [(keyword, keyword.lower()) for keyword in TECH_KEYWORDS]
+
+
+def clean_text(text: str) -> str:
+    """
+    HTML 태그를 제거하고 텍스트를 정제
+
+    Args:
+        text: 정제할 텍스트
+
+    Returns:
+        정제된 텍스트
+    """
+    if not text:
+        return ""
+
+    # HTML 태그 제거 후 여러 공백을 하나로 변환
+    clean = TAG_RE.sub('', text)
+    clean = WHITESPACE_RE.sub(' ', clean)
+    return clean.strip()
+
+
+def extract_keywords(text: str) -> List[str]:
+    """
+    텍스트에서 기술 키워드를 추출
+
+    Args:
+        text: 키워드를 추출할 텍스트
+
+    Returns:
+        추출된 키워드 목록 (최대 10개)
+    """
+    if not text:
+        return []
+
+    text_lower = text.lower()
+    found_keywords = [keyword for keyword, lowered in TECH_KEYWORDS_LOWER if lowered in text_lower]
+    return found_keywords[:10]
+
+
+def parse_entry_date(entry: Dict[str, Any], feed_key: str = None) -> Optional[datetime]:
+    """
+    RSS 엔트리의 날짜를 파싱
+
+    현재 시각 같은 값을 지어내면 published_at 정렬이 틀어지므로 파싱할 수
+    없으면 None 을 돌려준다. 저장 단계에서 기존 엔트리는 저장된 발행일을
+    유지하고 새 엔트리는 건너뛴다.
+
+    Args:
+        entry: RSS 엔트리
+        feed_key: 날짜 형식을 기억할 피드 식별자 (피드 URL)
+
+    Returns:
+        파싱된 날짜 (실패 시 None, 'unparsed' 카운터와 경고 로그로 기록)
+    """
+    parsed = default_date_parser.parse(entry, feed_key)
+    if parsed is None:
+        logger.warning("Unparseable date for entry %s (feed %s)", entry.get('link', ''), feed_key)
+    return parsed
+
+
+def process_entry(entry: Dict[str, Any], feed_key: str = None) -> Optional[Dict[str, Any]]:
+    """
+    RSS 엔트리를 처리하여 정제된 데이터로 변환
+
+    Args:
+        entry: 원본 RSS 엔트리
+        feed_key: 피드 식별자 (피드 URL)
+
+    Returns:
+        처리된 엔트리 데이터 (실패 시 None)
+    """
+    try:
+        title = clean_text(entry.get('title', ''))
+        description = clean_text(entry.get('description', ''))
+
+        return {
+            'title': title,
+            'link': canonicalize_url(entry.get('link', '')),
+            'description': description,
+            'author': entry.get('author', ''),
+            'published_at': parse_entry_date(entry, feed_key),
+            'keywords': extract_keywords(f"{title} {description}")
+        }
+
+    except Exception as e:
+        # 개별 엔트리 처리 실패 시 로그만 남기고 계속 진행
+        logger.warning("Failed to process entry: %s", e)
+        return None
+
+
+def parse_feed(raw: bytes, feed_key: str = None) -> List[Dict[str, Any]]:
+    """
+    피드 원문을 파싱하고 엔트리들을 정제
+
+    Args:
+        raw: 피드 응답 본문
+        feed_key: 피드 식별자 (피드 URL)
+
+    Returns:
+        처리된 엔트리 목록
+
+    Raises:
+        RSSFeedError: 유효하지 않은 피드
+    """
+    feed = feedparser.parse(raw)
+
+    # RSS 피드 유효성 검사
+    if feed.bozo:
+        raise RSSFeedError(f"Invalid RSS feed: {feed.bozo_exception}")
+
+    processed_entries = []
+    for entry in feed.entries:
+        processed_entry = process_entry(entry, feed_key)
+        if processed_entry:
+            processed_entries.append(processed_entry)
+    return processed_entries
+
+
+def parse_feed_with_stats(raw: bytes, feed_key: str = None) -> Tuple[List[Dict[str, Any]], Counter]:
+    """
+    parse_feed 와 같되 이 피드의 엔트리 날짜를 어떤 단계로 파싱했는지도 반환
+
+    날짜 파서 카운터는 프로세스별(프로세스 풀 워커마다 따로)이므로 피드
+    단위 증가분을 돌려받아 크롤링 지표로 내보낸다.
+
+    Returns:
+        처리된 엔트리 목록, 단계별 횟수 (struct, fast, detected, dateutil_fallback, unparsed)
+    """
+    before = Counter(default_date_parser.counters)
+    entries = parse_feed(raw, feed_key)
+    return entries, default_date_parser.counters - before
+
+
+def pool_workers(max_workers: Optional[int], jobs: int = None) -> int:
+    """
+    프로세스 풀 크기 결정
+
+    Celery prefork 풀의 워커처럼 데몬 프로세스는 자식 프로세스를 만들 수
+    없으므로(AssertionError: daemonic processes are not allowed to have
+    children) 이때는 1(현재 프로세스에서 실행)을 돌려준다.
+
+    Args:
+        max_workers: 요청한 워커 수 (None 이면 CPU 코어 수)
+        jobs: 처리할 작업 수 (지정 시 워커 수 상한)
+
+    Returns:
+        사용할 워커 수 (1이면 프로세스 풀을 만들지 않음)
+    """
+    if multiprocessing.current_process().daemon:
+        return 1
+    max_workers = max_workers or os.cpu_count() or 1
+    return max_workers if jobs is None else min(max_workers, max(jobs, 1))
+
+
+def _parse_feed_safe(raw: bytes, feed_key: str = None) -> Union[List[Dict[str, Any]], RSSFeedError]:
+    """프로세스 풀용: 예외를 결과로 돌려 한 피드의 실패가 배치 전체를 멈추지 않게 함"""
+    try:
+        return parse_feed(raw, feed_key)
+    except Exception as e:
+        return e if isinstance(e, RSSFeedError) else RSSFeedError(f"Failed to parse RSS feed: {str(e)}")
+
+
+def _parse_feed_timed(raw: bytes, feed_key: str = None):
+    """프로세스 풀용: 파싱 결과, 워커에서 잰 파싱 시간(ms), 날짜 파싱 단계별 횟수"""
+    before = Counter(default_date_parser.counters)
+    started = time.perf_counter()
+    result = _parse_feed_safe(raw, feed_key)
+    return result, (time.perf_counter() - started) * 1000, default_date_parser.counters - before
+
+
+def parse_feeds_parallel(
+    raw_bodies: List[bytes],
+    max_workers: int = None,
+    feed_keys: List[str] = None,
+    with_timings: bool = False,
+) -> List[Union[List[Dict[str, Any]], RSSFeedError]]:
+    """
+    여러 피드 원문을 프로세스 풀에서 병렬로 파싱/정제
+
+    Args:
+        raw_bodies: 피드 응답 본문 목록
+        max_workers: 워커 프로세스 수 (기본값: CPU 코어 수, 1이거나 데몬 프로세스면 현재 프로세스에서 실행)
+        feed_keys: 본문별 피드 식별자 (피드 URL)
+        with_timings: True 면 각 결과를 (결과, 파싱 시간 ms, 날짜 파싱 단계별 횟수) 로 반환
+
+    Returns:
+        입력 순서대로 처리된 엔트리 목록 또는 RSSFeedError
+    """
+    feed_keys = feed_keys or [None] * len(raw_bodies)
+    parse = _parse_feed_timed if with_timings else _parse_feed_safe
+    max_workers = pool_workers(max_workers, len(raw_bodies))
+    if max_workers <= 1:
+        return [parse(raw, feed_key) for raw, feed_key in zip(raw_bodies, feed_keys)]
+
+    chunksize = max(len(raw_bodies) // (max_workers * 4), 1)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(parse, raw_bodies, feed_keys, chunksize=chunksize))
@@ -0,0 +1,283 @@
+"""
+관련 기사 벡터 인덱스
+
+대표 엔트리(유사 중복 제외)마다 제목/설명 용어와 TF-IDF 키워드를 해시
+벡터(feature hashing)로 만들어 L2 정규화한 뒤 파일에 행 단위로 쌓는다.
+웹 워커는 파일을 np.memmap 으로 열어 복사 없이 공유하며, 질의 벡터와의
+내적(코사인 유사도) 한 번으로 상위 k 개 이웃을 찾는다.
+
+파일 구성 (RSS_RELATED_INDEX_DIR):
+    meta.json             현재 버전, 행 수, 차원, 마지막으로 색인한 엔트리 ID
+    vectors-<버전>.f32     (행 수, 차원) float32
+    ids-<버전>.i64         행별 엔트리 ID (오름차순)
+
+증분 갱신은 현재 버전 파일 끝에 행을 덧붙인 뒤 meta.json 을 원자적으로
+교체한다. 읽는 쪽은 meta.json 의 행 수만큼만 매핑하므로 덧붙이는 중인
+행은 보이지 않는다. 전체 재구축은 새 버전 파일을 만든 뒤 meta.json 을
+교체하므로, 이전 버전을 매핑한 워커도 계속 동작한다.
+"""
+import fcntl
+import json
+import math
+import os
+import zlib
+from typing import Iterable, List, Optional, Tuple
+
+import numpy as np
+from django.conf import settings
+
+from core.models import RSSEntry
+from .keywords import document_terms
+
+KEYWORD_WEIGHT = 3.0  # 키워드(코퍼스 TF-IDF 상위 용어)는 일반 용어보다 크게 반영
+
+
+def _index_dir() -> str:
+    return getattr(settings, 'RSS_RELATED_INDEX_DIR', os.path.join(settings.BASE_DIR, 'var', 'related'))
+
+
+def _dimensions() -> int:
+    return getattr(settings, 'RSS_RELATED_DIMENSIONS', 256)
+
+
+def entry_vectors(entries: Iterable[RSSEntry], dimensions: int) -> np.ndarray:
+    """
+    엔트리들의 L2 정규화된 해시 벡터
+
+    부호 있는 feature hashing 으로 충돌에 의한 편향을 줄이고, 용어 빈도는
+    1 + log(tf) 로 완만하게 반영한다.
+    """
+    entries = list(entries)
+    vectors = np.zeros((len(entries), dimensions), dtype=np.float32)
+    for row, entry in enumerate(entries):
+        weights = {
+            term: 1.0 + math.log(count)
+            for term, count in document_terms(entry.title, entry.full_description).items()
+        }
+        for keyword in entry.keywords_list:
+            term = str(keyword).lower()
+            weights[term] = weights.get(term, 0.0) + KEYWORD_WEIGHT
+        for term, weight in weights.items():
+            digest = zlib.crc32(term.encode('utf-8'))
+            sign = 1.0 if digest & 0x80000000 else -1.0
+            vectors[row, digest % dimensions] += sign * weight
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors / np.maximum(norms, 1e-9)
+
+
+def _indexable_entries():
+    """색인 대상: 유사 중복을 제외한 대표 엔트리"""
+    return RSSEntry.objects.canonical().select_related('article').order_by('pk')
+
+
+class RelatedIndexWriter:
+    """관련 기사 인덱스 파일 갱신 (파일 락으로 한 번에 하나의 writer 만)"""
+
+    def __init__(self, index_dir: str = None, dimensions: int = None):
+        self.index_dir = index_dir or _index_dir()
+        self.dimensions = dimensions or _dimensions()
+        self.meta_path = os.path.join(self.index_dir, 'meta.json')
+
+    def _paths(self, version: int) -> Tuple[str, str]:
+        return (
+            os.path.join(self.index_dir, f'vectors-{version}.f32'),
+            os.path.join(self.index_dir, f'ids-{version}.i64'),
+        )
+
+    def _read_meta(self) -> Optional[dict]:
+        try:
+            with open(self.meta_path) as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+
+    def _write_meta(self, meta: dict):
+        tmp_path = f"{self.meta_path}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(meta, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.meta_path)
+
+    def _append(self, version: int, count: int, entries: List[RSSEntry]) -> int:
+        """현재 버전 파일 끝에 엔트리 벡터를 덧붙이고 새 행 수 반환"""
+        vectors_path, ids_path = self._paths(version)
+        vectors = entry_vectors(entries, self.dimensions)
+        ids = np.asarray([entry.pk for entry in entries], dtype=np.int64)
+        for path, data, row_bytes in (
+            (vectors_path, vectors, self.dimensions * 4),
+            (ids_path, ids, 8),
+        ):
+            with open(path, 'ab') as f:
+                # meta.json 에 반영되지 못한 이전 쓰기(중단)는 잘라냄
+                f.truncate(count * row_bytes)
+                f.write(data.tobytes())
+                f.flush()
+                os.fsync(f.fileno())
+        return count + len(entries)
+
+    def update(self, batch_size: int = 5000, rebuild: bool = False) -> dict:
+        """
+        마지막으로 색인한 엔트리 이후의 대표 엔트리를 인덱스에 추가
+
+        Args:
+            batch_size: 한 번에 벡터로 만들 엔트리 수
+            rebuild: 새 버전으로 전체 재구축 (삭제된 엔트리 정리, 차원 변경 시)
+
+        Returns:
+            버전, 전체 행 수, 이번에 추가한 행 수
+        """
+        os.makedirs(self.index_dir, exist_ok=True)
+        with open(os.path.join(self.index_dir, '.lock'), 'w') as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+
+            meta = self._read_meta()
+            previous_version = meta['version'] if meta else None
+            if meta is None or rebuild or meta['dimensions'] != self.dimensions:
+                meta = {
+                    'version': (previous_version or 0) + 1,
+                    'dimensions': self.dimensions,
+                    'count': 0,
+                    'last_entry_id': 0,
+                }
+                for path in self._paths(meta['version']):
+                    open(path, 'wb').close()
+
+            added = 0
+            while True:
+                entries = list(_indexable_entries().filter(pk__gt=meta['last_entry_id'])[:batch_size])
+                if not entries:
+                    break
+                meta['count'] = self._append(meta['version'], meta['count'], entries)
+                meta['last_entry_id'] = entries[-1].pk
+                added += len(entries)
+                # 새 버전(재구축)은 끝까지 만든 뒤 한 번만 교체해 읽는 쪽이 일부만 보지 않게 함
+                if meta['version'] == previous_version:
+                    self._write_meta(meta)
+
+            if previous_version != meta['version']:
+                self._write_meta(meta)
+                # 이전 버전 파일은 meta.json 이 새 버전을 가리킨 뒤에만 삭제
+                if previous_version is not None:
+                    for path in self._paths(previous_version):
+                        if os.path.exists(path):
+                            os.remove(path)
+
+        return {'version': meta['version'], 'count': meta['count'], 'added': added}
+
+
+class RelatedIndex:
+    """관련 기사 인덱스 읽기 (memmap, 프로세스 간 페이지 캐시 공유)"""
+
+    def __init__(self, index_dir: str = None):
+        self.index_dir = index_dir or _index_dir()
+        self.meta_path = os.path.join(self.index_dir, 'meta.json')
+        self.meta = None
+        self.vectors = None
+        self.ids = None
+        self._meta_signature = None
+
+    def refresh(self) -> bool:
+        """meta.json 이 바뀌었으면 다시 매핑. 인덱스가 있으면 True"""
+        try:
+            stat = os.stat(self.meta_path)
+        except FileNotFoundError:
+            return False
+        # meta.json 은 항상 os.replace 로 교체되므로 inode 가 바뀜
+        signature = (stat.st_ino, stat.st_mtime_ns)
+        if signature == self._meta_signature:
+            return self.meta is not None and self.meta['count'] > 0
+
+        with open(self.meta_path) as f:
+            meta = json.load(f)
+        self._meta_signature = signature
+        self.meta = meta
+        if not meta['count']:
+            self.vectors = self.ids = None
+            return False
+
+        version, count, dimensions = meta['version'], meta['count'], meta['dimensions']
+        self.vectors = np.memmap(
+            os.path.join(self.index_dir, f'vectors-{version}.f32'),
+            dtype=np.float32, mode='r', shape=(count, dimensions)
+        )
+        self.ids = np.memmap(
+            os.path.join(self.index_dir, f'ids-{version}.i64'),
+            dtype=np.int64, mode='r', shape=(count,)
+        )
+        return True
+
+    def neighbours(self, entry: RSSEntry, k: int = 5) -> List[Tuple[int, float]]:
+        """
+        엔트리와 코사인 유사도가 높은 이웃 엔트리
+
+        Args:
+            entry: 기준 엔트리 (색인되지 않은 새 엔트리도 가능)
+            k: 이웃 수
+
+        Returns:
+            (엔트리 ID, 유사도) 목록, 유사도 내림차순. 인덱스가 없으면 빈 목록
+        """
+        if not self.refresh():
+            return []
+
+        row = int(np.searchsorted(self.ids, entry.pk))
+        if row < len(self.ids) and self.ids[row] == entry.pk:
+            query = np.asarray(self.vectors[row])
+        else:
+            query = entry_vectors([entry], self.meta['dimensions'])[0]
+
+        scores = self.vectors @ query
+        candidates = min(k + 1, len(scores))
+        top = np.argpartition(-scores, candidates - 1)[:candidates]
+        top = top[np.argsort(-scores[top], kind='stable')]
+        return [
+            (int(self.ids[i]), float(scores[i]))
+            for i in top
+            if self.ids[i] != entry.pk and scores[i] > 0
+        ][:k]
+
+
+_reader = None
+
+
+def get_related_index() -> RelatedIndex:
+    """프로세스별 공용 읽기 인스턴스"""
+    global _reader
+    if _reader is None or _reader.index_dir != _index_dir():
+        _reader = RelatedIndex()
+    return _reader
+
+
+def related_index_version() -> str:
+    """
+    현재 관련 기사 인덱스 버전 (페이지 캐시 키용)
+
+    증분 갱신은 버전을 유지한 채 행만 덧붙이므로 행 수까지 포함한다.
+    인덱스가 없으면 '0'.
+    """
+    index = get_related_index()
+    index.refresh()
+    if index.meta is None:
+        return '0'
+    return f"{index.meta['version']}.{index.meta['count']}"
+
+
+def related_entries(entry: RSSEntry, limit: int = None) -> List[Tuple[RSSEntry, float]]:
+    """
+    엔트리의 관련 기사 (인덱스 이웃을 DB 엔트리로 변환)
+
+    인덱스에는 이미 삭제된 엔트리가 남아 있을 수 있어 여유 있게 찾은 뒤
+    존재하는 엔트리만 반환한다.
+
+    Args:
+        entry: 기준 엔트리
+        limit: 관련 기사 수 (기본값: RSS_RELATED_LIMIT)
+
+    Returns:
+        (엔트리, 유사도) 목록, 유사도 내림차순
+    """
+    limit = limit or getattr(settings, 'RSS_RELATED_LIMIT', 5)
+    neighbours = get_related_index().neighbours(entry, k=limit * 2)
+    found = RSSEntry.objects.select_related('feed', 'article').in_bulk([pk for pk, _ in neighbours])
+    return [(found[pk], score) for pk, score in neighbours if pk in found][:limit]
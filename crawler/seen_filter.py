@@ -0,0 +1,191 @@
+import hashlib
+import logging
+import math
+from typing import Iterable, List, Optional
+
+import redis
+from django.conf import settings
+
+from core.redis_client import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+
+class SeenLinkFilter:
+    """
+    피드별로 이미 저장된 링크를 기억하는 Redis 블룸 필터
+
+    Redis 비트맵 위에 블룸 필터를 구현한다 (Redis Stack 모듈 불필요).
+    "없다"는 응답은 확실하므로 해당 링크는 DB 중복 조회 없이 바로 저장하고,
+    "있을 수도 있다"는 후보만 DB에서 확인한다.
+
+    비트 0은 필터가 전체 엔트리로 채워졌음을 뜻하는 준비 플래그다. 키가
+    없거나(최초 사용, maxmemory 정책에 의한 삭제) 플래그가 없으면 필터를
+    사용하지 않고 모든 링크를 DB에서 확인한다.
+    """
+
+    KEY_PREFIX = 'crawl:seen:'
+    READY_BIT = 0
+
+    def __init__(self, feed_id: int, capacity: int = None, error_rate: float = None):
+        self.feed_id = feed_id
+        capacity = capacity or getattr(settings, 'RSS_SEEN_FILTER_CAPACITY', 100000)
+        error_rate = error_rate or getattr(settings, 'RSS_SEEN_FILTER_ERROR_RATE', 0.001)
+
+        # 최적 비트 수 m 과 해시 함수 수 k
+        self.num_bits = int(math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.num_hashes = max(1, int(round(self.num_bits / capacity * math.log(2))))
+
+        # 크기가 바뀌면 다른 키를 쓰게 되어 자연스럽게 재구축된다
+        self.key = f"{self.KEY_PREFIX}{feed_id}:{self.num_bits}:{self.num_hashes}"
+        self.count_key = f"{self.key}:count"
+        self.stats_key = f"{self.KEY_PREFIX}{feed_id}:stats"
+
+    def _offsets(self, link: str) -> List[int]:
+        """링크에 대응하는 비트 위치 목록 (더블 해싱, 비트 0 제외)"""
+        digest = hashlib.sha256(link.encode('utf-8')).digest()
+        h1 = int.from_bytes(digest[:8], 'big')
+        h2 = int.from_bytes(digest[8:16], 'big') | 1
+        return [1 + (h1 + i * h2) % self.num_bits for i in range(self.num_hashes)]
+
+    def might_contain_many(self, links: List[str]) -> Optional[List[bool]]:
+        """
+        링크별로 이미 저장되었을 가능성이 있는지 확인
+
+        Args:
+            links: 확인할 링크 목록
+
+        Returns:
+            링크별 결과 (False 면 확실히 새 링크). 필터를 쓸 수 없으면 None
+        """
+        if not links:
+            return []
+
+        try:
+            bitfield = get_redis_client().bitfield(self.key)
+            bitfield.get('u1', self.READY_BIT)
+            for link in links:
+                for offset in self._offsets(link):
+                    bitfield.get('u1', offset)
+            bits = bitfield.execute()
+        except redis.RedisError as e:
+            logger.warning("Seen filter unavailable for feed %s: %s", self.feed_id, e)
+            return None
+
+        if not bits[0]:
+            return None
+
+        k = self.num_hashes
+        return [all(bits[1 + i * k:1 + (i + 1) * k]) for i in range(len(links))]
+
+    def _set_bits(self, client, key: str, links: List[str]):
+        bitfield = client.bitfield(key)
+        for link in links:
+            for offset in self._offsets(link):
+                bitfield.set('u1', offset, 1)
+        bitfield.execute()
+
+    def add_many(self, links: Iterable[str]) -> int:
+        """
+        새로 저장된 링크들을 필터에 추가
+
+        Returns:
+            추가한 링크 수
+        """
+        links = list(links)
+        if not links:
+            return 0
+
+        try:
+            client = get_redis_client()
+            self._set_bits(client, self.key, links)
+            client.incrby(self.count_key, len(links))
+        except redis.RedisError as e:
+            logger.warning("Failed to update seen filter for feed %s: %s", self.feed_id, e)
+            return 0
+        return len(links)
+
+    def rebuild(self, links: Iterable[str], chunk_size: int = 5000) -> int:
+        """
+        저장된 전체 링크로 필터를 다시 채움
+
+        임시 키에 채운 뒤 RENAME 으로 교체하므로 재구축 중에도 기존
+        필터를 계속 사용할 수 있다.
+
+        Args:
+            links: 피드에 저장된 전체 링크
+            chunk_size: 한 번에 Redis 로 보낼 링크 수
+
+        Returns:
+            필터에 넣은 링크 수
+        """
+        client = get_redis_client()
+        tmp_key = f"{self.key}:rebuild"
+        client.delete(tmp_key)
+
+        total = 0
+        chunk = []
+        for link in links:
+            chunk.append(link)
+            if len(chunk) >= chunk_size:
+                self._set_bits(client, tmp_key, chunk)
+                total += len(chunk)
+                chunk = []
+        if chunk:
+            self._set_bits(client, tmp_key, chunk)
+            total += len(chunk)
+
+        pipe = client.pipeline()
+        pipe.setbit(tmp_key, self.READY_BIT, 1)
+        pipe.rename(tmp_key, self.key)
+        pipe.set(self.count_key, total)
+        pipe.execute()
+        return total
+
+    def record_lookups(self, checked: int, ruled_out: int, false_positives: int):
+        """
+        필터 조회 결과 누적 (적중률/오탐률 지표용)
+
+        Args:
+            checked: 필터로 확인한 링크 수
+            ruled_out: 필터가 새 링크로 판정해 DB 조회를 생략한 수
+            false_positives: 필터가 "있을 수도" 라고 했지만 DB 에 없던 수
+        """
+        try:
+            pipe = get_redis_client().pipeline()
+            pipe.hincrby(self.stats_key, 'checked', checked)
+            pipe.hincrby(self.stats_key, 'ruled_out', ruled_out)
+            pipe.hincrby(self.stats_key, 'false_positives', false_positives)
+            pipe.execute()
+        except redis.RedisError:
+            pass
+
+    def stats(self) -> dict:
+        """
+        필터 지표
+
+        Returns:
+            항목 수, 추정/관측 오탐률, 적중률(DB 조회를 생략한 비율)
+        """
+        client = get_redis_client()
+        count = int(client.get(self.count_key) or 0)
+        raw = {k.decode(): int(v) for k, v in client.hgetall(self.stats_key).items()}
+        checked = raw.get('checked', 0)
+        ruled_out = raw.get('ruled_out', 0)
+        false_positives = raw.get('false_positives', 0)
+
+        estimated_fp_rate = (
+            1 - math.exp(-self.num_hashes * count / self.num_bits)
+        ) ** self.num_hashes
+
+        return {
+            'feed_id': self.feed_id,
+            'ready': bool(client.getbit(self.key, self.READY_BIT)),
+            'items': count,
+            'num_bits': self.num_bits,
+            'num_hashes': self.num_hashes,
+            'estimated_fp_rate': estimated_fp_rate,
+            'observed_fp_rate': false_positives / max(false_positives + ruled_out, 1),
+            'hit_rate': ruled_out / max(checked, 1),
+            'checked': checked,
+        }
@@ -1,13 +1,32 @@
-import feedparser
-import re
+import logging
+import redis
+import requests
 import time
-from datetime import datetime, timezone
-from typing import List, Dict, Any
+from concurrent.futures import Executor, ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import List, Dict, Any, Optional, Tuple
 from django.utils import timezone as django_timezone
 from django.conf import settings
+from django.db import DatabaseError, IntegrityError, transaction
+from django.db.models import Max, Q
 
-from .exceptions import RSSFeedError, RSSProcessingError
-from core.models import RSSFeed, RSSEntry, RSSProcessingLog
+from .canonical_urls import canonicalize_url
+from .exceptions import RSSFeedError, RSSProcessingError, RSSStorageError
+from .ingest import IngestBuffer
+from .keywords import TfidfKeywordExtractor
+from .metrics import CrawlMetrics, current_metrics, ensure_metrics, stage
+from .minhash import NearDuplicateIndex
+from .parsing import (
+    clean_text, extract_keywords, parse_entry_date, parse_feed_with_stats, parse_feeds_parallel, process_entry,
+)
+from .seen_filter import SeenLinkFilter
+from .summarize import summarize_many
+from .trending import record_keyword_events
+from core.fragments import bump_ingest_version
+from core.telemetry import FETCH_ERRORS
+from core.models import Article, FeedBody, FeedSnapshot, RSSFeed, RSSEntry, RSSProcessingLog
+
+logger = logging.getLogger(__name__)
 
 
 class RSSCrawlerService:
@@ -16,12 +35,64 @@ class RSSCrawlerService:
     def __init__(self):
         self.feed_url = getattr(settings, 'RSS_FEED_URL', 'https://techcrunch.com/feed/')
 
-    def crawl_rss_feed(self, feed_url: str = None) -> List[Dict[str, Any]]:
+    def fetch_feed(self, feed_url: str) -> bytes:
+        """
+        RSS 피드 원문을 가져옴
+
+        Args:
+            feed_url: RSS 피드 URL
+
+        Returns:
+            응답 본문
+        """
+        with stage('fetch'):
+            try:
+                response = requests.get(
+                    feed_url,
+                    timeout=getattr(settings, 'RSS_FETCH_TIMEOUT', 30),
+                    headers={'User-Agent': 'issue-tracker-feed/1.0'}
+                )
+                content = response.content
+            except Exception as e:
+                FETCH_ERRORS.inc(feed=feed_url, reason=type(e).__name__)
+                raise
+        metrics = current_metrics()
+        if metrics is not None:
+            metrics.record_response(response.status_code, len(content))
+        if not response.ok:
+            FETCH_ERRORS.inc(feed=feed_url, reason=str(response.status_code))
+        response.raise_for_status()
+        return content
+
+    def archive_feed_body(self, feed: RSSFeed, raw: bytes):
+        """
+        가져온 피드 원문을 보관 (재처리용)
+
+        보관 실패가 크롤링을 막지 않도록 오류는 로그만 남긴다.
+
+        Args:
+            feed: RSS 피드 모델 인스턴스
+            raw: 피드 응답 본문
+
+        Returns:
+            생성된 스냅샷 (비활성화 또는 실패 시 None)
+        """
+        if not getattr(settings, 'RSS_ARCHIVE_ENABLED', True):
+            return None
+        try:
+            with transaction.atomic():
+                return FeedSnapshot.objects.create(feed=feed, body=FeedBody.store(raw))
+        except DatabaseError as e:
+            logger.warning("Failed to archive feed body for %s: %s", feed.url, e)
+            return None
+
+    def crawl_rss_feed(self, feed_url: str = None, feed: RSSFeed = None) -> List[Dict[str, Any]]:
         """
         RSS 피드를 크롤링하여 엔트리 목록을 반환
         
         Args:
             feed_url: 크롤링할 RSS 피드 URL
+            feed: 지정 시 가져온 원문을 이 피드의 스냅샷으로 보관
             
         Returns:
             처리된 RSS 엔트리 목록
@@ -33,159 +104,99 @@ class RSSCrawlerService:
             feed_url = self.feed_url
 
         try:
-            # RSS 피드 파싱
-            feed = feedparser.parse(feed_url)
-            
-            # RSS 피드 유효성 검사
-            if feed.bozo:
-                raise RSSFeedError(f"Invalid RSS feed: {feed.bozo_exception}")
-            
-            # 엔트리 처리
-            processed_entries = []
-            for entry in feed.entries:
-                processed_entry = self._process_entry(entry)
-                if processed_entry:
-                    processed_entries.append(processed_entry)
-            
-            return processed_entries
-            
+            raw = self.fetch_feed(feed_url)
+            if feed is not None:
+                with stage('db'):
+                    self.archive_feed_body(feed, raw)
+            with stage('parse'):
+                entries, date_parses = parse_feed_with_stats(raw, feed_url)
+            metrics = current_metrics()
+            if metrics is not None:
+                metrics.add_date_parses(date_parses)
+            return entries
+        except RSSFeedError:
+            raise
         except Exception as e:
             raise RSSFeedError(f"Failed to crawl RSS feed: {str(e)}")
 
-    def _process_entry(self, entry: Dict[str, Any]) -> Dict[str, Any]:
+    def crawl_many(self, feed_urls: List[str], max_workers: int = None) -> Dict[str, Any]:
         """
-        RSS 엔트리를 처리하여 정제된 데이터로 변환
-        
-        Args:
-            entry: 원본 RSS 엔트리
-            
-        Returns:
-            처리된 엔트리 데이터
-        """
-        try:
-            # 기본 정보 추출
-            title = self._clean_text(entry.get('title', ''))
-            link = entry.get('link', '')
-            description = self._clean_text(entry.get('description', ''))
-            author = entry.get('author', '')
-            
-            # 날짜 파싱
-            published_at = self._parse_entry_date(entry)
-            
-            # 키워드 추출
-            keywords = self._extract_keywords(f"{title} {description}")
-            
-            return {
-                'title': title,
-                'link': link,
-                'description': description,
-                'author': author,
-                'published_at': published_at,
-                'keywords': keywords
-            }
-            
-        except Exception as e:
-            # 개별 엔트리 처리 실패 시 로그만 남기고 계속 진행
-            print(f"Failed to process entry: {str(e)}")
-            return None
+        여러 피드를 한 번에 크롤링 (스윕)
+
+        네트워크 대기는 스레드로 동시에 처리하고, CPU 를 쓰는 파싱/정제는
+        프로세스 풀에서 코어 수만큼 병렬로 처리한 뒤 순서대로 저장한다.
 
-    def _parse_entry_date(self, entry: Dict[str, Any]) -> datetime:
-        """
-        RSS 엔트리의 날짜를 파싱
-        
         Args:
-            entry: RSS 엔트리
-            
+            feed_urls: 크롤링할 RSS 피드 URL 목록
+            max_workers: 파싱 워커 프로세스 수
+
         Returns:
-            파싱된 날짜 (실패 시 현재 시간 반환)
+            피드 URL 별 처리 로그 또는 예외
         """
-        try:
-            # 다양한 날짜 형식 지원
-            date_fields = ['published', 'pubDate', 'updated']
-            
-            for field in date_fields:
-                if field in entry and entry[field]:
-                    # feedparser가 자동으로 파싱한 시간 사용
-                    if hasattr(entry, 'published_parsed') and entry.published_parsed:
-                        return datetime(*entry.published_parsed[:6], tzinfo=timezone.utc)
-                    
-                    # 문자열 날짜 파싱 시도
-                    date_str = entry[field]
-                    # 간단한 파싱 (실제로는 더 정교한 파싱이 필요)
-                    try:
-                        from dateutil import parser
-                        return parser.parse(date_str)
-                    except:
-                        pass
-            
-            # 파싱 실패 시 현재 시간 반환
-            return django_timezone.now()
-            
-        except Exception:
-            return django_timezone.now()
+        max_workers = max_workers or getattr(settings, 'RSS_PARSE_WORKERS', None)
+
+        # 피드마다 지표를 따로 모음 (가져오기는 각 스레드에서 기록)
+        metrics = {feed_url: CrawlMetrics() for feed_url in feed_urls}
+
+        def fetch(feed_url):
+            with metrics[feed_url].activate():
+                try:
+                    return self.fetch_feed(feed_url)
+                except Exception as e:
+                    return RSSFeedError(f"Failed to crawl RSS feed: {str(e)}")
+
+        with ThreadPoolExecutor(max_workers=min(len(feed_urls), 16) or 1) as executor:
+            fetched = list(executor.map(fetch, feed_urls))
+
+        fetched_urls = [feed_url for feed_url, body in zip(feed_urls, fetched) if isinstance(body, bytes)]
+        bodies = [body for body in fetched if isinstance(body, bytes)]
+        parsed = iter(parse_feeds_parallel(bodies, max_workers=max_workers, feed_keys=fetched_urls, with_timings=True))
+
+        results = {}
+        for feed_url, body in zip(feed_urls, fetched):
+            if isinstance(body, bytes):
+                entries, parse_ms, date_parses = next(parsed)
+                metrics[feed_url].add_stage_ms('parse', parse_ms)
+                metrics[feed_url].add_date_parses(date_parses)
+            else:
+                entries = body
+            if isinstance(entries, Exception):
+                results[feed_url] = entries
+                continue
+
+            with metrics[feed_url].activate() as feed_metrics, feed_metrics.track_queries():
+                with feed_metrics.stage('db'):
+                    feed = self._get_feed(feed_url)
+                    self.archive_feed_body(feed, body)
+                try:
+                    results[feed_url] = self.save_entries_to_db(feed, entries)
+                except RSSProcessingError as e:
+                    results[feed_url] = e
+        return results
+
+    def _process_entry(self, entry: Dict[str, Any]) -> Dict[str, Any]:
+        """RSS 엔트리를 처리하여 정제된 데이터로 변환 (crawler.parsing.process_entry)"""
+        return process_entry(entry)
+
+    def _parse_entry_date(self, entry: Dict[str, Any]) -> Optional[datetime]:
+        """RSS 엔트리의 날짜를 파싱 (crawler.parsing.parse_entry_date)"""
+        return parse_entry_date(entry)
 
     def _clean_text(self, text: str) -> str:
-        """
-        HTML 태그를 제거하고 텍스트를 정제
-        
-        Args:
-            text: 정제할 텍스트
-            
-        Returns:
-            정제된 텍스트
-        """
-        if not text:
-            return ""
-        
-        # HTML 태그 제거
-        clean_text = re.sub(r'<[^>]+>', '', text)
-        
-        # 여러 공백을 하나로 변환
-        clean_text = re.sub(r'\s+', ' ', clean_text)
-        
-        return clean_text.strip()
+        """HTML 태그를 제거하고 텍스트를 정제 (crawler.parsing.clean_text)"""
+        return clean_text(text)
 
     def _extract_keywords(self, text: str) -> List[str]:
-        """
-        텍스트에서 키워드를 추출
-        
-        Args:
-            text: 키워드를 추출할 텍스트
-            
-        Returns:
-            추출된 키워드 목록
-        """
-        if not text:
-            return []
-        
-        # 간단한 키워드 추출 (실제로는 TF-IDF나 다른 알고리즘 사용)
-        # 일반적인 기술 키워드들
-        tech_keywords = [
-            'AI', 'artificial intelligence', 'machine learning', 'ML',
-            'blockchain', 'cryptocurrency', 'bitcoin', 'ethereum',
-            'startup', 'venture capital', 'funding', 'investment',
-            'technology', 'innovation', 'disruption', 'digital',
-            'cloud', 'AWS', 'Azure', 'Google Cloud',
-            'mobile', 'app', 'application', 'software',
-            'cybersecurity', 'privacy', 'data', 'analytics',
-            'fintech', 'healthtech', 'edtech', 'proptech'
-        ]
-        
-        # 텍스트를 소문자로 변환
-        text_lower = text.lower()
-        
-        # 키워드 매칭
-        found_keywords = []
-        for keyword in tech_keywords:
-            if keyword.lower() in text_lower:
-                found_keywords.append(keyword)
-        
-        return found_keywords[:10]  # 최대 10개 키워드만 반환
+        """텍스트에서 키워드를 추출 (crawler.parsing.extract_keywords)"""
+        return extract_keywords(text)
 
     def save_entries_to_db(self, feed: RSSFeed, entries: List[Dict[str, Any]]) -> RSSProcessingLog:
         """
         처리된 엔트리들을 데이터베이스에 저장
         
+        크롤링 중이면(crawl_and_save 등) 그 크롤링의 지표에, 아니면 새 지표에
+        저장 단계 시간과 쿼리 수를 기록해 처리 로그에 남긴다.
+        
         Args:
             feed: RSS 피드 모델 인스턴스
             entries: 저장할 엔트리 목록
@@ -193,90 +204,707 @@ class RSSCrawlerService:
         Returns:
             처리 로그
         """
-        start_time = time.time()
+        with ensure_metrics() as metrics, metrics.track_queries(), metrics.stage('db'):
+            return self._save_entries_to_db(feed, entries, metrics)
+
+    def _save_entries_to_db(
+        self, feed: RSSFeed, entries: List[Dict[str, Any]], metrics: CrawlMetrics
+    ) -> RSSProcessingLog:
         processed_count = 0
         new_count = 0
         error_message = ""
         
         try:
+            entries = self._fill_missing_dates(feed, entries)
+
+            # 기사 본문/키워드는 정규화된 URL 기준 Article 에 한 번만 저장
+            entries, articles = self._save_articles(entries)
+
+            # 블룸 필터로 확실히 새로운 링크를 걸러내고, 나머지 후보만 한 번에 DB 조회
+            links = [entry_data['link'] for entry_data in entries]
+            seen_filter = self._get_seen_filter(feed)
+            maybe_seen = seen_filter.might_contain_many(links) if seen_filter else None
+            if maybe_seen is None:
+                candidates = set(links)
+            else:
+                candidates = {link for link, maybe in zip(links, maybe_seen) if maybe}
+
+            existing_entries = {}
+            if candidates:
+                existing_entries = {
+                    entry.link: entry
+                    for entry in RSSEntry.objects.filter(feed=feed, link__in=candidates)
+                }
+            false_positives = len(candidates) - len(existing_entries)
+
+            new_links = []
+            new_entries = []
             for entry_data in entries:
                 try:
-                    # 중복 체크
-                    existing_entry = RSSEntry.objects.filter(
-                        feed=feed,
-                        link=entry_data['link']
-                    ).first()
+                    existing_entry = existing_entries.get(entry_data['link'])
                     
-                    if existing_entry:
-                        # 기존 엔트리 업데이트
-                        existing_entry.title = entry_data['title']
-                        existing_entry.description = entry_data['description']
-                        existing_entry.author = entry_data['author']
-                        existing_entry.keywords = entry_data['keywords']
-                        existing_entry.save()
-                    else:
+                    if existing_entry is None:
                         # 새 엔트리 생성
-                        entry = RSSEntry.objects.create(
+                        entry = RSSEntry(
                             feed=feed,
+                            article=articles[entry_data['link']],
                             title=entry_data['title'],
                             link=entry_data['link'],
-                            description=entry_data['description'],
                             author=entry_data['author'],
                             published_at=entry_data['published_at']
                         )
                         entry.set_keywords(entry_data['keywords'])
-                        entry.save()
-                        new_count += 1
+                        try:
+                            with transaction.atomic():
+                                entry.save()
+                        except IntegrityError:
+                            # 필터 키 유실 등으로 놓친 기존 엔트리
+                            existing_entry = RSSEntry.objects.get(feed=feed, link=entry_data['link'])
+                        else:
+                            existing_entries[entry.link] = entry
+                            new_links.append(entry.link)
+                            new_entries.append(entry)
+                            new_count += 1
+                    
+                    if existing_entry is not None:
+                        # 기존 엔트리 업데이트
+                        existing_entry.article = articles[entry_data['link']]
+                        existing_entry.title = entry_data['title']
+                        existing_entry.description = ''
+                        existing_entry.author = entry_data['author']
+                        existing_entry.set_keywords(entry_data['keywords'])
+                        existing_entry.save()
                     
                     processed_count += 1
                     
                 except Exception as e:
                     error_message += f"Entry processing error: {str(e)}\n"
             
+            with stage('enrich'):
+                self._link_duplicates_safe(new_entries)
+
+            if seen_filter:
+                if maybe_seen is None:
+                    self._rebuild_seen_filter(feed, seen_filter)
+                else:
+                    seen_filter.add_many(new_links)
+                    seen_filter.record_lookups(
+                        checked=len(links),
+                        ruled_out=len(links) - len(candidates),
+                        false_positives=false_positives
+                    )
+            
             # 피드 업데이트 시간 갱신
             feed.last_crawled_at = django_timezone.now()
-            feed.save()
+            # 리스 필드를 덮어쓰지 않도록 필요한 컬럼만 저장
+            feed.save(update_fields=['last_crawled_at', 'updated_at'])
             
-            # 처리 로그 생성
-            processing_time = time.time() - start_time
+            # 처리 로그 생성 (처리 시간은 가져오기부터의 전체 시간)
             log = RSSProcessingLog.objects.create(
                 feed=feed,
                 status='success' if not error_message else 'partial',
                 entries_processed=processed_count,
                 entries_new=new_count,
                 error_message=error_message,
-                processing_time=processing_time
+                **metrics.log_fields()
             )
+            metrics.export(feed.url, log.status, new=new_count, updated=processed_count - new_count)
             
             return log
             
         except Exception as e:
             # 전체 처리 실패 시 로그 생성
-            processing_time = time.time() - start_time
             log = RSSProcessingLog.objects.create(
                 feed=feed,
                 status='error',
                 entries_processed=processed_count,
                 entries_new=new_count,
                 error_message=str(e),
-                processing_time=processing_time
+                **metrics.log_fields()
             )
+            metrics.export(feed.url, log.status)
             raise RSSProcessingError(f"Failed to save entries: {str(e)}")
 
-    def crawl_and_save(self, feed_url: str = None) -> RSSProcessingLog:
+    def upsert_entries(self, feed: RSSFeed, entries: List[Dict[str, Any]]) -> RSSProcessingLog:
         """
-        RSS 피드를 크롤링하고 데이터베이스에 저장
-        
+        엔트리들을 한 번의 bulk upsert 로 저장 (write-behind writer 용)
+
+        INSERT ... ON CONFLICT (feed_id, link) DO UPDATE 한 문장으로 저장하므로
+        엔트리 수와 관계없이 트랜잭션 하나, 쿼리 몇 개로 끝난다.
+
         Args:
-            feed_url: 크롤링할 RSS 피드 URL
-            
+            feed: RSS 피드 모델 인스턴스
+            entries: 저장할 엔트리 목록
+
         Returns:
             처리 로그
         """
+        with ensure_metrics() as metrics, metrics.track_queries(), metrics.stage('db'), transaction.atomic():
+            entries = self._fill_missing_dates(feed, entries)
+            entries, articles = self._save_articles(entries)
+
+            # 같은 배치 안의 중복 링크는 마지막 것만 사용
+            entries_by_link = {entry_data['link']: entry_data for entry_data in entries}
+            existing_links = set(
+                RSSEntry.objects.filter(
+                    feed=feed,
+                    link__in=list(entries_by_link)
+                ).values_list('link', flat=True)
+            )
+
+            objs = []
+            for entry_data in entries_by_link.values():
+                entry = RSSEntry(
+                    feed=feed,
+                    article=articles[entry_data['link']],
+                    title=entry_data['title'],
+                    link=entry_data['link'],
+                    author=entry_data['author'],
+                    published_at=entry_data['published_at']
+                )
+                entry.set_keywords(entry_data['keywords'])
+                objs.append(entry)
+
+            RSSEntry.objects.bulk_create(
+                objs,
+                batch_size=1000,
+                update_conflicts=True,
+                unique_fields=['feed', 'link'],
+                update_fields=['article', 'title', 'description', 'author', 'keywords', 'updated_at']
+            )
+
+            new_links = [link for link in entries_by_link if link not in existing_links]
+            with stage('enrich'):
+                self._link_duplicates_safe(
+                    list(
+                        RSSEntry.objects.filter(feed=feed, link__in=new_links)
+                        .select_related('article')
+                        .order_by('pk')
+                    )
+                )
+            log = RSSProcessingLog.objects.create(
+                feed=feed,
+                status='success',
+                entries_processed=len(entries_by_link),
+                entries_new=len(new_links),
+                **metrics.log_fields()
+            )
+            metrics.export(feed.url, log.status, new=len(new_links), updated=len(entries_by_link) - len(new_links))
+
+        seen_filter = self._get_seen_filter(feed)
+        if seen_filter:
+            seen_filter.add_many(new_links)
+
+        return log
+
+    def crawl_and_enqueue(self, feed_url: str = None) -> int:
+        """
+        RSS 피드를 크롤링하고 DB 대신 인제스트 스트림에 적재
+
+        Args:
+            feed_url: 크롤링할 RSS 피드 URL
+
+        Returns:
+            스트림에 적재한 엔트리 수
+
+        Raises:
+            RSSStorageError: 스트림 적재 실패 시
+        """
         if feed_url is None:
             feed_url = self.feed_url
-        
-        # RSS 피드 모델 가져오기 또는 생성
+
+        feed = self._get_feed(feed_url)
+
+        entries = self.crawl_rss_feed(feed_url, feed=feed)
+
+        try:
+            queued = IngestBuffer().append(feed.pk, entries)
+        except redis.RedisError as e:
+            raise RSSStorageError(f"Failed to enqueue entries: {str(e)}")
+
+        # 크롤링 주기 판단은 적재 시점 기준 (DB 반영은 writer 가 담당)
+        feed.last_crawled_at = django_timezone.now()
+        feed.save(update_fields=['last_crawled_at', 'updated_at'])
+        return queued
+
+    def reprocess_archive(
+        self,
+        feed_ids: List[int] = None,
+        since: datetime = None,
+        until: datetime = None,
+        max_workers: int = None,
+        chunk_size: int = 200,
+    ) -> Dict[str, int]:
+        """
+        보관된 피드 원문을 현재 파싱/정제 로직으로 다시 처리 (네트워크 미사용)
+
+        (피드, 원문) 쌍마다 한 번만 파싱하고, 오래된 원문부터 처리해 같은
+        링크는 가장 최근 원문의 결과가 남도록 한다. 이미 저장된 엔트리만
+        bulk_update 하며 삭제된 엔트리를 되살리지는 않는다.
+
+        Args:
+            feed_ids: 재처리할 피드 ID 목록 (기본값: 전체)
+            since: 이 시각 이후 수집된 스냅샷만
+            until: 이 시각 이전 수집된 스냅샷만
+            max_workers: 파싱 워커 프로세스 수
+            chunk_size: 한 번에 불러와 파싱할 원문 수
+
+        Returns:
+            처리한 원문 수, 파싱 실패 수, 갱신한 엔트리 수
+        """
+        max_workers = max_workers or getattr(settings, 'RSS_PARSE_WORKERS', None)
+
+        snapshots = FeedSnapshot.objects.all()
+        if feed_ids:
+            snapshots = snapshots.filter(feed_id__in=feed_ids)
+        if since:
+            snapshots = snapshots.filter(fetched_at__gte=since)
+        if until:
+            snapshots = snapshots.filter(fetched_at__lt=until)
+        pairs = list(
+            snapshots.values('feed_id', 'body_id')
+            .annotate(last_fetched_at=Max('fetched_at'))
+            .order_by('last_fetched_at')
+        )
+        feed_urls = dict(
+            RSSFeed.objects.filter(pk__in={pair['feed_id'] for pair in pairs}).values_list('pk', 'url')
+        )
+
+        stats = {'bodies': 0, 'failed': 0, 'updated': 0}
+        for start in range(0, len(pairs), chunk_size):
+            chunk = pairs[start:start + chunk_size]
+            bodies = FeedBody.objects.in_bulk([pair['body_id'] for pair in chunk])
+            parsed = parse_feeds_parallel(
+                [bodies[pair['body_id']].get_raw() for pair in chunk],
+                max_workers=max_workers,
+                feed_keys=[feed_urls[pair['feed_id']] for pair in chunk],
+            )
+
+            # 피드별로 링크 -> 최신 엔트리 데이터 (청크 안에서도 오래된 순)
+            latest = {}
+            for pair, entries in zip(chunk, parsed):
+                stats['bodies'] += 1
+                if isinstance(entries, Exception):
+                    stats['failed'] += 1
+                    logger.warning("Failed to reprocess body %s: %s", pair['body_id'], entries)
+                    continue
+                for entry_data in entries:
+                    latest.setdefault(pair['feed_id'], {})[entry_data['link']] = entry_data
+
+            stats['updated'] += self._bulk_update_entries(latest)
+        return stats
+
+    def _bulk_update_entries(self, entries_by_feed: Dict[int, Dict[str, Dict[str, Any]]]) -> int:
+        """피드별 링크 -> 엔트리 데이터로 기존 엔트리들을 일괄 갱신"""
+        updated = []
+        for feed_id, entries_by_link in entries_by_feed.items():
+            existing = list(RSSEntry.objects.filter(feed_id=feed_id, link__in=list(entries_by_link)))
+            reparsed = []
+            for entry in existing:
+                entry_data = entries_by_link[entry.link]
+                if entry_data['published_at'] is None:
+                    # 날짜를 파싱하지 못하면 저장된 발행일 유지
+                    entry_data = dict(entry_data, published_at=entry.published_at)
+                reparsed.append(entry_data)
+            entries, articles = self._save_articles(reparsed, refresh_dates=True)
+            for entry, entry_data in zip(existing, entries):
+                entry.article = articles[entry_data['link']]
+                entry.title = entry_data['title']
+                entry.description = ''
+                entry.author = entry_data['author']
+                entry.published_at = entry_data['published_at']
+                entry.set_keywords(entry_data['keywords'])
+                entry.updated_at = django_timezone.now()
+                updated.append(entry)
+
+        RSSEntry.objects.bulk_update(
+            updated,
+            ['article', 'title', 'description', 'author', 'published_at', 'keywords', 'updated_at'],
+            batch_size=1000
+        )
+        return len(updated)
+
+    def summarize_pending(
+        self, batch_size: int = 200, max_workers: int = None, executor: Executor = None
+    ) -> Dict[str, Any]:
+        """
+        요약되지 않은 엔트리(is_processed=False) 한 배치를 추출 요약
+
+        배치를 SELECT ... FOR UPDATE SKIP LOCKED 로 골라 summary_claimed_at 을
+        찍고 바로 커밋한 뒤(행 잠금은 이 짧은 트랜잭션 동안만 유지), 트랜잭션
+        밖에서 요약하고 결과 저장과 is_processed=True 표시를 한 번에 커밋한다.
+        요약 도중 워커가 죽으면 RSS_SUMMARY_CLAIM_SECONDS 가 지난 뒤 다른
+        워커가 배치를 다시 가져간다. 기사에 연결된 엔트리는 기사당 한 번만
+        요약해 Article.summary 에 저장한다.
+
+        Args:
+            batch_size: 한 번에 처리할 엔트리 수
+            max_workers: 요약 워커 프로세스 수
+            executor: 배치 사이에 재사용할 프로세스 풀 (crawler.summarize.summary_pool)
+
+        Returns:
+            처리한 엔트리 수, 생성한 요약 수, 배치 처리 시간(초)
+        """
+        started = time.perf_counter()
+        max_sentences = getattr(settings, 'RSS_SUMMARY_SENTENCES', 2)
+        max_chars = getattr(settings, 'RSS_SUMMARY_MAX_CHARS', 400)
+        claim_seconds = getattr(settings, 'RSS_SUMMARY_CLAIM_SECONDS', 300)
+
+        with transaction.atomic():
+            claimed_at = django_timezone.now()
+            entries = list(
+                RSSEntry.objects.filter(
+                    Q(summary_claimed_at__isnull=True)
+                    | Q(summary_claimed_at__lt=claimed_at - timedelta(seconds=claim_seconds)),
+                    is_processed=False,
+                )
+                .select_related('article')
+                .order_by('pk')
+                .select_for_update(skip_locked=True, of=('self',))[:batch_size]
+            )
+            if not entries:
+                return {'entries': 0, 'summaries': 0, 'seconds': time.perf_counter() - started}
+            RSSEntry.objects.filter(pk__in=[entry.pk for entry in entries]).update(summary_claimed_at=claimed_at)
+
+        # 요약 대상: 아직 요약이 없는 기사(기사당 한 번) + 기사 미연결 엔트리
+        targets = {}
+        for entry in entries:
+            if entry.article_id:
+                if not entry.article.summary:
+                    targets.setdefault(('article', entry.article_id), entry.article)
+            else:
+                targets[('entry', entry.pk)] = entry
+
+        try:
+            summaries = summarize_many(
+                [target.description for target in targets.values()],
+                max_sentences=max_sentences,
+                max_chars=max_chars,
+                max_workers=max_workers,
+                executor=executor
+            )
+        except Exception:
+            # 선점을 풀어 다음 실행에서 바로 다시 처리
+            RSSEntry.objects.filter(
+                pk__in=[entry.pk for entry in entries], summary_claimed_at=claimed_at
+            ).update(summary_claimed_at=None)
+            raise
+
+        now = django_timezone.now()
+        for target, summary in zip(targets.values(), summaries):
+            target.summary = summary
+            target.updated_at = now  # bulk_update 는 auto_now 를 갱신하지 않음 (상세 페이지 캐시 키)
+
+        with transaction.atomic():
+            Article.objects.bulk_update(
+                [target for key, target in targets.items() if key[0] == 'article'], ['summary', 'updated_at']
+            )
+            RSSEntry.objects.bulk_update(
+                [target for key, target in targets.items() if key[0] == 'entry'], ['summary', 'updated_at']
+            )
+            RSSEntry.objects.filter(pk__in=[entry.pk for entry in entries]).update(
+                is_processed=True, summary_claimed_at=None
+            )
+            transaction.on_commit(bump_ingest_version)
+
+        return {
+            'entries': len(entries),
+            'summaries': len(targets),
+            'seconds': time.perf_counter() - started,
+        }
+
+    def canonicalize_entry_links(self, entries: List[RSSEntry]) -> List[RSSEntry]:
+        """
+        기존 엔트리의 링크를 정규화된 URL 로 바꿈 (백필용)
+
+        크롤링은 정규화된 링크로 (feed, link) 를 조회하므로 예전 형식의
+        링크(utm 파라미터, 대문자 호스트 등)가 남아 있으면 같은 기사가 새
+        엔트리로 다시 저장된다. 같은 피드에서 같은 정규화 링크가 되는
+        엔트리(이미 중복 저장된 엔트리 포함)는 가장 먼저 저장된 엔트리 하나로
+        합치고, 나머지를 가리키던 대표 엔트리 참조는 남는 엔트리로 옮긴다.
+
+        Args:
+            entries: 백필할 엔트리 목록
+
+        Returns:
+            합친 뒤 남은 엔트리 목록 (입력 순서)
+        """
+        targets = {}
+        for entry in entries:
+            canonical = canonicalize_url(entry.link)
+            if canonical != entry.link:
+                targets[entry.pk] = (entry.feed_id, canonical)
+        if not targets:
+            return entries
+
+        # (피드, 정규화 링크) 별로 합칠 엔트리: 이번 배치 + 이미 그 링크로 저장된 엔트리
+        groups = {}
+        for entry in entries:
+            if entry.pk in targets:
+                groups.setdefault(targets[entry.pk], []).append(entry)
+        stored = RSSEntry.objects.filter(
+            feed_id__in={feed_id for feed_id, _ in groups},
+            link__in={link for _, link in groups},
+        )
+        for entry in stored:
+            group = groups.get((entry.feed_id, entry.link))
+            if group is not None and all(member.pk != entry.pk for member in group):
+                group.append(entry)
+
+        removed = set()
+        with transaction.atomic():
+            for (_, link), group in groups.items():
+                group.sort(key=lambda member: member.pk)
+                keeper, others = group[0], group[1:]
+                other_pks = [member.pk for member in others]
+                changes = {'link': link, 'updated_at': django_timezone.now()}
+                if other_pks:
+                    RSSEntry.objects.filter(canonical_entry_id__in=other_pks).exclude(pk=keeper.pk).update(
+                        canonical_entry_id=keeper.pk
+                    )
+                    for entry in entries:
+                        if entry.canonical_entry_id in other_pks:
+                            entry.canonical_entry_id = keeper.pk
+                    if keeper.canonical_entry_id in other_pks or keeper.canonical_entry_id == keeper.pk:
+                        changes['canonical_entry_id'] = keeper.canonical_entry_id = None
+                    if keeper.article_id is None:
+                        changes['article_id'] = keeper.article_id = next(
+                            (member.article_id for member in others if member.article_id), None
+                        )
+                    RSSEntry.objects.filter(pk__in=other_pks).delete()
+                    removed.update(other_pks)
+                RSSEntry.objects.filter(pk=keeper.pk).update(**changes)
+                keeper.link = link
+
+        for feed_id in {feed_id for feed_id, _ in groups}:
+            seen_filter = self._get_seen_filter(RSSFeed(pk=feed_id))
+            if seen_filter:
+                seen_filter.add_many([link for key_feed, link in groups if key_feed == feed_id])
+        if removed:
+            logger.info("Merged %d entries into canonical links", len(removed))
+        return [entry for entry in entries if entry.pk not in removed]
+
+    def attach_articles(self, entries: List[RSSEntry]) -> int:
+        """
+        기사가 연결되지 않은 기존 엔트리를 기사에 연결 (백필용)
+
+        엔트리의 설명은 기사로 옮기고 엔트리 쪽 사본은 비운다. 엔트리
+        링크의 정규화는 canonicalize_entry_links 가 먼저 처리한다.
+
+        Args:
+            entries: 기사 미연결 엔트리 목록
+
+        Returns:
+            연결한 엔트리 수
+        """
+        data, articles = self._save_articles([
+            {
+                'title': entry.title,
+                'link': entry.link,
+                'description': entry.description,
+                'author': entry.author,
+                'published_at': entry.published_at,
+                'keywords': entry.keywords_list,
+            }
+            for entry in entries
+        ])
+        for entry, entry_data in zip(entries, data):
+            entry.article = articles[entry_data['link']]
+            entry.description = ''
+            entry.set_keywords(entry_data['keywords'])
+        RSSEntry.objects.bulk_update(entries, ['article', 'description', 'keywords'], batch_size=1000)
+        return len(entries)
+
+    def _save_articles(
+        self, entries: List[Dict[str, Any]], refresh_dates: bool = False
+    ) -> Tuple[List[Dict[str, Any]], Dict[str, Article]]:
+        """
+        엔트리 배치의 기사를 정규화된 URL 기준으로 한 번에 upsert
+
+        키워드는 기사 단위로 계산하므로 여러 피드에 실린 기사도 문서
+        빈도에는 처음 저장될 때 한 번만 반영된다.
+
+        Args:
+            entries: 처리된 엔트리 목록
+            refresh_dates: 기존 기사의 발행일도 갱신할지 여부 (재처리용)
+
+        Returns:
+            링크를 정규화하고 기사 키워드를 채운 엔트리 목록, 정규화된 URL 별 기사
+        """
+        entries = [dict(entry_data, link=canonicalize_url(entry_data['link'])) for entry_data in entries]
+        entries_by_link = {entry_data['link']: entry_data for entry_data in entries}
+        if not entries_by_link:
+            return entries, {}
+
+        existing_urls = set(
+            Article.objects.filter(
+                canonical_url__in=list(entries_by_link)
+            ).values_list('canonical_url', flat=True)
+        )
+        new_links = set(entries_by_link) - existing_urls
+        with stage('enrich'):
+            scored = self._apply_corpus_keywords(list(entries_by_link.values()), new_links=new_links)
+
+        objs = []
+        for entry_data in scored:
+            article = Article(
+                canonical_url=entry_data['link'],
+                title=entry_data['title'],
+                description=entry_data['description'],
+                author=entry_data['author'],
+                published_at=entry_data['published_at']
+            )
+            article.set_keywords(entry_data['keywords'])
+            objs.append(article)
+
+        update_fields = ['title', 'description', 'author', 'keywords', 'updated_at']
+        if refresh_dates:
+            update_fields.append('published_at')
+        Article.objects.bulk_create(
+            objs,
+            batch_size=1000,
+            update_conflicts=True,
+            unique_fields=['canonical_url'],
+            update_fields=update_fields
+        )
+
+        # 트렌딩 점수는 새 기사만, 저장이 커밋된 뒤에 반영
+        trending_events = [
+            (entry_data['keywords'], entry_data['published_at'].timestamp())
+            for entry_data in scored
+            if entry_data['link'] in new_links
+        ]
+        transaction.on_commit(lambda: record_keyword_events(trending_events))
+        transaction.on_commit(bump_ingest_version)
+
+        articles = Article.objects.in_bulk(list(entries_by_link), field_name='canonical_url')
+        keywords = {entry_data['link']: entry_data['keywords'] for entry_data in scored}
+        for entry_data in entries:
+            entry_data['keywords'] = keywords[entry_data['link']]
+        return entries, articles
+
+    def _apply_corpus_keywords(self, entries: List[Dict[str, Any]], new_links: set) -> List[Dict[str, Any]]:
+        """
+        엔트리 배치의 키워드를 코퍼스 TF-IDF 로 다시 계산
+
+        새 엔트리만 문서 빈도에 반영하고, 이미 저장된 엔트리는 현재 문서
+        빈도로 점수만 다시 매긴다. RSS_KEYWORD_EXTRACTOR 가 'fixed' 이면
+        파싱 단계의 고정 키워드 목록 결과를 그대로 사용한다.
+
+        Args:
+            entries: 처리된 엔트리 목록
+            new_links: 새로 저장될 엔트리의 링크
+
+        Returns:
+            keywords 가 교체된 엔트리 목록 (입력 순서 유지)
+        """
+        if getattr(settings, 'RSS_KEYWORD_EXTRACTOR', 'tfidf') != 'tfidf':
+            return entries
+
+        entries = [dict(entry_data) for entry_data in entries]
+        extractor = TfidfKeywordExtractor(top_k=getattr(settings, 'RSS_KEYWORD_TOP_K', 10))
+        new_entries = [entry_data for entry_data in entries if entry_data['link'] in new_links]
+        seen_entries = [entry_data for entry_data in entries if entry_data['link'] not in new_links]
+        for group, count_documents in ((new_entries, True), (seen_entries, False)):
+            keywords = extractor.extract(
+                [(entry_data['title'], entry_data['description']) for entry_data in group],
+                count_documents=count_documents
+            )
+            for entry_data, entry_keywords in zip(group, keywords):
+                entry_data['keywords'] = entry_keywords
+        return entries
+
+    def _link_duplicates_safe(self, new_entries: List[RSSEntry]) -> int:
+        """
+        중복 연결을 실패해도 저장을 계속하도록 실행
+
+        엔트리는 이미 저장되었으므로 중복 연결(MinHash/LSH) 실패로 크롤링을
+        실패 처리하면 재시도 동안 last_crawled_at 과 블룸 필터 갱신이
+        빠진다. 세이브포인트 안에서 실행해 실패 시 연결만 되돌리고 경고를
+        남긴다 (해당 엔트리는 대표 엔트리로 남음).
+        """
+        try:
+            with transaction.atomic():
+                return self._link_duplicates(new_entries)
+        except Exception as e:
+            logger.warning("Failed to link near-duplicates for %d entries: %s", len(new_entries), e)
+            return 0
+
+    def _link_duplicates(self, new_entries: List[RSSEntry]) -> int:
+        """
+        새 엔트리 중 다른 피드에 이미 실린 기사를 대표 엔트리에 연결
+
+        같은 기사(정규화된 URL)는 그 기사의 첫 등장 엔트리에 바로 연결하고,
+        처음 보는 기사만 MinHash/LSH 유사 중복 인덱스로 확인한다.
+
+        Returns:
+            중복으로 연결한 엔트리 수
+        """
+        if not new_entries:
+            return 0
+
+        first_appearances = dict(
+            RSSEntry.objects.filter(
+                article_id__in={entry.article_id for entry in new_entries if entry.article_id},
+                canonical_entry__isnull=True
+            )
+            .exclude(pk__in=[entry.pk for entry in new_entries])
+            .order_by('article_id', 'pk')
+            .distinct('article_id')
+            .values_list('article_id', 'pk')
+        )
+        shared = [entry for entry in new_entries if entry.article_id in first_appearances]
+        for entry in shared:
+            entry.canonical_entry_id = first_appearances[entry.article_id]
+        RSSEntry.objects.bulk_update(shared, ['canonical_entry'])
+
+        unseen = [entry for entry in new_entries if entry.article_id not in first_appearances]
+        if not unseen or not getattr(settings, 'RSS_NEAR_DUPLICATE_ENABLED', True):
+            return len(shared)
+        return len(shared) + NearDuplicateIndex().index_entries(unseen)
+
+    def _fill_missing_dates(self, feed: RSSFeed, entries: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        발행일을 파싱하지 못한 엔트리에 저장된 발행일을 채움
+
+        이미 저장된 엔트리(같은 피드/링크, 없으면 같은 기사)는 저장된 발행일을
+        그대로 쓰고, 처음 보는 엔트리는 지어낸 시각으로 정렬을 어지럽히지
+        않도록 저장하지 않고 건너뛴다 (날짜 파싱 지표의 unparsed 로 집계됨).
+
+        Returns:
+            발행일이 모두 채워진 엔트리 목록
+        """
+        undated = {
+            canonicalize_url(entry_data['link'])
+            for entry_data in entries
+            if entry_data.get('published_at') is None
+        }
+        if not undated:
+            return entries
+
+        stored = dict(
+            Article.objects.filter(canonical_url__in=list(undated)).values_list('canonical_url', 'published_at')
+        )
+        stored.update(
+            RSSEntry.objects.filter(feed=feed, link__in=list(undated)).values_list('link', 'published_at')
+        )
+
+        filled = []
+        for entry_data in entries:
+            if entry_data.get('published_at') is None:
+                published_at = stored.get(canonicalize_url(entry_data['link']))
+                if published_at is None:
+                    continue
+                entry_data = dict(entry_data, published_at=published_at)
+            filled.append(entry_data)
+
+        skipped = len(entries) - len(filled)
+        if skipped:
+            logger.warning("Skipped %d new entries without a parseable date (feed %s)", skipped, feed.url)
+        return filled
+
+    def _get_feed(self, feed_url: str) -> RSSFeed:
+        """크롤링할 피드 모델 가져오기 또는 생성 (모든 크롤링 경로 공통)"""
         feed, created = RSSFeed.objects.get_or_create(
             url=feed_url,
             defaults={
@@ -284,9 +912,43 @@ class RSSCrawlerService:
                 'description': 'TechCrunch RSS Feed'
             }
         )
+        return feed
+
+    def _get_seen_filter(self, feed: RSSFeed):
+        """설정에 따라 피드의 블룸 필터 반환 (비활성화 시 None)"""
+        if not getattr(settings, 'RSS_SEEN_FILTER_ENABLED', True):
+            return None
+        return SeenLinkFilter(feed.pk)
+
+    def _rebuild_seen_filter(self, feed: RSSFeed, seen_filter: SeenLinkFilter):
+        """준비되지 않은 블룸 필터를 DB에 저장된 링크로 채움"""
+        links = RSSEntry.objects.filter(feed=feed).values_list('link', flat=True)
+        try:
+            seen_filter.rebuild(links.iterator(chunk_size=5000))
+        except redis.RedisError:
+            pass
+
+    def crawl_and_save(self, feed_url: str = None) -> RSSProcessingLog:
+        """
+        RSS 피드를 크롤링하고 데이터베이스에 저장
         
-        # RSS 피드 크롤링
-        entries = self.crawl_rss_feed(feed_url)
+        Args:
+            feed_url: 크롤링할 RSS 피드 URL
+            
+        Returns:
+            처리 로그
+        """
+        if feed_url is None:
+            feed_url = self.feed_url
         
-        # 데이터베이스에 저장
-        return self.save_entries_to_db(feed, entries) 
\ No newline at end of file
+        # 가져오기부터 저장까지 한 지표로 기록 (태스크가 활성화한 지표가 있으면 그대로 사용)
+        with ensure_metrics() as metrics, metrics.track_queries():
+            # RSS 피드 모델 가져오기 또는 생성
+            with metrics.stage('db'):
+                feed = self._get_feed(feed_url)
+            
+            # RSS 피드 크롤링 (원문은 재처리용으로 보관)
+            entries = self.crawl_rss_feed(feed_url, feed=feed)
+            
+            # 데이터베이스에 저장
+            return self.save_entries_to_db(feed, entries) 
\ No newline at end of file
@@ -0,0 +1,130 @@
+"""
+추출 요약 단계
+
+문장별 해시 단어 벡터(feature hashing)의 중심(centroid)과의 코사인
+유사도로 문장 점수를 매기고, 서로 너무 비슷한 문장은 건너뛰며 상위
+문장을 원래 순서대로 이어 붙인다. DB 나 Django 설정에 의존하지 않는
+순수 함수라 ProcessPoolExecutor 워커에서 그대로 실행할 수 있다.
+"""
+import os
+import re
+import zlib
+from concurrent.futures import Executor, ProcessPoolExecutor
+from contextlib import contextmanager
+from typing import Iterator, List, Optional
+
+import numpy as np
+
+from .parsing import clean_text, pool_workers
+
+SENTENCE_RE = re.compile(r'(?<=[.!?])\s+(?=[A-Z0-9"\'“‘(])')
+WORD_RE = re.compile(r'[a-z0-9]+')
+NUM_FEATURES = 1 << 12
+MIN_SENTENCE_WORDS = 4
+REDUNDANCY_THRESHOLD = 0.8  # 이미 고른 문장과 이 이상 비슷하면 건너뜀
+
+
+def split_sentences(text: str) -> List[str]:
+    """정제된 텍스트를 문장 단위로 분리"""
+    return [sentence.strip() for sentence in SENTENCE_RE.split(text) if sentence.strip()]
+
+
+def sentence_vectors(sentences: List[str]) -> np.ndarray:
+    """문장별 L2 정규화된 해시 단어 빈도 벡터 ((문장 수, NUM_FEATURES))"""
+    vectors = np.zeros((len(sentences), NUM_FEATURES), dtype=np.float32)
+    for row, sentence in enumerate(sentences):
+        columns = [zlib.crc32(word.encode('utf-8')) % NUM_FEATURES for word in WORD_RE.findall(sentence.lower())]
+        np.add.at(vectors[row], columns, 1.0)
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors / np.maximum(norms, 1e-9)
+
+
+def summarize(text: str, max_sentences: int = 2, max_chars: int = 400) -> str:
+    """
+    텍스트의 추출 요약 생성
+
+    Args:
+        text: 요약할 텍스트 (HTML 포함 가능)
+        max_sentences: 요약에 넣을 최대 문장 수
+        max_chars: 요약 최대 길이
+
+    Returns:
+        요약 (문장이 max_sentences 이하이면 정제된 원문)
+    """
+    cleaned = clean_text(text)
+    sentences = split_sentences(cleaned)
+    candidates = [i for i, sentence in enumerate(sentences) if len(sentence.split()) >= MIN_SENTENCE_WORDS]
+    if len(candidates) <= max_sentences:
+        return cleaned[:max_chars]
+
+    vectors = sentence_vectors([sentences[i] for i in candidates])
+    centroid = vectors.mean(axis=0)
+    scores = vectors @ (centroid / max(np.linalg.norm(centroid), 1e-9))
+
+    chosen = []
+    for position in np.argsort(-scores, kind='stable'):
+        if len(chosen) >= max_sentences:
+            break
+        if chosen and float(np.max(vectors[chosen] @ vectors[position])) >= REDUNDANCY_THRESHOLD:
+            continue
+        chosen.append(int(position))
+
+    summary = ' '.join(sentences[candidates[position]] for position in sorted(chosen))
+    return summary[:max_chars]
+
+
+def _summarize_chunk(texts: List[str], max_sentences: int, max_chars: int) -> List[str]:
+    return [summarize(text, max_sentences, max_chars) for text in texts]
+
+
+def summarize_many(
+    texts: List[str],
+    max_sentences: int = 2,
+    max_chars: int = 400,
+    max_workers: int = None,
+    executor: Executor = None,
+) -> List[str]:
+    """
+    여러 텍스트를 프로세스 풀에서 병렬로 요약
+
+    Args:
+        texts: 요약할 텍스트 목록
+        max_sentences: 요약에 넣을 최대 문장 수
+        max_chars: 요약 최대 길이
+        max_workers: 워커 프로세스 수 (기본값: CPU 코어 수, 1이거나 데몬 프로세스면 현재 프로세스에서 실행)
+        executor: 재사용할 프로세스 풀 (summary_pool, 없으면 호출마다 새로 만듦)
+
+    Returns:
+        입력 순서대로 요약 목록
+    """
+    if executor is None:
+        max_workers = pool_workers(max_workers, len(texts))
+        if max_workers <= 1:
+            return _summarize_chunk(texts, max_sentences, max_chars)
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            return summarize_many(texts, max_sentences, max_chars, max_workers, executor)
+
+    if not texts:
+        return []
+    # 텍스트 하나당 작업이 작으므로 워커별 덩어리로 나눠 전달
+    size = -(-len(texts) // ((max_workers or os.cpu_count() or 1) * 4))
+    chunks = [texts[i:i + size] for i in range(0, len(texts), size)]
+    results = executor.map(
+        _summarize_chunk, chunks, [max_sentences] * len(chunks), [max_chars] * len(chunks)
+    )
+    return [summary for chunk in results for summary in chunk]
+
+
+@contextmanager
+def summary_pool(max_workers: int = None) -> Iterator[Optional[Executor]]:
+    """
+    여러 배치에서 재사용할 요약 프로세스 풀
+
+    워커가 1개 이하(또는 데몬 프로세스)면 풀을 만들지 않고 None 을 돌려준다.
+    """
+    max_workers = pool_workers(max_workers)
+    if max_workers <= 1:
+        yield None
+        return
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        yield executor
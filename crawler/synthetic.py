@@ -0,0 +1,504 @@
+"""
+결정적 합성 코퍼스 생성기
+
+벤치마크와 부하 테스트용 DB 를 채울 피드/엔트리를 시드 하나로 재현
+가능하게 만든다. 분포는 운영 데이터를 흉내 낸다.
+
+- 피드별 발행량: 소수 피드가 대부분을 발행 (Zipf)
+- 키워드: TECH_KEYWORDS 순위별 Zipf 빈도, 엔트리당 0~4개
+- 발행 시각: 최근일수록 많고(지수 분포) 하루 중 업무 시간대에 몰림
+
+entry_rows() 는 저장할 값(정제된 텍스트, datetime, 키워드 목록)을,
+raw_entry() 는 같은 엔트리를 feedparser 결과 형태(HTML, RFC 822 날짜)로
+돌려준다. load_corpus() 는 ORM 을 거치지 않고 PostgreSQL COPY 로 바로
+적재한다 (load_synthetic_corpus 명령).
+"""
+import bisect
+import io
+import itertools
+import json
+import math
+import os
+import random
+import re
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, Iterator, List, Sequence, Tuple
+
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+
+from core.fragments import bump_ingest_version
+from core.models import Article, RSSEntry, RSSFeed, RSSProcessingLog, TermDocumentFrequency
+from .keywords import TfidfKeywordExtractor, tokenize
+from .parsing import TECH_KEYWORDS
+
+COMPANIES = [
+    'Acme', 'Globex', 'Initech', 'Umbrella', 'Hooli', 'Stark', 'Wayne', 'Wonka', 'Cyberdyne', 'Tyrell',
+    'Soylent', 'Vandelay', 'Aperture', 'Massive Dynamic', 'Pied Piper', 'Dunder', 'Oscorp', 'Gringotts',
+]
+VERBS = ['launches', 'raises', 'acquires', 'expands', 'rethinks', 'bets on', 'doubles down on', 'cuts', 'opens']
+NOUNS = ['platform', 'lab', 'partnership', 'product line', 'roadmap', 'team', 'fund', 'division', 'pilot']
+FILLER = [
+    'The company said the move follows a year of steady growth.',
+    'Analysts expect the market to consolidate over the next quarter.',
+    'Details on pricing were not disclosed.',
+    'The announcement comes amid broader industry changes.',
+    'Customers will see the changes rolled out in stages.',
+    'Executives declined to comment on future plans.',
+]
+FIRST_NAMES = ['Alex', 'Sam', 'Jordan', 'Taylor', 'Morgan', 'Casey', 'Riley', 'Jamie', 'Avery', 'Quinn']
+LAST_NAMES = ['Kim', 'Lee', 'Park', 'Smith', 'Garcia', 'Chen', 'Nguyen', 'Brown', 'Müller', 'Rossi']
+
+# 발행 시각(UTC)별 상대 빈도: 업무 시간대에 몰림
+HOUR_WEIGHTS = [1, 1, 1, 1, 1, 2, 3, 5, 7, 9, 10, 10, 10, 10, 10, 9, 8, 6, 5, 4, 3, 2, 2, 1]
+# 엔트리당 키워드 수별 상대 빈도
+KEYWORD_COUNT_WEIGHTS = [10, 30, 30, 20, 10]
+# 난수 생성기를 따로 시드하는 엔트리 블록 크기
+ENTRY_BLOCK = 10000
+# 처리 로그 상태별 상대 빈도와 오류 응답
+LOG_STATUS_WEIGHTS = [('success', 95), ('partial', 3), ('error', 2)]
+ERROR_STATUSES = [404, 500, 502, 503, None]
+
+ARTICLE_COLUMNS = (
+    'id', 'canonical_url', 'title', 'description', 'author', 'published_at', 'keywords', 'summary',
+    'created_at', 'updated_at',
+)
+ENTRY_COLUMNS = (
+    'id', 'feed_id', 'title', 'link', 'description', 'author', 'published_at', 'keywords', 'summary',
+    'is_processed', 'article_id', 'created_at', 'updated_at',
+)
+LOG_COLUMNS = (
+    'feed_id', 'status', 'entries_processed', 'entries_new', 'error_message', 'processing_time',
+    'fetch_ms', 'parse_ms', 'enrich_ms', 'db_ms', 'response_bytes', 'http_status', 'db_queries',
+    'peak_rss_delta_kb', 'created_at',
+)
+# COPY 텍스트 형식 이스케이프
+COPY_ESCAPES = str.maketrans({'\\': '\\\\', '\t': '\\t', '\n': '\\n', '\r': '\\r'})
+COPY_SPECIAL_RE = re.compile(r'[\\\t\n\r]')
+COPY_NULL = '\\N'
+
+
+def zipf_cum_weights(n: int, s: float) -> List[float]:
+    """순위 1..n 의 Zipf(지수 s) 누적 가중치"""
+    return list(itertools.accumulate(1 / rank ** s for rank in range(1, n + 1)))
+
+
+class SyntheticCorpus:
+    """
+    시드로 재현 가능한 합성 피드/엔트리 생성기
+
+    Args:
+        seed: 난수 시드 (같은 시드 + 같은 anchor 면 같은 코퍼스)
+        feeds: 피드 수
+        days: 발행 시각 범위(일), anchor 이전 days 일 안에 분포
+        anchor: 가장 최근 발행 시각 기준 (기본: 오늘 0시 UTC)
+        keyword_skew: 키워드 Zipf 지수
+        feed_skew: 피드별 발행량 Zipf 지수
+    """
+
+    def __init__(
+        self, seed: int = 42, feeds: int = 50, days: int = 90, anchor: datetime = None,
+        keyword_skew: float = 1.1, feed_skew: float = 0.8
+    ):
+        self.seed = seed
+        self.feeds = feeds
+        self.days = days
+        self.anchor = anchor or datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+        self._keyword_cum = zipf_cum_weights(len(TECH_KEYWORDS), keyword_skew)
+        self._feed_cum = zipf_cum_weights(feeds, feed_skew)
+        self._hour_cum = list(itertools.accumulate(HOUR_WEIGHTS))
+        self._count_cum = list(itertools.accumulate(KEYWORD_COUNT_WEIGHTS))
+
+    def feed_rows(self) -> List[Dict[str, Any]]:
+        """피드 목록 (title, url, description), 발행량이 많은 순"""
+        rng = random.Random(f'{self.seed}:feeds')
+        return [
+            {
+                'title': f"{rng.choice(COMPANIES)} {rng.choice(['Daily', 'Weekly', 'Insider', 'Wire', 'Review'])} {index}",
+                'url': f"https://feed{index}.example.com/rss",
+                'description': f"Synthetic feed {index}",
+            }
+            for index in range(self.feeds)
+        ]
+
+    @staticmethod
+    def _pick(rng: random.Random, cum_weights: Sequence[float]) -> int:
+        return bisect.bisect_left(cum_weights, rng.random() * cum_weights[-1])
+
+    def entry_rows(self, count: int, start: int = 0) -> Iterator[Dict[str, Any]]:
+        """
+        엔트리 count 개를 순서대로 생성
+
+        ENTRY_BLOCK 개 단위로 난수 생성기를 따로 시드하므로 엔트리 번호가
+        같으면 어떻게 나눠 생성해도 같은 엔트리가 나온다 (병렬 적재용).
+        적재 속도를 위해 randrange 대신 random() 과 미리 계산한 날짜 목록,
+        지역 변수로 꺼낸 누적 가중치를 쓴다.
+
+        Args:
+            count: 생성할 엔트리 수
+            start: 시작 번호 (링크에 사용)
+
+        Yields:
+            feed_index, title, link, description, author, published_at, keywords
+        """
+        keyword_cum, feed_cum, hour_cum, count_cum = self._keyword_cum, self._feed_cum, self._hour_cum, self._count_cum
+        keyword_total, feed_total, hour_total, count_total = keyword_cum[-1], feed_cum[-1], hour_cum[-1], count_cum[-1]
+        # 나이(일)별 그날 0시와 링크용 날짜 경로
+        days = self.days
+        day_starts = [self.anchor - timedelta(days=age + 1) for age in range(days)]
+        day_paths = [f"{day:%Y/%m/%d}" for day in day_starts]
+        # 나이(일)는 평균 days/5 의 지수 분포, 범위를 넘으면 다시 안쪽으로 접음
+        age_rate = 5 / days
+        authors = [f"{first} {last}" for first in FIRST_NAMES for last in LAST_NAMES]
+        n_companies, n_verbs, n_nouns, n_filler, n_authors = (
+            len(COMPANIES), len(VERBS), len(NOUNS), len(FILLER), len(authors)
+        )
+        # bisect_left 는 rand() * total 이 total 과 같아져도 범위 안의 마지막 순위를 돌려줌
+        pick = bisect.bisect_left
+
+        end = start + count
+        block_start = start - start % ENTRY_BLOCK
+        while block_start < end:
+            rng = random.Random(f'{self.seed}:entries:{block_start // ENTRY_BLOCK}')
+            rand = rng.random
+            expovariate = rng.expovariate
+            # 블록 중간에서 시작하면 앞부분은 생성만 하고 버림
+            for number in range(block_start, min(block_start + ENTRY_BLOCK, end)):
+                keywords = []
+                for _ in range(pick(count_cum, rand() * count_total)):
+                    keyword = TECH_KEYWORDS[pick(keyword_cum, rand() * keyword_total)]
+                    if keyword not in keywords:
+                        keywords.append(keyword)
+                feed_index = pick(feed_cum, rand() * feed_total)
+                company = COMPANIES[int(rand() * n_companies)]
+                topic = keywords[0] if keywords else NOUNS[int(rand() * n_nouns)]
+                age_days = int(expovariate(age_rate)) % days
+                row = {
+                    'feed_index': feed_index,
+                    'title': f"{company} {VERBS[int(rand() * n_verbs)]} {topic} {NOUNS[int(rand() * n_nouns)]}",
+                    'link': f"https://feed{feed_index}.example.com/{day_paths[age_days]}/story-{number}",
+                    'description': (
+                        f"{company} is focusing on {', '.join(keywords) or 'its core business'}. "
+                        f"{FILLER[int(rand() * n_filler)]} {FILLER[int(rand() * n_filler)]}"
+                    ),
+                    'author': authors[int(rand() * n_authors)],
+                    'published_at': day_starts[age_days] + timedelta(
+                        seconds=pick(hour_cum, rand() * hour_total) * 3600 + int(rand() * 3600)
+                    ),
+                    'keywords': keywords,
+                }
+                if number >= start:
+                    yield row
+            block_start += ENTRY_BLOCK
+
+    def log_rows(self, count: int) -> Iterator[Dict[str, Any]]:
+        """
+        처리 로그 count 개 생성 (피드별 균등, 기간 내 균등, 단계 시간은 로그 정규 분포)
+
+        Yields:
+            feed_index 와 RSSProcessingLog 필드 값
+        """
+        rng = random.Random(f'{self.seed}:logs')
+        span = self.days * 86400
+        statuses = [status for status, _ in LOG_STATUS_WEIGHTS]
+        status_cum = list(itertools.accumulate(weight for _, weight in LOG_STATUS_WEIGHTS))
+        for _ in range(count):
+            status = statuses[self._pick(rng, status_cum)]
+            stage_ms = {
+                'fetch_ms': rng.lognormvariate(math.log(300), 0.6),
+                'parse_ms': rng.lognormvariate(math.log(20), 0.5),
+                'enrich_ms': rng.lognormvariate(math.log(15), 0.5),
+                'db_ms': rng.lognormvariate(math.log(40), 0.7),
+            }
+            processed = 0 if status == 'error' else rng.randint(10, 50)
+            yield {
+                'feed_index': rng.randrange(self.feeds),
+                'status': status,
+                'entries_processed': processed,
+                'entries_new': rng.randint(0, min(processed, 10)),
+                'error_message': 'Failed to fetch feed: synthetic error' if status == 'error' else '',
+                'processing_time': sum(stage_ms.values()) / 1000,
+                **stage_ms,
+                'response_bytes': int(rng.lognormvariate(math.log(80000), 0.5)),
+                'http_status': rng.choice(ERROR_STATUSES) if status == 'error' else 200,
+                'db_queries': 0 if status == 'error' else processed + rng.randint(5, 15),
+                'peak_rss_delta_kb': int(rng.lognormvariate(math.log(2000), 1.0)),
+                'created_at': self.anchor - timedelta(seconds=rng.randrange(span)),
+            }
+
+    @staticmethod
+    def raw_entry(row: Dict[str, Any]) -> Dict[str, Any]:
+        """entry_rows() 의 엔트리를 feedparser 엔트리 형태(HTML, RFC 822 날짜)로 변환"""
+        return {
+            'title': f"<b>{row['title']}</b>",
+            'link': row['link'],
+            'description': f"<p>{row['description']}</p>\n<p><a href=\"{row['link']}\">Read more</a></p>",
+            'author': row['author'],
+            'published': row['published_at'].strftime('%a, %d %b %Y %H:%M:%S +0000'),
+        }
+
+
+@lru_cache(maxsize=None)
+def _sentence_terms(sentence: str) -> FrozenSet[str]:
+    return frozenset(tokenize(sentence))
+
+
+def _document_terms(title: str, description: str) -> FrozenSet[str]:
+    """
+    문서 빈도용 용어 집합
+
+    합성 설명은 몇 안 되는 문장/구의 조합이므로 마침표와 쉼표로 나눈 구
+    단위로 토큰화 결과를 캐시한다 (용어는 구두점을 넘지 않으므로 전체를
+    토큰화한 결과와 같다).
+    """
+    return _sentence_terms(title).union(*map(_sentence_terms, description.replace('. ', ', ').split(', ')))
+
+
+def _escape(value: str) -> str:
+    """COPY 텍스트 형식 이스케이프 (특수 문자가 없으면 그대로)"""
+    if COPY_SPECIAL_RE.search(value) is None:
+        return value
+    return value.translate(COPY_ESCAPES)
+
+
+def _copy_value(value) -> str:
+    if value is None:
+        return COPY_NULL
+    if isinstance(value, bool):
+        return 't' if value else 'f'
+    if isinstance(value, str):
+        return _escape(value)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+
+def _copy(cursor, model, columns: Sequence[str], buffer: io.StringIO):
+    """버퍼의 COPY 텍스트 행들을 테이블에 적재"""
+    cursor.copy_expert(
+        f"COPY {model._meta.db_table} ({', '.join(columns)}) FROM STDIN",
+        buffer,
+        1 << 20,  # 한 번에 읽을 크기
+    )
+
+
+def _reserve_ids(cursor, model, count: int) -> int:
+    """
+    테이블 id 시퀀스에서 count 개를 한 문장으로 예약
+
+    Returns:
+        예약한 첫 id
+    """
+    table = model._meta.db_table
+    cursor.execute(
+        "SELECT setval(pg_get_serial_sequence(%s, 'id'), nextval(pg_get_serial_sequence(%s, 'id')) + %s - 1)",
+        [table, table, count]
+    )
+    return cursor.fetchone()[0] - count + 1
+
+
+def _drop_secondary_indexes(cursor, models) -> List[str]:
+    """
+    기본 키를 뺀 유일/외래 키 제약과 인덱스를 지움
+
+    Returns:
+        적재 후 다시 만들 DDL 목록 (실행 순서대로)
+    """
+    tables = [model._meta.db_table for model in models]
+    cursor.execute(
+        """
+        SELECT conrelid::regclass::text, conname, pg_get_constraintdef(oid) FROM pg_constraint
+        WHERE conrelid = ANY(%s::regclass[]) AND contype IN ('u', 'f')
+        ORDER BY contype DESC
+        """,
+        [tables]
+    )
+    constraints = cursor.fetchall()
+    for table, name, _ in constraints:
+        cursor.execute(f'ALTER TABLE {table} DROP CONSTRAINT {name}')
+    # 제약에 딸린 인덱스는 위에서 함께 지워짐
+    cursor.execute(
+        """
+        SELECT indexname, indexdef FROM pg_indexes i
+        WHERE tablename = ANY(%s) AND NOT EXISTS (
+            SELECT 1 FROM pg_constraint c WHERE c.conname = i.indexname AND c.contype = 'p'
+        )
+        """,
+        [tables]
+    )
+    indexes = cursor.fetchall()
+    for name, _ in indexes:
+        cursor.execute(f'DROP INDEX {name}')
+    # 유일 제약(u)을 외래 키(f)보다 먼저 복원
+    return (
+        [definition for _, definition in indexes]
+        + [f'ALTER TABLE {table} ADD CONSTRAINT {name} {definition}' for table, name, definition in constraints]
+    )
+
+
+def _build_chunk(
+    corpus: SyntheticCorpus, start: int, count: int, feed_ids: List[int], article_id: int, entry_id: int
+) -> Tuple[str, str, Counter]:
+    """
+    엔트리 start 번부터 count 개의 COPY 텍스트 (프로세스 풀용)
+
+    Returns:
+        기사 COPY 텍스트, 엔트리 COPY 텍스트, 용어별 문서 빈도
+    """
+    articles, entries = io.StringIO(), io.StringIO()
+    document_frequency = Counter()
+    keyword_json = {}
+    for row in corpus.entry_rows(count, start=start):
+        title = _escape(row['title'])
+        link = _escape(row['link'])
+        author = _escape(row['author'])
+        published_at = row['published_at'].isoformat()
+        key = tuple(row['keywords'])
+        keywords = keyword_json.get(key)
+        if keywords is None:
+            keywords = keyword_json[key] = _escape(json.dumps(row['keywords']))
+        articles.write(
+            f"{article_id}\t{link}\t{title}\t{_escape(row['description'])}\t{author}\t"
+            f"{published_at}\t{keywords}\t\t{published_at}\t{published_at}\n"
+        )
+        entries.write(
+            f"{entry_id}\t{feed_ids[row['feed_index']]}\t{title}\t{link}\t\t{author}\t"
+            f"{published_at}\t{keywords}\t\tf\t{article_id}\t{published_at}\t{published_at}\n"
+        )
+        document_frequency.update(_document_terms(row['title'], row['description']))
+        article_id += 1
+        entry_id += 1
+    return articles.getvalue(), entries.getvalue(), document_frequency
+
+
+def _build_chunks(
+    corpus: SyntheticCorpus, count: int, start: int, chunk_size: int, feed_ids: List[int],
+    article_id: int, entry_id: int, max_workers: int
+) -> Iterator[Tuple[str, str, Counter]]:
+    """
+    청크별 COPY 텍스트를 순서대로 생성
+
+    워커가 여러 개면 프로세스 풀에서 다음 청크들을 미리 만들어 두어 현재
+    청크의 COPY 와 겹치게 한다 (메모리를 위해 진행 중인 청크는 워커 수 + 1 개까지).
+    """
+    chunk_args = [
+        (corpus, start + offset, min(chunk_size, count - offset), feed_ids, article_id + offset, entry_id + offset)
+        for offset in range(0, count, chunk_size)
+    ]
+    if max_workers <= 1:
+        for args in chunk_args:
+            yield _build_chunk(*args)
+        return
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        pending = deque()
+        for args in chunk_args:
+            pending.append(executor.submit(_build_chunk, *args))
+            if len(pending) > max_workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def load_corpus(
+    corpus: SyntheticCorpus, count: int, start: int = 0, logs: int = 0, chunk_size: int = 50000,
+    max_workers: int = None, rebuild_indexes: bool = None, using: str = DEFAULT_DB_ALIAS
+) -> Dict[str, int]:
+    """
+    합성 코퍼스를 PostgreSQL COPY 로 적재
+
+    피드는 ORM 으로 만들고(없을 때만), 기사/엔트리/처리 로그는 chunk_size
+    엔트리씩 메모리 버퍼에 COPY 텍스트로 써서 테이블마다 COPY 한 번으로
+    넣는다. 청크 텍스트는 프로세스 풀이 만들고 현재 프로세스는 COPY 만
+    하므로 생성과 적재가 겹친다. id 는 시퀀스에서 미리 예약해 엔트리가
+    기사 id 를 바로 참조한다. 용어 문서 빈도(TermDocumentFrequency)도
+    적재한 기사만큼 더한다.
+
+    기사/엔트리 테이블이 비어 있으면(부하 테스트 DB 새로 만들기) 보조
+    인덱스와 유일/외래 키 제약을 지웠다가 적재 후 한 번에 다시 만든다.
+    행마다 인덱스를 갱신하는 것보다 훨씬 빠르며, 제약은 다시 만들 때 전체
+    행에 대해 검사된다.
+
+    전체가 트랜잭션 하나이며, 커밋 후 인제스트 버전을 올려 화면 캐시를
+    무효화한다.
+
+    Args:
+        corpus: 합성 코퍼스
+        count: 적재할 엔트리 수
+        start: 엔트리 시작 번호 (이미 적재한 코퍼스에 이어서 넣을 때)
+        logs: 적재할 처리 로그 수
+        chunk_size: COPY 한 번에 넣을 엔트리 수
+        max_workers: 청크 생성 프로세스 수 (기본값: CPU 코어 수, 1이면 현재 프로세스에서 생성)
+        rebuild_indexes: 인덱스를 지웠다 다시 만들지 여부 (None 이면 테이블이 비어 있을 때만)
+        using: 대상 DB 별칭
+
+    Returns:
+        테이블별 적재 행 수 (feeds, articles, entries, logs, terms)
+    """
+    feed_ids = []
+    new_feeds = 0
+    for feed_row in corpus.feed_rows():
+        feed, created = RSSFeed.objects.using(using).get_or_create(url=feed_row['url'], defaults=feed_row)
+        feed_ids.append(feed.pk)
+        new_feeds += created
+
+    if rebuild_indexes is None:
+        rebuild_indexes = not (
+            Article.objects.using(using).exists() or RSSEntry.objects.using(using).exists()
+        )
+
+    document_frequency = Counter()
+    with transaction.atomic(using), connections[using].cursor() as cursor:
+        # 커밋 시 WAL flush 를 기다리지 않음 (이 트랜잭션만)
+        cursor.execute('SET LOCAL synchronous_commit = off')
+        restore = _drop_secondary_indexes(cursor, [Article, RSSEntry]) if rebuild_indexes and count else []
+
+        if count:
+            chunks = _build_chunks(
+                corpus, count, start, chunk_size, feed_ids,
+                article_id=_reserve_ids(cursor, Article, count),
+                entry_id=_reserve_ids(cursor, RSSEntry, count),
+                max_workers=max_workers or os.cpu_count() or 1,
+            )
+            for articles, entries, chunk_frequency in chunks:
+                _copy(cursor, Article, ARTICLE_COLUMNS, io.StringIO(articles))
+                _copy(cursor, RSSEntry, ENTRY_COLUMNS, io.StringIO(entries))
+                document_frequency.update(chunk_frequency)
+
+        for statement in restore:
+            cursor.execute(statement)
+
+        if logs:
+            buffer = io.StringIO()
+            for row in corpus.log_rows(logs):
+                row['feed_id'] = feed_ids[row['feed_index']]
+                buffer.write('\t'.join(_copy_value(row[column]) for column in LOG_COLUMNS) + '\n')
+            buffer.seek(0)
+            _copy(cursor, RSSProcessingLog, LOG_COLUMNS, buffer)
+
+        if count:
+            pairs = sorted(document_frequency.items())  # TfidfKeywordExtractor 와 같은 키 순서
+            pairs.insert(0, (TfidfKeywordExtractor.CORPUS_TERM, count))
+            table = TermDocumentFrequency._meta.db_table
+            cursor.execute(
+                f"""
+                INSERT INTO {table} (term, document_count)
+                SELECT * FROM unnest(%s::varchar[], %s::bigint[])
+                ON CONFLICT (term) DO UPDATE
+                    SET document_count = {table}.document_count + EXCLUDED.document_count
+                """,
+                [[term for term, _ in pairs], [df for _, df in pairs]]
+            )
+            cursor.execute(f'ANALYZE {Article._meta.db_table}, {RSSEntry._meta.db_table}')
+        transaction.on_commit(bump_ingest_version, using=using)
+
+    return {
+        'feeds': new_feeds,
+        'articles': count,
+        'entries': count,
+        'logs': logs,
+        'terms': len(document_frequency),
+        'rebuilt_indexes': len(restore),
+    }
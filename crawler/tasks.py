@@ -1,13 +1,66 @@
-from celery import shared_task
+import logging
+import time
+
+import redis
+from celery import Task, shared_task
+from celery.utils import uuid
 from django.conf import settings
 from django.utils import timezone
-from datetime import timedelta
+from datetime import date, timedelta
 
+from .exceptions import RSSProcessingError
+from .ingest import IngestBuffer
+from .leases import LeaseHeartbeat, make_worker_id
+from .metrics import CrawlMetrics
+from .locks import FeedCrawlLock
+from .related import RelatedIndexWriter
+from .seen_filter import SeenLinkFilter
 from .services import RSSCrawlerService
-from core.models import RSSFeed, RSSEntry, RSSProcessingLog
+from .summarize import summary_pool
+from core.fragments import bump_ingest_version
+from core.models import Article, DailySummary, FeedBody, FeedSnapshot, RSSFeed, RSSEntry, RSSProcessingLog
+from core.periods import local_today
+from core.telemetry import CRAWLS, INGEST_DEAD_LETTERS
 
+logger = logging.getLogger(__name__)
 
-@shared_task(bind=True)
+
+def _uses_ingest_stream() -> bool:
+    """크롤링 결과를 인제스트 스트림(write-behind)으로 보내는지 여부"""
+    return getattr(settings, 'RSS_INGEST_MODE', 'direct') == 'stream'
+
+
+def _crawl_lock(feed_url: str = None) -> FeedCrawlLock:
+    """피드 URL(없으면 기본 피드)에 대한 크롤링 락"""
+    return FeedCrawlLock(feed_url or getattr(settings, 'RSS_FEED_URL', 'https://techcrunch.com/feed/'))
+
+
+class CoalescingCrawlTask(Task):
+    """
+    같은 피드에 대한 중복 크롤링 요청을 하나로 합치는 태스크 베이스
+
+    /api/crawl/, /crawler/start/, beat 가 모두 apply_async 를 거치므로
+    여기서 피드 락을 잡고, 이미 진행 중인 크롤링이 있으면 새 태스크를
+    발행하지 않고 진행 중인 태스크의 AsyncResult 를 돌려준다.
+    """
+
+    def apply_async(self, args=None, kwargs=None, task_id=None, **options):
+        task_id = task_id or uuid()
+        feed_url = args[0] if args else (kwargs or {}).get('feed_url')
+        lock = _crawl_lock(feed_url)
+
+        holder = lock.acquire(task_id)
+        if holder != task_id:
+            return self.AsyncResult(holder)
+
+        try:
+            return super().apply_async(args, kwargs, task_id=task_id, **options)
+        except Exception:
+            lock.release(task_id)
+            raise
+
+
+@shared_task(bind=True, base=CoalescingCrawlTask)
 def crawl_rss_feed_task(self, feed_url: str = None):
     """
     RSS 피드를 크롤링하는 Celery 태스크
@@ -18,37 +71,385 @@ def crawl_rss_feed_task(self, feed_url: str = None):
     Returns:
         처리 결과
     """
+    lock = None
+    if not self.request.called_directly:
+        # 발행 이후 락이 만료됐거나 다른 태스크가 가져갔을 수 있으므로 실행 시점에 재확인
+        lock = _crawl_lock(feed_url)
+        holder = lock.acquire(self.request.id)
+        if holder != self.request.id:
+            return {
+                'status': 'coalesced',
+                'task_id': holder
+            }
+
+    # 실패 로그에도 가져오기 시간/HTTP 상태가 남도록 태스크에서 지표를 활성화
+    metrics = CrawlMetrics()
     try:
         service = RSSCrawlerService()
-        log = service.crawl_and_save(feed_url)
+        if _uses_ingest_stream():
+            # write-behind 모드: 스트림에 적재만 하고 DB 저장은 writer 태스크가 담당
+            with metrics.activate():
+                queued = service.crawl_and_enqueue(feed_url)
+            result = {
+                'status': 'queued',
+                'entries_queued': queued
+            }
+        else:
+            with metrics.activate():
+                log = service.crawl_and_save(feed_url)
+            result = {
+                'status': 'success',
+                'log_id': log.id,
+                'entries_processed': log.entries_processed,
+                'entries_new': log.entries_new,
+                'processing_time': log.processing_time
+            }
         
-        return {
-            'status': 'success',
-            'log_id': log.id,
-            'entries_processed': log.entries_processed,
-            'entries_new': log.entries_new,
-            'processing_time': log.processing_time
-        }
+    except Exception as e:
+        try:
+            # 태스크 실패 시 로그 생성
+            if feed_url:
+                feed, _ = RSSFeed.objects.get_or_create(
+                    url=feed_url,
+                    defaults={'title': 'Unknown Feed'}
+                )
+                
+                RSSProcessingLog.objects.create(
+                    feed=feed,
+                    status='error',
+                    entries_processed=0,
+                    entries_new=0,
+                    error_message=str(e),
+                    **metrics.log_fields()
+                )
+                # save_entries_to_db 실패는 서비스에서 이미 지표에 반영
+                if not isinstance(e, RSSProcessingError):
+                    metrics.export(feed.url, 'error')
+        finally:
+            # 재시도 대기 중인 태스크가 락을 붙잡지 않도록 먼저 해제
+            if lock:
+                lock.release(self.request.id)
         
+        # 태스크 재시도
+        raise self.retry(countdown=60, max_retries=3)
+
+    if lock:
+        lock.release(self.request.id)
+
+    return result
+
+
+def _crawl_claimed_feed(service: RSSCrawlerService, feed: RSSFeed, worker_id: str) -> str:
+    """리스로 선점한 피드 하나를 크롤링하고 리스를 반납"""
+    retry_delay = getattr(settings, 'RSS_CRAWL_RETRY_DELAY', 60)
+
+    # 수동 트리거(crawl_rss_feed_task)와도 겹치지 않도록 피드 락을 함께 획득
+    lock = FeedCrawlLock(feed.url)
+    if lock.acquire(worker_id) != worker_id:
+        feed.release_lease(worker_id, retry_after=retry_delay)
+        return 'skipped'
+
+    metrics = CrawlMetrics()
+    try:
+        with metrics.activate():
+            if _uses_ingest_stream():
+                service.crawl_and_enqueue(feed.url)
+            else:
+                service.crawl_and_save(feed.url)
     except Exception as e:
-        # 태스크 실패 시 로그 생성
-        if feed_url:
+        # save_entries_to_db 실패는 서비스에서 이미 오류 로그를 남김
+        if not isinstance(e, RSSProcessingError):
+            RSSProcessingLog.objects.create(
+                feed=feed,
+                status='error',
+                entries_processed=0,
+                entries_new=0,
+                error_message=str(e),
+                **metrics.log_fields()
+            )
+            metrics.export(feed.url, 'error')
+        feed.release_lease(worker_id, retry_after=retry_delay)
+        return 'failed'
+    finally:
+        lock.release(worker_id)
+
+    feed.release_lease(worker_id)
+    return 'crawled'
+
+
+@shared_task
+def claim_due_feeds_task(batch_size: int = None, max_runtime: int = None):
+    """
+    크롤링 주기가 된 피드를 리스로 선점하여 크롤링하는 태스크
+
+    여러 워커에서 동시에 실행되어도 SKIP LOCKED 선점 덕분에 피드가
+    중복 크롤링되지 않으며, 워커를 추가하면 처리량이 그만큼 늘어난다.
+
+    Args:
+        batch_size: 한 번에 선점할 피드 수
+        max_runtime: 새 배치 선점을 멈출 때까지의 시간(초)
+
+    Returns:
+        처리 결과
+    """
+    batch_size = batch_size or getattr(settings, 'RSS_CLAIM_BATCH_SIZE', 5)
+    max_runtime = max_runtime or getattr(settings, 'RSS_CLAIM_MAX_RUNTIME', 240)
+    deadline = time.monotonic() + max_runtime
+
+    worker_id = make_worker_id()
+    service = RSSCrawlerService()
+    results = {'crawled': 0, 'failed': 0, 'skipped': 0}
+
+    # 배치로 선점한 피드 모두의 리스를 크롤링이 끝날 때까지 함께 연장
+    with LeaseHeartbeat(worker_id):
+        while time.monotonic() < deadline:
+            feeds = RSSFeed.objects.claim_due(worker_id, limit=batch_size)
+            if not feeds:
+                break
+
+            for feed in feeds:
+                results[_crawl_claimed_feed(service, feed, worker_id)] += 1
+
+    return {
+        'status': 'success',
+        'worker_id': worker_id,
+        **results
+    }
+
+
+@shared_task(bind=True)
+def crawl_feeds_sweep_task(self, feed_urls: list = None, max_workers: int = None):
+    """
+    여러 피드를 한 번에 크롤링하는 스윕 태스크
+
+    가져오기는 스레드로 동시에, 파싱/정제는 프로세스 풀에서 병렬로 처리한다.
+    다른 태스크가 크롤링 중인 피드(피드 락 보유)는 건너뛴다.
+
+    Args:
+        feed_urls: 크롤링할 피드 URL 목록 (기본값: 모든 활성 피드)
+        max_workers: 파싱 워커 프로세스 수
+
+    Returns:
+        처리 결과
+    """
+    if feed_urls is None:
+        feed_urls = list(RSSFeed.objects.filter(is_active=True).values_list('url', flat=True))
+
+    token = self.request.id or uuid()
+    locks = {feed_url: FeedCrawlLock(feed_url) for feed_url in feed_urls}
+    owned = [feed_url for feed_url, lock in locks.items() if lock.acquire(token) == token]
+
+    try:
+        results = RSSCrawlerService().crawl_many(owned, max_workers=max_workers)
+    finally:
+        for feed_url in owned:
+            locks[feed_url].release(token)
+
+    failed = 0
+    for feed_url, result in results.items():
+        if not isinstance(result, Exception):
+            continue
+        failed += 1
+        # save_entries_to_db 실패는 서비스에서 이미 오류 로그를 남김
+        if not isinstance(result, RSSProcessingError):
             feed, _ = RSSFeed.objects.get_or_create(
                 url=feed_url,
                 defaults={'title': 'Unknown Feed'}
             )
-            
             RSSProcessingLog.objects.create(
                 feed=feed,
                 status='error',
                 entries_processed=0,
                 entries_new=0,
-                error_message=str(e),
+                error_message=str(result),
                 processing_time=0
             )
-        
-        # 태스크 재시도
-        raise self.retry(countdown=60, max_retries=3)
+            CRAWLS.inc(feed=feed_url, status='error')
+
+    return {
+        'status': 'success',
+        'crawled': len(results) - failed,
+        'failed': failed,
+        'skipped': len(feed_urls) - len(owned)
+    }
+
+
+@shared_task
+def drain_ingest_stream_task(batch_size: int = None, max_runtime: int = None):
+    """
+    인제스트 스트림을 큰 배치로 읽어 DB 에 upsert 하는 writer 태스크
+
+    먼저 ACK 되지 않은 채 오래 방치된 메시지(죽은 writer 몫)를 회수하고,
+    이후 새 메시지를 읽는다. 피드별로 묶어 한 번의 bulk upsert 와 처리
+    로그 하나로 저장한 뒤 ACK 한다. 저장 중 실패한 피드의 메시지는 ACK
+    하지 않으므로 다음 실행에서 다시 처리되고, RSS_INGEST_MAX_DELIVERIES 번
+    전달돼도 실패한 메시지는 dead-letter 스트림으로 옮긴다.
+
+    Args:
+        batch_size: 한 번에 읽을 메시지 수
+        max_runtime: 새 배치 읽기를 멈출 때까지의 시간(초)
+
+    Returns:
+        처리 결과와 큐 지연 지표
+    """
+    batch_size = batch_size or getattr(settings, 'RSS_INGEST_BATCH_SIZE', 2000)
+    max_runtime = max_runtime or getattr(settings, 'RSS_INGEST_MAX_RUNTIME', 50)
+    claim_idle_ms = getattr(settings, 'RSS_INGEST_CLAIM_IDLE_MS', 60000)
+    max_deliveries = getattr(settings, 'RSS_INGEST_MAX_DELIVERIES', 5)
+    deadline = time.monotonic() + max_runtime
+
+    buffer = IngestBuffer()
+    consumer = IngestBuffer.consumer_name()
+    service = RSSCrawlerService()
+    written = failed = dead_lettered = 0
+
+    try:
+        buffer.ensure_group()
+        messages = buffer.reclaim(consumer, batch_size, claim_idle_ms)
+
+        while True:
+            if not messages:
+                messages = buffer.read(consumer, batch_size, block_ms=1000)
+                if not messages:
+                    break
+
+            by_feed = {}
+            for message_id, feed_id, entry in messages:
+                by_feed.setdefault(feed_id, []).append((message_id, entry))
+
+            feeds = RSSFeed.objects.in_bulk(list(by_feed))
+            for feed_id, items in by_feed.items():
+                message_ids = [message_id for message_id, _ in items]
+                feed = feeds.get(feed_id)
+                if feed is None:
+                    # 적재 이후 삭제된 피드
+                    buffer.ack(message_ids)
+                    continue
+
+                try:
+                    service.upsert_entries(feed, [entry for _, entry in items])
+                except Exception as e:
+                    failed += len(items)
+                    # 재시도를 다 쓴 메시지는 더 돌리지 않고 dead-letter 로 옮김
+                    deliveries = buffer.delivery_counts(message_ids)
+                    exhausted = [
+                        (message_id, feed_id, entry) for message_id, entry in items
+                        if deliveries[message_id] >= max_deliveries
+                    ]
+                    buffer.dead_letter(exhausted, str(e))
+                    dead_lettered += len(exhausted)
+                    if exhausted:
+                        INGEST_DEAD_LETTERS.inc(len(exhausted), feed=feed.url)
+                        logger.error(
+                            "Moved %d ingest messages for %s to %s after %d deliveries",
+                            len(exhausted), feed.url, IngestBuffer.DEAD_LETTER_KEY, max_deliveries
+                        )
+                    RSSProcessingLog.objects.create(
+                        feed=feed,
+                        status='error',
+                        entries_processed=0,
+                        entries_new=0,
+                        error_message=f"Ingest write error: {str(e)}",
+                        processing_time=0
+                    )
+                    CRAWLS.inc(feed=feed.url, status='error')
+                    continue
+
+                buffer.ack(message_ids)
+                written += len(items)
+
+            if time.monotonic() >= deadline:
+                break
+            messages = []
+
+        lag = buffer.lag()
+    except redis.RedisError as e:
+        return {
+            'status': 'error',
+            'message': str(e),
+            'written': written,
+            'failed': failed,
+            'dead_lettered': dead_lettered
+        }
+
+    return {
+        'status': 'success',
+        'written': written,
+        'failed': failed,
+        'dead_lettered': dead_lettered,
+        'lag': lag
+    }
+
+
+@shared_task
+def summarize_entries_task(batch_size: int = None, max_runtime: int = None, max_workers: int = None):
+    """
+    요약되지 않은 엔트리를 배치 단위로 추출 요약하는 태스크
+
+    배치마다 커밋하므로 중단되어도 처리한 배치는 남고, 남은 엔트리는
+    다음 실행에서 이어서 처리된다. 요약 프로세스 풀은 실행마다 한 번 만든다.
+
+    Args:
+        batch_size: 한 배치의 엔트리 수
+        max_runtime: 새 배치 시작을 멈출 때까지의 시간(초)
+        max_workers: 요약 워커 프로세스 수
+
+    Returns:
+        처리량과 배치별 지연 시간
+    """
+    batch_size = batch_size or getattr(settings, 'RSS_SUMMARY_BATCH_SIZE', 200)
+    max_runtime = max_runtime or getattr(settings, 'RSS_SUMMARY_MAX_RUNTIME', 100)
+    max_workers = max_workers or getattr(settings, 'RSS_SUMMARY_WORKERS', None)
+    started = time.monotonic()
+    deadline = started + max_runtime
+
+    service = RSSCrawlerService()
+    entries = summaries = 0
+    latencies = []
+    # 프로세스 풀은 태스크 실행 동안 한 번만 만들어 모든 배치에서 재사용
+    with summary_pool(max_workers) as executor:
+        while time.monotonic() < deadline:
+            result = service.summarize_pending(batch_size=batch_size, max_workers=max_workers, executor=executor)
+            if not result['entries']:
+                break
+            entries += result['entries']
+            summaries += result['summaries']
+            latencies.append(result['seconds'])
+            logger.info(
+                "Summarized batch: %d entries, %d summaries in %.3fs",
+                result['entries'], result['summaries'], result['seconds']
+            )
+
+    elapsed = time.monotonic() - started
+    return {
+        'status': 'success',
+        'entries': entries,
+        'summaries': summaries,
+        'batches': len(latencies),
+        'entries_per_second': entries / elapsed if elapsed > 0 else 0.0,
+        'batch_latency_avg': sum(latencies) / len(latencies) if latencies else 0.0,
+        'batch_latency_max': max(latencies, default=0.0),
+        'remaining': RSSEntry.objects.filter(is_processed=False).count()
+    }
+
+
+@shared_task
+def update_related_index_task(rebuild: bool = False):
+    """
+    관련 기사 인덱스 갱신 태스크
+
+    새 대표 엔트리만 인덱스 파일 끝에 덧붙이고, rebuild 이면 삭제된
+    엔트리를 정리하기 위해 새 버전으로 다시 만든다.
+    """
+    result = RelatedIndexWriter().update(
+        batch_size=getattr(settings, 'RSS_RELATED_BATCH_SIZE', 5000),
+        rebuild=rebuild
+    )
+    logger.info(
+        "Related index v%d: %d rows (%d added)",
+        result['version'], result['count'], result['added']
+    )
+    return {'status': 'success', **result}
 
 
 @shared_task
@@ -62,59 +463,49 @@ def cleanup_old_entries_task():
     deleted_count = RSSEntry.objects.filter(
         published_at__lt=cutoff_date
     ).delete()[0]
+
+    # 보관 기간이 지난 피드 원문 스냅샷과 더 이상 참조되지 않는 원문 삭제
+    archive_cutoff = timezone.now() - timedelta(days=getattr(settings, 'RSS_ARCHIVE_RETENTION_DAYS', 90))
+    deleted_snapshots = FeedSnapshot.objects.filter(fetched_at__lt=archive_cutoff).delete()[0]
+    FeedBody.objects.filter(snapshots__isnull=True).delete()
+
+    # 어느 피드에도 남아 있지 않은 기사 삭제
+    deleted_articles = Article.objects.filter(appearances__isnull=True).delete()[0]
+    if deleted_count:
+        bump_ingest_version()
     
     return {
         'status': 'success',
-        'deleted_entries': deleted_count
+        'deleted_entries': deleted_count,
+        'deleted_snapshots': deleted_snapshots,
+        'deleted_articles': deleted_articles
     }
 
 
 @shared_task
-def generate_daily_summary_task():
+def generate_daily_summary_task(day: str = None):
     """
-    일일 요약을 생성하는 태스크
+    일일 요약을 생성해 DailySummary 로 저장하는 태스크
+
+    날짜를 지정하지 않은 정기 실행은 어제를 포함한 최근
+    RSS_DAILY_SUMMARY_REFRESH_DAYS 일을 다시 계산해, 늦게 들어온(발행일이
+    지난) 엔트리도 요약에 반영한다. 그보다 오래된 날짜는
+    backfill_daily_summaries 로 다시 계산한다.
+
+    Args:
+        day: 요약할 날짜 (YYYY-MM-DD, 기본값: 서비스 시간대 기준 어제)
+
+    Returns:
+        지정한 날짜(기본값: 어제)의 요약과 다시 계산한 날짜 수
     """
-    today = timezone.now().date()
-    yesterday = today - timedelta(days=1)
-    
-    # 어제 발행된 엔트리들 조회
-    yesterday_entries = RSSEntry.objects.filter(
-        published_at__date=yesterday
-    ).order_by('-published_at')
-    
-    # 요약 생성
-    summary = {
-        'date': yesterday,
-        'total_entries': yesterday_entries.count(),
-        'top_keywords': [],
-        'top_feeds': []
-    }
-    
-    # 키워드 통계
-    keyword_stats = {}
-    for entry in yesterday_entries:
-        for keyword in entry.keywords_list:
-            keyword_stats[keyword] = keyword_stats.get(keyword, 0) + 1
-    
-    summary['top_keywords'] = sorted(
-        keyword_stats.items(), 
-        key=lambda x: x[1], 
-        reverse=True
-    )[:10]
-    
-    # 피드별 통계
-    feed_stats = {}
-    for entry in yesterday_entries:
-        feed_name = entry.feed.title
-        feed_stats[feed_name] = feed_stats.get(feed_name, 0) + 1
-    
-    summary['top_feeds'] = sorted(
-        feed_stats.items(), 
-        key=lambda x: x[1], 
-        reverse=True
-    )[:5]
-    
-    return summary
+    if day:
+        return {**DailySummary.generate(date.fromisoformat(day)).as_dict(), 'refreshed_days': 1}
+
+    yesterday = local_today() - timedelta(days=1)
+    refresh_days = max(getattr(settings, 'RSS_DAILY_SUMMARY_REFRESH_DAYS', 3), 1)
+    for offset in range(refresh_days - 1, 0, -1):
+        DailySummary.generate(yesterday - timedelta(days=offset))
+    return {**DailySummary.generate(yesterday).as_dict(), 'refreshed_days': refresh_days}
 
 
 @shared_task
@@ -142,5 +533,20 @@ def health_check_task():
         'error_count': error_count,
         'last_check': timezone.now()
     }
+
+    # 인제스트 스트림 지연
+    try:
+        health_status['ingest_lag'] = IngestBuffer().lag()
+    except redis.RedisError:
+        health_status['ingest_lag'] = None
+
+    # 블룸 필터 적중률/오탐률
+    try:
+        health_status['seen_filters'] = [
+            SeenLinkFilter(feed_id).stats()
+            for feed_id in RSSFeed.objects.filter(is_active=True).values_list('id', flat=True)
+        ]
+    except redis.RedisError:
+        health_status['seen_filters'] = []
     
     return health_status 
\ No newline at end of file
@@ -0,0 +1,194 @@
+"""
+실시간 트렌딩 키워드
+
+키워드마다 시간 감쇠 점수를 반감기별 Redis 정렬 집합에 누적한다.
+감쇠는 forward decay 방식으로, 기준 시각(landmark) 이후 경과 시간만큼
+커지는 가중치 2^((t - landmark) / 반감기) 를 더해 두고 읽을 때 현재
+시각의 배율로 나눈다. 그래서 시간이 지나도 전체 점수를 다시 쓸 필요가
+없고, 쓰기는 ZINCRBY, 읽기는 ZREVRANGE 로 O(log n) 이다.
+
+가중치가 너무 커지기 전에 rescale() 이 기준 시각을 현재로 옮기며 점수를
+한 번에 줄이고, 무시할 만큼 작아진 키워드는 지운다.
+"""
+import logging
+import math
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import redis
+from django.conf import settings
+
+from core.redis_client import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+# 창 이름 -> 반감기(초)
+HALF_LIVES = {
+    '1h': 3600,
+    '24h': 86400,
+    '7d': 604800,
+}
+# 속도(velocity) 비교 기준이 되는 더 긴 창
+BASELINES = {
+    '1h': '24h',
+    '24h': '7d',
+}
+RESCALE_AFTER_HALF_LIVES = 32  # 기준 시각에서 반감기의 이 배수만큼 지나면 rescale
+MIN_SCORE = 0.01  # rescale 시 이보다 작은 (감쇠된) 점수의 키워드는 삭제
+
+
+class TrendingKeywords:
+    """반감기별 시간 감쇠 키워드 점수 (Redis 정렬 집합)"""
+
+    KEY_PREFIX = 'trending:'
+
+    def __init__(self, client: redis.Redis = None):
+        self.client = client or get_redis_client()
+
+    def _key(self, window: str) -> str:
+        return f"{self.KEY_PREFIX}{window}"
+
+    def _landmark_key(self, window: str) -> str:
+        return f"{self.KEY_PREFIX}{window}:landmark"
+
+    def _landmarks(self, pipe, now: float) -> Dict[str, float]:
+        """창별 기준 시각 (없으면 현재 시각으로 초기화)"""
+        windows = list(HALF_LIVES)
+        values = pipe.mget([self._landmark_key(window) for window in windows])
+        landmarks = {}
+        for window, value in zip(windows, values):
+            if value is None:
+                self.client.setnx(self._landmark_key(window), now)
+                value = self.client.get(self._landmark_key(window))
+            landmarks[window] = float(value)
+        return landmarks
+
+    def record(self, events: Iterable[Tuple[Iterable[str], float]], now: float = None) -> int:
+        """
+        키워드 발생을 모든 창에 반영
+
+        Args:
+            events: (키워드 목록, 발생 시각 epoch 초) 목록. 미래 시각은 현재로 간주
+            now: 현재 시각 (테스트용)
+
+        Returns:
+            반영한 키워드 발생 수
+        """
+        now = now or time.time()
+        events = [(set(keywords), min(timestamp, now)) for keywords, timestamp in events]
+        if not any(keywords for keywords, _ in events):
+            return 0
+
+        landmark_keys = [self._landmark_key(window) for window in HALF_LIVES]
+        with self.client.pipeline() as pipe:
+            while True:
+                try:
+                    # rescale 과 겹치면 기준 시각이 바뀌므로 다시 계산
+                    pipe.watch(*landmark_keys)
+                    landmarks = self._landmarks(pipe, now)
+                    pipe.multi()
+                    for window, half_life in HALF_LIVES.items():
+                        increments = {}
+                        for keywords, timestamp in events:
+                            weight = 2.0 ** ((timestamp - landmarks[window]) / half_life)
+                            for keyword in keywords:
+                                increments[keyword] = increments.get(keyword, 0.0) + weight
+                        for keyword, increment in increments.items():
+                            pipe.zincrby(self._key(window), increment, keyword)
+                    pipe.execute()
+                    break
+                except redis.WatchError:
+                    continue
+
+        for window, half_life in HALF_LIVES.items():
+            if (now - landmarks[window]) / half_life > RESCALE_AFTER_HALF_LIVES:
+                self.rescale(window, now)
+        return sum(len(keywords) for keywords, _ in events)
+
+    def rescale(self, window: str, now: float = None):
+        """기준 시각을 현재로 옮기고 점수를 같은 배율로 줄임"""
+        now = now or time.time()
+        key, landmark_key = self._key(window), self._landmark_key(window)
+        with self.client.pipeline() as pipe:
+            while True:
+                try:
+                    pipe.watch(landmark_key)
+                    landmark = pipe.get(landmark_key)
+                    if landmark is None:
+                        return
+                    factor = 2.0 ** (-(now - float(landmark)) / HALF_LIVES[window])
+                    pipe.multi()
+                    pipe.zunionstore(key, {key: factor})
+                    pipe.zremrangebyscore(key, '-inf', f'({MIN_SCORE}')
+                    pipe.set(landmark_key, now)
+                    pipe.execute()
+                    return
+                except redis.WatchError:
+                    continue
+
+    def top(self, window: str, limit: int = 10, now: float = None) -> List[dict]:
+        """
+        창의 상위 키워드
+
+        Args:
+            window: HALF_LIVES 의 창 이름
+            limit: 키워드 수
+            now: 현재 시각 (테스트용)
+
+        Returns:
+            키워드, 감쇠 점수, 시간당 발생률, 속도 목록 (점수 내림차순).
+            속도는 더 긴 창의 발생률 대비 배수로, 1보다 크면 급상승 중이다.
+        """
+        now = now or time.time()
+        half_life = HALF_LIVES[window]
+        baseline = BASELINES.get(window)
+
+        pipe = self.client.pipeline(transaction=False)
+        pipe.zrevrange(self._key(window), 0, limit - 1, withscores=True)
+        pipe.mget([self._landmark_key(window), self._landmark_key(baseline or window)])
+        ranked, (landmark, baseline_landmark) = pipe.execute()
+        if not ranked or landmark is None:
+            return []
+
+        keywords = [keyword.decode('utf-8') for keyword, _ in ranked]
+        baseline_scores: List[Optional[float]] = [None] * len(keywords)
+        if baseline and baseline_landmark is not None:
+            baseline_scores = self.client.zmscore(self._key(baseline), keywords)
+
+        results = []
+        for keyword, (_, raw), baseline_raw in zip(keywords, ranked, baseline_scores):
+            score = raw * 2.0 ** (-(now - float(landmark)) / half_life)
+            # 감쇠 점수 = 발생률 × 반감기 / ln 2 (일정한 발생률일 때)
+            rate = score * math.log(2) / (half_life / 3600)
+            velocity = None
+            if baseline_raw:
+                baseline_half_life = HALF_LIVES[baseline]
+                baseline_score = baseline_raw * 2.0 ** (-(now - float(baseline_landmark)) / baseline_half_life)
+                baseline_rate = baseline_score * math.log(2) / (baseline_half_life / 3600)
+                velocity = round(rate / baseline_rate, 3) if baseline_rate > 0 else None
+            results.append({
+                'keyword': keyword,
+                'score': round(score, 4),
+                'rate_per_hour': round(rate, 4),
+                'velocity': velocity,
+            })
+        return results
+
+
+def record_keyword_events(events: List[Tuple[List[str], float]]) -> int:
+    """
+    인제스트 시 새 기사 키워드를 트렌딩 점수에 반영 (Redis 장애 시 건너뜀)
+
+    Args:
+        events: (키워드 목록, 발행 시각 epoch 초) 목록
+
+    Returns:
+        반영한 키워드 발생 수
+    """
+    if not events or not getattr(settings, 'RSS_TRENDING_ENABLED', True):
+        return 0
+    try:
+        return TrendingKeywords().record(events)
+    except redis.RedisError as e:
+        logger.warning("Failed to update trending keywords: %s", e)
+        return 0
@@ -0,0 +1,77 @@
+from django.conf import settings
+from django.http import HttpResponse
+from django.utils.cache import patch_vary_headers
+
+from .snapshots import fresh_snapshot_path, snapshot_paths
+
+
+def accepts_gzip(accept_encoding: str) -> bool:
+    """
+    Accept-Encoding 헤더가 gzip 을 허용하는지 (q 값 반영)
+
+    'gzip;q=0' 처럼 q=0 이면 거부, gzip 이 없으면 '*' 의 q 값을 따른다.
+    """
+    qualities = {}
+    for item in accept_encoding.split(','):
+        coding, _, params = item.partition(';')
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        quality = 1.0
+        for param in params.split(';'):
+            name, _, value = param.partition('=')
+            if name.strip().lower() == 'q':
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        qualities[coding] = quality
+    return qualities.get('gzip', qualities.get('*', 0.0)) > 0
+
+
+class StaticSnapshotMiddleware:
+    """
+    익명 사용자의 기본 홈/대시보드 요청을 미리 렌더링된 스냅샷 파일로 응답
+
+    쿼리 문자열이 있거나 세션 쿠키가 있는 요청, 스냅샷이 없거나 오래된
+    경우에는 뷰로 넘겨 평소처럼 렌더링한다.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.paths = None
+
+    def __call__(self, request):
+        response = self._snapshot_response(request)
+        if response is not None:
+            return response
+        return self.get_response(request)
+
+    def _snapshot_response(self, request):
+        if not getattr(settings, 'RSS_SNAPSHOT_ENABLED', True):
+            return None
+        if request.method not in ('GET', 'HEAD') or request.GET or settings.SESSION_COOKIE_NAME in request.COOKIES:
+            return None
+
+        if self.paths is None:
+            self.paths = snapshot_paths()
+        name = self.paths.get(request.path_info)
+        if name is None:
+            return None
+
+        gzipped = accepts_gzip(request.headers.get('Accept-Encoding', ''))
+        path = fresh_snapshot_path(name, gzipped=gzipped)
+        if path is None:
+            return None
+        try:
+            with open(path, 'rb') as f:
+                content = f.read()
+        except FileNotFoundError:
+            return None
+
+        response = HttpResponse(content, content_type='text/html; charset=utf-8')
+        if gzipped:
+            response['Content-Encoding'] = 'gzip'
+        patch_vary_headers(response, ('Accept-Encoding', 'Cookie'))
+        response['X-Snapshot'] = 'hit'
+        return response
@@ -0,0 +1,133 @@
+"""
+홈/대시보드 정적 스냅샷
+
+익명 사용자의 기본(필터 없는) 홈과 대시보드 요청은 인제스트 후 미리
+렌더링해 둔 HTML(및 gzip) 파일로 응답한다. 파일은 임시 파일에 쓴 뒤
+os.replace 로 교체하므로 읽는 쪽은 항상 완전한 파일을 본다. 스냅샷이
+없거나 RSS_SNAPSHOT_MAX_AGE 보다 오래되었으면 평소처럼 뷰가 렌더링한다.
+"""
+import gzip
+import json
+import logging
+import os
+import time
+from typing import Dict, Optional
+
+from django.conf import settings
+from django.contrib.auth.models import AnonymousUser
+from django.http import HttpRequest
+from django.urls import resolve, reverse
+
+from core.fragments import ingest_version
+
+logger = logging.getLogger(__name__)
+
+# 스냅샷 이름 -> URL 이름
+SNAPSHOT_PAGES = {
+    'home': 'frontend:home',
+    'dashboard': 'frontend:dashboard',
+}
+
+
+def snapshot_dir() -> str:
+    return getattr(settings, 'RSS_SNAPSHOT_DIR', os.path.join(settings.BASE_DIR, 'var', 'snapshots'))
+
+
+def snapshot_paths() -> Dict[str, str]:
+    """요청 경로 -> 스냅샷 이름"""
+    return {reverse(url_name): name for name, url_name in SNAPSHOT_PAGES.items()}
+
+
+def _write_atomic(path: str, data: bytes):
+    tmp_path = f"{path}.tmp.{os.getpid()}"
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def _render(url_name: str) -> bytes:
+    """뷰를 익명 사용자의 기본 요청으로 렌더링"""
+    path = reverse(url_name)
+    request = HttpRequest()
+    request.method = 'GET'
+    request.path = request.path_info = path
+    request.META = {'REQUEST_METHOD': 'GET', 'PATH_INFO': path, 'SERVER_NAME': 'localhost', 'SERVER_PORT': '80'}
+    request.user = AnonymousUser()
+    match = resolve(path)
+    response = match.func(request, *match.args, **match.kwargs)
+    if hasattr(response, 'render'):
+        response.render()
+    if response.status_code != 200:
+        raise ValueError(f"{path} rendered with status {response.status_code}")
+    return response.content
+
+
+def read_meta() -> dict:
+    try:
+        with open(os.path.join(snapshot_dir(), 'meta.json')) as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {}
+
+
+def publish_snapshots(force: bool = False) -> dict:
+    """
+    홈/대시보드를 렌더링해 스냅샷 파일로 교체
+
+    마지막 발행 이후 인제스트 버전이 바뀌지 않았고 모든 페이지의 스냅샷이
+    아직 신선하면 건너뛴다 (force 이면 항상 렌더링). meta.json 은 모든
+    페이지를 발행했을 때만 갱신한다.
+
+    Args:
+        force: 버전과 관계없이 다시 렌더링
+
+    Returns:
+        발행한 페이지, 실패한 페이지, 인제스트 버전
+    """
+    directory = snapshot_dir()
+    os.makedirs(directory, exist_ok=True)
+    version = ingest_version()
+    meta = read_meta()
+    max_age = getattr(settings, 'RSS_SNAPSHOT_MAX_AGE', 600)
+    if (
+        not force
+        and version
+        and meta.get('version') == version
+        and set(meta.get('pages', ())) >= set(SNAPSHOT_PAGES)
+        and time.time() - meta.get('published_at', 0) < max_age / 2
+    ):
+        return {'published': [], 'failed': [], 'version': version, 'skipped': True}
+
+    published, failed = [], []
+    for name, url_name in SNAPSHOT_PAGES.items():
+        try:
+            content = _render(url_name)
+        except Exception as e:
+            logger.warning("Failed to render snapshot %s: %s", name, e)
+            failed.append(name)
+            continue
+        _write_atomic(os.path.join(directory, f'{name}.html.gz'), gzip.compress(content))
+        _write_atomic(os.path.join(directory, f'{name}.html'), content)
+        published.append(name)
+
+    # 실패한 페이지가 있으면 버전/발행 시각을 올리지 않아 다음 실행에서 다시 렌더링
+    if not failed:
+        _write_atomic(
+            os.path.join(directory, 'meta.json'),
+            json.dumps({'version': version, 'published_at': time.time(), 'pages': published}).encode('utf-8')
+        )
+    return {'published': published, 'failed': failed, 'version': version, 'skipped': False}
+
+
+def fresh_snapshot_path(name: str, gzipped: bool = False) -> Optional[str]:
+    """신선한 스냅샷 파일 경로 (없거나 오래되었으면 None)"""
+    path = os.path.join(snapshot_dir(), f'{name}.html.gz' if gzipped else f'{name}.html')
+    try:
+        age = time.time() - os.stat(path).st_mtime
+    except FileNotFoundError:
+        return None
+    if age > getattr(settings, 'RSS_SNAPSHOT_MAX_AGE', 600):
+        return None
+    return path
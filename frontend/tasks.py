@@ -0,0 +1,23 @@
+import logging
+
+from celery import shared_task
+
+from .snapshots import publish_snapshots
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task
+def publish_snapshots_task(force: bool = False):
+    """
+    홈/대시보드 정적 스냅샷 발행 태스크
+
+    인제스트 버전이 바뀌었거나 스냅샷이 오래되었을 때만 다시 렌더링한다.
+    """
+    result = publish_snapshots(force=force)
+    if not result['skipped']:
+        logger.info(
+            "Published snapshots %s for ingest v%s (failed: %s)",
+            result['published'], result['version'], result['failed']
+        )
+    return {'status': 'success', **result}
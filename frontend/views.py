@@ -1,9 +1,17 @@
+from django.conf import settings
+from django.db.models import Count, Q
+from django.http import HttpResponse
 from django.shortcuts import render
-from django.views.generic import ListView, DetailView
 from django.utils import timezone
+from django.views.generic import ListView, DetailView
 from datetime import timedelta
 
-from core.models import RSSFeed, RSSEntry, RSSProcessingLog
+from core.filters import entry_facets, filter_entries
+from core.fragments import cached_fragment, ingest_version
+from core.models import DailySummary, RSSFeed, RSSEntry, RSSProcessingLog
+from core.pagination import EstimatedCountPaginator
+from core.periods import PERIODS, local_today, period_counts, period_q
+from crawler.related import related_entries, related_index_version
 
 
 class HomeView(ListView):
@@ -14,23 +22,29 @@ class HomeView(ListView):
     paginate_by = 10
     
     def get_queryset(self):
-        return RSSEntry.objects.select_related('feed').order_by('-published_at')[:10]
+        self.version = ingest_version()
+        return cached_fragment(
+            'home_recent_entries',
+            lambda: list(RSSEntry.objects.select_related('feed', 'article').order_by('-published_at')[:10]),
+            version=self.version
+        )
     
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         
-        # 통계 정보 추가
-        today = timezone.now().date()
-        week_ago = today - timedelta(days=7)
-        
-        context.update({
-            'total_feeds': RSSFeed.objects.filter(is_active=True).count(),
-            'today_entries': RSSEntry.objects.filter(published_at__date=today).count(),
-            'week_entries': RSSEntry.objects.filter(published_at__date__gte=week_ago).count(),
-            'active_feeds': RSSFeed.objects.filter(is_active=True)[:5]
-        })
+        # 통계 정보 추가 (기간 통계는 날짜가 바뀌면 달라지므로 날짜도 키에 포함)
+        context.update(cached_fragment('home_stats', self._build_stats, local_today(), version=self.version))
         
         return context
+    
+    def _build_stats(self):
+        period_stats = period_counts(RSSEntry.objects.canonical())
+        return {
+            'total_feeds': RSSFeed.objects.filter(is_active=True).count(),
+            'today_entries': period_stats['today'],
+            'week_entries': period_stats['this_week'],
+            'active_feeds': list(RSSFeed.objects.filter(is_active=True)[:5])
+        }
 
 
 class RSSFeedListView(ListView):
@@ -51,8 +65,17 @@ class RSSFeedDetailView(DetailView):
     
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context['recent_entries'] = self.object.entries.order_by('-published_at')[:10]
-        context['processing_logs'] = self.object.processing_logs.order_by('-created_at')[:5]
+        version = ingest_version()
+        context['recent_entries'] = cached_fragment(
+            'feed_recent_entries',
+            lambda: list(self.object.entries.order_by('-published_at')[:10]),
+            self.object.pk, version=version
+        )
+        context['processing_logs'] = cached_fragment(
+            'feed_processing_logs',
+            lambda: list(self.object.processing_logs.order_by('-created_at')[:5]),
+            self.object.pk, version=version
+        )
         return context
 
 
@@ -62,41 +85,17 @@ class RSSEntryListView(ListView):
     template_name = 'frontend/entry_list.html'
     context_object_name = 'entries'
     paginate_by = 20
+    paginator_class = EstimatedCountPaginator
     
     def get_queryset(self):
-        queryset = RSSEntry.objects.select_related('feed').order_by('-published_at')
-        
-        # 필터링
-        feed_id = self.request.GET.get('feed')
-        if feed_id:
-            queryset = queryset.filter(feed_id=feed_id)
-        
-        period = self.request.GET.get('period')
-        if period:
-            today = timezone.now().date()
-            if period == 'today':
-                queryset = queryset.filter(published_at__date=today)
-            elif period == 'this_week':
-                week_ago = today - timedelta(days=7)
-                queryset = queryset.filter(published_at__date__gte=week_ago)
-            elif period == 'this_month':
-                month_ago = today - timedelta(days=30)
-                queryset = queryset.filter(published_at__date__gte=month_ago)
-        
-        keyword = self.request.GET.get('keyword')
-        if keyword:
-            queryset = queryset.filter(keywords__icontains=keyword)
-        
-        return queryset
+        queryset = RSSEntry.objects.select_related('feed', 'article').order_by('-published_at')
+        return filter_entries(queryset, self.request.GET)
     
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         context['feeds'] = RSSFeed.objects.filter(is_active=True)
-        context['periods'] = [
-            ('today', '오늘'),
-            ('this_week', '이번 주'),
-            ('this_month', '이번 달'),
-        ]
+        context['periods'] = PERIODS
+        context['facets'] = entry_facets(self.request.GET)
         return context
 
 
@@ -105,6 +104,30 @@ class RSSEntryDetailView(DetailView):
     model = RSSEntry
     template_name = 'frontend/entry_detail.html'
     context_object_name = 'entry'
+    
+    def get_queryset(self):
+        return RSSEntry.objects.select_related('feed', 'article')
+    
+    def get(self, request, *args, **kwargs):
+        """엔트리/기사의 updated_at 과 관련 기사 인덱스 버전을 키로 렌더링된 페이지를 캐시"""
+        self.object = self.get_object()
+        article_updated_at = self.object.article.updated_at.timestamp() if self.object.article_id else ''
+        
+        def render_page():
+            response = self.render_to_response(self.get_context_data(object=self.object))
+            return response.render().content
+        
+        content = cached_fragment(
+            'entry_page', render_page,
+            self.object.pk, self.object.updated_at.timestamp(), article_updated_at, related_index_version(),
+            versioned=False, timeout=getattr(settings, 'RSS_ENTRY_PAGE_CACHE_SECONDS', 3600)
+        )
+        return HttpResponse(content)
+    
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context['related_entries'] = [related for related, _ in related_entries(self.object)]
+        return context
 
 
 class RSSProcessingLogListView(ListView):
@@ -113,6 +136,7 @@ class RSSProcessingLogListView(ListView):
     template_name = 'frontend/log_list.html'
     context_object_name = 'logs'
     paginate_by = 20
+    paginator_class = EstimatedCountPaginator
     
     def get_queryset(self):
         return RSSProcessingLog.objects.select_related('feed').order_by('-created_at')
@@ -120,19 +144,34 @@ class RSSProcessingLogListView(ListView):
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         
-        # 통계 정보
-        total_logs = RSSProcessingLog.objects.count()
-        success_logs = RSSProcessingLog.objects.filter(status='success').count()
-        error_logs = RSSProcessingLog.objects.filter(status='error').count()
+        # 통계 정보 (한 번의 조건부 집계, 짧게 캐시)
+        context['stats'] = cached_fragment(
+            'log_stats', self._build_stats,
+            timeout=getattr(settings, 'RSS_LOG_STATS_CACHE_SECONDS', 60)
+        )
         
-        context['stats'] = {
-            'total': total_logs,
-            'success': success_logs,
-            'error': error_logs,
-            'success_rate': success_logs / max(total_logs, 1) * 100
-        }
+        # 피드별 단계(가져오기/파싱/키워드·중복/DB) 소요 시간 p50/p95
+        context['stage_percentiles'] = cached_fragment(
+            'log_stage_percentiles', self._build_stage_percentiles,
+            timeout=getattr(settings, 'RSS_LOG_STATS_CACHE_SECONDS', 60)
+        )
         
         return context
+    
+    def _build_stage_percentiles(self):
+        days = getattr(settings, 'RSS_STAGE_METRICS_DAYS', 7)
+        return RSSProcessingLog.objects.filter(
+            created_at__gte=timezone.now() - timedelta(days=days)
+        ).stage_percentiles()
+    
+    def _build_stats(self):
+        counts = RSSProcessingLog.objects.aggregate(
+            total=Count('pk'),
+            success=Count('pk', filter=Q(status='success')),
+            error=Count('pk', filter=Q(status='error'))
+        )
+        counts['success_rate'] = counts['success'] / max(counts['total'], 1) * 100
+        return counts
 
 
 class DashboardView(ListView):
@@ -143,37 +182,38 @@ class DashboardView(ListView):
     
     def get_queryset(self):
         # 최근 일주일간의 엔트리만 표시
-        week_ago = timezone.now().date() - timedelta(days=7)
-        return RSSEntry.objects.filter(
-            published_at__date__gte=week_ago
-        ).select_related('feed').order_by('-published_at')[:50]
+        self.version = ingest_version()
+        self.today = local_today()
+        return cached_fragment(
+            'dashboard_recent_entries',
+            lambda: list(RSSEntry.objects.filter(
+                period_q('this_week')
+            ).select_related('feed', 'article').order_by('-published_at')[:50]),
+            self.today, version=self.version
+        )
     
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         
-        today = timezone.now().date()
-        week_ago = today - timedelta(days=7)
-        month_ago = today - timedelta(days=30)
-        
-        # 기간별 통계
-        context.update({
-            'period_stats': {
-                'today': RSSEntry.objects.filter(published_at__date=today).count(),
-                'this_week': RSSEntry.objects.filter(published_at__date__gte=week_ago).count(),
-                'this_month': RSSEntry.objects.filter(published_at__date__gte=month_ago).count(),
-            },
-            'feed_stats': RSSFeed.objects.filter(is_active=True).count(),
-            'recent_logs': RSSProcessingLog.objects.order_by('-created_at')[:5]
-        })
+        # 기간별 통계 (유사 중복 제외)
+        context.update(cached_fragment('dashboard_stats', self._build_stats, self.today, version=self.version))
         
         # 키워드 통계
-        keyword_stats = {}
-        recent_entries = RSSEntry.objects.filter(published_at__date__gte=week_ago)
-        for entry in recent_entries:
-            for keyword in entry.keywords_list:
-                keyword_stats[keyword] = keyword_stats.get(keyword, 0) + 1
+        context['top_keywords'] = cached_fragment(
+            'dashboard_keywords', self._build_keywords, self.today, version=self.version
+        )
         
-        top_keywords = sorted(keyword_stats.items(), key=lambda x: x[1], reverse=True)[:10]
-        context['top_keywords'] = top_keywords
+        # 지난 일주일 일일 요약 (저장된 값만 조회)
+        context['daily_summaries'] = list(DailySummary.objects.all()[:7])
         
         return context
+    
+    def _build_stats(self):
+        return {
+            'period_stats': period_counts(RSSEntry.objects.canonical()),
+            'feed_stats': RSSFeed.objects.filter(is_active=True).count(),
+            'recent_logs': list(RSSProcessingLog.objects.select_related('feed').order_by('-created_at')[:5])
+        }
+    
+    def _build_keywords(self):
+        return RSSEntry.objects.canonical().filter(period_q('this_week')).keyword_counts(10)
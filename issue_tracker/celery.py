@@ -1,5 +1,8 @@
 import os
+import time
+
 from celery import Celery
+from celery.signals import task_postrun, task_prerun
 
 # Django 설정을 Celery에 알려줍니다
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'issue_tracker.settings')
@@ -12,6 +15,34 @@ app.config_from_object('django.conf:settings', namespace='CELERY')
 # 등록된 Django 앱에서 작업을 자동으로 로드합니다
 app.autodiscover_tasks()
 
+# 태스크 실행 시간과 쿼리 예산 (prefork 자식 프로세스마다 기록, 실행 시간은 Redis 지표에 누적)
+_task_started = {}
+
+
+@task_prerun.connect
+def _record_task_start(task_id=None, task=None, **kwargs):
+    from core.profiling import start_task_profile
+    from core.querybudget import start_task_budget
+    _task_started[task_id] = time.perf_counter()
+    task_name = task.name if task is not None else 'unknown'
+    start_task_budget(task_id, task_name)
+    # headers={'profile': True} 로 보낸 실행만 프로파일링
+    start_task_profile(task_id, task_name, task.request.headers if task is not None else None)
+
+
+@task_postrun.connect
+def _record_task_runtime(task_id=None, task=None, state=None, **kwargs):
+    from core.profiling import finish_task_profile
+    from core.querybudget import finish_task_budget
+    finish_task_profile(task_id, state)
+    finish_task_budget(task_id)
+    started = _task_started.pop(task_id, None)
+    if started is None or task is None:
+        return
+    from core.telemetry import TASK_SECONDS
+    TASK_SECONDS.observe(time.perf_counter() - started, task=task.name, state=state or 'UNKNOWN')
+
+
 @app.task(bind=True)
 def debug_task(self):
     print(f'Request: {self.request!r}') 
\ No newline at end of file
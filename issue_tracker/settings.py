@@ -5,6 +5,8 @@ Django settings for issue_tracker project.
 from pathlib import Path
 import os
 
+from celery.schedules import crontab
+
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -34,7 +36,11 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'api.middleware.ProfilingMiddleware',
+    'api.middleware.RequestMetricsMiddleware',
+    'api.middleware.QueryBudgetMiddleware',
     'django.middleware.security.SecurityMiddleware',
+    'frontend.middleware.StaticSnapshotMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -110,7 +116,124 @@ CELERY_ACCEPT_CONTENT = ['json']
 CELERY_TASK_SERIALIZER = 'json'
 CELERY_RESULT_SERIALIZER = 'json'
 CELERY_TIMEZONE = TIME_ZONE
+CELERY_BEAT_SCHEDULE = {
+    # 크롤링 주기가 된 피드를 워커들이 리스로 나눠 가져감
+    'claim-due-feeds': {
+        'task': 'crawler.tasks.claim_due_feeds_task',
+        'schedule': 30.0,
+    },
+    # 인제스트 스트림 writer (RSS_INGEST_MODE = 'stream' 일 때 사용)
+    'drain-ingest-stream': {
+        'task': 'crawler.tasks.drain_ingest_stream_task',
+        'schedule': 60.0,
+    },
+    # 요약되지 않은 엔트리 추출 요약
+    'summarize-entries': {
+        'task': 'crawler.tasks.summarize_entries_task',
+        'schedule': 120.0,
+    },
+    # 인제스트 후 홈/대시보드 정적 스냅샷 갱신 (버전이 같으면 건너뜀)
+    'publish-snapshots': {
+        'task': 'frontend.tasks.publish_snapshots_task',
+        'schedule': 60.0,
+    },
+    # 전날까지 최근 며칠의 일일 요약을 DailySummary 로 저장 (과거 날짜는 backfill_daily_summaries)
+    'generate-daily-summary': {
+        'task': 'crawler.tasks.generate_daily_summary_task',
+        'schedule': crontab(hour=0, minute=10),
+    },
+    # 관련 기사 인덱스에 새 대표 엔트리 추가
+    'update-related-index': {
+        'task': 'crawler.tasks.update_related_index_task',
+        'schedule': 300.0,
+    },
+    # 삭제된 엔트리 정리를 위해 하루 한 번 새 버전으로 재구축
+    'rebuild-related-index': {
+        'task': 'crawler.tasks.update_related_index_task',
+        'schedule': 86400.0,
+        'kwargs': {'rebuild': True},
+    },
+}
+CELERY_TASK_ROUTES = {
+    # DB writer 는 전용 큐에서 단일 워커로 실행 (celery -A issue_tracker worker -Q ingest -c 1)
+    'crawler.tasks.drain_ingest_stream_task': {'queue': 'ingest'},
+    # 요약은 태스크 안에서 프로세스 풀을 쓰므로 solo 풀 워커에서 실행 (celery -A issue_tracker worker -Q enrich -P solo)
+    'crawler.tasks.summarize_entries_task': {'queue': 'enrich'},
+    'crawler.tasks.update_related_index_task': {'queue': 'enrich'},
+}
+
+# Redis (크롤링 락 등 공용 상태 저장소)
+REDIS_URL = os.environ.get('REDIS_URL', 'redis://localhost:6379/1')
+
+# 화면 조각/페이지 캐시 (웹 워커 간 공유, core.fragments)
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': os.environ.get('CACHE_URL', 'redis://localhost:6379/2'),
+        'OPTIONS': {
+            'socket_connect_timeout': 1,
+            'socket_timeout': 2,
+        },
+    }
+}
 
 # RSS Crawler Settings
 RSS_FEED_URL = 'https://techcrunch.com/feed/'
-RSS_CRAWL_INTERVAL = 3600  # 1시간마다 크롤링 
\ No newline at end of file
+RSS_CRAWL_INTERVAL = 3600  # 1시간마다 크롤링
+CRAWL_LOCK_TTL = 600  # 피드별 크롤링 락 유지 시간(초)
+RSS_FETCH_TIMEOUT = 30  # 피드 요청 타임아웃(초)
+RSS_PARSE_WORKERS = None  # 스윕 파싱 프로세스 수 (None: CPU 코어 수)
+RSS_CRAWL_RETRY_DELAY = 60  # 크롤링 실패 후 재시도까지 대기 시간(초)
+RSS_FEED_LEASE_SECONDS = 300  # 피드 리스 유지 시간(초), 하트비트로 연장
+RSS_CLAIM_BATCH_SIZE = 5  # 워커가 한 번에 선점하는 피드 수
+RSS_CLAIM_MAX_RUNTIME = 240  # 선점 태스크 한 번의 최대 실행 시간(초)
+RSS_SEEN_FILTER_ENABLED = True  # 저장된 링크 블룸 필터로 DB 중복 조회 생략
+RSS_SEEN_FILTER_CAPACITY = 100000  # 피드당 필터 용량 (링크 수)
+RSS_SEEN_FILTER_ERROR_RATE = 0.001  # 목표 오탐률
+RSS_KEYWORD_EXTRACTOR = 'tfidf'  # 'tfidf' (코퍼스 문서 빈도 기반) / 'fixed' (고정 기술 키워드 목록)
+RSS_KEYWORD_TOP_K = 10  # 엔트리별 저장 키워드 수
+RSS_NEAR_DUPLICATE_ENABLED = True  # MinHash/LSH 로 피드 간 같은 기사를 대표 엔트리에 연결
+RSS_NEAR_DUPLICATE_THRESHOLD = 0.8  # 중복으로 볼 추정 자카드 유사도
+RSS_SUMMARY_BATCH_SIZE = 200  # 요약 배치 크기 (배치마다 커밋)
+RSS_SUMMARY_MAX_RUNTIME = 100  # 요약 태스크 한 번의 최대 실행 시간(초)
+RSS_SUMMARY_WORKERS = None  # 요약 프로세스 수 (None: CPU 코어 수)
+RSS_SUMMARY_CLAIM_SECONDS = 300  # 요약 중인 배치의 선점 유지 시간(초), 지나면 다른 워커가 다시 가져감
+RSS_SUMMARY_SENTENCES = 2  # 요약 문장 수
+RSS_SUMMARY_MAX_CHARS = 400  # 요약 최대 길이
+RSS_DAILY_SUMMARY_REFRESH_DAYS = 3  # 정기 일일 요약이 다시 계산하는 최근 날짜 수 (늦게 들어온 엔트리 반영)
+RSS_ARCHIVE_ENABLED = True  # 가져온 피드 원문을 압축 보관 (reprocess_feeds 재처리용)
+RSS_ARCHIVE_RETENTION_DAYS = 90  # 피드 원문 보관 기간(일)
+RSS_FACETS_CACHE_SECONDS = 60  # 필터 조합별 패싯 건수 캐시 시간(초)
+RSS_FRAGMENT_CACHE_SECONDS = 600  # 인제스트 버전 기반 화면 조각 캐시 시간(초)
+RSS_ENTRY_PAGE_CACHE_SECONDS = 3600  # updated_at 기반 엔트리 상세 페이지 캐시 시간(초)
+RSS_EXACT_COUNT_THRESHOLD = 10000  # 플래너 추정 건수가 이보다 작을 때만 목록 페이지에서 COUNT(*) 실행
+RSS_LOG_STATS_CACHE_SECONDS = 60  # 처리 로그 통계 캐시 시간(초)
+RSS_STAGE_METRICS_DAYS = 7  # 피드별 크롤링 단계 시간 백분위수 집계 기간(일)
+RSS_METRICS_ENABLED = True  # Prometheus 지표를 Redis(REDIS_URL)에 누적해 /metrics 로 노출
+RSS_QUERY_BUDGET_REQUEST = 30  # 요청당 쿼리 수 예산 (초과 시 경고 로그)
+RSS_QUERY_TIME_BUDGET_REQUEST_MS = 500  # 요청당 DB 시간 예산(ms)
+RSS_QUERY_BUDGET_TASK = 1000  # Celery 태스크당 쿼리 수 예산
+RSS_QUERY_TIME_BUDGET_TASK_MS = 30000  # Celery 태스크당 DB 시간 예산(ms)
+RSS_QUERY_REPEAT_THRESHOLD = 5  # 같은 SQL 모양이 이 횟수 이상 반복되면 N+1 의심으로 경고
+RSS_SERVER_TIMING = True  # 응답에 Server-Timing(db/app) 헤더 추가
+RSS_PROFILING_ENABLED = True  # 서명된 X-Profile 헤더 / profile 태스크 메시지 헤더로 단건 프로파일링 허용
+RSS_PROFILE_DIR = os.environ.get('RSS_PROFILE_DIR', str(BASE_DIR / 'var' / 'profiles'))
+RSS_PROFILE_TOKEN_MAX_AGE = 3600  # X-Profile 토큰 유효 시간(초)
+RSS_PROFILE_KEEP = 200  # 보관할 최근 캡처 수
+RSS_SNAPSHOT_ENABLED = True  # 익명 기본 홈/대시보드 요청을 정적 스냅샷으로 응답
+RSS_SNAPSHOT_DIR = os.environ.get('RSS_SNAPSHOT_DIR', str(BASE_DIR / 'var' / 'snapshots'))
+RSS_SNAPSHOT_MAX_AGE = 600  # 이보다 오래된 스냅샷은 쓰지 않고 실시간 렌더링(초)
+RSS_TRENDING_ENABLED = True  # 새 기사 키워드를 Redis 시간 감쇠 점수(1h/24h/7d 반감기)에 반영
+RSS_RELATED_INDEX_DIR = os.environ.get('RSS_RELATED_INDEX_DIR', str(BASE_DIR / 'var' / 'related'))  # 웹 워커와 공유하는 디렉터리
+RSS_RELATED_DIMENSIONS = 256  # 관련 기사 해시 벡터 차원
+RSS_RELATED_BATCH_SIZE = 5000  # 인덱스 갱신 시 한 번에 벡터화할 엔트리 수
+RSS_RELATED_LIMIT = 5  # 상세/API 에서 보여줄 관련 기사 수
+
+# 인제스트 모드: 'direct' (크롤링 태스크가 직접 저장) / 'stream' (Redis Stream 적재 후 writer 가 일괄 저장)
+RSS_INGEST_MODE = os.environ.get('RSS_INGEST_MODE', 'direct')
+RSS_INGEST_BATCH_SIZE = 2000  # writer 가 한 번에 읽는 메시지 수
+RSS_INGEST_MAX_RUNTIME = 50  # writer 태스크 한 번의 최대 실행 시간(초)
+RSS_INGEST_CLAIM_IDLE_MS = 60000  # 이 시간 이상 ACK 되지 않은 메시지는 다른 writer 가 회수
+RSS_INGEST_STREAM_MAXLEN = 1000000  # 밀린 메시지 최대 수, 넘으면 적재를 거부 (읽지 않은 메시지는 자르지 않음)
+RSS_INGEST_BACKLOG_WARN_RATIO = 0.8  # 밀린 양이 최대 수의 이 비율을 넘으면 경고 로그
+RSS_INGEST_MAX_DELIVERIES = 5  # 이 횟수만큼 전달돼도 저장에 실패한 메시지는 dead-letter 스트림(crawl:ingest:dead)으로 이동
\ No newline at end of file
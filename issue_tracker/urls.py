@@ -2,9 +2,12 @@
 from django.contrib import admin
 from django.urls import path, include
 
+from api.views import MetricsView
+
 urlpatterns = [
     path('admin/', admin.site.urls),
     path('', include('frontend.urls')),           # 웹 페이지 (HTML)
     path('api/', include('api.urls')),            # REST API (JSON)
     path('crawler/', include('crawler.urls')),    # 크롤링 관리
+    path('metrics', MetricsView.as_view(), name='metrics'),  # Prometheus 지표 (text)
 ] 
\ No newline at end of file
@@ -1,10 +1,23 @@
 import json
+import fakeredis
+import redis
+import shutil
+import tempfile
 from unittest.mock import patch, Mock
-from django.test import TestCase, Client
+from django.core.cache import cache
+from django.test import TestCase, Client, override_settings
 from django.urls import reverse
 from django.utils import timezone
+from datetime import timedelta
 
-from core.models import RSSFeed, RSSEntry, RSSProcessingLog
+from core.models import DailySummary, RSSFeed, RSSEntry, RSSProcessingLog
+from core.profiling import list_captures, make_token
+from core.filters import entry_facets
+from core.testing import QueryBudgetAssertionsMixin, force_parallel_plan
+from crawler.related import RelatedIndexWriter
+from crawler.trending import TrendingKeywords
+
+LOCMEM_CACHES = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}
 
 
 class TestAPIViews(TestCase):
@@ -39,6 +52,47 @@ class TestAPIViews(TestCase):
         self.assertIn('data', data)
         self.assertIn('period_stats', data['data'])
 
+    def test_daily_summary_api_view_get(self):
+        """저장된 일일 요약은 그대로 반환하고, 없는 날짜는 계산하거나 저장하지 않고 404"""
+        # Given
+        yesterday = timezone.localdate() - timedelta(days=1)
+        DailySummary.objects.create(date=yesterday, total_entries=7, top_keywords=[['AI', 3]])
+
+        # When
+        response = self.client.get('/api/summary/daily/')
+        missing = self.client.get('/api/summary/daily/', {'date': (yesterday - timedelta(days=1)).isoformat()})
+        ancient = self.client.get('/api/summary/daily/', {'date': '1900-01-01'})
+        invalid = self.client.get('/api/summary/daily/', {'date': timezone.localdate().isoformat()})
+
+        # Then
+        data = json.loads(response.content)['data']
+        self.assertEqual(data['date'], yesterday.isoformat())
+        self.assertEqual(data['total_entries'], 7)
+        self.assertEqual(data['top_keywords'], [['AI', 3]])
+        self.assertEqual(missing.status_code, 404)
+        self.assertEqual(ancient.status_code, 404)
+        self.assertEqual(DailySummary.objects.count(), 1)
+        self.assertEqual(invalid.status_code, 400)
+
+    def test_crawl_stage_metrics_api_view_get(self):
+        """피드별 단계 시간 백분위수 API"""
+        # Given
+        for fetch_ms in (100, 300):
+            RSSProcessingLog.objects.create(
+                feed=self.feed, status='success',
+                fetch_ms=fetch_ms, parse_ms=5, enrich_ms=2, db_ms=20
+            )
+
+        # When
+        response = self.client.get('/api/logs/stages/', {'feed': self.feed.pk})
+
+        # Then
+        self.assertEqual(response.status_code, 200)
+        data = json.loads(response.content)
+        self.assertEqual(data['count'], 1)
+        self.assertEqual(data['data'][0]['fetch_p50'], 200.0)
+        self.assertEqual(data['data'][0]['crawls'], 2)
+
     def test_rss_feeds_api_view_get(self):
         """RSS 피드 API 테스트"""
         # When
@@ -51,6 +105,129 @@ class TestAPIViews(TestCase):
         self.assertEqual(len(data['data']), 1)
         self.assertEqual(data['data'][0]['title'], 'Test Feed')
 
+    def test_related_entries_api_view_get(self):
+        """관련 기사 API 테스트"""
+        # Given
+        index_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, index_dir)
+        related = RSSEntry.objects.create(
+            feed=self.feed,
+            title='Test Article follow-up',
+            link='https://techcrunch.com/test-2',
+            description='Test description',
+            published_at=timezone.now()
+        )
+
+        with override_settings(RSS_RELATED_INDEX_DIR=index_dir):
+            RelatedIndexWriter().update()
+
+            # When
+            response = self.client.get(f'/api/entries/{self.entry.id}/related/')
+            missing = self.client.get('/api/entries/0/related/')
+
+        # Then
+        self.assertEqual(response.status_code, 200)
+        data = json.loads(response.content)
+        self.assertEqual([item['id'] for item in data['data']], [related.id])
+        self.assertEqual(missing.status_code, 404)
+
+    @patch('crawler.trending.get_redis_client')
+    def test_trending_keywords_api_view_get(self, mock_get_client):
+        """트렌딩 키워드 API 테스트"""
+        # Given
+        mock_get_client.return_value = fakeredis.FakeRedis()
+        TrendingKeywords().record([(['stripe', 'payments'], timezone.now().timestamp())])
+
+        # When
+        response = self.client.get('/api/trending/?window=1h')
+        invalid = self.client.get('/api/trending/?window=2h')
+
+        # Then
+        self.assertEqual(response.status_code, 200)
+        data = json.loads(response.content)
+        self.assertEqual({item['keyword'] for item in data['data']}, {'stripe', 'payments'})
+        self.assertIn('velocity', data['data'][0])
+        self.assertEqual(invalid.status_code, 400)
+
+    @override_settings(CACHES=LOCMEM_CACHES)
+    def test_entry_facets_api_view_get(self):
+        """패싯 API 는 각 차원을 제외한 나머지 필터로 건수를 센다"""
+        # Given
+        cache.clear()
+        self.entry.set_keywords(['AI', 'Startup'])
+        self.entry.save()
+        other_feed = RSSFeed.objects.create(title='Other Feed', url='https://example.com/feed/')
+        RSSEntry.objects.create(
+            feed=other_feed,
+            title='Old AI Article',
+            link='https://example.com/old',
+            keywords='["AI"]',
+            published_at=timezone.now() - timedelta(days=20)
+        )
+
+        # When
+        with self.assertNumQueries(1):
+            response = self.client.get(f'/api/entries/facets/?feed={self.feed.id}&keyword=AI')
+        with self.assertNumQueries(0):
+            cached = self.client.get(f'/api/entries/facets/?keyword=AI&feed={self.feed.id}')
+        stats = json.loads(self.client.get('/api/cache-stats/').content)
+
+        # Then
+        self.assertEqual(response.status_code, 200)
+        data = json.loads(response.content)['data']
+        self.assertEqual(data['total'], 1)
+        self.assertEqual(
+            {feed['title']: feed['count'] for feed in data['feeds']},
+            {'Test Feed': 1, 'Other Feed': 1}
+        )
+        self.assertEqual(
+            {period['value']: period['count'] for period in data['periods']},
+            {'today': 1, 'this_week': 1, 'this_month': 1}
+        )
+        self.assertEqual(data['keywords'][0], {'value': 'AI', 'count': 1})
+        self.assertEqual(json.loads(cached.content)['data'], data)
+        self.assertEqual(stats['data']['entry_facets'], {'hits': 1, 'misses': 1, 'hit_rate': 0.5})
+
+    @override_settings(CACHES=LOCMEM_CACHES)
+    def test_entry_facets_with_legacy_repr_keywords(self):
+        """파이썬 repr 형식 키워드 행이 있어도 패싯 집계가 실패하지 않음"""
+        # Given
+        cache.clear()
+        self.entry.set_keywords(['AI'])
+        self.entry.save()
+        RSSEntry.objects.create(
+            feed=self.feed,
+            title='Legacy Article',
+            link='https://techcrunch.com/legacy',
+            keywords="['AI', 'startup']",
+            published_at=timezone.now()
+        )
+
+        # When
+        response = self.client.get('/api/entries/facets/')
+
+        # Then
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(json.loads(response.content)['data']['keywords'], [{'value': 'AI', 'count': 1}])
+
+    def test_entry_facets_under_parallel_plan(self):
+        """병렬 계획에서도 패싯 키워드 집계가 실패하지 않음 (큰 테이블에서 PostgreSQL 이 고르는 계획)"""
+        # Given
+        RSSEntry.objects.bulk_create([
+            RSSEntry(
+                feed=self.feed, title=f'Article {i}', link=f'https://techcrunch.com/parallel-{i}',
+                keywords='["AI"]', published_at=timezone.now()
+            )
+            for i in range(200)
+        ])
+
+        # When
+        with force_parallel_plan():
+            facets = entry_facets({})
+
+        # Then
+        self.assertEqual(facets['keywords'], [{'value': 'AI', 'count': 200}])
+
     def test_rss_entries_api_view_get(self):
         """RSS 엔트리 API 테스트"""
         # When
@@ -120,4 +297,164 @@ class TestAPIViews(TestCase):
         self.assertEqual(response.status_code, 400)
         data = json.loads(response.content)
         self.assertEqual(data['status'], 'error')
-        self.assertEqual(data['message'], 'Invalid JSON') 
\ No newline at end of file
+        self.assertEqual(data['message'], 'Invalid JSON') 
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class TestMetricsEndpoint(TestCase):
+    """Prometheus 지표 엔드포인트 테스트"""
+
+    def setUp(self):
+        """테스트 설정 (지표 저장소는 fakeredis)"""
+        self.redis = fakeredis.FakeRedis()
+        patcher = patch('core.telemetry.get_redis_client', return_value=self.redis)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        state = patch.dict('core.telemetry._state', {'retry_at': 0.0})
+        state.start()
+        self.addCleanup(state.stop)
+        cache.clear()
+        self.feed = RSSFeed.objects.create(title='Test Feed', url='https://techcrunch.com/feed/')
+
+    def test_request_latency_is_exported_without_database(self):
+        """요청 지연이 뷰별로 누적되고 스크레이프는 DB 를 조회하지 않음"""
+        # Given
+        self.client.get('/api/feeds/')
+        self.client.get('/api/feeds/')
+
+        # When
+        with self.assertNumQueries(0):
+            response = self.client.get('/metrics')
+
+        # Then
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response['Content-Type'].startswith('text/plain; version=0.0.4'))
+        body = response.content.decode()
+        self.assertIn('# TYPE rss_http_request_seconds histogram', body)
+        self.assertIn(
+            'rss_http_request_seconds_bucket{view="api:feeds-api",method="GET",status="200",le="+Inf"} 2', body
+        )
+        self.assertIn('rss_http_request_seconds_count{view="api:feeds-api",method="GET",status="200"} 2', body)
+        self.assertIn('# TYPE rss_fragment_cache_hit_ratio gauge', body)
+
+    def test_metrics_store_unavailable_returns_503(self):
+        """지표 저장소 장애 시 503 (요청 자체는 계속 처리)"""
+        # Given
+        self.redis.pipeline = Mock(side_effect=redis.ConnectionError('down'))
+
+        # When
+        feeds = self.client.get('/api/feeds/')
+        response = self.client.get('/metrics')
+
+        # Then
+        self.assertEqual(feeds.status_code, 200)
+        self.assertEqual(response.status_code, 503)
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class TestQueryBudgets(QueryBudgetAssertionsMixin, TestCase):
+    """뷰별 쿼리 수 고정 (피드/엔트리/로그 수와 무관해야 함)"""
+
+    def setUp(self):
+        """피드 3개, 피드마다 엔트리/처리 로그 4개"""
+        cache.clear()
+        for f in range(3):
+            feed = RSSFeed.objects.create(title=f'Feed {f}', url=f'https://feed{f}.example.com/rss')
+            for i in range(4):
+                RSSEntry.objects.create(
+                    feed=feed,
+                    title=f'Article {f}-{i}',
+                    link=f'https://feed{f}.example.com/{i}',
+                    published_at=timezone.now() - timedelta(days=i),
+                    keywords='["AI"]'
+                )
+                RSSProcessingLog.objects.create(
+                    feed=feed, status='success', fetch_ms=10, parse_ms=1, enrich_ms=1, db_ms=5
+                )
+
+    def test_api_view_query_counts(self):
+        """API 뷰마다 쿼리 수가 고정 값 이하"""
+        budgets = {
+            '/api/feeds/': 1,
+            '/api/summary/': 4,
+            '/api/entries/': 1,
+            '/api/entries/facets/': 1,
+            '/api/logs/stages/': 1,
+        }
+        for url, max_queries in budgets.items():
+            with self.subTest(url=url):
+                # When
+                with self.assertQueryBudget(max_queries):
+                    response = self.client.get(url)
+
+                # Then
+                self.assertEqual(response.status_code, 200)
+
+    def test_feeds_api_counts_without_per_feed_queries(self):
+        """피드별 엔트리 수가 GROUP BY 로 계산됨"""
+        # When
+        data = json.loads(self.client.get('/api/feeds/').content)
+
+        # Then
+        self.assertEqual({feed['entry_count'] for feed in data['data']}, {4})
+        self.assertEqual({feed['recent_entry_count'] for feed in data['data']}, {4})
+
+    @override_settings(RSS_QUERY_BUDGET_REQUEST=0)
+    def test_middleware_logs_offenders_and_sets_server_timing(self):
+        """예산을 넘은 요청은 경고 로그, 모든 응답에 Server-Timing 헤더"""
+        # When
+        with self.assertLogs('core.querybudget', level='WARNING') as logs:
+            response = self.client.get('/api/feeds/')
+
+        # Then
+        self.assertIn('db;dur=', response['Server-Timing'])
+        self.assertIn('desc="1 queries"', response['Server-Timing'])
+        self.assertIn('GET api:feeds-api', logs.output[0])
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class TestProfilingMiddleware(TestCase):
+    """서명된 X-Profile 헤더 요청 프로파일링 테스트"""
+
+    def setUp(self):
+        """캡처는 임시 디렉터리에 저장"""
+        cache.clear()
+        self.profile_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.profile_dir, ignore_errors=True)
+        settings_override = override_settings(RSS_PROFILE_DIR=self.profile_dir)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        RSSFeed.objects.create(title='Test Feed', url='https://techcrunch.com/feed/')
+
+    def test_signed_header_writes_capture(self):
+        """서명된 헤더가 있는 요청만 pstats 파일로 저장"""
+        # When
+        plain = self.client.get('/api/feeds/')
+        profiled = self.client.get('/api/feeds/', HTTP_X_PROFILE=make_token('tests'))
+
+        # Then
+        self.assertNotIn('X-Profile-Capture', plain)
+        captures = list_captures(self.profile_dir)
+        self.assertEqual(len(captures), 1)
+        self.assertEqual(captures[0]['kind'], 'request')
+        self.assertEqual(captures[0]['label'], 'GET api:feeds-api')
+        self.assertTrue(captures[0]['path'].endswith(profiled['X-Profile-Capture']))
+
+    def test_invalid_header_is_ignored(self):
+        """서명이 틀린 헤더는 경고만 남기고 프로파일링하지 않음"""
+        # When
+        with self.assertLogs('api.middleware', level='WARNING'):
+            response = self.client.get('/api/feeds/', HTTP_X_PROFILE='forged:token')
+
+        # Then
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(list_captures(self.profile_dir), [])
+
+    @override_settings(RSS_PROFILING_ENABLED=False)
+    def test_disabled_hook_ignores_signed_header(self):
+        """훅이 꺼져 있으면 서명된 헤더도 무시"""
+        # When
+        response = self.client.get('/api/feeds/', HTTP_X_PROFILE=make_token())
+
+        # Then
+        self.assertNotIn('X-Profile-Capture', response)
+        self.assertEqual(list_captures(self.profile_dir), [])
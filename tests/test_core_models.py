@@ -1,13 +1,52 @@
+import importlib
+import os
+import shutil
+import tempfile
+import time
+import fakeredis
 import pytest
 from unittest.mock import Mock, patch, MagicMock
-from datetime import datetime, timezone
-from django.test import TestCase
+from datetime import datetime, timedelta, timezone
+from django.apps import apps as django_apps
+from django.core.cache import cache
+from django.test import TestCase, override_settings
 from django.utils import timezone as django_timezone
 
 # 새로운 구조로 import 변경
-from core.models import RSSFeed, RSSEntry, RSSProcessingLog
+from core.models import (
+    Article, FeedBody, FeedSnapshot, RSSFeed, RSSEntry, RSSEntryLSHBand, RSSProcessingLog, TermDocumentFrequency,
+)
+from core.fragments import bump_ingest_version, cached_fragment, fragment_stats, ingest_version
+from core.pagination import EstimatedCountPaginator, estimate_count
+from core.periods import annotate_time_period, period_counts, period_range
+from core.telemetry import render_metrics
 from crawler.services import RSSCrawlerService
+from crawler.dates import FeedDateParser
+from crawler.canonical_urls import canonicalize_url
 from crawler.exceptions import RSSFeedError
+from crawler.keywords import TfidfKeywordExtractor
+from crawler.metrics import CrawlMetrics
+from crawler.minhash import MinHasher, similarity
+from crawler.parsing import parse_feed, parse_feeds_parallel
+from crawler.related import RelatedIndex, RelatedIndexWriter, related_entries
+from crawler.seen_filter import SeenLinkFilter
+from crawler.summarize import summarize
+from crawler.synthetic import SyntheticCorpus
+from crawler.trending import TrendingKeywords
+
+FIXTURE_FEED = os.path.join(os.path.dirname(__file__), 'fixtures', 'techcrunch_feed.xml')
+
+
+def entry_data(link, title='Title', description='desc', author='author', keywords=('AI',)):
+    """save_entries_to_db / upsert_entries 에 넘길 처리된 엔트리 레코드"""
+    return {
+        'title': title,
+        'link': link,
+        'description': description,
+        'author': author,
+        'published_at': django_timezone.now(),
+        'keywords': list(keywords)
+    }
 
 
 class TestRSSCrawlerService(TestCase):
@@ -40,8 +79,9 @@ class TestRSSCrawlerService(TestCase):
             ]
         }
 
-    @patch('crawler.services.feedparser')
-    def test_crawl_rss_feed_success(self, mock_feedparser):
+    @patch.object(RSSCrawlerService, 'fetch_feed', return_value=b'<rss/>')
+    @patch('crawler.parsing.feedparser')
+    def test_crawl_rss_feed_success(self, mock_feedparser, mock_fetch):
         """RSS 피드 크롤링 성공 테스트"""
         # Given
         mock_feed = Mock()
@@ -64,10 +104,12 @@ class TestRSSCrawlerService(TestCase):
         self.assertEqual(len(result), 2)
         self.assertEqual(result[0]['title'], 'Test Article 1')
         self.assertEqual(result[1]['title'], 'Test Article 2')
-        mock_feedparser.parse.assert_called_once_with('https://techcrunch.com/feed/')
+        mock_fetch.assert_called_once_with('https://techcrunch.com/feed/')
+        mock_feedparser.parse.assert_called_once_with(b'<rss/>')
 
-    @patch('crawler.services.feedparser')
-    def test_crawl_rss_feed_invalid_feed(self, mock_feedparser):
+    @patch.object(RSSCrawlerService, 'fetch_feed', return_value=b'<rss/>')
+    @patch('crawler.parsing.feedparser')
+    def test_crawl_rss_feed_invalid_feed(self, mock_feedparser, mock_fetch):
         """잘못된 RSS 피드 처리 테스트"""
         # Given
         mock_feed = Mock()
@@ -79,16 +121,62 @@ class TestRSSCrawlerService(TestCase):
         with self.assertRaises(RSSFeedError):
             self.service.crawl_rss_feed('https://invalid-feed.com/feed/')
 
-    @patch('crawler.services.feedparser')
-    def test_crawl_rss_feed_network_error(self, mock_feedparser):
+    @patch('crawler.services.requests')
+    def test_crawl_rss_feed_network_error(self, mock_requests):
         """네트워크 오류 처리 테스트"""
         # Given
-        mock_feedparser.parse.side_effect = Exception("Network error")
+        mock_requests.get.side_effect = Exception("Network error")
 
         # When & Then
         with self.assertRaises(RSSFeedError):
             self.service.crawl_rss_feed('https://techcrunch.com/feed/')
 
+    def test_parse_feed_fixture(self):
+        """피드 원문(bytes) 파싱/정제 테스트"""
+        # Given
+        with open(FIXTURE_FEED, 'rb') as f:
+            raw = f.read()
+
+        # When
+        result = parse_feed(raw)
+
+        # Then
+        self.assertEqual(len(result), 20)
+        self.assertEqual(result[0]['author'], 'Kyle Wiggers')
+        self.assertEqual(result[0]['published_at'], datetime(2025, 7, 10, 8, 0, tzinfo=timezone.utc))
+        self.assertNotIn('<p>', result[0]['description'])
+
+    def test_parse_feeds_parallel_matches_serial(self):
+        """프로세스 풀 파싱 결과는 순서와 내용이 직렬 처리와 같고 실패는 피드 단위로 격리"""
+        # Given
+        with open(FIXTURE_FEED, 'rb') as f:
+            raw = f.read()
+        bodies = [raw, b'<rss><channel><item>', raw]
+
+        # When
+        result = parse_feeds_parallel(bodies, max_workers=2)
+
+        # Then
+        self.assertEqual(result[0], parse_feed(raw))
+        self.assertIsInstance(result[1], RSSFeedError)
+        self.assertEqual(result[2], result[0])
+
+    def test_parse_feeds_parallel_in_daemon_process(self):
+        """Celery prefork 워커 같은 데몬 프로세스에서는 프로세스 풀 없이 현재 프로세스에서 파싱"""
+        # Given
+        with open(FIXTURE_FEED, 'rb') as f:
+            raw = f.read()
+        daemon = Mock(daemon=True)
+
+        # When
+        with patch('crawler.parsing.multiprocessing.current_process', return_value=daemon), \
+                patch('crawler.parsing.ProcessPoolExecutor') as mock_pool:
+            result = parse_feeds_parallel([raw, raw], max_workers=4)
+
+        # Then
+        mock_pool.assert_not_called()
+        self.assertEqual(result, [parse_feed(raw), parse_feed(raw)])
+
     def test_parse_entry_date_valid(self):
         """유효한 날짜 파싱 테스트"""
         # Given
@@ -111,8 +199,8 @@ class TestRSSCrawlerService(TestCase):
         # When
         result = self.service._parse_entry_date(entry)
 
-        # Then
-        self.assertIsInstance(result, datetime)
+        # Then: 현재 시각을 지어내지 않음
+        self.assertIsNone(result)
 
     def test_clean_text(self):
         """텍스트 정제 테스트"""
@@ -138,6 +226,1018 @@ class TestRSSCrawlerService(TestCase):
         self.assertTrue(len(result) > 0)
 
 
+class TestFeedDateParser(TestCase):
+    """피드별 형식 기억 날짜 파서 테스트"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.parser = FeedDateParser()
+
+    def test_parsed_struct_used_first(self):
+        """feedparser 가 파싱한 struct_time 우선 사용"""
+        # Given
+        entry = {'published': 'garbage', 'published_parsed': (2025, 7, 31, 9, 0, 0, 3, 212, 0)}
+
+        # When
+        result = self.parser.parse(entry)
+
+        # Then
+        self.assertEqual(result, datetime(2025, 7, 31, 9, 0, tzinfo=timezone.utc))
+        self.assertEqual(self.parser.counters['struct'], 1)
+
+    def test_rfc822_format_is_memoized_per_feed(self):
+        """처음 감지한 형식을 피드별로 기억해 재사용"""
+        # When
+        first = self.parser.parse({'published': 'Thu, 31 Jul 2025 09:00:00 +0900'}, 'feed-a')
+        second = self.parser.parse({'published': 'Fri, 01 Aug 2025 10:30:00 GMT'}, 'feed-a')
+
+        # Then
+        self.assertEqual(first, datetime(2025, 7, 31, 0, 0, tzinfo=timezone.utc))
+        self.assertEqual(second, datetime(2025, 8, 1, 10, 30, tzinfo=timezone.utc))
+        self.assertEqual(self.parser.strategies['feed-a'], 'rfc822')
+        self.assertEqual(self.parser.counters['detected'], 1)
+        self.assertEqual(self.parser.counters['fast'], 1)
+
+    def test_iso8601_naive_is_utc(self):
+        """시간대 없는 ISO 8601 은 UTC 로 간주"""
+        # When
+        result = self.parser.parse({'updated': '2025-07-31T09:00:00'}, 'feed-b')
+
+        # Then
+        self.assertEqual(result, datetime(2025, 7, 31, 9, 0, tzinfo=timezone.utc))
+        self.assertEqual(self.parser.strategies['feed-b'], 'iso8601')
+
+    def test_dateutil_fallback_and_unparsed_are_counted(self):
+        """빠른 파서가 실패하면 dateutil, 그래도 실패하면 None"""
+        # When
+        fallback = self.parser.parse({'published': 'July 31, 2025 9:00 AM'})
+        unparsed = self.parser.parse({'published': 'invalid-date'})
+
+        # Then
+        self.assertEqual(fallback, datetime(2025, 7, 31, 9, 0, tzinfo=timezone.utc))
+        self.assertIsNone(unparsed)
+        self.assertEqual(self.parser.counters['dateutil_fallback'], 1)
+        self.assertEqual(self.parser.counters['unparsed'], 1)
+
+
+class TestTfidfKeywordExtractor(TestCase):
+    """코퍼스 TF-IDF 키워드 추출 테스트"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.extractor = TfidfKeywordExtractor(top_k=3)
+        self.documents = [
+            ('Nvidia earnings beat expectations', 'Nvidia reported record GPU revenue from startups.'),
+            ('Stripe raises funding', 'Stripe payments startup raises funding from investors.'),
+            ('Startup funding slows', 'Startup funding from investors slowed this quarter.'),
+        ]
+
+    def test_batch_updates_document_frequencies(self):
+        """새 문서 배치의 DF 와 전체 문서 수가 한 번에 누적됨"""
+        # When
+        self.extractor.extract(self.documents)
+        self.extractor.extract(self.documents[:1])
+
+        # Then
+        frequencies = dict(TermDocumentFrequency.objects.values_list('term', 'document_count'))
+        self.assertEqual(frequencies[TfidfKeywordExtractor.CORPUS_TERM], 4)
+        self.assertEqual(frequencies['nvidia'], 2)
+        self.assertEqual(frequencies['funding'], 2)
+        self.assertNotIn('from', frequencies)  # 불용어 제외
+
+    def test_distinctive_terms_rank_first(self):
+        """코퍼스 전체에 흔한 용어보다 문서 고유 용어가 상위"""
+        # Given
+        self.extractor.add_documents(self.documents)
+
+        # When
+        keywords = self.extractor.extract(self.documents, count_documents=False)
+
+        # Then
+        self.assertEqual(keywords[0][0], 'nvidia')
+        self.assertEqual(keywords[1][0], 'stripe')
+        self.assertTrue(all(len(entry_keywords) == 3 for entry_keywords in keywords))
+        self.assertEqual(
+            TermDocumentFrequency.objects.get(term=TfidfKeywordExtractor.CORPUS_TERM).document_count, 3
+        )
+
+    @patch('crawler.services.SeenLinkFilter')
+    def test_save_entries_stores_tfidf_keywords(self, mock_filter_class):
+        """새 엔트리 저장 시 TF-IDF 키워드가 set_keywords 형식으로 저장됨"""
+        # Given
+        mock_filter_class.return_value.might_contain_many.return_value = [False, False, False]
+        feed = RSSFeed.objects.create(title='Test Feed', url='https://techcrunch.com/feed/')
+        entries = [
+            {
+                'title': title,
+                'link': f'https://techcrunch.com/{index}',
+                'description': description,
+                'author': '',
+                'published_at': django_timezone.now(),
+                'keywords': [],
+            }
+            for index, (title, description) in enumerate(self.documents)
+        ]
+
+        # When
+        RSSCrawlerService().save_entries_to_db(feed, entries)
+
+        # Then
+        entry = RSSEntry.objects.get(link='https://techcrunch.com/0')
+        self.assertEqual(entry.keywords_list[0], 'nvidia')
+        self.assertLessEqual(len(entry.keywords_list), 10)
+
+
+@override_settings(RSS_SEEN_FILTER_ENABLED=False)
+class TestArticleStore(TestCase):
+    """정규화된 URL 기준 기사 공유 테스트"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.service = RSSCrawlerService()
+        self.feed_a = RSSFeed.objects.create(title='Feed A', url='https://a.example.com/feed/')
+        self.feed_b = RSSFeed.objects.create(title='Feed B', url='https://b.example.com/feed/')
+
+    STRIPE = {
+        'title': 'Stripe raises funding',
+        'description': 'Payments startup Stripe raised a new round from investors.',
+    }
+
+    @patch('crawler.services.record_keyword_events')
+    def test_only_new_articles_update_trending(self, mock_record):
+        """트렌딩 점수에는 처음 저장된 기사의 키워드만 커밋 후 반영"""
+        # When
+        with self.captureOnCommitCallbacks(execute=True):
+            self.service.save_entries_to_db(
+                self.feed_a, [entry_data('https://stripe.example.com/news', **self.STRIPE)]
+            )
+        with self.captureOnCommitCallbacks(execute=True):
+            self.service.upsert_entries(
+                self.feed_b, [entry_data('https://stripe.example.com/news?utm_source=b', **self.STRIPE)]
+            )
+
+        # Then
+        first_events, second_events = [call.args[0] for call in mock_record.call_args_list]
+        self.assertEqual(len(first_events), 1)
+        self.assertEqual(second_events, [])
+
+    def test_canonicalize_url_strips_tracking(self):
+        """추적 파라미터, 프래그먼트, 호스트 대소문자, 기본 포트 정규화"""
+        # When
+        result = canonicalize_url(
+            'HTTPS://TechCrunch.com:443/2025/07/Stripe/?utm_source=rss&guccounter=1&b=2&a=1#comments'
+        )
+
+        # Then
+        self.assertEqual(result, 'https://techcrunch.com/2025/07/Stripe/?a=1&b=2')
+        self.assertEqual(canonicalize_url('https://techcrunch.com'), 'https://techcrunch.com/')
+
+    def test_syndicated_article_is_stored_once(self):
+        """여러 피드에 실린 같은 기사는 기사 하나를 공유하고 대표 엔트리에 연결"""
+        # When
+        self.service.save_entries_to_db(
+            self.feed_a, [entry_data('https://stripe.example.com/news?utm_source=a', **self.STRIPE)]
+        )
+        self.service.upsert_entries(
+            self.feed_b, [entry_data('https://stripe.example.com/news?utm_medium=rss&guccounter=2', **self.STRIPE)]
+        )
+
+        # Then
+        article = Article.objects.get()
+        self.assertEqual(article.canonical_url, 'https://stripe.example.com/news')
+        first = RSSEntry.objects.get(feed=self.feed_a)
+        second = RSSEntry.objects.get(feed=self.feed_b)
+        self.assertEqual(first.article, article)
+        self.assertEqual(second.article, article)
+        self.assertEqual(second.link, 'https://stripe.example.com/news')
+        self.assertEqual(second.canonical_entry, first)
+        self.assertEqual(second.description, '')
+        self.assertEqual(second.clean_description, article.description)
+        self.assertEqual(second.keywords_list, article.keywords_list)
+        self.assertEqual(
+            TermDocumentFrequency.objects.get(term=TfidfKeywordExtractor.CORPUS_TERM).document_count, 1
+        )
+
+    def test_undated_entries_keep_stored_date(self):
+        """날짜를 파싱하지 못한 기존 엔트리는 저장된 발행일을 유지하고 새 엔트리는 건너뜀"""
+        # Given
+        stored = django_timezone.now() - timedelta(days=3)
+        self.service.save_entries_to_db(
+            self.feed_a, [dict(entry_data('https://stripe.example.com/news', **self.STRIPE), published_at=stored)]
+        )
+        undated = [
+            dict(entry_data('https://stripe.example.com/news', **self.STRIPE), published_at=None),
+            dict(entry_data('https://stripe.example.com/other', **self.STRIPE), published_at=None),
+        ]
+
+        # When
+        log = self.service.save_entries_to_db(self.feed_a, undated)
+        self.service.upsert_entries(self.feed_b, undated)
+
+        # Then
+        self.assertEqual(log.status, 'success')
+        self.assertEqual(log.entries_processed, 1)
+        self.assertEqual(
+            list(RSSEntry.objects.values_list('published_at', flat=True)), [stored, stored]
+        )
+        self.assertFalse(Article.objects.filter(canonical_url='https://stripe.example.com/other').exists())
+
+    def test_attach_articles_backfills_legacy_entries(self):
+        """기사 미연결 기존 엔트리를 기사에 연결하고 설명 사본을 비움"""
+        # Given
+        entry = RSSEntry.objects.create(
+            feed=self.feed_a,
+            title='Legacy',
+            link='https://legacy.example.com/story?utm_campaign=x',
+            description='Legacy description',
+            published_at=django_timezone.now()
+        )
+
+        # When
+        self.service.attach_articles([entry])
+
+        # Then
+        entry.refresh_from_db()
+        self.assertEqual(entry.article.canonical_url, 'https://legacy.example.com/story')
+        self.assertEqual(entry.article.description, 'Legacy description')
+        self.assertEqual(entry.description, '')
+        self.assertEqual(entry.clean_description, 'Legacy description')
+
+
+    def test_backfill_canonicalizes_legacy_links(self):
+        """백필이 예전 링크를 정규화하고 같은 피드의 중복을 합쳐 다음 크롤링에서 새 엔트리가 생기지 않음"""
+        # Given: 정규화 전 저장된 엔트리와, 그 사이 크롤링으로 중복 저장된 엔트리
+        from django.core.management import call_command
+        legacy = RSSEntry.objects.create(
+            feed=self.feed_a,
+            title='Legacy',
+            link='https://Stripe.example.com/news?utm_source=rss',
+            description='Legacy description',
+            published_at=django_timezone.now()
+        )
+        other = RSSEntry.objects.create(
+            feed=self.feed_a,
+            title='Other',
+            link='https://other.example.com/story?utm_medium=rss',
+            published_at=django_timezone.now()
+        )
+        self.service.save_entries_to_db(
+            self.feed_a, [entry_data('https://stripe.example.com/news?utm_source=rss', **self.STRIPE)]
+        )
+        RSSEntry.objects.filter(link='https://stripe.example.com/news').update(canonical_entry=None)
+        RSSEntry.objects.filter(pk=other.pk).update(
+            canonical_entry=RSSEntry.objects.get(link='https://stripe.example.com/news')
+        )
+
+        # When
+        call_command('backfill_articles', stdout=Mock())
+        log = self.service.save_entries_to_db(
+            self.feed_a, [entry_data('https://stripe.example.com/news?utm_source=twitter', **self.STRIPE)]
+        )
+
+        # Then
+        legacy.refresh_from_db()
+        other.refresh_from_db()
+        self.assertEqual(RSSEntry.objects.filter(feed=self.feed_a).count(), 2)
+        self.assertEqual(legacy.link, 'https://stripe.example.com/news')
+        self.assertEqual(legacy.article.canonical_url, 'https://stripe.example.com/news')
+        self.assertEqual(other.link, 'https://other.example.com/story')
+        self.assertEqual(other.canonical_entry, legacy)
+        self.assertEqual(log.entries_new, 0)
+
+class TestRelatedIndex(TestCase):
+    """관련 기사 벡터 인덱스 테스트"""
+
+    def setUp(self):
+        """임시 인덱스 디렉터리와 주제가 다른 엔트리 준비"""
+        self.index_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.index_dir)
+        override = override_settings(RSS_RELATED_INDEX_DIR=self.index_dir)
+        override.enable()
+        self.addCleanup(override.disable)
+
+        self.feed = RSSFeed.objects.create(title='Feed', url='https://example.com/feed/')
+        self.stripe = self._entry('Stripe raises funding for payments', 'Payments startup Stripe raised funding.', ['stripe', 'payments'])
+        self.stripe_follow_up = self._entry('Stripe payments expand to Europe', 'Stripe payments funding grows.', ['stripe', 'payments'])
+        self.rocket = self._entry('Rocket launch reaches orbit', 'The rocket launch carried satellites.', ['rocket', 'orbit'])
+
+    def _entry(self, title, description, keywords):
+        entry = RSSEntry.objects.create(
+            feed=self.feed, title=title, link=f'https://example.com/{title.split()[0].lower()}/{RSSEntry.objects.count()}',
+            description=description, published_at=django_timezone.now()
+        )
+        entry.set_keywords(keywords)
+        entry.save()
+        return entry
+
+    def test_neighbours_rank_by_similarity(self):
+        """같은 주제 엔트리가 가장 가까운 이웃이고 자기 자신은 제외"""
+        # Given
+        RelatedIndexWriter().update()
+
+        # When
+        neighbours = RelatedIndex().neighbours(self.stripe, k=2)
+
+        # Then
+        self.assertEqual(neighbours[0][0], self.stripe_follow_up.pk)
+        self.assertNotIn(self.stripe.pk, [pk for pk, _ in neighbours])
+
+    def test_incremental_update_appends_new_entries(self):
+        """갱신 시 새 엔트리만 덧붙이고, 기존 읽기 인스턴스도 새 행을 본다"""
+        # Given
+        writer = RelatedIndexWriter()
+        first = writer.update()
+        reader = RelatedIndex()
+        reader.refresh()
+        launch = self._entry('Rocket launch delayed again', 'Another rocket launch to orbit.', ['rocket', 'orbit'])
+
+        # When
+        second = writer.update()
+
+        # Then
+        self.assertEqual((first['count'], second['added'], second['version']), (3, 1, first['version']))
+        self.assertEqual(reader.neighbours(self.rocket, k=1)[0][0], launch.pk)
+
+    def test_rebuild_drops_deleted_entries(self):
+        """재구축은 새 버전을 만들고 삭제된 엔트리를 제외"""
+        # Given
+        writer = RelatedIndexWriter()
+        first = writer.update()
+        self.stripe_follow_up.delete()
+
+        # When
+        stale = related_entries(self.stripe)
+        rebuilt = writer.update(rebuild=True)
+
+        # Then
+        self.assertNotIn(self.stripe_follow_up.pk, [entry.pk for entry, _ in stale])
+        self.assertEqual((rebuilt['version'], rebuilt['count']), (first['version'] + 1, 2))
+        self.assertFalse(os.path.exists(os.path.join(self.index_dir, f"vectors-{first['version']}.f32")))
+
+    def test_rebuild_swaps_meta_once_complete(self):
+        """재구축 중에는 이전 버전을 계속 보여주고, 모든 배치를 쓴 뒤 한 번만 새 버전으로 교체"""
+        # Given
+        writer = RelatedIndexWriter()
+        first = writer.update()
+        seen = []
+        append = writer._append
+
+        def append_and_read(version, count, entries):
+            seen.append(RelatedIndexWriter()._read_meta()['version'])
+            return append(version, count, entries)
+
+        # When
+        with patch.object(writer, '_append', side_effect=append_and_read), \
+                patch.object(writer, '_write_meta', wraps=writer._write_meta) as write_meta:
+            rebuilt = writer.update(batch_size=1, rebuild=True)
+
+        # Then
+        self.assertEqual(seen, [first['version']] * 3)
+        write_meta.assert_called_once()
+        self.assertEqual(write_meta.call_args.args[0]['count'], 3)
+        self.assertEqual(rebuilt['version'], first['version'] + 1)
+
+    def test_missing_index_returns_no_neighbours(self):
+        """인덱스가 아직 없으면 빈 목록"""
+        self.assertEqual(RelatedIndex().neighbours(self.stripe), [])
+
+    def test_entry_page_cache_follows_related_index(self):
+        """관련 기사 인덱스가 갱신되면 캐시된 상세 페이지 대신 새로 렌더링"""
+        # Given: 관련 기사 제목을 출력하는 임시 템플릿과 로컬 메모리 캐시
+        template_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, template_dir)
+        os.makedirs(os.path.join(template_dir, 'frontend'))
+        with open(os.path.join(template_dir, 'frontend', 'entry_detail.html'), 'w') as f:
+            f.write('{% for related in related_entries %}{{ related.title }}|{% endfor %}')
+        override = override_settings(
+            CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}},
+            TEMPLATES=[{'BACKEND': 'django.template.backends.django.DjangoTemplates', 'DIRS': [template_dir]}],
+        )
+        override.enable()
+        self.addCleanup(override.disable)
+        cache.clear()
+        writer = RelatedIndexWriter()
+        writer.update()
+        before = self.client.get(f'/entries/{self.rocket.pk}/').content.decode()
+        launch = self._entry('Rocket launch delayed again', 'Another rocket launch to orbit.', ['rocket', 'orbit'])
+
+        # When
+        writer.update()
+        after = self.client.get(f'/entries/{self.rocket.pk}/').content.decode()
+
+        # Then
+        self.assertNotIn(launch.title, before)
+        self.assertTrue(after.startswith(launch.title))
+
+
+class TestTrendingKeywords(TestCase):
+    """시간 감쇠 트렌딩 키워드 테스트"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.trending = TrendingKeywords(client=fakeredis.FakeRedis())
+        self.now = time.time()
+
+    def test_scores_decay_by_half_life(self):
+        """반감기만큼 지난 발생은 절반만 반영"""
+        # Given
+        self.trending.record([(['stripe'], self.now - 3600), (['stripe'], self.now)], now=self.now)
+
+        # When
+        top = self.trending.top('1h', now=self.now)
+
+        # Then
+        self.assertEqual(top[0]['keyword'], 'stripe')
+        self.assertAlmostEqual(top[0]['score'], 1.5, places=3)
+
+    def test_spiking_keyword_has_higher_velocity(self):
+        """최근에 몰린 키워드가 꾸준한 키워드보다 속도가 높음"""
+        # Given
+        day = 86400
+        steady = [(['cloud'], self.now - i * day / 8) for i in range(8)]
+        spike = [(['outage'], self.now - i * 60) for i in range(8)]
+        self.trending.record(steady + spike, now=self.now)
+
+        # When
+        velocity = {item['keyword']: item['velocity'] for item in self.trending.top('1h', now=self.now)}
+
+        # Then
+        self.assertGreater(velocity['outage'], velocity['cloud'])
+        self.assertGreater(velocity['outage'], 1)
+
+    def test_rescale_preserves_decayed_scores(self):
+        """기준 시각을 옮겨도 현재 점수는 같고, 작아진 키워드는 삭제"""
+        # Given
+        self.trending.record([(['stripe'], self.now), (['old'], self.now - 20 * 3600)], now=self.now)
+        later = self.now + 3600
+        before = self.trending.top('1h', now=later)
+
+        # When
+        self.trending.rescale('1h', now=later)
+
+        # Then
+        after = self.trending.top('1h', now=later)
+        self.assertEqual([item['keyword'] for item in after], ['stripe'])
+        self.assertAlmostEqual(after[0]['score'], before[0]['score'], places=3)
+
+
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+class TestFragmentCache(TestCase):
+    """인제스트 버전 기반 조각 캐시 테스트"""
+
+    def setUp(self):
+        """테스트 설정"""
+        cache.clear()
+        self.builds = 0
+
+    def _build(self):
+        self.builds += 1
+        return {'today_entries': self.builds}
+
+    def test_ingest_version_bump_invalidates_fragments(self):
+        """같은 버전에서는 캐시를 쓰고, 버전이 오르면 다시 계산"""
+        # When
+        first = cached_fragment('home_stats', self._build)
+        second = cached_fragment('home_stats', self._build)
+        bump_ingest_version()
+        third = cached_fragment('home_stats', self._build)
+
+        # Then
+        self.assertEqual((first, second, third), ({'today_entries': 1}, {'today_entries': 1}, {'today_entries': 2}))
+        self.assertEqual(fragment_stats()['home_stats'], {'hits': 1, 'misses': 2, 'hit_rate': 0.3333})
+
+    def test_page_fragment_keyed_on_updated_at(self):
+        """버전 없는 페이지 캐시는 updated_at 이 바뀔 때만 다시 계산"""
+        # When
+        cached_fragment('entry_page', self._build, 1, 100.0, versioned=False)
+        bump_ingest_version()
+        cached_fragment('entry_page', self._build, 1, 100.0, versioned=False)
+        cached_fragment('entry_page', self._build, 1, 200.0, versioned=False)
+
+        # Then
+        self.assertEqual(self.builds, 2)
+
+    @override_settings(CACHES={'default': {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache', 'LOCATION': 'redis://127.0.0.1:1/0'
+    }})
+    def test_cache_outage_falls_back_to_build(self):
+        """캐시 장애 시에도 조각을 계산해 반환"""
+        self.assertEqual(cached_fragment('home_stats', self._build), {'today_entries': 1})
+        self.assertEqual(bump_ingest_version(), 0)
+
+    def test_crawler_bumps_version_after_commit(self):
+        """엔트리 저장이 커밋되면 인제스트 버전이 오름"""
+        # Given
+        feed = RSSFeed.objects.create(title='Feed', url='https://example.com/feed/')
+        before = ingest_version()
+
+        # When
+        with override_settings(RSS_SEEN_FILTER_ENABLED=False, RSS_TRENDING_ENABLED=False):
+            with self.captureOnCommitCallbacks(execute=True):
+                RSSCrawlerService().save_entries_to_db(feed, [{
+                    'title': 'Title', 'link': 'https://example.com/a', 'description': 'desc',
+                    'author': '', 'published_at': django_timezone.now(), 'keywords': []
+                }])
+
+        # Then
+        self.assertEqual(ingest_version(), before + 1)
+
+
+class TestExtractiveSummary(TestCase):
+    """추출 요약 단계 테스트"""
+
+    TEXT = (
+        '<p>Stripe raised new funding from investors to expand its payments business.</p>'
+        '<p>The payments company said the funding will expand its business in Europe. '
+        'Lunch was served at noon in the office cafeteria today. '
+        'Investors said the payments business of Stripe keeps growing with new funding.</p>'
+    )
+
+    def test_summary_prefers_central_sentences(self):
+        """중심 문장을 원래 순서대로 고르고 주제와 먼 문장은 제외"""
+        # When
+        summary = summarize(self.TEXT, max_sentences=2)
+
+        # Then
+        self.assertNotIn('Lunch', summary)
+        self.assertNotIn('<p>', summary)
+        self.assertTrue(summary.startswith('Stripe raised') or summary.startswith('The payments'))
+
+    def test_short_text_is_returned_cleaned(self):
+        """문장이 적으면 정제된 원문을 그대로 사용"""
+        self.assertEqual(summarize('<b>Only one sentence here.</b>'), 'Only one sentence here.')
+
+    def test_summarize_pending_once_per_article(self):
+        """기사당 한 번 요약하고 배치의 엔트리를 처리 완료로 표시"""
+        # Given
+        article = Article.objects.create(
+            canonical_url='https://stripe.example.com/news',
+            title='Stripe raises funding',
+            description=self.TEXT,
+            published_at=django_timezone.now()
+        )
+        feed_a = RSSFeed.objects.create(title='Feed A', url='https://a.example.com/feed/')
+        feed_b = RSSFeed.objects.create(title='Feed B', url='https://b.example.com/feed/')
+        for feed in (feed_a, feed_b):
+            RSSEntry.objects.create(
+                feed=feed, article=article, title=article.title,
+                link=article.canonical_url, published_at=article.published_at
+            )
+        legacy = RSSEntry.objects.create(
+            feed=feed_a, title='Legacy', link='https://legacy.example.com/',
+            description='Legacy description only.', published_at=django_timezone.now()
+        )
+
+        # When
+        result = RSSCrawlerService().summarize_pending(batch_size=10, max_workers=1)
+        again = RSSCrawlerService().summarize_pending(batch_size=10, max_workers=1)
+
+        # Then
+        self.assertEqual(result['entries'], 3)
+        self.assertEqual(result['summaries'], 2)
+        self.assertEqual(again['entries'], 0)
+        article.refresh_from_db()
+        legacy.refresh_from_db()
+        self.assertNotIn('Lunch', article.summary)
+        self.assertEqual(legacy.summary, 'Legacy description only.')
+        self.assertFalse(RSSEntry.objects.filter(is_processed=False).exists())
+
+    def test_summarize_pending_claims_batch_before_summarizing(self):
+        """요약 중에는 배치를 선점 표시만 하고 다른 호출은 같은 엔트리를 가져가지 않음"""
+        # Given
+        feed = RSSFeed.objects.create(title='Feed A', url='https://a.example.com/feed/')
+        entry = RSSEntry.objects.create(
+            feed=feed, title='Claimed', link='https://claimed.example.com/',
+            description='Claimed description only.', published_at=django_timezone.now()
+        )
+        seen = {}
+
+        def fake_summarize_many(texts, **kwargs):
+            seen['claimed'] = RSSEntry.objects.get(pk=entry.pk).summary_claimed_at
+            seen['nested'] = RSSCrawlerService().summarize_pending(batch_size=10, max_workers=1)
+            seen['executor'] = kwargs['executor']
+            return ['summary'] * len(texts)
+
+        # When
+        with patch('crawler.services.summarize_many', side_effect=fake_summarize_many):
+            result = RSSCrawlerService().summarize_pending(batch_size=10, max_workers=1, executor='pool')
+
+        # Then
+        self.assertEqual(result['entries'], 1)
+        self.assertIsNotNone(seen['claimed'])
+        self.assertEqual(seen['nested']['entries'], 0)
+        self.assertEqual(seen['executor'], 'pool')
+        entry.refresh_from_db()
+        self.assertTrue(entry.is_processed)
+        self.assertIsNone(entry.summary_claimed_at)
+        self.assertEqual(entry.summary, 'summary')
+
+    @override_settings(RSS_SUMMARY_CLAIM_SECONDS=60)
+    def test_summarize_pending_retakes_expired_claim(self):
+        """선점 시간이 지난 배치는 다시 가져가고, 요약 실패 시 선점을 해제"""
+        # Given
+        feed = RSSFeed.objects.create(title='Feed A', url='https://a.example.com/feed/')
+        stale = RSSEntry.objects.create(
+            feed=feed, title='Stale', link='https://stale.example.com/', description='Stale one.',
+            published_at=django_timezone.now(),
+            summary_claimed_at=django_timezone.now() - timedelta(minutes=5)
+        )
+        fresh = RSSEntry.objects.create(
+            feed=feed, title='Fresh', link='https://fresh.example.com/', description='Fresh one.',
+            published_at=django_timezone.now(), summary_claimed_at=django_timezone.now()
+        )
+
+        # When
+        with patch('crawler.services.summarize_many', side_effect=RuntimeError('boom')):
+            with self.assertRaises(RuntimeError):
+                RSSCrawlerService().summarize_pending(batch_size=10, max_workers=1)
+        stale.refresh_from_db()
+        released = stale.summary_claimed_at
+        result = RSSCrawlerService().summarize_pending(batch_size=10, max_workers=1)
+
+        # Then
+        self.assertIsNone(released)
+        self.assertEqual(result['entries'], 1)
+        stale.refresh_from_db()
+        fresh.refresh_from_db()
+        self.assertTrue(stale.is_processed)
+        self.assertFalse(fresh.is_processed)
+
+
+@override_settings(RSS_SEEN_FILTER_ENABLED=False, RSS_KEYWORD_EXTRACTOR='fixed')
+class TestNearDuplicateIndex(TestCase):
+    """MinHash/LSH 유사 중복 탐지 테스트"""
+
+    STORY = (
+        'OpenAI has released a new reasoning model for enterprise customers, the company said on Thursday. '
+        'The model is available through the API and ChatGPT Enterprise, and pricing starts at launch for '
+        'existing business accounts that signed annual contracts with the startup last year.'
+    )
+
+    def setUp(self):
+        """테스트 설정"""
+        self.service = RSSCrawlerService()
+        self.feed_a = RSSFeed.objects.create(title='Feed A', url='https://a.example.com/feed/')
+        self.feed_b = RSSFeed.objects.create(title='Feed B', url='https://b.example.com/feed/')
+
+    def test_signature_similarity_tracks_overlap(self):
+        """거의 같은 글은 시그니처 유사도가 높고 다른 글은 낮음"""
+        # When
+        signatures = MinHasher().signatures([
+            ('OpenAI ships reasoning model', self.STORY),
+            ('OpenAI ships new reasoning model', self.STORY + ' Updated with comment.'),
+            ('Stripe raises funding', 'Payments startup Stripe raised a new round from investors in Europe.'),
+        ])
+
+        # Then
+        self.assertEqual(signatures.shape, (3, 128))
+        self.assertGreater(similarity(signatures[0], signatures[1]), 0.8)
+        self.assertLess(similarity(signatures[0], signatures[2]), 0.2)
+
+    def test_cross_feed_duplicate_links_to_canonical(self):
+        """다른 피드의 같은 기사는 먼저 저장된 엔트리에 연결되고 집계에서 제외"""
+        # Given
+        self.service.save_entries_to_db(self.feed_a, [
+            entry_data('https://a.example.com/openai', 'OpenAI ships reasoning model', self.STORY),
+        ])
+
+        # When
+        self.service.save_entries_to_db(self.feed_b, [
+            entry_data('https://b.example.com/2025/openai-model', 'OpenAI ships reasoning model', self.STORY),
+            entry_data('https://b.example.com/stripe', 'Stripe raises funding', 'Stripe raised a new round.'),
+        ])
+
+        # Then
+        original = RSSEntry.objects.get(link='https://a.example.com/openai')
+        duplicate = RSSEntry.objects.get(link='https://b.example.com/2025/openai-model')
+        self.assertEqual(duplicate.canonical_entry, original)
+        self.assertIsNone(original.canonical_entry)
+        self.assertEqual(len(bytes(duplicate.minhash)), 512)
+        self.assertEqual(RSSEntry.objects.count(), 3)
+        self.assertEqual(RSSEntry.objects.canonical().count(), 2)
+
+    def test_duplicates_within_batch_are_linked(self):
+        """같은 배치 안의 중복도 배치의 첫 엔트리에 연결"""
+        # When
+        self.service.upsert_entries(self.feed_a, [
+            entry_data('https://a.example.com/1', 'OpenAI ships reasoning model', self.STORY),
+            entry_data('https://a.example.com/2', 'OpenAI ships reasoning model', self.STORY),
+        ])
+
+        # Then
+        first = RSSEntry.objects.get(link='https://a.example.com/1')
+        second = RSSEntry.objects.get(link='https://a.example.com/2')
+        self.assertEqual(second.canonical_entry, first)
+        self.assertEqual(RSSEntryLSHBand.objects.filter(entry=first).count(), 16)
+
+
+    @patch('crawler.services.NearDuplicateIndex')
+    def test_duplicate_linking_failure_does_not_fail_crawl(self, mock_index_class):
+        """유사 중복 연결이 실패해도 저장된 엔트리로 크롤링은 성공 처리"""
+        # Given
+        mock_index_class.return_value.index_entries.side_effect = RuntimeError('lsh unavailable')
+
+        # When
+        with self.assertLogs('crawler.services', level='WARNING'):
+            log = self.service.save_entries_to_db(self.feed_a, [
+                entry_data('https://a.example.com/openai', 'OpenAI ships reasoning model', self.STORY),
+            ])
+        self.service.upsert_entries(self.feed_b, [
+            entry_data('https://b.example.com/openai', 'OpenAI ships reasoning model', self.STORY),
+        ])
+
+        # Then
+        self.feed_a.refresh_from_db()
+        self.assertEqual(log.status, 'success')
+        self.assertEqual(log.entries_new, 1)
+        self.assertIsNotNone(self.feed_a.last_crawled_at)
+        self.assertEqual(RSSEntry.objects.count(), 2)
+
+@override_settings(RSS_KEYWORD_EXTRACTOR='fixed')
+class TestSeenLinkFilterDedupe(TestCase):
+    """블룸 필터 기반 중복 체크 테스트"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.service = RSSCrawlerService()
+        self.feed = RSSFeed.objects.create(title='Test Feed', url='https://techcrunch.com/feed/')
+        self.existing = RSSEntry.objects.create(
+            feed=self.feed,
+            title='Old Title',
+            link='https://techcrunch.com/old',
+            published_at=django_timezone.now()
+        )
+
+    @patch('crawler.services.SeenLinkFilter')
+    def test_ruled_out_links_skip_db_lookup(self, mock_filter_class):
+        """필터가 새 링크로 판정한 엔트리는 조회 없이 생성"""
+        # Given
+        mock_filter = mock_filter_class.return_value
+        mock_filter.might_contain_many.return_value = [False, True]
+        entries = [entry_data('https://techcrunch.com/new'), entry_data('https://techcrunch.com/old', 'New Title')]
+
+        # When
+        log = self.service.save_entries_to_db(self.feed, entries)
+
+        # Then
+        self.assertEqual(log.entries_new, 1)
+        self.assertEqual(RSSEntry.objects.count(), 2)
+        self.existing.refresh_from_db()
+        self.assertEqual(self.existing.title, 'New Title')
+        self.assertEqual(self.existing.keywords_list, ['AI'])
+        mock_filter.add_many.assert_called_once_with(['https://techcrunch.com/new'])
+        mock_filter.record_lookups.assert_called_once_with(checked=2, ruled_out=1, false_positives=0)
+
+    @patch('crawler.services.SeenLinkFilter')
+    def test_missed_existing_link_falls_back_to_update(self, mock_filter_class):
+        """필터가 기존 링크를 놓쳐도 중복 생성 없이 업데이트"""
+        # Given
+        mock_filter_class.return_value.might_contain_many.return_value = [False]
+
+        # When
+        log = self.service.save_entries_to_db(
+            self.feed, [entry_data('https://techcrunch.com/old', 'New Title')]
+        )
+
+        # Then
+        self.assertEqual(log.status, 'success')
+        self.assertEqual(log.entries_new, 0)
+        self.assertEqual(RSSEntry.objects.count(), 1)
+        self.existing.refresh_from_db()
+        self.assertEqual(self.existing.title, 'New Title')
+
+    @patch('crawler.services.SeenLinkFilter')
+    def test_unready_filter_checks_db_and_rebuilds(self, mock_filter_class):
+        """준비되지 않은 필터는 모든 링크를 DB에서 확인하고 재구축"""
+        # Given
+        mock_filter = mock_filter_class.return_value
+        mock_filter.might_contain_many.return_value = None
+
+        # When
+        log = self.service.save_entries_to_db(self.feed, [entry_data('https://techcrunch.com/old')])
+
+        # Then
+        self.assertEqual(log.entries_new, 0)
+        mock_filter.rebuild.assert_called_once()
+        mock_filter.add_many.assert_not_called()
+
+    @patch('crawler.services.SeenLinkFilter')
+    def test_upsert_entries_bulk_writes_batch(self, mock_filter_class):
+        """write-behind writer 의 bulk upsert"""
+        # Given
+        entries = [
+            entry_data('https://techcrunch.com/old', 'Updated Title'),
+            entry_data('https://techcrunch.com/new', 'First'),
+            entry_data('https://techcrunch.com/new', 'Second'),
+        ]
+
+        # When
+        log = self.service.upsert_entries(self.feed, entries)
+
+        # Then
+        self.assertEqual(log.status, 'success')
+        self.assertEqual(log.entries_processed, 2)
+        self.assertEqual(log.entries_new, 1)
+        self.assertEqual(RSSEntry.objects.count(), 2)
+        self.existing.refresh_from_db()
+        self.assertEqual(self.existing.title, 'Updated Title')
+        self.assertEqual(RSSEntry.objects.get(link='https://techcrunch.com/new').title, 'Second')
+        mock_filter_class.return_value.add_many.assert_called_once_with(['https://techcrunch.com/new'])
+        # writer 는 가져오기/파싱을 하지 않으므로 해당 단계는 측정값 없음
+        self.assertIsNone(log.fetch_ms)
+        self.assertIsNone(log.parse_ms)
+        self.assertIsNotNone(log.db_ms)
+
+    def test_filter_offsets_are_stable_and_skip_ready_bit(self):
+        """링크별 비트 위치는 결정적이며 준비 플래그 비트를 쓰지 않음"""
+        # Given
+        seen_filter = SeenLinkFilter(self.feed.pk, capacity=1000, error_rate=0.01)
+
+        # When
+        offsets = seen_filter._offsets('https://techcrunch.com/old')
+
+        # Then
+        self.assertEqual(offsets, seen_filter._offsets('https://techcrunch.com/old'))
+        self.assertEqual(len(offsets), seen_filter.num_hashes)
+        self.assertTrue(all(1 <= offset <= seen_filter.num_bits for offset in offsets))
+
+
+@override_settings(RSS_SEEN_FILTER_ENABLED=False, RSS_KEYWORD_EXTRACTOR='fixed')
+class TestFeedArchive(TestCase):
+    """피드 원문 보관/재처리 테스트"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.service = RSSCrawlerService()
+        self.feed = RSSFeed.objects.create(title='TechCrunch', url='https://techcrunch.com/feed/')
+        with open(FIXTURE_FEED, 'rb') as f:
+            self.raw = f.read()
+
+    def test_identical_bodies_are_stored_once(self):
+        """같은 내용의 원문은 한 번만 압축 저장"""
+        # When
+        first = self.service.archive_feed_body(self.feed, self.raw)
+        second = self.service.archive_feed_body(self.feed, self.raw)
+
+        # Then
+        self.assertEqual(FeedSnapshot.objects.filter(feed=self.feed).count(), 2)
+        self.assertEqual(FeedBody.objects.count(), 1)
+        self.assertEqual(first.body_id, second.body_id)
+        body = FeedBody.objects.get()
+        self.assertLess(len(bytes(body.data)), body.size)
+        self.assertEqual(body.get_raw(), self.raw)
+
+    @patch.object(RSSCrawlerService, 'fetch_feed')
+    def test_crawl_and_save_archives_fetched_body(self, mock_fetch):
+        """크롤링 시 가져온 원문이 스냅샷으로 보관됨"""
+        # Given
+        mock_fetch.return_value = self.raw
+
+        # When
+        self.service.crawl_and_save(self.feed.url)
+
+        # Then
+        snapshot = FeedSnapshot.objects.get(feed=self.feed)
+        self.assertEqual(snapshot.body.get_raw(), self.raw)
+
+    @patch('crawler.services.requests')
+    def test_crawl_and_save_records_stage_metrics(self, mock_requests):
+        """크롤링 로그에 단계별 시간, 응답 크기/상태, 쿼리 수가 남음"""
+        # Given
+        mock_requests.get.return_value = Mock(status_code=200, content=self.raw)
+
+        # When
+        log = self.service.crawl_and_save(self.feed.url)
+
+        # Then
+        self.assertEqual(log.http_status, 200)
+        self.assertEqual(log.response_bytes, len(self.raw))
+        self.assertGreater(log.parse_ms, 0)
+        self.assertGreater(log.db_ms, 0)
+        self.assertGreater(log.db_queries, 0)
+        self.assertIsNotNone(log.peak_rss_delta_kb)
+        stage_total = (log.fetch_ms + log.parse_ms + log.enrich_ms + log.db_ms) / 1000
+        self.assertLessEqual(stage_total, log.processing_time + 1e-3)
+
+    def test_peak_rss_is_sampled_per_crawl(self):
+        """최대 RSS 증가량은 프로세스 수명 최댓값이 아니라 크롤링 중 샘플링한 현재 RSS 기준"""
+        # Given: 시작 100MB, 단계 종료 시 150MB, 로그 기록 시 120MB
+        with patch('crawler.metrics._current_rss_kb', side_effect=[100_000, 150_000, 120_000]):
+            metrics = CrawlMetrics()
+            with metrics.stage('parse'):
+                pass
+
+            # When
+            fields = metrics.log_fields()
+
+        # Then
+        self.assertEqual(fields['peak_rss_delta_kb'], 50_000)
+        self.assertIsNone(fields['fetch_ms'])
+        self.assertIsNotNone(fields['parse_ms'])
+
+    @patch.dict('core.telemetry._state', {'retry_at': 0.0})
+    @patch('core.telemetry.get_redis_client')
+    @patch('crawler.services.requests')
+    def test_crawl_exports_prometheus_metrics(self, mock_requests, mock_get_client):
+        """크롤링 단계 시간/엔트리 수/가져오기 오류가 지표에 누적됨"""
+        # Given
+        mock_get_client.return_value = fakeredis.FakeRedis()
+        mock_requests.get.side_effect = [
+            Mock(status_code=200, ok=True, content=self.raw),
+            Mock(status_code=503, ok=False, content=b'', raise_for_status=Mock(side_effect=Exception('503'))),
+        ]
+
+        # When
+        log = self.service.crawl_and_save(self.feed.url)
+        with self.assertRaises(RSSFeedError):
+            self.service.crawl_and_save(self.feed.url)
+        body = render_metrics()
+
+        # Then
+        feed = 'feed="https://techcrunch.com/feed/"'
+        self.assertIn(f'rss_entries_ingested_total{{{feed}}} {log.entries_new}', body)
+        self.assertIn(f'rss_crawls_total{{{feed},status="success"}} 1', body)
+        self.assertIn(f'rss_crawl_stage_seconds_count{{{feed},stage="parse"}} 1', body)
+        self.assertIn(f'rss_crawl_stage_seconds_bucket{{{feed},stage="db",le="+Inf"}} 1', body)
+        self.assertIn(f'rss_fetch_errors_total{{{feed},reason="503"}} 1', body)
+        self.assertIn(f'rss_entry_date_parses_total{{{feed},strategy="struct"}} {log.entries_processed}', body)
+
+    @patch('crawler.services.requests')
+    def test_reprocess_archive_updates_entries_without_network(self, mock_requests):
+        """보관된 원문으로 기존 엔트리를 갱신하고 네트워크는 사용하지 않음"""
+        # Given
+        self.service.archive_feed_body(self.feed, self.raw)
+        entry = RSSEntry.objects.create(
+            feed=self.feed,
+            title='Stale Title',
+            link='https://techcrunch.com/2025/07/10/openai-rolls-out-new-reasoning-model-to-enterprise-customers/',
+            description='<p>stale</p>',
+            published_at=django_timezone.now()
+        )
+
+        # When
+        stats = self.service.reprocess_archive(max_workers=1)
+
+        # Then
+        entry.refresh_from_db()
+        self.assertEqual(stats, {'bodies': 1, 'failed': 0, 'updated': 1})
+        self.assertEqual(entry.title, 'OpenAI rolls out new reasoning model to enterprise customers')
+        self.assertEqual(entry.keywords_list, ['AI'])
+        self.assertEqual(entry.published_at, datetime(2025, 7, 10, 8, 0, tzinfo=timezone.utc))
+        self.assertEqual(RSSEntry.objects.count(), 1)  # 없던 엔트리는 만들지 않음
+        mock_requests.get.assert_not_called()
+
+
+class TestSyntheticCorpus(TestCase):
+    """합성 코퍼스 생성기 테스트"""
+
+    anchor = datetime(2024, 6, 1, tzinfo=timezone.utc)
+
+    def test_same_seed_reproduces_corpus(self):
+        """같은 시드는 같은 엔트리, 다른 시드는 다른 엔트리"""
+        # When
+        first = list(SyntheticCorpus(seed=7, anchor=self.anchor).entry_rows(200))
+        second = list(SyntheticCorpus(seed=7, anchor=self.anchor).entry_rows(200))
+        other = list(SyntheticCorpus(seed=8, anchor=self.anchor).entry_rows(200))
+
+        # Then
+        self.assertEqual(first, second)
+        self.assertNotEqual(first, other)
+        self.assertEqual(len({row['link'] for row in first}), 200)
+
+    def test_distributions_are_skewed(self):
+        """첫 순위 피드/키워드가 가장 많고 최근 발행이 많음"""
+        # When
+        rows = list(SyntheticCorpus(seed=1, feeds=20, days=90, anchor=self.anchor).entry_rows(5000))
+
+        # Then
+        feed_counts = [sum(1 for row in rows if row['feed_index'] == index) for index in range(20)]
+        self.assertEqual(max(feed_counts), feed_counts[0])
+        keyword_counts = {}
+        for row in rows:
+            for keyword in row['keywords']:
+                keyword_counts[keyword] = keyword_counts.get(keyword, 0) + 1
+        self.assertEqual(max(keyword_counts, key=keyword_counts.get), 'AI')
+        recent = sum(1 for row in rows if row['published_at'] >= self.anchor - timedelta(days=30))
+        self.assertGreater(recent, len(rows) / 2)
+        self.assertTrue(all(self.anchor - timedelta(days=90) <= row['published_at'] < self.anchor for row in rows))
+
+    def test_raw_entry_round_trips_through_parser(self):
+        """raw_entry 를 파싱하면 생성한 제목/링크/발행 시각/키워드가 나옴"""
+        # Given
+        service = RSSCrawlerService()
+        row = next(row for row in SyntheticCorpus(seed=3, anchor=self.anchor).entry_rows(50) if row['keywords'])
+
+        # When
+        processed = service._process_entry(SyntheticCorpus.raw_entry(row))
+
+        # Then
+        self.assertEqual(processed['title'], row['title'])
+        self.assertEqual(processed['link'], row['link'])
+        self.assertEqual(processed['published_at'], row['published_at'])
+        self.assertTrue(set(row['keywords']) <= set(processed['keywords']))
+
+
 class TestRSSFeedModel(TestCase):
     """RSS 피드 모델 테스트"""
 
@@ -168,6 +1268,85 @@ class TestRSSFeedModel(TestCase):
         self.assertEqual(str(feed), 'Test Feed')
 
 
+class TestRSSFeedLease(TestCase):
+    """RSS 피드 리스 선점 테스트"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.feed_a = RSSFeed.objects.create(title='Feed A', url='https://a.example.com/feed/')
+        self.feed_b = RSSFeed.objects.create(title='Feed B', url='https://b.example.com/feed/')
+
+    def test_claim_due_assigns_distinct_feeds(self):
+        """워커마다 서로 다른 피드를 선점"""
+        # When
+        first = RSSFeed.objects.claim_due('worker-1', limit=1)
+        second = RSSFeed.objects.claim_due('worker-2', limit=1)
+        third = RSSFeed.objects.claim_due('worker-3', limit=1)
+
+        # Then
+        self.assertEqual(len(first), 1)
+        self.assertEqual(len(second), 1)
+        self.assertNotEqual(first[0].pk, second[0].pk)
+        self.assertEqual(third, [])
+        self.assertEqual(RSSFeed.objects.get(pk=first[0].pk).lease_owner, 'worker-1')
+
+    def test_claim_due_skips_recently_crawled(self):
+        """크롤링 주기가 지나지 않은 피드는 선점하지 않음"""
+        # Given
+        RSSFeed.objects.update(last_crawled_at=django_timezone.now())
+
+        # When & Then
+        self.assertEqual(RSSFeed.objects.claim_due('worker-1'), [])
+
+    def test_expired_lease_is_reclaimable(self):
+        """리스가 만료된 피드(워커 크래시)는 다시 선점 가능"""
+        # Given
+        from datetime import timedelta
+        RSSFeed.objects.claim_due('crashed-worker', limit=2)
+        RSSFeed.objects.filter(pk=self.feed_a.pk).update(
+            lease_expires_at=django_timezone.now() - timedelta(seconds=1)
+        )
+
+        # When
+        claimed = RSSFeed.objects.claim_due('worker-2', limit=2)
+
+        # Then
+        self.assertEqual([feed.pk for feed in claimed], [self.feed_a.pk])
+
+    def test_renew_and_release_lease(self):
+        """리스 소유자만 연장/반납 가능"""
+        # Given
+        feed = RSSFeed.objects.claim_due('worker-1', limit=1)[0]
+
+        # When & Then
+        self.assertEqual(RSSFeed.objects.renew_leases('worker-1'), 1)
+        self.assertEqual(RSSFeed.objects.renew_leases('worker-2'), 0)
+        feed.release_lease('worker-1')
+        feed.refresh_from_db()
+        self.assertEqual(feed.lease_owner, '')
+        self.assertIsNone(feed.lease_expires_at)
+
+    def test_heartbeat_renews_every_claimed_lease(self):
+        """하트비트는 배치로 선점한 피드 중 아직 크롤링하지 않은 피드의 리스도 연장"""
+        # Given
+        from datetime import timedelta
+        from crawler.leases import LeaseHeartbeat
+        RSSFeed.objects.claim_due('worker-1', limit=2)
+        soon = django_timezone.now() + timedelta(seconds=5)
+        RSSFeed.objects.update(lease_expires_at=soon)
+        self.feed_b.release_lease('worker-1')
+
+        # When
+        renewed = LeaseHeartbeat('worker-1', lease_seconds=300).beat()
+
+        # Then
+        self.feed_a.refresh_from_db()
+        self.feed_b.refresh_from_db()
+        self.assertEqual(renewed, 1)
+        self.assertGreater(self.feed_a.lease_expires_at, soon + timedelta(seconds=60))
+        self.assertIsNone(self.feed_b.lease_expires_at)
+
+
 class TestRSSEntryModel(TestCase):
     """RSS 엔트리 모델 테스트"""
 
@@ -208,6 +1387,32 @@ class TestRSSEntryModel(TestCase):
         # When & Then
         self.assertEqual(str(entry), 'Test Article')
 
+    def test_period_ranges_are_half_open_in_service_timezone(self):
+        """기간은 Asia/Seoul 자정 기준 반열림 구간이며 SQL 분류와 모델 분류가 같음"""
+        # Given: 서울 기준 6월 10일 00:30 (UTC 6월 9일 15:30)
+        now = datetime(2025, 6, 9, 15, 30, tzinfo=timezone.utc)
+        start, end = period_range('today', now)
+        published = {
+            'today': start,
+            'this_week': start - timedelta(microseconds=1),
+            'this_month': start - timedelta(days=20),
+            'older': start - timedelta(days=31),
+        }
+        for name, published_at in published.items():
+            RSSEntry.objects.create(
+                feed=self.feed, title=name, link=f'https://techcrunch.com/{name}', published_at=published_at
+            )
+
+        # When
+        annotated = dict(annotate_time_period(RSSEntry.objects.all(), now).values_list('title', 'time_period'))
+        counts = period_counts(RSSEntry.objects.all(), now)
+
+        # Then
+        self.assertEqual(start, datetime(2025, 6, 9, 15, 0, tzinfo=timezone.utc))
+        self.assertEqual(end - start, timedelta(days=1))
+        self.assertEqual(annotated, {name: name for name in published})
+        self.assertEqual(counts, {'today': 1, 'this_week': 2, 'this_month': 3})
+
     def test_rss_entry_keywords(self):
         """RSS 엔트리 키워드 테스트"""
         # Given
@@ -223,6 +1428,70 @@ class TestRSSEntryModel(TestCase):
         # When & Then
         self.assertEqual(entry.keywords_list, ['AI', 'technology', 'innovation'])
 
+    def test_legacy_repr_keywords_are_normalized(self):
+        """마이그레이션이 파이썬 repr 형식 키워드를 JSON 배열로 변환"""
+        # Given
+        migration = importlib.import_module('core.migrations.0011_normalize_legacy_keywords')
+        keywords = {
+            'legacy': "['AI', 'startup']",
+            'json': '["AI"]',
+            'broken': "['AI'",
+            'empty': '',
+        }
+        for name, value in keywords.items():
+            RSSEntry.objects.create(
+                feed=self.feed, title=name, link=f'https://techcrunch.com/{name}',
+                keywords=value, published_at=django_timezone.now()
+            )
+
+        # When
+        migration.normalize_keywords(django_apps, None)
+
+        # Then
+        stored = dict(RSSEntry.objects.values_list('title', 'keywords'))
+        self.assertEqual(stored['legacy'], '["AI", "startup"]')
+        self.assertEqual(stored['json'], '["AI"]')
+        self.assertEqual(stored['broken'], '[]')
+        self.assertEqual(stored['empty'], '[]')
+
+
+class TestEstimatedCountPaginator(TestCase):
+    """근사 건수 페이지네이터 테스트"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.feed = RSSFeed.objects.create(title='Test Feed', url='https://techcrunch.com/feed/')
+        RSSProcessingLog.objects.bulk_create([
+            RSSProcessingLog(feed=self.feed, status='success' if i % 3 else 'error')
+            for i in range(30)
+        ])
+
+    def test_small_result_uses_exact_count(self):
+        """추정치가 임계값보다 작으면 정확한 건수"""
+        # When
+        paginator = EstimatedCountPaginator(RSSProcessingLog.objects.order_by('-created_at'), 20)
+
+        # Then
+        self.assertEqual(paginator.count, 30)
+        self.assertFalse(paginator.is_estimated)
+        self.assertEqual(paginator.num_pages, 2)
+
+    def test_large_result_uses_planner_estimate(self):
+        """추정치가 임계값 이상이면 COUNT(*) 없이 추정치 사용"""
+        # Given
+        queryset = RSSProcessingLog.objects.filter(status='error').order_by('-created_at')
+        paginator = EstimatedCountPaginator(queryset, 20, exact_threshold=1)
+
+        # When
+        with self.assertNumQueries(1):
+            count = paginator.count
+
+        # Then
+        self.assertTrue(paginator.is_estimated)
+        self.assertEqual(count, estimate_count(queryset))
+        self.assertGreater(count, 0)
+        self.assertGreaterEqual(estimate_count(RSSProcessingLog.objects.all()), 0)
+
 
 class TestRSSProcessingLogModel(TestCase):
     """RSS 처리 로그 모델 테스트"""
@@ -252,6 +1521,47 @@ class TestRSSProcessingLogModel(TestCase):
         self.assertEqual(log.entries_new, 5)
         self.assertEqual(log.processing_time, 2.5)
 
+    def test_stage_percentiles_per_feed(self):
+        """피드별 단계 시간 p50/p95 를 집계하고 지표 없는 로그는 제외"""
+        # Given
+        for i in range(1, 11):
+            RSSProcessingLog.objects.create(
+                feed=self.feed, status='success',
+                fetch_ms=i * 10, parse_ms=i, enrich_ms=0, db_ms=100
+            )
+        RSSProcessingLog.objects.create(feed=self.feed, status='error', processing_time=0)
+
+        # When
+        stats = RSSProcessingLog.objects.stage_percentiles()
+
+        # Then
+        self.assertEqual(len(stats), 1)
+        self.assertEqual(stats[0]['feed__title'], 'Test Feed')
+        self.assertEqual(stats[0]['crawls'], 10)
+        self.assertAlmostEqual(stats[0]['fetch_p50'], 55.0)
+        self.assertAlmostEqual(stats[0]['fetch_p95'], 95.5)
+        self.assertAlmostEqual(stats[0]['parse_p50'], 5.5)
+        self.assertEqual(stats[0]['db_p95'], 100.0)
+
+    def test_stage_percentiles_ignore_unmeasured_stages(self):
+        """실행하지 않은 단계(None)는 그 단계 백분위에서만 빠짐"""
+        # Given: 크롤링 로그 1건 + 스트림 writer 로그 1건 (fetch/parse 없음)
+        RSSProcessingLog.objects.create(
+            feed=self.feed, status='success', fetch_ms=200, parse_ms=10, enrich_ms=1, db_ms=100
+        )
+        RSSProcessingLog.objects.create(
+            feed=self.feed, status='success', fetch_ms=None, parse_ms=None, enrich_ms=1, db_ms=300
+        )
+
+        # When
+        stats = RSSProcessingLog.objects.stage_percentiles()
+
+        # Then
+        self.assertEqual(stats[0]['crawls'], 2)
+        self.assertEqual(stats[0]['fetch_p50'], 200.0)
+        self.assertEqual(stats[0]['parse_p50'], 10.0)
+        self.assertEqual(stats[0]['db_p50'], 200.0)
+
 
 class TestRSSFeedError(TestCase):
     """RSS 피드 오류 테스트"""
@@ -1,12 +1,31 @@
+import gzip
+import json
+import os
+import shutil
+import tempfile
+import fakeredis
+import redis
 from unittest.mock import patch, Mock
-from django.test import TestCase
+from django.test import TestCase, override_settings
 from django.utils import timezone
 
-from core.models import RSSFeed, RSSEntry, RSSProcessingLog
-from crawler.tasks import crawl_rss_feed_task, cleanup_old_entries_task, generate_daily_summary_task
+from core.models import DailySummary, RSSFeed, RSSEntry, RSSProcessingLog
+from core.profiling import finish_task_profile, start_task_profile
+from core.querybudget import finish_task_budget, start_task_budget
+from core.testing import QueryBudgetAssertionsMixin, force_parallel_plan
+from crawler.exceptions import IngestBacklogFullError
+from crawler.ingest import IngestBuffer
+from crawler.locks import FeedCrawlLock
+from crawler.services import RSSCrawlerService
+from crawler.tasks import (
+    crawl_rss_feed_task, cleanup_old_entries_task, generate_daily_summary_task,
+    claim_due_feeds_task, drain_ingest_stream_task, crawl_feeds_sweep_task, summarize_entries_task,
+)
+from frontend.middleware import accepts_gzip
+from frontend.tasks import publish_snapshots_task
 
 
-class TestCrawlerTasks(TestCase):
+class TestCrawlerTasks(QueryBudgetAssertionsMixin, TestCase):
     """Crawler 태스크 테스트"""
 
     def setUp(self):
@@ -52,6 +71,206 @@ class TestCrawlerTasks(TestCase):
             # Note: 실제 테스트에서는 Celery의 retry 메커니즘을 mock해야 함
             crawl_rss_feed_task('https://techcrunch.com/feed/')
 
+    @patch('crawler.tasks.FeedCrawlLock')
+    @patch('crawler.tasks.RSSCrawlerService')
+    def test_claim_due_feeds_task(self, mock_service_class, mock_lock_class):
+        """주기가 된 피드를 선점해 크롤링하고 리스 반납"""
+        # Given
+        mock_lock_class.return_value.acquire.side_effect = lambda token: token
+        mock_service = mock_service_class.return_value
+        mock_service.crawl_and_save.side_effect = lambda url: RSSFeed.objects.filter(url=url).update(
+            last_crawled_at=timezone.now()
+        )
+
+        # When
+        result = claim_due_feeds_task()
+
+        # Then
+        self.assertEqual(result['crawled'], 1)
+        mock_service.crawl_and_save.assert_called_once_with(self.feed.url)
+        self.feed.refresh_from_db()
+        self.assertEqual(self.feed.lease_owner, '')
+
+    @patch('crawler.tasks.FeedCrawlLock')
+    @patch('crawler.tasks.RSSCrawlerService')
+    def test_claim_due_feeds_task_backs_off_on_failure(self, mock_service_class, mock_lock_class):
+        """크롤링 실패 시 재시도 지연만큼 다시 선점되지 않음"""
+        # Given
+        mock_lock_class.return_value.acquire.side_effect = lambda token: token
+        mock_service_class.return_value.crawl_and_save.side_effect = Exception("Test error")
+
+        # When
+        result = claim_due_feeds_task()
+
+        # Then
+        self.assertEqual(result['failed'], 1)
+        self.assertEqual(RSSProcessingLog.objects.filter(status='error').count(), 1)
+        self.assertEqual(RSSFeed.objects.due().count(), 0)
+
+    @override_settings(RSS_INGEST_MODE='stream')
+    @patch('crawler.tasks.RSSCrawlerService')
+    def test_crawl_rss_feed_task_stream_mode(self, mock_service_class):
+        """write-behind 모드에서는 스트림에 적재만 하고 반환"""
+        # Given
+        mock_service = mock_service_class.return_value
+        mock_service.crawl_and_enqueue.return_value = 7
+
+        # When
+        result = crawl_rss_feed_task('https://techcrunch.com/feed/')
+
+        # Then
+        self.assertEqual(result, {'status': 'queued', 'entries_queued': 7})
+        mock_service.crawl_and_save.assert_not_called()
+
+    @patch('crawler.tasks.RSSCrawlerService')
+    @patch('crawler.tasks.IngestBuffer')
+    def test_drain_ingest_stream_task(self, mock_buffer_class, mock_service_class):
+        """스트림 메시지를 피드별로 묶어 저장 후 ACK"""
+        # Given
+        mock_buffer = mock_buffer_class.return_value
+        mock_buffer.reclaim.return_value = [('1-0', self.feed.id, {'link': 'a'})]
+        mock_buffer.read.side_effect = [
+            [('2-0', self.feed.id, {'link': 'b'}), ('2-1', 999999, {'link': 'c'})],
+            [],
+        ]
+        mock_buffer.lag.return_value = {'backlog': 0, 'pending': 0, 'oldest_age_seconds': 0.0}
+        mock_service = mock_service_class.return_value
+
+        # When
+        result = drain_ingest_stream_task()
+
+        # Then
+        self.assertEqual(result['written'], 2)
+        self.assertEqual(mock_service.upsert_entries.call_count, 2)
+        mock_buffer.ack.assert_any_call(['1-0'])
+        mock_buffer.ack.assert_any_call(['2-0'])
+        mock_buffer.ack.assert_any_call(['2-1'])
+
+    @patch('crawler.tasks.RSSCrawlerService')
+    @patch('crawler.tasks.IngestBuffer')
+    def test_drain_ingest_stream_task_leaves_failed_unacked(self, mock_buffer_class, mock_service_class):
+        """저장 실패한 메시지는 ACK 하지 않아 재처리 대상으로 남음"""
+        # Given
+        mock_buffer = mock_buffer_class.return_value
+        mock_buffer.reclaim.return_value = [('1-0', self.feed.id, {'link': 'a'})]
+        mock_buffer.read.return_value = []
+        mock_buffer.delivery_counts.return_value = {'1-0': 1}
+        mock_service_class.return_value.upsert_entries.side_effect = Exception("DB down")
+
+        # When
+        result = drain_ingest_stream_task()
+
+        # Then
+        self.assertEqual(result['failed'], 1)
+        self.assertEqual(result['dead_lettered'], 0)
+        mock_buffer.ack.assert_not_called()
+        mock_buffer.dead_letter.assert_called_once_with([], 'DB down')
+
+    @override_settings(RSS_INGEST_CLAIM_IDLE_MS=0, RSS_INGEST_MAX_DELIVERIES=2)
+    @patch('crawler.tasks.RSSCrawlerService')
+    @patch('crawler.ingest.get_redis_client')
+    def test_drain_ingest_stream_task_dead_letters_after_max_deliveries(self, mock_get_client, mock_service_class):
+        """계속 저장에 실패한 메시지는 최대 전달 횟수 뒤 dead-letter 스트림으로 옮겨 더 재시도하지 않음"""
+        # Given
+        client = fakeredis.FakeRedis()
+        mock_get_client.return_value = client
+        buffer = IngestBuffer()
+        buffer.ensure_group()
+        buffer.append(self.feed.id, [{'link': 'https://test.com/poison', 'title': 'Poison'}])
+        mock_service_class.return_value.upsert_entries.side_effect = Exception("bad row")
+
+        # When: 첫 전달(XREADGROUP), 두 번째 전달(XAUTOCLAIM)
+        first = drain_ingest_stream_task(max_runtime=1)
+        second = drain_ingest_stream_task(max_runtime=1)
+
+        # Then
+        self.assertEqual((first['failed'], first['dead_lettered']), (1, 0))
+        self.assertEqual((second['failed'], second['dead_lettered']), (1, 1))
+        self.assertEqual(second['lag']['backlog'], 0)
+        self.assertEqual(second['lag']['dead_letters'], 1)
+        (_, fields), = client.xrange(IngestBuffer.DEAD_LETTER_KEY)
+        self.assertEqual(fields[b'error'], b'bad row')
+        self.assertEqual(json.loads(fields[b'entry'])['link'], 'https://test.com/poison')
+
+    @override_settings(RSS_INGEST_STREAM_MAXLEN=3)
+    @patch('crawler.ingest.get_redis_client')
+    def test_ingest_append_refuses_when_backlog_full(self, mock_get_client):
+        """밀린 메시지가 용량을 넘게 되면 읽지 않은 메시지를 자르지 않고 적재를 거부"""
+        # Given
+        mock_get_client.return_value = fakeredis.FakeRedis()
+        buffer = IngestBuffer()
+        buffer.append(self.feed.id, [{'link': f'https://test.com/{i}'} for i in range(2)])
+
+        # When / Then
+        with self.assertRaises(IngestBacklogFullError):
+            buffer.append(self.feed.id, [{'link': f'https://test.com/more-{i}'} for i in range(2)])
+        self.assertEqual(buffer.lag()['backlog'], 2)
+
+    @patch('crawler.tasks.FeedCrawlLock')
+    @patch('crawler.tasks.RSSCrawlerService')
+    def test_crawl_feeds_sweep_task(self, mock_service_class, mock_lock_class):
+        """스윕 태스크는 락을 얻은 활성 피드만 한 번에 크롤링"""
+        # Given
+        mock_lock_class.return_value.acquire.side_effect = lambda token: token
+        mock_service = mock_service_class.return_value
+        mock_service.crawl_many.return_value = {self.feed.url: Mock()}
+
+        # When
+        result = crawl_feeds_sweep_task()
+
+        # Then
+        self.assertEqual(result['crawled'], 1)
+        self.assertEqual(result['skipped'], 0)
+        mock_service.crawl_many.assert_called_once_with([self.feed.url], max_workers=None)
+        mock_lock_class.return_value.release.assert_called_once()
+
+    def test_summarize_entries_task_reports_throughput(self):
+        """요약 태스크가 배치 단위로 처리하고 처리량/지연을 보고"""
+        # Given
+        for i in range(3):
+            RSSEntry.objects.create(
+                feed=self.feed,
+                title=f'Article {i}',
+                link=f'https://test.com/summary-{i}',
+                description='First sentence about funding. Second sentence about funding rounds.',
+                published_at=timezone.now()
+            )
+
+        # When
+        result = summarize_entries_task(batch_size=2, max_workers=1)
+
+        # Then
+        self.assertEqual(result['status'], 'success')
+        self.assertEqual(result['entries'], 3)
+        self.assertEqual(result['batches'], 2)
+        self.assertEqual(result['remaining'], 0)
+        self.assertGreater(result['entries_per_second'], 0)
+        self.assertGreaterEqual(result['batch_latency_max'], result['batch_latency_avg'])
+
+    @patch('crawler.tasks.summary_pool')
+    def test_summarize_entries_task_reuses_one_pool(self, mock_pool):
+        """요약 태스크는 실행마다 프로세스 풀을 한 번만 만들어 모든 배치에 전달"""
+        # Given
+        for i in range(3):
+            RSSEntry.objects.create(
+                feed=self.feed,
+                title=f'Article {i}',
+                link=f'https://test.com/pool-{i}',
+                description='Only sentence.',
+                published_at=timezone.now()
+            )
+        mock_pool.return_value.__enter__.return_value = None
+
+        # When
+        with patch.object(RSSCrawlerService, 'summarize_pending', autospec=True,
+                          side_effect=RSSCrawlerService.summarize_pending) as mock_pending:
+            result = summarize_entries_task(batch_size=1, max_workers=2)
+
+        # Then
+        self.assertEqual(result['entries'], 3)
+        mock_pool.assert_called_once_with(2)
+        self.assertTrue(all(call.kwargs['executor'] is None for call in mock_pending.call_args_list))
+
     def test_cleanup_old_entries_task(self):
         """오래된 엔트리 정리 태스크 테스트"""
         # Given
@@ -86,13 +305,13 @@ class TestCrawlerTasks(TestCase):
         """일일 요약 생성 태스크 테스트"""
         # Given
         from datetime import timedelta
-        yesterday = timezone.now().date() - timedelta(days=1)
+        yesterday = timezone.localdate() - timedelta(days=1)
         
         entry = RSSEntry.objects.create(
             feed=self.feed,
             title='Yesterday Article',
             link='https://test.com/yesterday',
-            published_at=timezone.datetime.combine(yesterday, timezone.datetime.min.time()),
+            published_at=timezone.make_aware(timezone.datetime.combine(yesterday, timezone.datetime.min.time())),
             keywords='["AI", "technology"]'
         )
 
@@ -102,5 +321,393 @@ class TestCrawlerTasks(TestCase):
         # Then
         self.assertEqual(result['date'], yesterday)
         self.assertEqual(result['total_entries'], 1)
-        self.assertIsInstance(result['top_keywords'], list)
-        self.assertIsInstance(result['top_feeds'], list) 
\ No newline at end of file
+        self.assertEqual(result['top_keywords'], [['AI', 1], ['technology', 1]])
+        self.assertEqual(result['top_feeds'], [['Test Feed', 1]])
+        self.assertEqual(DailySummary.objects.get(date=yesterday).total_entries, 1)
+
+    def test_generate_daily_summary_task_refreshes_recent_days(self):
+        """정기 실행은 최근 며칠 요약을 다시 계산해 늦게 들어온 엔트리를 반영"""
+        # Given: 그제 요약이 저장된 뒤 그제 발행일의 엔트리가 늦게 들어옴
+        from datetime import timedelta
+        two_days_ago = timezone.localdate() - timedelta(days=2)
+        DailySummary.generate(two_days_ago)
+        RSSEntry.objects.create(
+            feed=self.feed, title='Late Article', link='https://test.com/late',
+            published_at=timezone.make_aware(timezone.datetime.combine(two_days_ago, timezone.datetime.min.time())),
+            keywords='["AI"]'
+        )
+
+        # When
+        with override_settings(RSS_DAILY_SUMMARY_REFRESH_DAYS=3):
+            result = generate_daily_summary_task()
+
+        # Then
+        self.assertEqual(result['refreshed_days'], 3)
+        self.assertEqual(DailySummary.objects.get(date=two_days_ago).total_entries, 1)
+        self.assertEqual(DailySummary.objects.count(), 3)
+
+    def test_generate_daily_summary_task_with_legacy_keywords(self):
+        """파이썬 repr 형식이나 깨진 키워드 행이 있어도 일일 요약 집계가 실패하지 않음"""
+        # Given
+        from datetime import timedelta
+        yesterday = timezone.localdate() - timedelta(days=1)
+        published_at = timezone.make_aware(timezone.datetime.combine(yesterday, timezone.datetime.min.time()))
+        for i, keywords in enumerate(['["AI"]', "['AI', 'startup']", '[broken', '{"AI": 1}']):
+            RSSEntry.objects.create(
+                feed=self.feed, title=f'Article {i}', link=f'https://test.com/legacy-{i}',
+                published_at=published_at, keywords=keywords
+            )
+
+        # When
+        result = generate_daily_summary_task()
+        counts = RSSEntry.objects.keyword_counts(10)
+
+        # Then
+        self.assertEqual(result['total_entries'], 4)
+        self.assertEqual(result['top_keywords'], [['AI', 1]])
+        self.assertEqual(counts, [('AI', 1)])
+
+    def test_daily_summary_keywords_under_parallel_plan(self):
+        """병렬 계획에서도 키워드 집계가 실패하지 않음 (큰 테이블에서 PostgreSQL 이 고르는 계획)"""
+        # Given
+        from datetime import timedelta
+        yesterday = timezone.localdate() - timedelta(days=1)
+        published_at = timezone.make_aware(timezone.datetime.combine(yesterday, timezone.datetime.min.time()))
+        RSSEntry.objects.bulk_create([
+            RSSEntry(
+                feed=self.feed, title=f'Article {i}', link=f'https://test.com/parallel-{i}',
+                published_at=published_at, keywords='["AI", "startup"]' if i % 2 else '["AI"]'
+            )
+            for i in range(200)
+        ])
+
+        # When
+        with force_parallel_plan():
+            summary = DailySummary.generate(yesterday)
+            counts = RSSEntry.objects.canonical().keyword_counts(10)
+
+        # Then
+        self.assertEqual(summary.top_keywords[:2], [['AI', 200], ['startup', 100]])
+        self.assertEqual(counts, [('AI', 200), ('startup', 100)])
+
+    def test_generate_daily_summary_task_query_budget(self):
+        """일일 요약 쿼리 수는 엔트리/피드 수와 무관"""
+        # Given
+        from datetime import timedelta
+        yesterday = timezone.localdate() - timedelta(days=1)
+        published_at = timezone.make_aware(timezone.datetime.combine(yesterday, timezone.datetime.min.time()))
+        for f in range(3):
+            feed = RSSFeed.objects.create(title=f'Feed {f}', url=f'https://feed{f}.example.com/rss')
+            for i in range(5):
+                RSSEntry.objects.create(
+                    feed=feed, title=f'Article {f}-{i}', link=f'https://feed{f}.example.com/{i}',
+                    published_at=published_at, keywords='["AI", "funding"]'
+                )
+
+        # When: 하루치 쿼리 수만 고정
+        with self.assertQueryBudget(9), override_settings(RSS_DAILY_SUMMARY_REFRESH_DAYS=1):
+            result = generate_daily_summary_task()
+
+        # Then
+        self.assertEqual(result['total_entries'], 15)
+
+    def test_task_query_budget_logs_repeated_sql(self):
+        """태스크 훅이 같은 SQL 모양의 반복(N+1)을 묶어 경고"""
+        # Given
+        feeds = [RSSFeed.objects.create(title=f'Feed {i}', url=f'https://n{i}.example.com/rss') for i in range(6)]
+
+        # When
+        with self.assertLogs('core.querybudget', level='WARNING') as logs:
+            start_task_budget('task-1', 'crawler.tasks.example_task')
+            for feed in feeds:
+                feed.entries.count()
+            budget = finish_task_budget('task-1')
+
+        # Then
+        self.assertEqual(budget.count, 6)
+        self.assertEqual(len(budget.shapes), 1)
+        self.assertIn('repeated 6x', logs.output[0])
+        self.assertIn('crawler.tasks.example_task', logs.output[0])
+
+    def test_task_profile_header_captures_single_run(self):
+        """profile 헤더를 붙인 실행만 pstats 로 저장되고 list_profiles 에 나타남"""
+        # Given
+        from io import StringIO
+        from django.core.management import call_command
+        profile_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, profile_dir, ignore_errors=True)
+
+        with override_settings(RSS_PROFILE_DIR=profile_dir):
+            # When
+            for task_id, headers in (('task-plain', None), ('task-profiled', {'profile': True})):
+                start_task_profile(task_id, 'crawler.tasks.generate_daily_summary_task', headers)
+                generate_daily_summary_task()
+                finish_task_profile(task_id, 'SUCCESS')
+            out = StringIO()
+            call_command('list_profiles', '--top', '5', stdout=out)
+
+        # Then
+        self.assertEqual(len([name for name in os.listdir(profile_dir) if name.endswith('.pstats')]), 1)
+        self.assertIn('crawler.tasks.generate_daily_summary_task', out.getvalue())
+        self.assertIn('top 5 functions by tottime across 1 captures', out.getvalue())
+
+    def test_load_synthetic_corpus_command(self):
+        """COPY 로 적재한 엔트리/기사/로그/문서 빈도가 코퍼스와 일치하고 재적재는 거부"""
+        # Given
+        from datetime import datetime, timezone as dt_timezone
+        from io import StringIO
+        from django.core.management import call_command
+        from django.core.management.base import CommandError
+        from core.models import Article, TermDocumentFrequency
+        from crawler.keywords import TfidfKeywordExtractor
+        from crawler.synthetic import SyntheticCorpus
+        entries_before = RSSEntry.objects.count()
+        args = ['--entries', '300', '--feeds', '5', '--logs', '20', '--anchor', '2024-01-31', '--chunk-size', '120']
+
+        # When
+        out = StringIO()
+        call_command('load_synthetic_corpus', *args, '--workers', '2', stdout=out)
+
+        # Then
+        corpus = SyntheticCorpus(seed=42, feeds=5, anchor=datetime(2024, 1, 31, tzinfo=dt_timezone.utc))
+        expected = list(corpus.entry_rows(300))
+        loaded = RSSEntry.objects.filter(link__startswith='https://feed').select_related('article', 'feed')
+        self.assertEqual(RSSEntry.objects.count(), entries_before + 300)
+        self.assertEqual(sorted(entry.link for entry in loaded), sorted(row['link'] for row in expected))
+        self.assertTrue(all(entry.article.canonical_url == entry.link for entry in loaded))
+        self.assertEqual(RSSProcessingLog.objects.filter(feed__url__startswith='https://feed').count(), 20)
+        self.assertEqual(TermDocumentFrequency.objects.get(term=TfidfKeywordExtractor.CORPUS_TERM).document_count, 300)
+        self.assertIn('loaded: 300 entries, 300 articles, 20 logs, 5 new feeds', out.getvalue())
+
+        # When / Then: 같은 시드로 다시 적재하면 안내와 함께 실패, --start 로 이어서 적재
+        with self.assertRaisesMessage(CommandError, 'use --start'):
+            call_command('load_synthetic_corpus', *args, stdout=Mock())
+        call_command('load_synthetic_corpus', *args, '--start', '300', '--workers', '1', stdout=Mock())
+        self.assertEqual(RSSEntry.objects.count(), entries_before + 600)
+        self.assertEqual(Article.objects.filter(canonical_url__contains='/story-').count(), 600)
+
+    @patch('crawler.management.commands.backfill_daily_summaries.group')
+    def test_backfill_daily_summaries_command(self, mock_group):
+        """기간 백필이 날짜마다 태스크를 하나씩 만들고 --sync 는 바로 저장"""
+        # Given
+        from datetime import timedelta
+        from django.core.management import call_command
+        today = timezone.localdate()
+        start = today - timedelta(days=3)
+        RSSEntry.objects.create(
+            feed=self.feed,
+            title='Old Article',
+            link='https://test.com/backfill',
+            published_at=timezone.make_aware(timezone.datetime.combine(start, timezone.datetime.min.time())),
+            keywords='["AI"]'
+        )
+
+        # When
+        call_command('backfill_daily_summaries', '--start', start.isoformat(), stdout=Mock())
+
+        # Then
+        signatures = list(mock_group.call_args[0][0])
+        self.assertEqual([sig.args[0] for sig in signatures], [(start + timedelta(days=i)).isoformat() for i in range(3)])
+        self.assertFalse(DailySummary.objects.exists())
+
+        # When
+        call_command('backfill_daily_summaries', '--start', start.isoformat(), '--sync', stdout=Mock())
+
+        # Then
+        self.assertEqual(list(DailySummary.objects.order_by('date').values_list('total_entries', flat=True)), [1, 0, 0])
+
+
+class TestCrawlCoalescing(TestCase):
+    """피드별 크롤링 중복 요청 병합 테스트"""
+
+    feed_url = 'https://techcrunch.com/feed/'
+
+    @patch('celery.app.task.Task.apply_async')
+    @patch('crawler.tasks.FeedCrawlLock')
+    def test_duplicate_trigger_returns_in_flight_task(self, mock_lock_class, mock_apply_async):
+        """진행 중인 크롤링이 있으면 새 태스크 대신 기존 task id 반환"""
+        # Given
+        mock_lock_class.return_value.acquire.return_value = 'in-flight-id'
+
+        # When
+        result = crawl_rss_feed_task.delay(self.feed_url)
+
+        # Then
+        self.assertEqual(result.id, 'in-flight-id')
+        mock_apply_async.assert_not_called()
+
+    @patch('celery.app.task.Task.apply_async')
+    @patch('crawler.tasks.FeedCrawlLock')
+    def test_first_trigger_publishes_task(self, mock_lock_class, mock_apply_async):
+        """락을 획득하면 같은 task id로 태스크 발행"""
+        # Given
+        mock_lock_class.return_value.acquire.side_effect = lambda token: token
+
+        # When
+        crawl_rss_feed_task.delay(self.feed_url)
+
+        # Then
+        mock_apply_async.assert_called_once()
+        token = mock_lock_class.return_value.acquire.call_args[0][0]
+        self.assertEqual(mock_apply_async.call_args.kwargs['task_id'], token)
+
+    @patch('crawler.tasks.RSSCrawlerService')
+    @patch('crawler.tasks.FeedCrawlLock')
+    def test_lock_released_after_success(self, mock_lock_class, mock_service_class):
+        """크롤링 성공 후 락 해제"""
+        # Given
+        mock_lock = mock_lock_class.return_value
+        mock_lock.acquire.side_effect = lambda token: token
+        mock_service_class.return_value.crawl_and_save.return_value = Mock(
+            id=1, entries_processed=1, entries_new=1, processing_time=0.1
+        )
+
+        # When
+        result = crawl_rss_feed_task.apply(args=[self.feed_url])
+
+        # Then
+        self.assertEqual(result.result['status'], 'success')
+        mock_lock.release.assert_called_once_with(result.id)
+
+    @patch('crawler.tasks.RSSCrawlerService')
+    @patch('crawler.tasks.FeedCrawlLock')
+    def test_lock_released_before_retry(self, mock_lock_class, mock_service_class):
+        """크롤링 실패 시 재시도 전에 락 해제"""
+        # Given
+        mock_lock = mock_lock_class.return_value
+        mock_lock.acquire.side_effect = lambda token: token
+        mock_service_class.return_value.crawl_and_save.side_effect = Exception("Test error")
+
+        # When
+        result = crawl_rss_feed_task.apply(args=[self.feed_url])
+
+        # Then
+        self.assertTrue(result.failed())
+        self.assertEqual(mock_lock.release.call_count, mock_lock.acquire.call_count)
+
+    @patch('crawler.tasks.RSSCrawlerService')
+    @patch('crawler.tasks.FeedCrawlLock')
+    def test_task_skips_when_lock_held_by_other(self, mock_lock_class, mock_service_class):
+        """실행 시점에 다른 태스크가 락을 갖고 있으면 크롤링하지 않음"""
+        # Given
+        mock_lock_class.return_value.acquire.return_value = 'other-task-id'
+
+        # When
+        result = crawl_rss_feed_task.apply(args=[self.feed_url])
+
+        # Then
+        self.assertEqual(result.result, {'status': 'coalesced', 'task_id': 'other-task-id'})
+        mock_service_class.return_value.crawl_and_save.assert_not_called()
+
+    @patch('crawler.locks.get_redis_client')
+    def test_lock_fails_open_without_redis(self, mock_get_client):
+        """Redis 장애 시 락 없이 크롤링 진행"""
+        # Given
+        mock_get_client.return_value.register_script.side_effect = redis.ConnectionError()
+
+        # When
+        holder = FeedCrawlLock(self.feed_url).acquire('task-id')
+
+        # Then
+        self.assertEqual(holder, 'task-id')
+
+
+class TestStaticSnapshots(TestCase):
+    """홈/대시보드 정적 스냅샷 테스트"""
+
+    def setUp(self):
+        """스냅샷/템플릿 임시 디렉터리 준비"""
+        root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, root)
+        self.snapshot_dir = os.path.join(root, 'snapshots')
+        os.makedirs(os.path.join(root, 'templates', 'frontend'))
+        for name in ('home', 'dashboard'):
+            with open(os.path.join(root, 'templates', 'frontend', f'{name}.html'), 'w') as f:
+                f.write(name + ' {{ today_entries|default:"" }}{% now "U" %}')
+
+        override = override_settings(
+            RSS_SNAPSHOT_DIR=self.snapshot_dir,
+            CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}},
+            TEMPLATES=[{
+                'BACKEND': 'django.template.backends.django.DjangoTemplates',
+                'DIRS': [os.path.join(root, 'templates')],
+            }],
+        )
+        override.enable()
+        self.addCleanup(override.disable)
+
+    def test_publish_and_serve_snapshot(self):
+        """발행된 스냅샷을 기본 익명 요청에 파일 그대로 응답 (gzip 포함)"""
+        # Given
+        result = publish_snapshots_task(force=True)
+
+        # When
+        response = self.client.get('/')
+        gzipped = self.client.get('/dashboard/', HTTP_ACCEPT_ENCODING='gzip')
+        filtered = self.client.get('/?page=2')
+
+        # Then
+        self.assertEqual(result['published'], ['home', 'dashboard'])
+        self.assertEqual(response['X-Snapshot'], 'hit')
+        with open(os.path.join(self.snapshot_dir, 'home.html'), 'rb') as f:
+            self.assertEqual(response.content, f.read())
+        self.assertEqual(gzipped['Content-Encoding'], 'gzip')
+        self.assertTrue(gzip.decompress(gzipped.content).startswith(b'dashboard'))
+        self.assertFalse(filtered.has_header('X-Snapshot'))
+
+    def test_gzip_refused_by_q_value_serves_plain_snapshot(self):
+        """Accept-Encoding 의 q 값을 반영해 gzip;q=0 이면 압축하지 않은 스냅샷으로 응답"""
+        # Given
+        publish_snapshots_task(force=True)
+
+        # When
+        refused = self.client.get('/', HTTP_ACCEPT_ENCODING='gzip;q=0, identity')
+        wildcard = self.client.get('/', HTTP_ACCEPT_ENCODING='br, *;q=0.5')
+
+        # Then
+        self.assertFalse(refused.has_header('Content-Encoding'))
+        self.assertTrue(refused.content.startswith(b'home'))
+        self.assertEqual(wildcard['Content-Encoding'], 'gzip')
+        self.assertTrue(accepts_gzip('deflate, GZIP;q=0.8'))
+        self.assertFalse(accepts_gzip('gzip;q=0.0'))
+        self.assertFalse(accepts_gzip('*;q=1, gzip;q=0'))
+        self.assertFalse(accepts_gzip(''))
+
+    def test_unchanged_ingest_version_skips_render(self):
+        """인제스트 버전이 같고 스냅샷이 신선하면 다시 렌더링하지 않음"""
+        # Given
+        publish_snapshots_task()
+
+        # When
+        result = publish_snapshots_task()
+
+        # Then
+        self.assertTrue(result['skipped'])
+
+    def test_failed_render_is_retried_next_run(self):
+        """렌더링에 실패한 페이지가 있으면 버전이 같아도 다음 실행에서 다시 렌더링"""
+        # Given
+        with patch('frontend.snapshots._render', side_effect=ValueError('boom')):
+            failed = publish_snapshots_task()
+
+        # When
+        retried = publish_snapshots_task()
+
+        # Then
+        self.assertEqual(failed['failed'], ['home', 'dashboard'])
+        self.assertFalse(retried['skipped'])
+        self.assertEqual(retried['published'], ['home', 'dashboard'])
+
+    def test_stale_snapshot_falls_back_to_live_render(self):
+        """오래된 스냅샷은 쓰지 않고 뷰가 렌더링"""
+        # Given
+        publish_snapshots_task(force=True)
+        stale = os.path.getmtime(os.path.join(self.snapshot_dir, 'home.html')) - 3600
+        os.utime(os.path.join(self.snapshot_dir, 'home.html'), (stale, stale))
+
+        # When
+        response = self.client.get('/')
+
+        # Then
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(response.has_header('X-Snapshot'))